@@ -0,0 +1,101 @@
+"""Benchmarks the per-call overhead of `merge_decorators` against direct stacking.
+
+Each decorator below does some work when it's applied (like `call` decorators do), so
+re-applying the decorators on every call shows up directly in the per-call overhead.
+
+Usage:
+
+```
+python benchmarks/merge_decorators.py [--number 100000]
+```
+"""
+
+import argparse
+import inspect
+from collections.abc import Callable
+from functools import reduce, wraps
+from typing import Any
+
+from timing import best
+
+from mirascope.core import merge_decorators
+
+
+def validate_args(fn: Callable) -> Callable:
+    signature = inspect.signature(fn)
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        signature.bind(*args, **kwargs)
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def count_calls(fn: Callable) -> Callable:
+    calls = {fn.__name__: 0}
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        calls[fn.__name__] += 1
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def retry(fn: Callable) -> Callable:
+    attempts = [inspect.getdoc(fn) is not None] * 3
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        for _ in attempts:
+            try:
+                return fn(*args, **kwargs)
+            except ValueError:
+                continue
+        raise ValueError("Out of attempts.")
+
+    return wrapper
+
+
+def per_call_merge_decorators(*decorators: Callable) -> Callable:
+    """The previous implementation, which re-applies every decorator on each call."""
+
+    def compose(f: Callable, d: Callable) -> Callable:
+        @wraps(f)
+        def wrapped(*args: Any, **kwargs: Any) -> Any:
+            return d(f)(*args, **kwargs)
+
+        return wrapped
+
+    return lambda fn: reduce(compose, reversed(decorators), fn)
+
+
+def recommend(genre: str) -> str:
+    """Recommend a {genre} book."""
+    return genre
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    decorators = (validate_args, count_calls, retry)
+    candidates = {
+        "undecorated": recommend,
+        "stacked": validate_args(count_calls(retry(recommend))),
+        "merge_decorators": merge_decorators(*decorators)()(recommend),
+        "per-call (previous)": per_call_merge_decorators(*decorators)(recommend),
+    }
+
+    print(f"{'candidate':<22}{'per call (µs)':>14}{'overhead (µs)':>16}")
+    baseline = None
+    for name, fn in candidates.items():
+        per_call = best(lambda fn=fn: fn("fantasy"), args.number, args.repeat)
+        baseline = per_call if baseline is None else baseline
+        print(f"{name:<22}{per_call:>14.3f}{per_call - baseline:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
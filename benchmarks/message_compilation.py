@@ -0,0 +1,100 @@
+"""Benchmarks setting up a call from a chat prompt template with each provider.
+
+For each provider, this reports the time to set up a call (parse the prompt template,
+convert the messages, and build the call kwargs) from a typical chat prompt with a
+system message and a user message. The prompt is set up with the messages converted
+directly into the provider's message parameters (the fast path), with the generic
+path that builds `BaseMessageParam` messages first, and with the generic path without
+any cached template parsing (as every call was set up before the fast path).
+
+Usage:
+
+```
+python benchmarks/message_compilation.py [--providers openai anthropic] [--number 2000]
+```
+"""
+
+import argparse
+import importlib
+from contextlib import nullcontext
+from unittest.mock import patch
+
+from providers import PROVIDERS, Provider, Responder
+from timing import best
+
+from mirascope.core import prompt_template
+from mirascope.core.base._utils._format_template import _compile_template
+from mirascope.core.base._utils._parse_content_template import _parse_parts
+from mirascope.core.base._utils._parse_prompt_messages import _split_messages
+
+# The providers whose `setup_call` converts text messages directly. LiteLLM sets up its
+# calls with OpenAI's `setup_call`, so it isn't benchmarked separately.
+FAST_PATH_PROVIDERS = ["anthropic", "bedrock", "fake", "gemini", "groq", "openai"]
+
+
+@prompt_template(
+    """
+    SYSTEM:
+    You are a librarian who recommends books that readers will love.
+    Keep your recommendations short and explain why you chose each book.
+
+    USER: I just finished {book} and loved it. Recommend a {genre} book like it.
+    """
+)
+def recommend_book(book: str, genre: str) -> None: ...
+
+
+def clear_caches() -> None:
+    for cached in [_split_messages, _parse_parts, _compile_template]:
+        cached.cache_clear()
+
+
+def benchmark(name: str, provider: Provider, number: int, repeat: int) -> list[float]:
+    utils = importlib.import_module(f"mirascope.core.{name}._utils._setup_call")
+    responder = Responder()
+    client = None if provider.client is None else provider.client(responder)
+
+    def setup_call() -> object:
+        return utils.setup_call(
+            model=provider.model,
+            client=client,
+            fn=recommend_book,
+            fn_args={"book": "The Name of the Wind", "genre": "fantasy"},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={"max_tokens": 1000},
+            extract=False,
+            stream=False,
+        )
+
+    def uncached_setup_call() -> object:
+        clear_caches()
+        return setup_call()
+
+    fast = best(setup_call, number, repeat)
+    with patch.object(utils, "convert_text_message", None):
+        generic = best(setup_call, number, repeat)
+        uncached = best(uncached_setup_call, number, repeat)
+    return [fast, generic, uncached]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--providers", nargs="+", default=FAST_PATH_PROVIDERS)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    columns = ["fast path (µs)", "generic (µs)", "uncached (µs)"]
+    print(f"{'provider':<11}" + "".join(f"{column:>16}" for column in columns))
+    for name in args.providers:
+        provider = PROVIDERS[name]()
+        context = nullcontext() if provider.patch is None else patch(provider.patch)
+        with context:
+            results = benchmark(name, provider, args.number, args.repeat)
+        print(f"{name:<11}" + "".join(f"{result:>16.1f}" for result in results))
+
+
+if __name__ == "__main__":
+    main()
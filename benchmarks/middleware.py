@@ -0,0 +1,114 @@
+"""Benchmarks the overhead of stacking `middleware_factory` integrations.
+
+Each integration mirrors the shape of `with_otel`/`with_logfire` (a context manager
+plus a stream handler), and the stream yields pre-built chunks so that the numbers
+only include the overhead added by the middleware.
+
+Usage:
+
+```
+python benchmarks/middleware.py [--chunks 1000]
+```
+"""
+
+import argparse
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from typing import Any
+
+from timing import best
+
+from mirascope.core.base import BaseStream
+from mirascope.integrations import middleware_factory
+
+
+class Stream(BaseStream):
+    """A stream that yields pre-built chunks without any per-chunk processing."""
+
+    def __iter__(self) -> Generator[tuple[Any, Any], None, None]:
+        assert isinstance(self.stream, Generator)
+        yield from self.stream
+
+    @property
+    def cost(self) -> None:
+        return None
+
+    def _construct_message_param(
+        self, tool_calls: list[Any] | None = None, content: str | None = None
+    ) -> None:
+        return None
+
+    def construct_call_response(self) -> Any:
+        return None
+
+
+@contextmanager
+def span(fn: Callable) -> Generator[dict, None, None]:
+    yield {"name": fn.__name__}
+
+
+def handle_stream(stream: BaseStream, fn: Callable, context: dict | None) -> None:
+    if context is not None:
+        context["content"] = stream.content
+
+
+def with_integration() -> Callable[[Callable], Callable]:
+    return middleware_factory(custom_context_manager=span, handle_stream=handle_stream)
+
+
+def stream_fn(chunks: list[tuple[Any, None]]) -> Callable[[], Stream]:
+    def recommend_book() -> Stream:
+        return Stream(
+            stream=(chunk for chunk in chunks),
+            metadata={},
+            tool_types=None,
+            call_response_type=Any,  # pyright: ignore [reportArgumentType]
+            model="model",
+            prompt_template=None,
+            fn_args={},
+            dynamic_config=None,
+            messages=[],
+            call_params={},
+            call_kwargs={},
+        )
+
+    return recommend_book
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    chunks = [(object(), None) for _ in range(args.chunks)]
+    print(f"{'integrations':<14}{'per call (µs)':>14}{'per chunk (ns)':>16}")
+    call_baseline = chunk_baseline = 0.0
+    for count in range(4):
+        fn = stream_fn(chunks)
+        for _ in range(count):
+            fn = with_integration()(fn)
+
+        def call(fn: Callable[[], Stream] = fn) -> None:
+            for _ in fn():
+                break
+
+        def consume(fn: Callable[[], Stream] = fn) -> None:
+            for _ in fn():
+                pass
+
+        per_call = best(call, args.number, args.repeat)
+        per_chunk = (
+            (best(consume, args.number, args.repeat) - per_call) / args.chunks * 1e3
+        )
+        if count == 0:
+            call_baseline, chunk_baseline = per_call, per_chunk
+        print(
+            f"{count:<14}{per_call - call_baseline:>14.2f}"
+            f"{per_chunk - chunk_baseline:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
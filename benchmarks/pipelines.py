@@ -0,0 +1,195 @@
+"""Benchmarks the call, stream, and extraction pipelines of every provider.
+
+Each provider responds with the synthetic SDK responses in `providers.py`, so the
+numbers only include the work done by mirascope. For each provider, this measures:
+
+- the overhead of a call (setup, message conversion, and response parsing),
+- the overhead of each chunk of a stream,
+- the latency of extraction (`response_model` with `json_mode`), both from a call
+  response and from a structured stream, as the number of extracted items grows,
+- and the memory retained by each call response.
+
+Results can be saved as a baseline and compared against later runs, which prints a
+report of the changes and exits with an error if any metric regressed by more than
+the threshold. Baselines are specific to the machine they were measured on.
+
+Usage:
+
+```
+python benchmarks/pipelines.py [--providers openai anthropic] [--save baseline.json]
+python benchmarks/pipelines.py --compare baseline.json [--threshold 0.1]
+```
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from contextlib import nullcontext
+from pathlib import Path
+from unittest.mock import patch
+
+from providers import PROVIDERS, Provider, Responder
+from pydantic import BaseModel
+from timing import best
+
+
+class Books(BaseModel):
+    titles: list[str]
+
+
+def recommend_book(genre: str) -> str:
+    return f"Recommend a {genre} book"
+
+
+def extract_books(text: str) -> str:
+    return f"Extract the books from this text: {text}"
+
+
+def books_json(count: int) -> str:
+    return Books(titles=["The Name of the Wind"] * count).model_dump_json()
+
+
+def split(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def retained_memory(statement: Callable[[], object], count: int = 100) -> float:
+    """Returns the memory retained by each result of `statement` in KiB."""
+    statement()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    results = [statement() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    return (after - before) / count / 1024
+
+
+def benchmark(
+    provider: Provider, chunks: int, sizes: list[int], number: int, repeat: int
+) -> dict[str, float]:
+    responder = Responder()
+    kwargs = {} if provider.client is None else {"client": provider.client(responder)}
+    call = provider.call(provider.model, **kwargs)
+    stream = provider.call(provider.model, stream=True, **kwargs)
+    extract = provider.call(
+        provider.model, response_model=Books, json_mode=True, **kwargs
+    )
+    structured_stream = provider.call(
+        provider.model, response_model=Books, json_mode=True, stream=True, **kwargs
+    )
+    call_fn, stream_fn = call(recommend_book), stream(recommend_book)
+    extract_fn, structured_stream_fn = (
+        extract(extract_books),
+        structured_stream(extract_books),
+    )
+
+    def consume(fn: Callable, *args: object) -> None:
+        for _ in fn(*args):
+            pass
+
+    results = {}
+    context = nullcontext() if provider.patch is None else patch(provider.patch)
+    with context as mock_create:
+        if mock_create is not None:
+            mock_create.side_effect = responder
+
+        responder.response = provider.response("The Name of the Wind")
+        results["call (µs)"] = best(lambda: call_fn("fantasy"), number, repeat)
+        results["memory (KiB)"] = retained_memory(lambda: call_fn("fantasy"))
+
+        responder.chunks = provider.chunks(["The Name "])
+        single = best(lambda: consume(stream_fn, "fantasy"), number, repeat)
+        responder.chunks = provider.chunks(["The Name "] * chunks)
+        total = best(
+            lambda: consume(stream_fn, "fantasy"), max(number // 10, 1), repeat
+        )
+        results["chunk (ns)"] = (total - single) / (chunks - 1) * 1e3
+
+        for size in sizes:
+            text = books_json(size)
+            responder.response = provider.response(text)
+            results[f"extract {size} (µs)"] = best(
+                lambda: extract_fn("text"), number, repeat
+            )
+            responder.chunks = provider.chunks(split(text, 16))
+            results[f"structured stream {size} (µs)"] = best(
+                lambda: consume(structured_stream_fn, "text"),
+                max(number // 10, 1),
+                repeat,
+            )
+    return results
+
+
+def report(results: dict[str, dict[str, float]]) -> None:
+    metrics = list(next(iter(results.values())))
+    width = max(len(metric) for metric in metrics) + 2
+    print(f"{'metric':<{width}}" + "".join(f"{name:>11}" for name in results))
+    for metric in metrics:
+        print(
+            f"{metric:<{width}}"
+            + "".join(f"{values[metric]:>11.2f}" for values in results.values())
+        )
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    results: dict[str, dict[str, float]],
+    threshold: float,
+) -> bool:
+    """Prints the changes from the baseline and returns whether any regressed."""
+    regressed = False
+    print(f"{'provider':<11}{'metric':<28}{'baseline':>11}{'current':>11}{'change':>9}")
+    for name, values in results.items():
+        for metric, value in values.items():
+            if (previous := baseline.get(name, {}).get(metric)) is None:
+                continue
+            change = (value - previous) / previous if previous else 0.0
+            flag = " regressed" if change > threshold else ""
+            regressed = regressed or bool(flag)
+            print(
+                f"{name:<11}{metric:<28}{previous:>11.2f}{value:>11.2f}"
+                f"{change:>+9.1%}{flag}"
+            )
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--providers", nargs="+", default=list(PROVIDERS))
+    parser.add_argument("--chunks", type=int, default=100)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", type=Path, help="Saves the results as a baseline.")
+    parser.add_argument("--compare", type=Path, help="Compares against a baseline.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The relative slowdown above which a metric counts as a regression.",
+    )
+    args = parser.parse_args()
+
+    results = {
+        name: benchmark(
+            PROVIDERS[name](), args.chunks, args.sizes, args.number, args.repeat
+        )
+        for name in args.providers
+    }
+    report(results)
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+    if args.compare:
+        print()
+        baseline = json.loads(args.compare.read_text())
+        if compare(baseline, results, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
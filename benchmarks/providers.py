@@ -0,0 +1,486 @@
+"""Synthetic SDK responses and clients for benchmarking every provider.
+
+Each provider's client returns pre-built SDK responses (or streams of pre-built SDK
+chunks) without a network, so benchmarks only measure the work done by mirascope:
+setting up the call, converting messages, and parsing responses and chunks.
+"""
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+_USAGE = {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30}
+
+
+class Responder:
+    """Returns the current synthetic response, or a stream of the current chunks."""
+
+    def __init__(self) -> None:
+        self.response: object = None
+        self.chunks: list[object] = []
+
+    def __call__(self, *, stream: bool = False, **kwargs: Any) -> Any:
+        return iter(self.chunks) if stream else self.response
+
+    def stream(self, **kwargs: Any) -> Iterator[object]:
+        return iter(self.chunks)
+
+
+@dataclass
+class Provider:
+    """A provider's call decorator with synthetic SDK responses."""
+
+    call: Callable[..., Callable]
+    model: str
+    response: Callable[[str], object]
+    """Returns the SDK response with the given text content."""
+    chunks: Callable[[list[str]], list[object]]
+    """Returns the SDK chunks that stream the given text parts."""
+    client: Callable[[Responder], object] | None
+    """Returns a client that responds with the responder, if the call takes one."""
+    patch: str | None = None
+    """The create function to replace with the responder, for calls without a client."""
+
+
+def _openai_response(model: str, completion: type) -> Callable[[str], object]:
+    def response(text: str) -> object:
+        return completion.model_validate(
+            {
+                "id": "id",
+                "object": "chat.completion",
+                "created": 0,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": text},
+                    }
+                ],
+                "usage": _USAGE,
+            }
+        )
+
+    return response
+
+
+def _openai_chunks(
+    model: str, chunk: type, **fields: object
+) -> Callable[[list[str]], list[object]]:
+    def build(delta: dict, finish_reason: str | None = None) -> object:
+        return chunk.model_validate(
+            fields
+            | {
+                "id": "id",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+                "usage": _USAGE if finish_reason else None,
+            }
+        )
+
+    return lambda parts: [
+        *(build({"content": part}) for part in parts),
+        build({}, "stop"),
+    ]
+
+
+def openai() -> Provider:
+    from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+    from mirascope.core import openai
+
+    model = "gpt-4o-mini"
+    return Provider(
+        call=openai.call,
+        model=model,
+        response=_openai_response(model, ChatCompletion),
+        chunks=_openai_chunks(model, ChatCompletionChunk),
+        client=lambda responder: SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=responder))
+        ),
+    )
+
+
+def anthropic() -> Provider:
+    from anthropic.types import Message, MessageStreamEvent
+    from pydantic import TypeAdapter
+
+    from mirascope.core import anthropic
+
+    model = "claude-3-5-sonnet-20240620"
+    message = {
+        "id": "id",
+        "type": "message",
+        "role": "assistant",
+        "model": model,
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 10, "output_tokens": 20},
+    }
+    event = TypeAdapter(MessageStreamEvent)
+
+    def chunks(parts: list[str]) -> list[object]:
+        return [
+            event.validate_python(
+                {"type": "message_start", "message": message | {"content": []}}
+            ),
+            event.validate_python(
+                {
+                    "type": "content_block_start",
+                    "index": 0,
+                    "content_block": {"type": "text", "text": ""},
+                }
+            ),
+            *(
+                event.validate_python(
+                    {
+                        "type": "content_block_delta",
+                        "index": 0,
+                        "delta": {"type": "text_delta", "text": part},
+                    }
+                )
+                for part in parts
+            ),
+            event.validate_python({"type": "content_block_stop", "index": 0}),
+            event.validate_python(
+                {
+                    "type": "message_delta",
+                    "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                    "usage": {"output_tokens": 20},
+                }
+            ),
+            event.validate_python({"type": "message_stop"}),
+        ]
+
+    return Provider(
+        call=anthropic.call,
+        model=model,
+        response=lambda text: Message.model_validate(
+            message | {"content": [{"type": "text", "text": text}]}
+        ),
+        chunks=chunks,
+        client=lambda responder: SimpleNamespace(
+            messages=SimpleNamespace(create=responder)
+        ),
+    )
+
+
+def azure() -> Provider:
+    from azure.ai.inference.models import (
+        ChatCompletions,
+        StreamingChatCompletionsUpdate,
+    )
+
+    from mirascope.core import azure
+
+    model = "gpt-4o-mini"
+    completion = {"id": "id", "created": 0, "model": model, "usage": _USAGE}
+
+    def chunk(delta: dict, finish_reason: str | None = None) -> object:
+        return StreamingChatCompletionsUpdate(
+            completion
+            | {
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ]
+            }
+        )
+
+    return Provider(
+        call=azure.call,
+        model=model,
+        response=lambda text: ChatCompletions(
+            completion
+            | {
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": text},
+                    }
+                ]
+            }
+        ),
+        chunks=lambda parts: [
+            *(chunk({"role": "assistant", "content": part}) for part in parts),
+            chunk({"role": "assistant"}, "stop"),
+        ],
+        client=lambda responder: SimpleNamespace(complete=responder),
+    )
+
+
+def bedrock() -> Provider:
+    from mirascope.core import bedrock
+
+    metadata = {"RequestId": "id", "HTTPStatusCode": 200}
+    usage = {"inputTokens": 10, "outputTokens": 20, "totalTokens": 30}
+
+    def client(responder: Responder) -> object:
+        return SimpleNamespace(
+            converse=responder,
+            converse_stream=lambda **kwargs: {
+                "stream": responder.stream(),
+                "ResponseMetadata": metadata,
+            },
+        )
+
+    return Provider(
+        call=bedrock.call,
+        model="anthropic.claude-3-haiku-20240307-v1:0",
+        response=lambda text: {
+            "output": {"message": {"role": "assistant", "content": [{"text": text}]}},
+            "stopReason": "end_turn",
+            "usage": usage,
+            "metrics": {"latencyMs": 0},
+            "ResponseMetadata": metadata,
+        },
+        chunks=lambda parts: [
+            {"messageStart": {"role": "assistant"}},
+            *(
+                {"contentBlockDelta": {"delta": {"text": part}, "contentBlockIndex": 0}}
+                for part in parts
+            ),
+            {"contentBlockStop": {"contentBlockIndex": 0}},
+            {"messageStop": {"stopReason": "end_turn"}},
+            {"metadata": {"usage": usage, "metrics": {"latencyMs": 0}}},
+        ],
+        client=client,
+    )
+
+
+def cohere() -> Provider:
+    from cohere.types import (
+        ApiMeta,
+        ApiMetaBilledUnits,
+        NonStreamedChatResponse,
+        StreamEndStreamedChatResponse,
+        StreamStartStreamedChatResponse,
+        TextGenerationStreamedChatResponse,
+    )
+
+    from mirascope.core import cohere
+
+    def response(text: str) -> NonStreamedChatResponse:
+        return NonStreamedChatResponse(
+            text=text,
+            generation_id="id",
+            finish_reason="COMPLETE",
+            meta=ApiMeta(
+                billed_units=ApiMetaBilledUnits(input_tokens=10, output_tokens=20)
+            ),
+        )
+
+    return Provider(
+        call=cohere.call,
+        model="command-r-plus",
+        response=response,
+        chunks=lambda parts: [
+            StreamStartStreamedChatResponse(generation_id="id"),
+            *(TextGenerationStreamedChatResponse(text=part) for part in parts),
+            StreamEndStreamedChatResponse(
+                finish_reason="COMPLETE", response=response("".join(parts))
+            ),
+        ],
+        client=lambda responder: SimpleNamespace(
+            chat=responder, chat_stream=responder.stream
+        ),
+    )
+
+
+def gemini() -> Provider:
+    from google.ai.generativelanguage import GenerateContentResponse
+    from google.generativeai.types import (  # pyright: ignore [reportMissingTypeStubs]
+        GenerateContentResponse as GenerateContentResponseType,
+    )
+
+    from mirascope.core import gemini
+
+    def response(text: str) -> object:
+        return GenerateContentResponseType.from_response(
+            GenerateContentResponse(
+                {
+                    "candidates": [
+                        {
+                            "finish_reason": 1,
+                            "content": {"role": "model", "parts": [{"text": text}]},
+                        }
+                    ],
+                    "usage_metadata": {
+                        "prompt_token_count": 10,
+                        "candidates_token_count": 20,
+                        "total_token_count": 30,
+                    },
+                }
+            )
+        )
+
+    return Provider(
+        call=gemini.call,
+        model="gemini-1.5-flash",
+        response=response,
+        chunks=lambda parts: [response(part) for part in parts],
+        client=lambda responder: SimpleNamespace(generate_content=responder),
+    )
+
+
+def groq() -> Provider:
+    from groq.types.chat import ChatCompletion, ChatCompletionChunk
+
+    from mirascope.core import groq
+
+    model = "llama-3.1-8b-instant"
+    return Provider(
+        call=groq.call,
+        model=model,
+        response=_openai_response(model, ChatCompletion),
+        chunks=_openai_chunks(model, ChatCompletionChunk, x_groq=None),
+        client=lambda responder: SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=responder))
+        ),
+    )
+
+
+def litellm() -> Provider:
+    from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+    from mirascope.core import litellm
+
+    model = "gpt-4o-mini"
+    return Provider(
+        call=litellm.call,
+        model=model,
+        response=_openai_response(model, ChatCompletion),
+        chunks=_openai_chunks(model, ChatCompletionChunk),
+        client=None,
+        patch="mirascope.core.litellm._utils._setup_call.completion",
+    )
+
+
+def mistral() -> Provider:
+    from mistralai.models.chat_completion import (
+        ChatCompletionResponse,
+        ChatCompletionStreamResponse,
+    )
+
+    from mirascope.core import mistral
+
+    model = "mistral-large-latest"
+    completion = {"id": "id", "created": 0, "model": model}
+
+    def chunk(delta: dict, finish_reason: str | None = None) -> object:
+        return ChatCompletionStreamResponse.model_validate(
+            completion
+            | {
+                "object": "chat.completion.chunk",
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+                "usage": _USAGE if finish_reason else None,
+            }
+        )
+
+    return Provider(
+        call=mistral.call,
+        model=model,
+        response=lambda text: ChatCompletionResponse.model_validate(
+            completion
+            | {
+                "object": "chat.completion",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": text},
+                    }
+                ],
+                "usage": _USAGE,
+            }
+        ),
+        chunks=lambda parts: [
+            *(chunk({"content": part}) for part in parts),
+            chunk({}, "stop"),
+        ],
+        client=lambda responder: SimpleNamespace(
+            chat=responder, chat_stream=responder.stream
+        ),
+    )
+
+
+def vertex() -> Provider:
+    from vertexai.generative_models import GenerationResponse
+
+    from mirascope.core import vertex
+
+    def response(text: str) -> object:
+        return GenerationResponse.from_dict(
+            {
+                "candidates": [
+                    {
+                        "finish_reason": 1,
+                        "content": {"role": "model", "parts": [{"text": text}]},
+                    }
+                ],
+                "usage_metadata": {
+                    "prompt_token_count": 10,
+                    "candidates_token_count": 20,
+                    "total_token_count": 30,
+                },
+            }
+        )
+
+    return Provider(
+        call=vertex.call,
+        model="gemini-1.5-flash",
+        response=response,
+        chunks=lambda parts: [response(part) for part in parts],
+        client=lambda responder: SimpleNamespace(generate_content=responder),
+    )
+
+
+def fake() -> Provider:
+    from mirascope.core import fake
+    from mirascope.core.fake.types import (
+        FakeCompletion,
+        FakeCompletionChunk,
+        FakeUsage,
+    )
+
+    model = "fake-model"
+    usage = FakeUsage(input_tokens=10, output_tokens=20)
+    return Provider(
+        call=fake.call,
+        model=model,
+        response=lambda text: FakeCompletion(
+            id="id", model=model, content=text, usage=usage
+        ),
+        chunks=lambda parts: [
+            *(
+                FakeCompletionChunk(id="id", model=model, content=part)
+                for part in parts
+            ),
+            FakeCompletionChunk(
+                id="id", model=model, finish_reason="stop", usage=usage
+            ),
+        ],
+        client=lambda responder: SimpleNamespace(create=responder),
+    )
+
+
+PROVIDERS: dict[str, Callable[[], Provider]] = {
+    "anthropic": anthropic,
+    "azure": azure,
+    "bedrock": bedrock,
+    "cohere": cohere,
+    "fake": fake,
+    "gemini": gemini,
+    "groq": groq,
+    "litellm": litellm,
+    "mistral": mistral,
+    "openai": openai,
+    "vertex": vertex,
+}
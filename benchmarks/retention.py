@@ -0,0 +1,98 @@
+"""Benchmarks the memory retained by call responses with each `retention` policy.
+
+This runs a multimodal conversation in which every user turn sends an image and the
+history grows by the user and assistant messages of each turn. Every response is
+kept, as an agent loop that keeps its responses would. For each policy, this reports
+the memory retained by each response on top of the conversation history, and the
+time of each turn.
+
+Each provider responds with the synthetic SDK responses in `providers.py`, so the
+numbers only include the work done by mirascope. The images are random bytes, so
+providers that decode images (Gemini and Vertex) aren't supported.
+
+Usage:
+
+```
+python benchmarks/retention.py [--providers openai anthropic] [--turns 50]
+```
+"""
+
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+
+from providers import PROVIDERS, Provider, Responder
+
+from mirascope.core import BaseMessageParam, Messages
+from mirascope.core.base import ImagePart, TextPart
+
+RETENTIONS = ["full", "lean", "minimal"]
+
+
+def describe_image(history: list, image: bytes) -> Messages.Type:
+    return [
+        *history,
+        BaseMessageParam(
+            role="user",
+            content=[
+                TextPart(type="text", text="What changed in this image?"),
+                ImagePart(
+                    type="image", media_type="image/png", image=image, detail=None
+                ),
+            ],
+        ),
+    ]
+
+
+def converse(
+    provider: Provider, retention: str, turns: int, image_size: int
+) -> dict[str, float]:
+    responder = Responder()
+    responder.response = provider.response("The cat moved to the left.")
+    kwargs = {} if provider.client is None else {"client": provider.client(responder)}
+    call = provider.call(provider.model, retention=retention, **kwargs)(describe_image)
+    images = [os.urandom(image_size) for _ in range(turns)]
+
+    gc.collect()
+    tracemalloc.start()
+    history, responses = [], []
+    start = time.perf_counter()
+    for image in images:
+        responses.append(response := call(history, image))
+        history += [response.user_message_param, response.message_param]
+    elapsed = time.perf_counter() - start
+    with_responses = tracemalloc.get_traced_memory()[0]
+    del responses, response  # pyright: ignore [reportPossiblyUnboundVariable]
+    gc.collect()
+    without_responses = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {
+        "memory (KiB)": (with_responses - without_responses) / turns / 1024,
+        "turn (µs)": elapsed / turns * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--providers", nargs="+", default=["openai", "anthropic"])
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--image-size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    print(f"{'provider':<11}{'retention':<11}{'memory (KiB)':>14}{'turn (µs)':>12}")
+    for name in args.providers:
+        provider = PROVIDERS[name]()
+        if provider.patch is not None:
+            continue  # The responder can't be patched in for the whole conversation
+        for retention in RETENTIONS:
+            results = converse(provider, retention, args.turns, args.image_size)
+            print(
+                f"{name:<11}{retention:<11}{results['memory (KiB)']:>14.2f}"
+                f"{results['turn (µs)']:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
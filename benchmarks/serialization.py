@@ -0,0 +1,103 @@
+"""Benchmarks serializing call responses compared to `model_dump_json`.
+
+For each provider, this makes a call that responds with the synthetic SDK response in
+`providers.py` and reports the time to serialize the response with
+`dump_call_response` (with and without compression) and to load it with
+`load_call_response`, and the size of the serialized response, alongside the time and
+size of `model_dump_json`. A provider whose response can't be dumped as JSON reports
+`n/a` for it.
+
+Usage:
+
+```
+python benchmarks/serialization.py [--providers openai anthropic] [--text-size 2000]
+```
+"""
+
+import argparse
+from contextlib import nullcontext
+from unittest.mock import patch
+
+from providers import PROVIDERS, Provider, Responder
+from timing import best
+
+from mirascope.core.base import BaseCallResponse
+from mirascope.core.base.serialization import dump_call_response, load_call_response
+
+
+def format_book(title: str, author: str) -> str:
+    """Returns the title and author of a book nicely formatted."""
+    return f"{title} by {author}"
+
+
+def recommend_book(genre: str) -> str:
+    return f"Recommend a {genre} book"
+
+
+def call_response(provider: Provider, text: str) -> BaseCallResponse:
+    responder = Responder()
+    responder.response = provider.response(text)
+    kwargs = {} if provider.client is None else {"client": provider.client(responder)}
+    call = provider.call(provider.model, tools=[format_book], **kwargs)
+    context = nullcontext() if provider.patch is None else patch(provider.patch)
+    with context as mock_create:
+        if mock_create is not None:
+            mock_create.side_effect = responder
+        return call(recommend_book)("fantasy")
+
+
+def benchmark(
+    provider: Provider, text_size: int, number: int, repeat: int
+) -> dict[str, float | None]:
+    response = call_response(provider, "The Name of the Wind. " * (text_size // 22))
+    data = dump_call_response(response)
+    compressed = dump_call_response(response, compress=True)
+    assert load_call_response(data, tools=[format_book]).content == response.content
+    try:
+        json_size = len(response.model_dump_json())
+        json_dump = best(response.model_dump_json, number, repeat)
+    except Exception:
+        json_size = json_dump = None
+    return {
+        "json dump (µs)": json_dump,
+        "dump (µs)": best(lambda: dump_call_response(response), number, repeat),
+        "compressed dump (µs)": best(
+            lambda: dump_call_response(response, compress=True), number, repeat
+        ),
+        "load (µs)": best(lambda: load_call_response(data), number, repeat),
+        "compressed load (µs)": best(
+            lambda: load_call_response(compressed), number, repeat
+        ),
+        "json size (B)": json_size,
+        "size (B)": len(data),
+        "compressed size (B)": len(compressed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--providers", nargs="+", default=list(PROVIDERS))
+    parser.add_argument("--text-size", type=int, default=2000)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {
+        name: benchmark(PROVIDERS[name](), args.text_size, args.number, args.repeat)
+        for name in args.providers
+    }
+    metrics = list(next(iter(results.values())))
+    width = max(len(metric) for metric in metrics) + 2
+    print(f"{'metric':<{width}}" + "".join(f"{name:>11}" for name in results))
+    for metric in metrics:
+        print(
+            f"{metric:<{width}}"
+            + "".join(
+                f"{'n/a':>11}" if value is None else f"{value:>11.1f}"
+                for value in (values[metric] for values in results.values())
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
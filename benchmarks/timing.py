@@ -0,0 +1,10 @@
+"""Timing helpers shared by the benchmarks."""
+
+import timeit
+from collections.abc import Callable
+
+
+def best(statement: Callable[[], object], number: int, repeat: int) -> float:
+    """Returns the fastest time of `statement` in microseconds."""
+    seconds = min(timeit.repeat(statement, number=number, repeat=repeat))
+    return seconds / number * 1e6
@@ -0,0 +1,28 @@
+from mirascope.core import Messages, anthropic
+from mirascope.core.anthropic import AnthropicMessageParam
+
+
+@anthropic.call(
+    "claude-3-5-sonnet-20240620",
+    call_params={
+        "max_tokens": 1024,
+        "auto_cache_control": True,
+        "extra_headers": {"anthropic-beta": "prompt-caching-2024-07-31"},
+    },
+)
+def chat(history: list[AnthropicMessageParam], query: str) -> Messages.Type:
+    return [
+        Messages.System("You are a librarian. <very long, stable instructions>"),
+        *history,
+        Messages.User(query),
+    ]
+
+
+history: list[AnthropicMessageParam] = []
+for query in ["Recommend a fantasy book", "What about sci-fi?"]:
+    response = chat(history, query)
+    print(response.content)
+    print(response.cache_creation_input_tokens, response.cache_read_input_tokens)
+    if response.user_message_param:
+        history.append(response.user_message_param)
+    history.append(response.message_param)
@@ -2,7 +2,7 @@
 
 from contextlib import suppress
 
-from . import base
+from . import base, fake
 from .base import (
     BaseDynamicConfig,
     BaseMessageParam,
@@ -12,6 +12,9 @@ from .base import (
     FromCallArgs,
     Messages,
     ResponseModelConfigDict,
+    StreamConfig,
+    call_tools,
+    call_tools_async,
     merge_decorators,
     metadata,
     prompt_template,
@@ -54,7 +57,10 @@ __all__ = [
     "BasePrompt",
     "BaseTool",
     "BaseToolKit",
+    "call_tools",
+    "call_tools_async",
     "cohere",
+    "fake",
     "FromCallArgs",
     "gemini",
     "groq",
@@ -66,6 +72,7 @@ __all__ = [
     "openai",
     "prompt_template",
     "ResponseModelConfigDict",
+    "StreamConfig",
     "toolkit_tool",
     "vertex",
 ]
@@ -7,6 +7,7 @@ from anthropic.types import MessageParam
 from ..base import BaseMessageParam
 from ._call import anthropic_call
 from ._call import anthropic_call as call
+from .batch import AnthropicBatch
 from .call_params import AnthropicCallParams
 from .call_response import AnthropicCallResponse
 from .call_response_chunk import AnthropicCallResponseChunk
@@ -20,6 +21,7 @@ __all__ = [
     "call",
     "AsyncAnthropicDynamicConfig",
     "AnthropicDynamicConfig",
+    "AnthropicBatch",
     "AnthropicCallParams",
     "AnthropicCallResponse",
     "AnthropicCallResponseChunk",
@@ -1,18 +1,22 @@
 """Anthropic utilities for decorator factories."""
 
+from ._auto_cache_control import MAX_CACHE_BREAKPOINTS, apply_auto_cache_control
 from ._calculate_cost import calculate_cost
 from ._convert_common_call_params import convert_common_call_params
-from ._convert_message_params import convert_message_params
+from ._convert_message_params import convert_message_params, convert_text_message
 from ._get_json_output import get_json_output
 from ._handle_stream import handle_stream, handle_stream_async
 from ._setup_call import setup_call
 
 __all__ = [
+    "apply_auto_cache_control",
     "calculate_cost",
     "convert_common_call_params",
     "convert_message_params",
+    "convert_text_message",
     "get_json_output",
     "handle_stream",
     "handle_stream_async",
+    "MAX_CACHE_BREAKPOINTS",
     "setup_call",
 ]
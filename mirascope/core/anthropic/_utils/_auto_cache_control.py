@@ -0,0 +1,134 @@
+"""Utility for automatically placing Anthropic prompt caching breakpoints."""
+
+import json
+import threading
+from collections.abc import Callable
+from typing import Any, cast
+from weakref import WeakKeyDictionary
+
+from anthropic.types import MessageParam, ToolParam
+
+from .._call_kwargs import AnthropicCallKwargs
+
+MAX_CACHE_BREAKPOINTS = 4
+"""The maximum number of `cache_control` breakpoints Anthropic allows per request."""
+
+_EPHEMERAL = {"type": "ephemeral"}
+
+_previous_fingerprints: WeakKeyDictionary[Callable, list[int]] = WeakKeyDictionary()
+_previous_fingerprints_lock = threading.Lock()
+
+
+def _fingerprint(value: Any) -> int:  # noqa: ANN401
+    """Returns a stable (per-process) fingerprint of a request segment."""
+    return hash(json.dumps(value, sort_keys=True, default=str))
+
+
+def _has_cache_control(value: Any) -> bool:  # noqa: ANN401
+    """Returns whether the segment already contains a user-provided breakpoint."""
+    if isinstance(value, str):
+        return False
+    if isinstance(value, dict):
+        return "cache_control" in value or _has_cache_control(value.get("content", ""))
+    if isinstance(value, list | tuple):
+        return any(_has_cache_control(block) for block in value)
+    return getattr(value, "cache_control", None) is not None
+
+
+def _with_cache_control(content: Any) -> list[Any] | None:  # noqa: ANN401
+    """Returns a copy of `content` as blocks with a breakpoint on the last block."""
+    if isinstance(content, str):
+        return [{"type": "text", "text": content, "cache_control": _EPHEMERAL}]
+    blocks = list(content or [])
+    if not blocks:
+        return None
+    last = blocks[-1]
+    last = dict(last) if isinstance(last, dict) else last.model_dump()
+    blocks[-1] = last | {"cache_control": _EPHEMERAL}
+    return blocks
+
+
+def _common_prefix_length(previous: list[int], current: list[int]) -> int:
+    length = 0
+    for previous_fingerprint, current_fingerprint in zip(
+        previous, current, strict=False
+    ):
+        if previous_fingerprint != current_fingerprint:
+            break
+        length += 1
+    return length
+
+
+def apply_auto_cache_control(
+    fn: Callable, call_kwargs: AnthropicCallKwargs
+) -> list[MessageParam]:
+    """Inserts `cache_control` breakpoints on the prefix that is stable across calls.
+
+    Anthropic caches the request prefix in the order tools -> system -> messages. We
+    fingerprint each of these segments and compare them against the previous call of
+    the same function. The longest common prefix is considered stable, and breakpoints
+    are placed (in order of priority) at the end of the stable messages, at the end of
+    the current messages when the conversation is growing, at the end of the system
+    prompt, and at the end of the tools. Any breakpoints already placed by the user
+    count against Anthropic's limit of `MAX_CACHE_BREAKPOINTS`.
+
+    Messages provided by the user are never mutated -- segments that receive a
+    breakpoint are copied before modification.
+
+    Args:
+        fn: The function whose successive calls are compared.
+        call_kwargs: The finalized call keyword arguments, which are updated in place.
+
+    Returns:
+        The list of messages with any breakpoints applied.
+    """
+    tools = call_kwargs.get("tools", None) or []
+    system = call_kwargs.get("system", None)
+    messages = call_kwargs["messages"]
+
+    segments: list[Any] = [*tools]
+    if system:
+        segments.append(system)
+    segments.extend(messages)
+    fingerprints = [_fingerprint(segment) for segment in segments]
+
+    with _previous_fingerprints_lock:
+        previous = _previous_fingerprints.get(fn, [])
+        _previous_fingerprints[fn] = fingerprints
+
+    stable = _common_prefix_length(previous, fingerprints)
+    limit = MAX_CACHE_BREAKPOINTS - sum(
+        _has_cache_control(segment) for segment in segments
+    )
+    if not stable or limit <= 0:
+        return messages
+
+    num_prefix_segments = len(tools) + (1 if system else 0)
+    candidates: list[int] = []
+    if stable > num_prefix_segments:
+        candidates.append(stable - 1)
+        if stable == len(previous) and len(segments) > stable:
+            candidates.append(len(segments) - 1)
+    if system and stable >= num_prefix_segments:
+        candidates.append(num_prefix_segments - 1)
+    if tools and stable >= len(tools):
+        candidates.append(len(tools) - 1)
+
+    for index in list(dict.fromkeys(candidates))[:limit]:
+        if index < len(tools):
+            tools = list(tools)
+            tools[index] = cast(
+                ToolParam, {**tools[index], "cache_control": _EPHEMERAL}
+            )
+            call_kwargs["tools"] = tools
+        elif index < num_prefix_segments:
+            if (blocks := _with_cache_control(system)) is not None:
+                call_kwargs["system"] = blocks
+        else:
+            message = messages[index - num_prefix_segments]
+            if (blocks := _with_cache_control(message["content"])) is not None:
+                messages[index - num_prefix_segments] = {
+                    "role": message["role"],
+                    "content": blocks,
+                }
+    return messages
@@ -1,6 +1,7 @@
 """Utility for converting `BaseMessageParam` to `MessageParam`"""
 
 import base64
+from typing import cast
 
 from anthropic.types import MessageParam
 
@@ -70,3 +71,8 @@ def convert_message_params(
                 {"role": message_param.role, "content": converted_content}
             )
     return converted_message_params
+
+
+def convert_text_message(role: str, text: str) -> list[MessageParam]:
+    """Converts a message with only text into Anthropic message parameters."""
+    return [cast(MessageParam, {"role": role, "content": text})]
@@ -5,30 +5,36 @@ from collections.abc import AsyncGenerator, Generator
 import jiter
 from anthropic.types import MessageStreamEvent, ToolUseBlock
 
+from ...base._utils import PartialToolConstructor, StreamedJsonObject
 from ..call_response_chunk import AnthropicCallResponseChunk
 from ..tool import AnthropicTool
 
 
 def _handle_chunk(
-    buffer: str,
+    buffer: StreamedJsonObject,
     chunk: MessageStreamEvent,
     current_tool_call: ToolUseBlock,
     current_tool_type: type[AnthropicTool] | None,
     tool_types: list[type[AnthropicTool]] | None,
+    construct_partial_tool: PartialToolConstructor[AnthropicTool] | None = None,
 ) -> tuple[
-    str,
+    StreamedJsonObject,
     AnthropicTool | None,
     ToolUseBlock,
     type[AnthropicTool] | None,
 ]:
-    """Handles a chunk of the stream."""
+    """Handles a chunk of the stream.
+
+    When `construct_partial_tool` is provided, a partial tool is also returned for each
+    input JSON delta of a tool call.
+    """
     if not tool_types:
         return buffer, None, current_tool_call, current_tool_type
 
-    if chunk.type == "content_block_stop" and current_tool_type and buffer:
-        current_tool_call.input = jiter.from_json(buffer.encode())
+    if chunk.type == "content_block_stop" and current_tool_type and buffer.text:
+        current_tool_call.input = jiter.from_json(buffer.text.encode())
         return (
-            "",
+            StreamedJsonObject(),
             current_tool_type.from_tool_call(current_tool_call),
             ToolUseBlock(id="", input={}, name="", type="tool_use"),
             None,
@@ -48,7 +54,7 @@ def _handle_chunk(
                 f"Unknown tool type in stream: {content_block.name}."
             )  # pragma: no cover
         return (
-            "",
+            StreamedJsonObject(partial=construct_partial_tool is not None),
             None,
             ToolUseBlock(
                 id=content_block.id, input={}, name=content_block.name, type="tool_use"
@@ -57,7 +63,21 @@ def _handle_chunk(
         )
 
     if chunk.type == "content_block_delta" and chunk.delta.type == "input_json_delta":
-        buffer += chunk.delta.partial_json
+        buffer.feed(delta := chunk.delta.partial_json)
+        if construct_partial_tool and current_tool_type and delta:
+            arguments = buffer.value or {}
+            partial_tool = construct_partial_tool(
+                current_tool_type,
+                arguments,
+                ToolUseBlock(
+                    id=current_tool_call.id,
+                    input=arguments,
+                    name=current_tool_call.name,
+                    type="tool_use",
+                ),
+                delta,
+            )
+            return buffer, partial_tool, current_tool_call, current_tool_type
 
     return buffer, None, current_tool_call, current_tool_type
 
@@ -65,13 +85,22 @@ def _handle_chunk(
 def handle_stream(
     stream: Generator[MessageStreamEvent, None, None],
     tool_types: list[type[AnthropicTool]] | None,
+    partial_tools: bool = False,
 ) -> Generator[tuple[AnthropicCallResponseChunk, AnthropicTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
     current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
-    current_tool_type, buffer = None, ""
+    current_tool_type, buffer = None, StreamedJsonObject()
+    construct_partial_tool = (
+        PartialToolConstructor[AnthropicTool]() if partial_tools else None
+    )
     for chunk in stream:
         buffer, tool, current_tool_call, current_tool_type = _handle_chunk(
-            buffer, chunk, current_tool_call, current_tool_type, tool_types
+            buffer,
+            chunk,
+            current_tool_call,
+            current_tool_type,
+            tool_types,
+            construct_partial_tool,
         )
         yield AnthropicCallResponseChunk(chunk=chunk), tool
 
@@ -79,11 +108,20 @@ def handle_stream(
 async def handle_stream_async(
     stream: AsyncGenerator[MessageStreamEvent, None],
     tool_types: list[type[AnthropicTool]] | None,
+    partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[AnthropicCallResponseChunk, AnthropicTool | None], None]:
     current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
-    current_tool_type, buffer = None, ""
+    current_tool_type, buffer = None, StreamedJsonObject()
+    construct_partial_tool = (
+        PartialToolConstructor[AnthropicTool]() if partial_tools else None
+    )
     async for chunk in stream:
         buffer, tool, current_tool_call, current_tool_type = _handle_chunk(
-            buffer, chunk, current_tool_call, current_tool_type, tool_types
+            buffer,
+            chunk,
+            current_tool_call,
+            current_tool_type,
+            tool_types,
+            construct_partial_tool,
         )
         yield AnthropicCallResponseChunk(chunk=chunk), tool
@@ -15,13 +15,20 @@ from anthropic import (
 from anthropic.types import Message, MessageParam, MessageStreamEvent
 
 from ...base import BaseMessageParam, BaseTool, _utils
-from ...base._utils import AsyncCreateFn, CreateFn
+from ...base._utils import (
+    AsyncCreateFn,
+    CreateFn,
+    MessagesOnlyClient,
+    get_async_create_fn,
+    get_create_fn,
+)
 from .._call_kwargs import AnthropicCallKwargs
 from ..call_params import AnthropicCallParams
 from ..dynamic_config import AnthropicDynamicConfig, AsyncAnthropicDynamicConfig
 from ..tool import AnthropicTool
+from ._auto_cache_control import apply_auto_cache_control
 from ._convert_common_call_params import convert_common_call_params
-from ._convert_message_params import convert_message_params
+from ._convert_message_params import convert_message_params, convert_text_message
 
 
 @overload
@@ -87,7 +94,7 @@ def setup_call(
     extract: bool,
     stream: bool,
 ) -> tuple[
-    Callable[..., Message | Awaitable[Message]],
+    CreateFn[Message, MessageStreamEvent] | AsyncCreateFn[Message, MessageStreamEvent],
     str | None,
     list[MessageParam],
     list[type[AnthropicTool]] | None,
@@ -101,6 +108,7 @@ def setup_call(
         AnthropicTool,
         call_params,
         convert_common_call_params,
+        convert_text_message=convert_text_message,
     )
     call_kwargs = cast(AnthropicCallKwargs, base_call_kwargs)
     messages = cast(list[BaseMessageParam | MessageParam], messages)
@@ -128,8 +136,18 @@ def setup_call(
         "messages": messages,
         "max_tokens": call_kwargs["max_tokens"],
     }
+    if call_kwargs.pop("auto_cache_control", False) and not isinstance(
+        client, MessagesOnlyClient
+    ):
+        messages = apply_auto_cache_control(fn, call_kwargs)
 
     if client is None:
         client = AsyncAnthropic() if inspect.iscoroutinefunction(fn) else Anthropic()
-    create = client.messages.create
+    create = (
+        get_async_create_fn(client.messages.create)
+        if isinstance(
+            client, AsyncAnthropic | AsyncAnthropicBedrock | AsyncAnthropicVertex
+        )
+        else get_create_fn(client.messages.create)
+    )
     return create, prompt_template, messages, tool_types, call_kwargs
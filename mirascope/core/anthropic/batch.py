@@ -0,0 +1,78 @@
+"""The `AnthropicBatch` class for running calls through the Message Batches API.
+
+usage docs: learn/calls.md#batch-processing
+"""
+
+from typing import Any, TypeVar
+
+from anthropic import Anthropic
+from anthropic.types import Message
+
+from ..base.batch import BaseBatch, BatchRequestError
+
+_ResultT = TypeVar("_ResultT")
+
+
+class AnthropicBatch(BaseBatch[Anthropic, _ResultT]):
+    """A batch of Anthropic calls to run through the Message Batches API.
+
+    Each result is parsed into the output of the call, e.g. an
+    `AnthropicCallResponse` or an instance of its `response_model`.
+
+    Example:
+
+    ```python
+    from mirascope.core import anthropic
+
+
+    @anthropic.call("claude-3-5-sonnet-20240620")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    batch = anthropic.AnthropicBatch(recommend_book)
+    for genre in ["fantasy", "mystery", "horror"]:
+        batch.add(genre, custom_id=genre)
+    results = batch.wait()
+    print(results["fantasy"])
+    ```
+    """
+
+    def _default_client(self) -> Anthropic:
+        return Anthropic()
+
+    @property
+    def _batches(self) -> Any:  # noqa: ANN401
+        # The Message Batches API moved out of beta in later SDK versions
+        if (batches := getattr(self.client.messages, "batches", None)) is not None:
+            return batches
+        return self.client.beta.messages.batches
+
+    def _submit(self, requests: dict[str, dict[str, Any]]) -> str:
+        return self._batches.create(
+            requests=[
+                {"custom_id": custom_id, "params": call_kwargs}
+                for custom_id, call_kwargs in requests.items()
+            ]
+        ).id
+
+    def _retrieve_status(self) -> tuple[str, bool]:
+        batch = self._batches.retrieve(self.id)
+        return batch.processing_status, batch.processing_status == "ended"
+
+    def _retrieve_results(self) -> dict[str, Any]:
+        results: dict[str, Any] = {}
+        for response in self._batches.results(self.id):
+            custom_id, result = response.custom_id, response.result
+            if result.type == "succeeded":
+                results[custom_id] = Message.model_validate(result.message.model_dump())
+            elif result.type == "errored":
+                error = getattr(result.error, "error", result.error)
+                results[custom_id] = BatchRequestError(
+                    custom_id, getattr(error, "message", str(error))
+                )
+            else:
+                results[custom_id] = BatchRequestError(
+                    custom_id, f"Request {result.type}."
+                )
+        return results
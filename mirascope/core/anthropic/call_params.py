@@ -19,6 +19,10 @@ class AnthropicCallParams(BaseCallParams):
     [Anthropic API Reference](https://docs.anthropic.com/en/api/messages)
 
     Attributes:
+        auto_cache_control: Whether to automatically insert `cache_control`
+            breakpoints on the request prefix (tools, system prompt, earlier messages)
+            that is stable across successive calls of the same function. This is a
+            Mirascope-specific parameter and is not sent to the API.
         max_tokens: ...
         tool_choice: ...
         metadata: ...
@@ -29,6 +33,7 @@ class AnthropicCallParams(BaseCallParams):
         timeout: ...
     """
 
+    auto_cache_control: NotRequired[bool]
     extra_headers: NotRequired[dict[str, str] | None]
     max_tokens: int
     tool_choice: NotRequired[ToolChoice | None]
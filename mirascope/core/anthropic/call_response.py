@@ -91,10 +91,26 @@ class AnthropicCallResponse(
         """Returns the number of output tokens."""
         return self.usage.output_tokens
 
+    @property
+    def cache_creation_input_tokens(self) -> int | None:
+        """Returns the number of input tokens written to the prompt cache."""
+        return getattr(self.usage, "cache_creation_input_tokens", None)
+
+    @property
+    def cache_read_input_tokens(self) -> int | None:
+        """Returns the number of input tokens read from the prompt cache."""
+        return getattr(self.usage, "cache_read_input_tokens", None)
+
     @property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
-        return calculate_cost(self.input_tokens, self.output_tokens, self.model)
+        return calculate_cost(
+            self.input_tokens,
+            self.output_tokens,
+            self.model,
+            self.cache_read_input_tokens,
+            self.cache_creation_input_tokens,
+        )
 
     @computed_field
     @property
@@ -101,3 +101,13 @@ class AnthropicCallResponseChunk(
         if self.usage:
             return self.usage.output_tokens
         return None
+
+    @property
+    def cache_creation_input_tokens(self) -> int | None:
+        """Returns the number of input tokens written to the prompt cache."""
+        return getattr(self.usage, "cache_creation_input_tokens", None)
+
+    @property
+    def cache_read_input_tokens(self) -> int | None:
+        """Returns the number of input tokens read from the prompt cache."""
+        return getattr(self.usage, "cache_read_input_tokens", None)
@@ -64,10 +64,29 @@ class AnthropicStream(
 
     _provider = "anthropic"
 
+    cache_creation_input_tokens: int | None = None
+    cache_read_input_tokens: int | None = None
+
+    def _update_properties(self, chunk: AnthropicCallResponseChunk) -> None:
+        """Updates the properties of the stream, including prompt cache usage."""
+        super()._update_properties(chunk)
+        if (tokens := chunk.cache_creation_input_tokens) is not None:
+            self.cache_creation_input_tokens = (
+                self.cache_creation_input_tokens or 0
+            ) + tokens
+        if (tokens := chunk.cache_read_input_tokens) is not None:
+            self.cache_read_input_tokens = (self.cache_read_input_tokens or 0) + tokens
+
     @property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
-        return calculate_cost(self.input_tokens, self.output_tokens, self.model)
+        return calculate_cost(
+            self.input_tokens,
+            self.output_tokens,
+            self.model,
+            self.cache_read_input_tokens,
+            self.cache_creation_input_tokens,
+        )
 
     def _construct_message_param(
         self, tool_calls: list[ToolUseBlock] | None = None, content: str | None = None
@@ -104,6 +123,10 @@ class AnthropicStream(
             input_tokens=int(self.input_tokens or 0),
             output_tokens=int(self.output_tokens or 0),
         )
+        if self.cache_creation_input_tokens is not None:
+            usage.cache_creation_input_tokens = self.cache_creation_input_tokens  # pyright: ignore [reportAttributeAccessIssue]
+        if self.cache_read_input_tokens is not None:
+            usage.cache_read_input_tokens = self.cache_read_input_tokens  # pyright: ignore [reportAttributeAccessIssue]
 
         content_blocks: list[ContentBlock] = []
 
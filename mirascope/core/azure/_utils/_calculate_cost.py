@@ -1,8 +1,16 @@
 """Calculate the cost of a completion using the Azure API."""
 
+from ...base.pricing import pricing_registry
+
 
 def calculate_cost(
-    input_tokens: int | float | None, output_tokens: int | float | None, model: str
+    input_tokens: int | float | None,
+    output_tokens: int | float | None,
+    model: str,
 ) -> float | None:
-    """Calculate the cost of a completion using the Azure API."""
-    return None
+    """Calculate the cost of a completion using the Azure API.
+
+    The prices are looked up in `mirascope.core.base.pricing.pricing_registry`, which
+    doesn't include any models for this provider by default.
+    """
+    return pricing_registry.calculate_cost("azure", model, input_tokens, output_tokens)
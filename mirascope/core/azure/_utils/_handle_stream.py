@@ -1,6 +1,5 @@
 """Handles the stream of completion chunks."""
 
-import copy
 from collections.abc import AsyncGenerator, Generator
 
 from azure.ai.inference.models import (
@@ -9,120 +8,156 @@ from azure.ai.inference.models import (
     StreamingChatCompletionsUpdate,
 )
 
+from ...base._utils import PartialToolConstructor, StreamedJsonObject
 from ..call_response_chunk import AzureCallResponseChunk
 from ..tool import AzureTool
 
+_StreamedToolCall = tuple[str, str, type[AzureTool], StreamedJsonObject]
+
+
+def _construct_tool_call(
+    streamed_tool_call: _StreamedToolCall,
+) -> ChatCompletionsToolCall:
+    """Constructs the tool call from a (possibly incomplete) streamed tool call."""
+    id, name, _, arguments = streamed_tool_call
+    return ChatCompletionsToolCall(
+        id=id, function=FunctionCall(arguments=arguments.text, name=name)
+    )
+
+
+def _construct_tool(streamed_tool_call: _StreamedToolCall) -> AzureTool:
+    """Constructs the tool from a (possibly incomplete) streamed tool call."""
+    tool_type = streamed_tool_call[2]
+    return tool_type.from_tool_call(_construct_tool_call(streamed_tool_call))
+
+
+def _flush_tools(
+    current_tool_calls: dict[int, _StreamedToolCall],
+) -> list[AzureTool]:
+    """Constructs any remaining tools in the order in which they were requested."""
+    tools = [_construct_tool(current_tool_calls[i]) for i in sorted(current_tool_calls)]
+    current_tool_calls.clear()
+    return tools
+
 
 def _handle_chunk(
     chunk: StreamingChatCompletionsUpdate,
-    current_tool_call: ChatCompletionsToolCall,
-    current_tool_type: type[AzureTool] | None,
-    tool_types: list[type[AzureTool]] | None,
-) -> tuple[
-    AzureTool | None,
-    ChatCompletionsToolCall,
-    type[AzureTool] | None,
-]:
-    """Handles a chunk of the stream."""
-    if (
-        not tool_types
-        or not chunk.choices
-        or not (tool_calls := chunk.choices[0].delta.tool_calls)
-    ):
-        return None, current_tool_call, current_tool_type
-
-    tool_call = tool_calls[0]
-    # Reset on new tool
-    if tool_call.id and tool_call.function is not None:
-        previous_tool_call = copy.deepcopy(current_tool_call)
-        previous_tool_type = current_tool_type
-        current_tool_call = ChatCompletionsToolCall(
-            id=tool_call.id,
-            function=FunctionCall(
-                arguments="",
-                name=tool_call.function.name if tool_call.function.name else "",
-            ),
-        )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
-        if current_tool_type is None:
-            raise RuntimeError(
-                f"Unknown tool type in stream: {tool_call.function.name}"
-            )  # pragma: no cover
+    current_tool_calls: dict[int, _StreamedToolCall],
+    tool_types: list[type[AzureTool]],
+    construct_partial_tool: PartialToolConstructor[AzureTool] | None,
+) -> list[AzureTool]:
+    """Handles a chunk of the stream, returning any tools completed by the chunk.
+
+    Tool calls are tracked by their `index` when the raw payload includes one so that
+    interleaved deltas for parallel tool calls are accumulated correctly. Otherwise a
+    delta with a new tool call id starts a new tool call. Each tool is constructed as
+    soon as its arguments form a complete JSON object.
+
+    When `construct_partial_tool` is provided, a partial tool is also returned for each
+    arguments fragment that doesn't complete its tool call.
+    """
+    tools = []
+    for tool_call in chunk.choices[0].delta.tool_calls or []:
+        latest_index = max(current_tool_calls, default=-1)
+        index = tool_call.get("index", None)
+        if index is None:
+            latest_tool_call = current_tool_calls.get(latest_index)
+            is_new = tool_call.id and (
+                latest_tool_call is None or latest_tool_call[0] != tool_call.id
+            )
+            index = latest_index + 1 if is_new else latest_index
+        # Start tracking a new tool
         if (
-            previous_tool_call.id
-            and previous_tool_call.function.arguments
-            and previous_tool_type is not None
+            tool_call.id
+            and tool_call.function is not None
+            and (
+                index not in current_tool_calls
+                or current_tool_calls[index][0] != tool_call.id
+            )
         ):
-            return (
-                previous_tool_type.from_tool_call(previous_tool_call),
-                current_tool_call,
-                current_tool_type,
+            name = tool_call.function.name or ""
+            for tool_type in tool_types:
+                if tool_type._name() == name:
+                    break
+            else:
+                raise RuntimeError(
+                    f"Unknown tool type in stream: {name}"
+                )  # pragma: no cover
+            current_tool_calls[index] = (
+                tool_call.id,
+                name,
+                tool_type,
+                StreamedJsonObject(partial=construct_partial_tool is not None),
             )
 
-    # Update arguments with each chunk
-    if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
-
-    return None, current_tool_call, current_tool_type
+        # Update arguments with each chunk
+        if (
+            index not in current_tool_calls
+            or not tool_call.function
+            or not tool_call.function.arguments
+        ):
+            continue
+        delta = tool_call.function.arguments
+        streamed_tool_call = current_tool_calls[index]
+        if streamed_tool_call[3].feed(delta):
+            tools.append(_construct_tool(current_tool_calls.pop(index)))
+        elif construct_partial_tool and (
+            partial_tool := construct_partial_tool(
+                streamed_tool_call[2],
+                streamed_tool_call[3].value,
+                _construct_tool_call(streamed_tool_call),
+                delta,
+            )
+        ):
+            tools.append(partial_tool)
+    return tools
 
 
 def handle_stream(
     stream: Generator[StreamingChatCompletionsUpdate, None, None],
     tool_types: list[type[AzureTool]] | None,
+    partial_tools: bool = False,
 ) -> Generator[tuple[AzureCallResponseChunk, AzureTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
-    current_tool_call = ChatCompletionsToolCall(
-        id="", function=FunctionCall(arguments="", name="")
+    current_tool_calls: dict[int, _StreamedToolCall] = {}
+    construct_partial_tool = (
+        PartialToolConstructor[AzureTool]() if partial_tools else None
     )
-    current_tool_type = None
     for chunk in stream:
+        call_response_chunk = AzureCallResponseChunk(chunk=chunk)
         if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
-            if current_tool_type:
-                yield (
-                    AzureCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
-                )
-                current_tool_type = None
-            else:
-                yield AzureCallResponseChunk(chunk=chunk), None
-        tool, current_tool_call, current_tool_type = _handle_chunk(
-            chunk,
-            current_tool_call,
-            current_tool_type,
-            tool_types,
-        )
-        if tool is not None:
-            yield AzureCallResponseChunk(chunk=chunk), tool
+            tools = _flush_tools(current_tool_calls)
+            if not tools:
+                yield call_response_chunk, None
+            for tool in tools:
+                yield call_response_chunk, tool
+            continue
+        for tool in _handle_chunk(
+            chunk, current_tool_calls, tool_types, construct_partial_tool
+        ):
+            yield call_response_chunk, tool
 
 
 async def handle_stream_async(
     stream: AsyncGenerator[StreamingChatCompletionsUpdate, None],
     tool_types: list[type[AzureTool]] | None,
+    partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[AzureCallResponseChunk, AzureTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
-    current_tool_call = ChatCompletionsToolCall(
-        id="", function=FunctionCall(arguments="", name="")
+    current_tool_calls: dict[int, _StreamedToolCall] = {}
+    construct_partial_tool = (
+        PartialToolConstructor[AzureTool]() if partial_tools else None
     )
-    current_tool_type = None
     async for chunk in stream:
-        if not tool_types or not chunk.choices[0].delta.tool_calls:
-            if current_tool_type:
-                yield (
-                    AzureCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
-                )
-                current_tool_type = None
-            else:
-                yield AzureCallResponseChunk(chunk=chunk), None
-        tool, current_tool_call, current_tool_type = _handle_chunk(
-            chunk,
-            current_tool_call,
-            current_tool_type,
-            tool_types,
-        )
-        if tool is not None:
-            yield AzureCallResponseChunk(chunk=chunk), tool
+        call_response_chunk = AzureCallResponseChunk(chunk=chunk)
+        if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
+            tools = _flush_tools(current_tool_calls)
+            if not tools:
+                yield call_response_chunk, None
+            for tool in tools:
+                yield call_response_chunk, tool
+            continue
+        for tool in _handle_chunk(
+            chunk, current_tool_calls, tool_types, construct_partial_tool
+        ):
+            yield call_response_chunk, tool
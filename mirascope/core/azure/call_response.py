@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from typing import Any
+
 from azure.ai.inference.models import (
     AssistantMessage,
     ChatCompletions,
@@ -59,6 +61,16 @@ class AzureCallResponse(
 
     _provider = "azure"
 
+    @classmethod
+    def _dump_response(cls, response: ChatCompletions) -> dict[str, Any]:
+        """Returns the `ChatCompletions` as JSON data."""
+        return response.as_dict()
+
+    @classmethod
+    def _load_response(cls, data: dict[str, Any]) -> ChatCompletions:
+        """Returns the `ChatCompletions` rebuilt from its JSON data."""
+        return ChatCompletions(data)
+
     @property
     def content(self) -> str:
         """Returns the content of the chat completion for the 0th choice."""
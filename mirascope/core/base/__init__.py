@@ -7,6 +7,7 @@ from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams, CommonCallParams
 from .call_response import BaseCallResponse
 from .call_response_chunk import BaseCallResponseChunk
+from .call_tools import call_tools, call_tools_async
 from .dynamic_config import BaseDynamicConfig
 from .from_call_args import FromCallArgs
 from .merge_decorators import merge_decorators
@@ -23,6 +24,7 @@ from .metadata import Metadata
 from .prompt import BasePrompt, metadata, prompt_template
 from .response_model_config_dict import ResponseModelConfigDict
 from .stream import BaseStream
+from .stream_config import StreamConfig
 from .structured_stream import BaseStructuredStream
 from .tool import BaseTool, GenerateJsonSchemaNoTitles, ToolConfig
 from .toolkit import BaseToolKit, toolkit_tool
@@ -45,6 +47,8 @@ __all__ = [
     "BaseType",
     "CacheControlPart",
     "call_factory",
+    "call_tools",
+    "call_tools_async",
     "CommonCallParams",
     "FromCallArgs",
     "GenerateJsonSchemaNoTitles",
@@ -55,6 +59,7 @@ __all__ = [
     "Metadata",
     "prompt_template",
     "ResponseModelConfigDict",
+    "StreamConfig",
     "TextPart",
     "ToolConfig",
     "toolkit_tool",
@@ -24,10 +24,12 @@ from ._utils._protocols import (
     SyncLLMFunctionDecorator,
 )
 from .call_params import BaseCallParams
-from .call_response import BaseCallResponse
+from .call_response import BaseCallResponse, ResponseRetention
 from .call_response_chunk import BaseCallResponseChunk
+from .client_pool import ClientPool
 from .dynamic_config import BaseDynamicConfig
 from .stream import BaseStream, stream_factory
+from .stream_config import StreamConfig
 from .structured_stream import structured_stream_factory
 from .tool import BaseTool
 
@@ -123,7 +125,7 @@ def call_factory(  # noqa: ANN202
     def base_call(
         model: str,
         *,
-        stream: bool = False,
+        stream: bool | StreamConfig = False,
         tools: list[type[BaseTool] | Callable] | None = None,
         response_model: type[_ResponseModelT] | None = None,
         output_parser: Callable[[_BaseCallResponseT], _ParsedOutputT]
@@ -134,8 +136,11 @@ def call_factory(  # noqa: ANN202
         client: _SameSyncAndAsyncClientT
         | _AsyncBaseClientT
         | _SyncBaseClientT
+        | ClientPool
         | None = None,
         call_params: BaseCallParams | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> (
         AsyncLLMFunctionDecorator[
             _AsyncBaseDynamicConfigT,
@@ -168,9 +173,16 @@ def call_factory(  # noqa: ANN202
             | AsyncIterable[_ResponseModelT],
         ]
     ):
+        partial_tools = False
+        if isinstance(stream, dict):
+            partial_tools, stream = stream.get("partial_tools", False), True
+
         if stream and output_parser:
             raise ValueError("Cannot use `output_parser` with `stream=True`.")
 
+        if stream and retention != "full":
+            raise ValueError("Cannot use `retention` with `stream=True`.")
+
         if call_params is None:
             call_params = default_call_params
 
@@ -190,6 +202,7 @@ def call_factory(  # noqa: ANN202
                     json_mode=json_mode,
                     client=client,
                     call_params=call_params,
+                    priority=priority,
                 )  # pyright: ignore [reportReturnType, reportCallIssue]
             else:
                 return partial(
@@ -205,6 +218,8 @@ def call_factory(  # noqa: ANN202
                     json_mode=json_mode,
                     client=client,
                     call_params=call_params,
+                    priority=priority,
+                    retention=retention,
                 )  # pyright: ignore [reportCallIssue]
 
         if stream:
@@ -221,6 +236,8 @@ def call_factory(  # noqa: ANN202
                 json_mode=json_mode,
                 client=client,
                 call_params=call_params,
+                partial_tools=partial_tools,
+                priority=priority,
             )  # pyright: ignore [reportReturnType, reportCallIssue]
         return partial(
             create_factory(TCallResponse=TCallResponse, setup_call=setup_call),
@@ -230,6 +247,8 @@ def call_factory(  # noqa: ANN202
             json_mode=json_mode,
             client=client,
             call_params=call_params,
+            priority=priority,
+            retention=retention,
         )  # pyright: ignore [reportReturnType, reportCallIssue]
 
     return base_call  # pyright: ignore [reportReturnType]
@@ -6,20 +6,25 @@ from functools import wraps
 from typing import Any, ParamSpec, TypeVar, cast, overload
 
 from ._utils import (
+    MessagesOnlyClient,
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
     fn_is_async,
     get_dynamic_configuration,
-    get_fn_args,
+    get_fn_args_binder,
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
 )
+from .batch import get_batch_request_handler
 from .call_params import BaseCallParams
-from .call_response import BaseCallResponse
+from .call_response import BaseCallResponse, ResponseRetention
+from .client_pool import ClientPool, pool_setup_call
+from .deadline import check_deadline, wait_for_deadline, with_timeout_kwargs
 from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .prompt import prompt_template
+from .scheduler import scheduled_call, scheduled_call_async
 from .tool import BaseTool
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
@@ -66,6 +71,8 @@ def create_factory(  # noqa: ANN202
     ],
 ):
     """Returns the wrapped function with the provider specific interfaces."""
+    setup_messages: Callable[..., tuple] = setup_call
+    setup_call = pool_setup_call(setup_call)
 
     @overload
     def decorator(
@@ -76,6 +83,8 @@ def create_factory(  # noqa: ANN202
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> Callable[_P, _BaseCallResponseT | _ParsedOutputT]: ...
 
     @overload
@@ -87,6 +96,8 @@ def create_factory(  # noqa: ANN202
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> Callable[_P, _BaseCallResponseT | _ParsedOutputT]: ...
 
     @overload
@@ -102,6 +113,8 @@ def create_factory(  # noqa: ANN202
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> Callable[
         _P,
         Awaitable[_BaseCallResponseT | _ParsedOutputT],
@@ -116,6 +129,8 @@ def create_factory(  # noqa: ANN202
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> Callable[
         _P,
         Awaitable[_BaseCallResponseT | _ParsedOutputT],
@@ -134,8 +149,14 @@ def create_factory(  # noqa: ANN202
         tools: list[type[BaseTool] | Callable] | None,
         output_parser: Callable[[_BaseCallResponseT], _ParsedOutputT] | None,
         json_mode: bool,
-        client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | _SyncBaseClientT | None,
+        client: _SameSyncAndAsyncClientT
+        | _AsyncBaseClientT
+        | _SyncBaseClientT
+        | ClientPool
+        | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> Callable[
         _P,
         _BaseCallResponseT
@@ -153,21 +174,41 @@ def create_factory(  # noqa: ANN202
                 fn,
             )
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
+        fn._provider = getattr(TCallResponse, "_provider", "")  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        bind_fn_args = get_fn_args_binder(fn)
+
+        def rebuild_messages(
+            fn_args: dict[str, Any], dynamic_config: BaseDynamicConfig
+        ) -> list[Any]:
+            return setup_messages(  # pyright: ignore [reportCallIssue]
+                model=model,
+                client=MessagesOnlyClient(),  # pyright: ignore [reportArgumentType]
+                fn=fn,  # pyright: ignore [reportArgumentType]
+                fn_args=fn_args,
+                dynamic_config=dynamic_config,  # pyright: ignore [reportArgumentType]
+                tools=tools,
+                json_mode=json_mode,
+                call_params=call_params,
+                extract=False,
+                stream=False,
+            )[2]
+
         if fn_is_async(fn):
 
             @wraps(fn)
             async def inner_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> TCallResponse | _ParsedOutputT:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = bind_fn_args(args, kwargs)
                 dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
-                nonlocal client
+                call_client = client
                 if dynamic_config is not None:
-                    client = dynamic_config.get("client", None) or client
+                    call_client = dynamic_config.get("client", None) or client
+                check_deadline()
                 create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
                     model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
+                    client=call_client,  # pyright: ignore [reportArgumentType]
                     fn=fn,
                     fn_args=fn_args,
                     dynamic_config=dynamic_config,
@@ -177,9 +218,15 @@ def create_factory(  # noqa: ANN202
                     extract=False,
                     stream=False,
                 )
-                start_time = datetime.datetime.now().timestamp() * 1000
-                response = await create(stream=False, **call_kwargs)
-                end_time = datetime.datetime.now().timestamp() * 1000
+                async with scheduled_call_async(priority, dynamic_config):
+                    start_time = datetime.datetime.now().timestamp() * 1000
+                    response = await wait_for_deadline(
+                        create(
+                            stream=False,
+                            **with_timeout_kwargs(call_kwargs, TCallResponse),
+                        )
+                    )
+                    end_time = datetime.datetime.now().timestamp() * 1000
                 output = TCallResponse(
                     metadata=get_metadata(fn, dynamic_config),
                     response=response,
@@ -195,6 +242,7 @@ def create_factory(  # noqa: ANN202
                     end_time=end_time,
                 )
                 output._model = model
+                output._retain(retention, rebuild_messages)
                 return output if not output_parser else output_parser(output)
 
             return inner_async
@@ -204,14 +252,18 @@ def create_factory(  # noqa: ANN202
             def inner(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> TCallResponse | _ParsedOutputT:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = bind_fn_args(args, kwargs)
                 dynamic_config = get_dynamic_configuration(fn, args, kwargs)
-                nonlocal client
+                call_client = client
                 if dynamic_config is not None:
-                    client = dynamic_config.get("client", None) or client
+                    call_client = dynamic_config.get("client", None) or client
+                check_deadline()
+                batch_handler = get_batch_request_handler()
                 create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
                     model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
+                    client=call_client
+                    if batch_handler is None
+                    else batch_handler.client,  # pyright: ignore [reportArgumentType]
                     fn=fn,
                     fn_args=fn_args,
                     dynamic_config=dynamic_config,
@@ -221,25 +273,47 @@ def create_factory(  # noqa: ANN202
                     extract=False,
                     stream=False,
                 )
-                start_time = datetime.datetime.now().timestamp() * 1000
-                response = create(stream=False, **call_kwargs)
-                end_time = datetime.datetime.now().timestamp() * 1000
-                output = TCallResponse(
-                    metadata=get_metadata(fn, dynamic_config),
-                    response=response,
-                    tool_types=tool_types,  # pyright: ignore [reportArgumentType]
-                    prompt_template=prompt_template,
-                    fn_args=fn_args,
-                    dynamic_config=dynamic_config,
-                    messages=messages,
-                    call_params=call_params,
-                    call_kwargs=call_kwargs,
-                    user_message_param=get_possible_user_message_param(messages),
-                    start_time=start_time,
-                    end_time=end_time,
-                )
-                output._model = model
-                return output if not output_parser else output_parser(output)
+
+                def parse_response(
+                    response: Any,  # noqa: ANN401
+                    start_time: float,
+                    end_time: float,
+                ) -> _BaseCallResponseT | _ParsedOutputT:
+                    output = TCallResponse(
+                        metadata=get_metadata(fn, dynamic_config),
+                        response=response,
+                        tool_types=tool_types,  # pyright: ignore [reportArgumentType]
+                        prompt_template=prompt_template,
+                        fn_args=fn_args,
+                        dynamic_config=dynamic_config,
+                        messages=messages,
+                        call_params=call_params,
+                        call_kwargs=call_kwargs,
+                        user_message_param=get_possible_user_message_param(messages),
+                        start_time=start_time,
+                        end_time=end_time,
+                    )
+                    output._model = model
+                    output._retain(retention, rebuild_messages)
+                    return output if not output_parser else output_parser(output)
+
+                if batch_handler is not None:
+                    # The batch parses the response once the batch has finished
+                    start_time = datetime.datetime.now().timestamp() * 1000
+                    batch_handler.handle(
+                        call_kwargs,
+                        lambda response: parse_response(
+                            response, start_time, start_time
+                        ),
+                    )
+                with scheduled_call(priority, dynamic_config):
+                    start_time = datetime.datetime.now().timestamp() * 1000
+                    response = create(
+                        stream=False,
+                        **with_timeout_kwargs(call_kwargs, TCallResponse),
+                    )
+                    end_time = datetime.datetime.now().timestamp() * 1000
+                return parse_response(response, start_time, end_time)
 
             return inner
 
@@ -16,9 +16,10 @@ from ._utils import (
     fn_is_async,
     setup_extract_tool,
 )
-from ._utils._get_fields_from_call_args import get_fields_from_call_args
+from ._utils._get_fields_from_call_args import get_fields_from_call_args_binder
+from .batch import parse_batch_output
 from .call_params import BaseCallParams
-from .call_response import BaseCallResponse
+from .call_response import BaseCallResponse, ResponseRetention
 from .dynamic_config import BaseDynamicConfig
 from .tool import BaseTool
 
@@ -82,6 +83,8 @@ def extract_factory(  # noqa: ANN202
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> Callable[_P, _ResponseModelT | _ParsedOutputT]: ...
 
     @overload
@@ -93,6 +96,8 @@ def extract_factory(  # noqa: ANN202
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> Callable[_P, Awaitable[_ResponseModelT | _ParsedOutputT]]: ...
 
     def decorator(
@@ -104,11 +109,14 @@ def extract_factory(  # noqa: ANN202
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> Callable[
         _P,
         _ResponseModelT | _ParsedOutputT | Awaitable[_ResponseModelT | _ParsedOutputT],
     ]:
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
+        fn._provider = getattr(TCallResponse, "_provider", "")  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
         tool = setup_extract_tool(response_model, TToolType)
         create_decorator_kwargs = {
@@ -118,20 +126,22 @@ def extract_factory(  # noqa: ANN202
             "json_mode": json_mode,
             "client": client,
             "call_params": call_params,
+            "priority": priority,
+            "retention": retention,
         }
+        bind_fields_from_call_args = get_fields_from_call_args_binder(
+            response_model, fn
+        )
 
         if fn_is_async(fn):
+            create_call_async = create_decorator(fn=fn, **create_decorator_kwargs)
 
             @wraps(fn)
             async def inner_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> _ResponseModelT:
-                fields_from_call_args = get_fields_from_call_args(
-                    response_model, fn, args, kwargs
-                )
-                call_response = await create_decorator(
-                    fn=fn, **create_decorator_kwargs
-                )(*args, **kwargs)
+                fields_from_call_args = bind_fields_from_call_args(args, kwargs)
+                call_response = await create_call_async(*args, **kwargs)
                 try:
                     json_output = get_json_output(call_response, json_mode)
                     output = extract_tool_return(
@@ -146,26 +156,28 @@ def extract_factory(  # noqa: ANN202
 
             return inner_async
         else:
+            create_call = create_decorator(fn=fn, **create_decorator_kwargs)
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> _ResponseModelT:
-                fields_from_call_args = get_fields_from_call_args(
-                    response_model, fn, args, kwargs
-                )
-                call_response = create_decorator(fn=fn, **create_decorator_kwargs)(
-                    *args, **kwargs
-                )
-                try:
-                    json_output = get_json_output(call_response, json_mode)
-                    output = extract_tool_return(
-                        response_model, json_output, False, fields_from_call_args
-                    )
-                except Exception as e:
-                    e._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
-                    raise e
-                if isinstance(output, BaseModel):
-                    output._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
-                return output if not output_parser else output_parser(output)  # pyright: ignore [reportReturnType, reportArgumentType]
+                fields_from_call_args = bind_fields_from_call_args(args, kwargs)
+
+                def parse_output(call_response: _BaseCallResponseT) -> _ResponseModelT:
+                    try:
+                        json_output = get_json_output(call_response, json_mode)
+                        output = extract_tool_return(
+                            response_model, json_output, False, fields_from_call_args
+                        )
+                    except Exception as e:
+                        e._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
+                        raise e
+                    if isinstance(output, BaseModel):
+                        output._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
+                    return output if not output_parser else output_parser(output)  # pyright: ignore [reportReturnType, reportArgumentType]
+
+                with parse_batch_output(parse_output):
+                    call_response = create_call(*args, **kwargs)
+                return parse_output(call_response)
 
             return inner
 
@@ -12,7 +12,7 @@ from ._get_audio_type import get_audio_type
 from ._get_create_fn_or_async_create_fn import get_async_create_fn, get_create_fn
 from ._get_document_type import get_document_type
 from ._get_dynamic_configuration import get_dynamic_configuration
-from ._get_fn_args import get_fn_args
+from ._get_fn_args import get_fn_args, get_fn_args_binder
 from ._get_image_type import get_image_type
 from ._get_metadata import get_metadata
 from ._get_possible_user_message_param import get_possible_user_message_param
@@ -23,8 +23,10 @@ from ._get_unsupported_tool_config_keys import get_unsupported_tool_config_keys
 from ._is_prompt_template import is_prompt_template
 from ._json_mode_content import json_mode_content
 from ._messages_decorator import MessagesDecorator, messages_decorator
+from ._messages_only_client import MessagesOnlyClient
 from ._parse_content_template import parse_content_template
 from ._parse_prompt_messages import parse_prompt_messages
+from ._partial_tool_constructor import PartialToolConstructor
 from ._protocols import (
     AsyncCreateFn,
     CalculateCost,
@@ -39,6 +41,7 @@ from ._protocols import (
 )
 from ._setup_call import setup_call
 from ._setup_extract_tool import setup_extract_tool
+from ._streamed_json_object import StreamedJsonObject
 
 __all__ = [
     "AsyncCreateFn",
@@ -60,6 +63,7 @@ __all__ = [
     "get_document_type",
     "get_dynamic_configuration",
     "get_fn_args",
+    "get_fn_args_binder",
     "get_image_type",
     "get_metadata",
     "get_possible_user_message_param",
@@ -75,9 +79,12 @@ __all__ = [
     "LLMFunctionDecorator",
     "MessagesDecorator",
     "messages_decorator",
+    "MessagesOnlyClient",
     "parse_content_template",
     "parse_prompt_messages",
+    "PartialToolConstructor",
     "SetupCall",
     "setup_call",
     "setup_extract_tool",
+    "StreamedJsonObject",
 ]
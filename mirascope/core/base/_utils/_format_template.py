@@ -1,12 +1,27 @@
 """This module contains the `format_template` function."""
 
 import inspect
+from functools import lru_cache
 from typing import Any
 
 from ._get_template_values import get_template_values
 from ._get_template_variables import get_template_variables
 
 
+@lru_cache(maxsize=1024)
+def _compile_template(template: str) -> tuple[str, list[tuple[str, str | None]]]:
+    """Returns the dedented template and its variables, which are the same each call.
+
+    The returned variables are shared between calls and must not be mutated.
+    """
+    dedented_template = inspect.cleandoc(template).strip()
+    template_vars = get_template_variables(dedented_template, True)
+
+    # Remove any special format specs that are actually invalid normally
+    dedented_template = dedented_template.replace(":lists", "").replace(":list", "")
+    return dedented_template, template_vars
+
+
 def format_template(template: str, attrs: dict[str, Any]) -> str:
     """Formats the given prompt `template`
 
@@ -18,12 +33,6 @@ def format_template(template: str, attrs: dict[str, Any]) -> str:
         The formatted template.
 
     """
-    dedented_template = inspect.cleandoc(template).strip()
-    template_vars = get_template_variables(dedented_template, True)
-
+    dedented_template, template_vars = _compile_template(template)
     values = get_template_values(template_vars, attrs)
-
-    # Remove any special format specs that are actually invalid normally
-    dedented_template = dedented_template.replace(":lists", "").replace(":list", "")
-
     return dedented_template.format(**values).strip()
@@ -1,4 +1,5 @@
 import inspect
+import time
 from collections.abc import (
     AsyncGenerator,
     AsyncIterable,
@@ -21,6 +22,7 @@ from typing import (
 
 from typing_extensions import TypeIs
 
+from ..recording import get_call_recorder, get_call_replayer
 from ._protocols import AsyncCreateFn, CreateFn
 
 _StreamedResponse = TypeVar("_StreamedResponse")
@@ -73,8 +75,16 @@ def get_async_create_fn(
         Awaitable[AsyncGenerator[_StreamedResponse, None]]
         | Awaitable[_NonStreamedResponse]
     ):
+        if (replayer := get_call_replayer()) is not None:
+            if stream:
+                return replayer.stream_async(kwargs)
+            return replayer.response_async(kwargs)
+        recorder = get_call_recorder()
         if not stream:
-            return cast(Awaitable[_NonStreamedResponse], async_func(**kwargs))
+            response = cast(Awaitable[_NonStreamedResponse], async_func(**kwargs))
+            if recorder is not None:
+                return recorder.record_response_async(kwargs, response)
+            return response
         else:
             if async_generator_func is None:
                 async_generator = async_func(**kwargs, stream=True)
@@ -85,11 +95,14 @@ def get_async_create_fn(
                 async def _stream() -> AsyncGenerator[_StreamedResponse]:
                     return cast(AsyncGenerator[_StreamedResponse], async_generator)
 
-                return _stream()
+                result = _stream()
             else:
-                return cast(
+                result = cast(
                     Awaitable[AsyncGenerator[_StreamedResponse]], async_generator
                 )
+            if recorder is not None:
+                return recorder.record_stream_async(kwargs, result)
+            return result
 
     return create_or_stream
 
@@ -117,6 +130,10 @@ def get_create_fn(
         stream: bool = False,
         **kwargs: Any,  # noqa: ANN401
     ) -> Generator[_StreamedResponse, None, None] | _NonStreamedResponse:
+        if (replayer := get_call_replayer()) is not None:
+            return replayer.stream(kwargs) if stream else replayer.response(kwargs)
+        recorder = get_call_recorder()
+        start = time.perf_counter()
         if stream:
             if sync_generator_func is None:
                 generator = cast(
@@ -127,10 +144,24 @@ def get_create_fn(
                 generator = sync_generator_func(**kwargs)
 
             def _stream() -> Generator[_StreamedResponse, None, None]:
-                yield from generator
-
+                try:
+                    yield from generator
+                finally:
+                    # Closes the upstream connection if the stream is closed early
+                    if callable(close := getattr(generator, "close", None)):
+                        close()
+
+            if recorder is not None:
+                return recorder.record_stream(
+                    kwargs, _stream(), time.perf_counter() - start
+                )
             return _stream()
 
-        return cast(_NonStreamedResponse, sync_func(**kwargs))
+        response = cast(_NonStreamedResponse, sync_func(**kwargs))
+        if recorder is not None:
+            return recorder.record_response(
+                kwargs, response, time.perf_counter() - start
+            )
+        return response
 
     return create_or_stream
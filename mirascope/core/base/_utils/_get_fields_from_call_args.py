@@ -6,29 +6,51 @@ from typing import Any, get_origin
 
 from pydantic import BaseModel
 
-from mirascope.core.base._utils import get_fn_args
+from mirascope.core.base._utils._get_fn_args import FnArgsBinder, get_fn_args_binder
 from mirascope.core.base.from_call_args import is_from_call_args
 
 
-def get_fields_from_call_args(
-    response_model: object,
-    fn: Callable,
-    args: tuple[object, ...],
-    kwargs: dict[str, Any],
-) -> dict[str, Any]:
+def get_call_args_fields(response_model: object) -> frozenset[str]:
+    """Returns the names of the `response_model` fields marked with `FromCallArgs`."""
     if origin := get_origin(response_model):
         response_model = origin
     if not (inspect.isclass(response_model) and issubclass(response_model, BaseModel)):
-        return {}
-    call_args_fields = {
+        return frozenset()
+    return frozenset(
         name
         for name, field in response_model.model_fields.items()
         if is_from_call_args(field)
-    }
-
-    fn_args = get_fn_args(fn, args, kwargs)
-    if not call_args_fields.issubset(fn_args.keys()):
-        raise ValueError(
-            f"The function arguments do not contain all the fields marked with `FromCallArgs`. {fn_args=}, {call_args_fields=}"
-        )
-    return {name: fn_args[name] for name in call_args_fields}
+    )
+
+
+def get_fields_from_call_args_binder(
+    response_model: object, fn: Callable
+) -> FnArgsBinder:
+    """Returns a function that gets the `FromCallArgs` fields from a call to `fn`.
+
+    The fields of `response_model` and the signature of `fn` are inspected once, so
+    decorators create the binder when they decorate `fn` and reuse it for every call.
+    """
+    call_args_fields = get_call_args_fields(response_model)
+    if not call_args_fields:
+        return lambda args, kwargs: {}
+    bind_fn_args = get_fn_args_binder(fn)
+
+    def bind(args: tuple[object, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        fn_args = bind_fn_args(args, kwargs)
+        if not call_args_fields.issubset(fn_args.keys()):
+            raise ValueError(
+                f"The function arguments do not contain all the fields marked with `FromCallArgs`. {fn_args=}, {call_args_fields=}"
+            )
+        return {name: fn_args[name] for name in call_args_fields}
+
+    return bind
+
+
+def get_fields_from_call_args(
+    response_model: object,
+    fn: Callable,
+    args: tuple[object, ...],
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    return get_fields_from_call_args_binder(response_model, fn)(args, kwargs)
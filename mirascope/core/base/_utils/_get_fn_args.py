@@ -2,22 +2,84 @@
 
 import inspect
 from collections.abc import Callable
-from typing import Any
+from typing import Any, TypeAlias
+
+FnArgsBinder: TypeAlias = Callable[[tuple[object, ...], dict[str, Any]], dict[str, Any]]
+
+_POSITIONAL = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+_KEYWORD = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+
+def get_fn_args_binder(fn: Callable) -> FnArgsBinder:
+    """Returns a function that binds `args` and `kwargs` as a dictionary to `fn`.
+
+    The signature of `fn` is inspected once, so decorators create the binder when they
+    decorate `fn` and reuse it for every call. Arguments that match the parameters of
+    `fn` are bound directly, and anything else (e.g. too many arguments, or `*args`)
+    is bound with `inspect.Signature.bind_partial` so that it raises the same errors.
+    """
+    signature = inspect.signature(fn)
+    parameters = signature.parameters.values()
+    var_keyword = next(
+        (p.name for p in parameters if p.kind == inspect.Parameter.VAR_KEYWORD), None
+    )
+    has_var_positional = any(
+        p.kind == inspect.Parameter.VAR_POSITIONAL for p in parameters
+    )
+    positional = [p.name for p in parameters if p.kind in _POSITIONAL]
+    positional_only = {
+        p.name for p in parameters if p.kind == inspect.Parameter.POSITIONAL_ONLY
+    }
+    keyword = {p.name for p in parameters if p.kind in _KEYWORD}
+    names = [p.name for p in parameters if p.kind in _POSITIONAL + _KEYWORD]
+    defaults = {p.name: p.default for p in parameters if p.default is not p.empty}
+
+    def bind_signature(
+        args: tuple[object, ...], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        bound_args = signature.bind_partial(*args, **kwargs)
+        bound_args.apply_defaults()
+
+        fn_args = {}
+        for name, value in bound_args.arguments.items():
+            if name == var_keyword:
+                fn_args.update(value)
+            else:
+                fn_args[name] = value
+        return fn_args
+
+    def bind(args: tuple[object, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        if has_var_positional or len(args) > len(positional):
+            return bind_signature(args, kwargs)
+        values = dict(zip(positional, args, strict=False))
+        extra_kwargs = {}
+        for name, value in kwargs.items():
+            if (
+                name in values
+                or name in positional_only
+                or (name not in keyword and var_keyword is None)
+            ):
+                return bind_signature(args, kwargs)
+            if name in keyword:
+                values[name] = value
+            else:
+                extra_kwargs[name] = value
+        fn_args = {
+            name: values[name] if name in values else defaults[name]
+            for name in names
+            if name in values or name in defaults
+        }
+        fn_args.update(extra_kwargs)
+        return fn_args
+
+    return bind
 
 
 def get_fn_args(
     fn: Callable, args: tuple[object, ...], kwargs: dict[str, Any]
 ) -> dict[str, Any]:
     """Returns the `args` and `kwargs` as a dictionary bound by `fn`'s signature."""
-    signature = inspect.signature(fn)
-    bound_args = signature.bind_partial(*args, **kwargs)
-    bound_args.apply_defaults()
-
-    fn_args = {}
-    for name, value in bound_args.arguments.items():
-        if signature.parameters[name].kind == inspect.Parameter.VAR_KEYWORD:
-            fn_args.update(value)
-        else:
-            fn_args[name] = value
-
-    return fn_args
+    return get_fn_args_binder(fn)(args, kwargs)
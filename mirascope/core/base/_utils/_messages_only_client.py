@@ -0,0 +1,21 @@
+"""This module contains the `MessagesOnlyClient` class."""
+
+from typing import NoReturn
+
+
+class MessagesOnlyClient:
+    """A client for setting up a call's messages without preparing a request.
+
+    Passing it as the client of a provider's `setup_call` skips constructing a default
+    client (or choosing one from a pool), and providers skip any side effects of
+    preparing a request for it (e.g. Anthropic's automatic cache control). The returned
+    create function must never be called.
+    """
+
+    def __getattr__(self, name: str) -> "MessagesOnlyClient":
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self
+
+    def __call__(self, *args: object, **kwargs: object) -> NoReturn:
+        raise RuntimeError("A `MessagesOnlyClient` can't make requests.")
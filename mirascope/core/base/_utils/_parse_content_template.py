@@ -2,6 +2,7 @@
 
 import re
 import urllib.request
+from functools import lru_cache
 from typing import Any, Literal, cast
 
 from typing_extensions import TypedDict
@@ -30,7 +31,11 @@ class _Part(TypedDict):
     options: dict[str, str] | None
 
 
+@lru_cache(maxsize=1024)
 def _parse_parts(template: str) -> list[_Part]:
+    # The parts of a template never change, so they're parsed once per template. The
+    # cached parts are shared and must not be mutated.
+    #
     # \{ and \} match the literal curly braces.
     #
     # ([^:{}]*) captures content before the colon that are not { or } or :.
@@ -182,14 +187,21 @@ def _construct_parts(
             else []
         )
     else:  # text type
-        text = part["template"]
-        if text in attrs:
-            source = attrs[text]
-            return [TextPart(type="text", text=source)]
-        formatted_template = format_template(part["template"].strip(), attrs)
-        if not formatted_template:
-            return []
-        return [TextPart(type="text", text=formatted_template)]
+        text = format_text_template(part["template"], attrs)
+        return [TextPart(type="text", text=text)] if text is not None else []
+
+
+def is_text_template(template: str) -> bool:
+    """Returns whether the content template is a single text part."""
+    parts = _parse_parts(template)
+    return len(parts) == 1 and parts[0]["type"] == "text"
+
+
+def format_text_template(template: str, attrs: dict[str, Any]) -> str | None:
+    """Returns the text of a text part template, or `None` if the text is empty."""
+    if template in attrs:
+        return attrs[template]
+    return format_template(template.strip(), attrs) or None
 
 
 def parse_content_template(
@@ -1,6 +1,8 @@
 """This module provides a function to parse messages from a prompt template."""
 
 import re
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
@@ -9,7 +11,11 @@ from ..call_params import BaseCallParams
 from ..dynamic_config import BaseDynamicConfig
 from ..message_param import BaseMessageParam
 from ._get_template_variables import get_template_variables
-from ._parse_content_template import parse_content_template
+from ._parse_content_template import (
+    format_text_template,
+    is_text_template,
+    parse_content_template,
+)
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 _MessageParamT = TypeVar("_MessageParamT", bound=Any)
@@ -17,14 +23,44 @@ _CallParamsT = TypeVar("_CallParamsT", bound=BaseCallParams)
 _ClientT = TypeVar("_ClientT")
 
 
+@lru_cache(maxsize=1024)
+def _split_messages(roles: tuple[str, ...], template: str) -> list[tuple[str, str]]:
+    # The messages of a template never change, so they're split once per template. The
+    # cached messages are shared and must not be mutated.
+    re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
+    return [
+        (match.group(1).lower(), match.group(2).strip())
+        for match in re.finditer(
+            rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template
+        )
+    ]
+
+
+def _parse_content(
+    role: str,
+    template: str,
+    attrs: dict[str, Any],
+    convert_text_message: Callable[[str, str], list[Any]] | None,
+) -> list[BaseMessageParam | Any]:
+    if convert_text_message is not None and is_text_template(template):
+        text = format_text_template(template, attrs)
+        return convert_text_message(role, text) if text is not None else []
+    content = parse_content_template(role, template, attrs)
+    return [content] if content else []
+
+
 def parse_prompt_messages(
     roles: list[str],
     template: str,
     attrs: dict[str, Any],
     dynamic_config: BaseDynamicConfig[_MessageParamT, _CallParamsT, _ClientT] = None,
-) -> list[BaseMessageParam]:
+    convert_text_message: Callable[[str, str], list[Any]] | None = None,
+) -> list[BaseMessageParam | Any]:
     """Returns messages parsed from the provided prompt `template`.
 
+    When `convert_text_message` is provided, messages with only text are converted
+    directly into the provider's message parameters instead of `BaseMessageParam`.
+
     Raises:
         ValueError: if `MESSAGES` keyword is used with a non-list attribute.
     """
@@ -33,9 +69,7 @@ def parse_prompt_messages(
         if computed_fields:
             attrs |= computed_fields
     messages = []
-    re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
-    for match in re.finditer(rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template):
-        role, content_template = match.group(1).lower(), match.group(2).strip()
+    for role, content_template in _split_messages(tuple(roles), template):
         if role == "messages":
             template_variables = get_template_variables(content_template, False)
             if template_variables[0].startswith("self"):
@@ -53,11 +87,9 @@ def parse_prompt_messages(
                 )
             messages += attr
         else:
-            content = parse_content_template(role, content_template, attrs)
-            if content:
-                messages.append(content)
+            messages += _parse_content(
+                role, content_template, attrs, convert_text_message
+            )
     if len(messages) == 0:
-        content = parse_content_template("user", template, attrs)
-        if content:
-            messages.append(content)
+        messages += _parse_content("user", template, attrs, convert_text_message)
     return messages
@@ -0,0 +1,48 @@
+"""This module contains the `PartialToolConstructor` class."""
+
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from .._partial import partial
+
+_BaseToolT = TypeVar("_BaseToolT", bound=BaseModel)
+
+
+class PartialToolConstructor(Generic[_BaseToolT]):
+    """Constructs partial tools from the partially streamed arguments of a tool call.
+
+    The partial version of each tool type is only generated once per constructor, so a
+    single constructor should be used for the lifetime of a stream.
+    """
+
+    def __init__(self) -> None:
+        self._partial_tool_types: dict[type[_BaseToolT], type[_BaseToolT]] = {}
+
+    def __call__(
+        self,
+        tool_type: type[_BaseToolT],
+        arguments: dict[str, Any] | None,
+        tool_call: Any,  # noqa: ANN401
+        delta: str,
+    ) -> _BaseToolT | None:
+        """Returns the partial tool or `None` if the arguments don't validate yet.
+
+        Args:
+            tool_type: The type of the tool being streamed.
+            arguments: The partially parsed arguments streamed so far.
+            tool_call: The provider-specific tool call for the partial arguments.
+            delta: The arguments fragment that was just streamed.
+        """
+        if (partial_tool_type := self._partial_tool_types.get(tool_type)) is None:
+            partial_tool_type = partial(tool_type)
+            partial_tool_type.__custom_name__ = tool_type._name()  # pyright: ignore [reportAttributeAccessIssue]
+            self._partial_tool_types[tool_type] = partial_tool_type
+        try:
+            tool = partial_tool_type.model_validate(arguments or {})
+        except ValidationError:
+            return None
+        if "tool_call" in partial_tool_type.model_fields:
+            tool.tool_call = tool_call  # pyright: ignore [reportAttributeAccessIssue]
+        tool._delta = delta  # pyright: ignore [reportAttributeAccessIssue]
+        return tool
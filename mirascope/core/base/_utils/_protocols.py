@@ -23,9 +23,10 @@ from typing import (
 from pydantic import BaseModel
 
 from ..call_kwargs import BaseCallKwargs
-from ..call_response import BaseCallResponse
+from ..call_response import BaseCallResponse, ResponseRetention
 from ..call_response_chunk import BaseCallResponseChunk
 from ..messages import Messages
+from ..stream_config import StreamConfig
 from ..tool import BaseTool
 from ._base_type import BaseType
 
@@ -340,6 +341,7 @@ class HandleStream(
         self,
         stream: Generator[_InvariantResponseChunkT, None, None],
         tool_types: list[type[_BaseToolT]] | None,
+        partial_tools: bool = False,
     ) -> Generator[
         tuple[_BaseCallResponseChunkT, _BaseToolT | None], None, None
     ]: ...  # pragma: no cover
@@ -352,6 +354,7 @@ class HandleStreamAsync(
         self,
         stream: AsyncGenerator[_InvariantResponseChunkT, None],
         tool_types: list[type[_BaseToolT]] | None,
+        partial_tools: bool = False,
     ) -> AsyncGenerator[
         tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
     ]: ...  # pragma: no cover
@@ -395,6 +398,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SameSyncAndAsyncClientT | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> LLMFunctionDecorator[
         _BaseDynamicConfigT,
         _AsyncBaseDynamicConfigT,
@@ -414,6 +419,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _AsyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> AsyncLLMFunctionDecorator[_AsyncBaseDynamicConfigT, _BaseCallResponseT]: ...
 
     @overload
@@ -428,6 +435,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> SyncLLMFunctionDecorator[_BaseDynamicConfigT, _BaseCallResponseT]: ...
 
     @overload
@@ -442,6 +451,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SameSyncAndAsyncClientT | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> LLMFunctionDecorator[
         _BaseDynamicConfigT, _AsyncBaseDynamicConfigT, _ParsedOutputT, _ParsedOutputT
     ]: ...
@@ -458,6 +469,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _AsyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> AsyncLLMFunctionDecorator[_AsyncBaseDynamicConfigT, _ParsedOutputT]: ...
 
     @overload
@@ -472,6 +485,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> SyncLLMFunctionDecorator[_BaseDynamicConfigT, _ParsedOutputT]: ...
 
     @overload
@@ -489,6 +504,8 @@ class CallDecorator(
         | _AsyncBaseClientT
         | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> NoReturn: ...
 
     @overload
@@ -496,13 +513,15 @@ class CallDecorator(
         self,
         model: str,
         *,
-        stream: Literal[True] = True,
+        stream: Literal[True] | StreamConfig = True,
         tools: list[type[BaseTool] | Callable] | None = None,
         response_model: None = None,
         output_parser: None = None,
         json_mode: bool = False,
         client: _SameSyncAndAsyncClientT | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> LLMFunctionDecorator[
         _BaseDynamicConfigT, _AsyncBaseDynamicConfigT, _BaseStreamT, _BaseStreamT
     ]: ...
@@ -512,13 +531,15 @@ class CallDecorator(
         self,
         model: str,
         *,
-        stream: Literal[True] = True,
+        stream: Literal[True] | StreamConfig = True,
         tools: list[type[BaseTool] | Callable] | None = None,
         response_model: None = None,
         output_parser: None = None,
         json_mode: bool = False,
         client: _AsyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> AsyncLLMFunctionDecorator[_AsyncBaseDynamicConfigT, _BaseStreamT]: ...
 
     @overload
@@ -526,13 +547,15 @@ class CallDecorator(
         self,
         model: str,
         *,
-        stream: Literal[True] = True,
+        stream: Literal[True] | StreamConfig = True,
         tools: list[type[BaseTool] | Callable] | None = None,
         response_model: None = None,
         output_parser: None = None,
         json_mode: bool = False,
         client: _SyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> SyncLLMFunctionDecorator[_BaseDynamicConfigT, _BaseStreamT]: ...
 
     @overload
@@ -540,7 +563,7 @@ class CallDecorator(
         self,
         model: str,
         *,
-        stream: Literal[True] = True,
+        stream: Literal[True] | StreamConfig = True,
         tools: list[type[BaseTool] | Callable] | None = None,
         response_model: None = None,
         output_parser: Callable[[_BaseCallResponseChunkT], _ParsedOutputT],
@@ -550,6 +573,8 @@ class CallDecorator(
         | _AsyncBaseClientT
         | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> NoReturn: ...
 
     @overload
@@ -557,7 +582,7 @@ class CallDecorator(
         self,
         model: str,
         *,
-        stream: Literal[True] = True,
+        stream: Literal[True] | StreamConfig = True,
         tools: list[type[BaseTool] | Callable] | None = None,
         response_model: None = None,
         output_parser: Callable[[_BaseCallResponseT], _ParsedOutputT],
@@ -567,6 +592,8 @@ class CallDecorator(
         | _AsyncBaseClientT
         | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> NoReturn: ...
 
     @overload
@@ -581,6 +608,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SameSyncAndAsyncClientT | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> LLMFunctionDecorator[
         _BaseDynamicConfigT, _AsyncBaseDynamicConfigT, _ResponseModelT, _ResponseModelT
     ]: ...
@@ -597,6 +626,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _AsyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> AsyncLLMFunctionDecorator[_AsyncBaseDynamicConfigT, _ResponseModelT]: ...
 
     @overload
@@ -611,6 +642,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> SyncLLMFunctionDecorator[_BaseDynamicConfigT, _ResponseModelT]: ...
 
     @overload
@@ -625,6 +658,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SameSyncAndAsyncClientT | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> LLMFunctionDecorator[
         _BaseDynamicConfigT, _AsyncBaseDynamicConfigT, _ParsedOutputT, _ParsedOutputT
     ]: ...
@@ -641,6 +676,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _AsyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> AsyncLLMFunctionDecorator[_AsyncBaseDynamicConfigT, _ParsedOutputT]: ...
 
     @overload
@@ -655,6 +692,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> SyncLLMFunctionDecorator[_BaseDynamicConfigT, _ParsedOutputT]: ...
 
     @overload
@@ -669,6 +708,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SameSyncAndAsyncClientT | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> LLMFunctionDecorator[
         _BaseDynamicConfigT,
         _AsyncBaseDynamicConfigT,
@@ -688,6 +729,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _AsyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> AsyncLLMFunctionDecorator[
         _AsyncBaseDynamicConfigT, AsyncIterable[_ResponseModelT]
     ]: ...
@@ -704,6 +747,8 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> SyncLLMFunctionDecorator[_BaseDynamicConfigT, Iterable[_ResponseModelT]]: ...
 
     @overload
@@ -724,13 +769,15 @@ class CallDecorator(
         | _SyncBaseClientT
         | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> NoReturn: ...
 
     def __call__(
         self,
         model: str,
         *,
-        stream: bool = False,
+        stream: bool | StreamConfig = False,
         tools: list[type[BaseTool] | Callable] | None = None,
         response_model: type[_ResponseModelT] | None = None,
         output_parser: Callable[[_BaseCallResponseT], _ParsedOutputT]
@@ -743,6 +790,8 @@ class CallDecorator(
         | _SyncBaseClientT
         | None = None,
         call_params: _BaseCallParamsT | None = None,
+        priority: str | None = None,
+        retention: ResponseRetention = "full",
     ) -> (
         AsyncLLMFunctionDecorator[
             _AsyncBaseDynamicConfigT,
@@ -41,6 +41,7 @@ def setup_call(
     tool_type: type[_BaseToolT],
     call_params: _BaseCallParamsT | CommonCallParams,
     convert_common_call_params: ConvertCommonParamsFunc[_BaseCallParamsT],
+    convert_text_message: Callable[[str, str], list[Any]] | None = None,
 ) -> tuple[
     str | None,
     list[BaseMessageParam | Any],
@@ -66,6 +67,7 @@ def setup_call(
             template=prompt_template,
             attrs=fn_args,
             dynamic_config=dynamic_config,
+            convert_text_message=convert_text_message,
         )
 
     tool_types = None
@@ -0,0 +1,240 @@
+"""This module contains the `StreamedJsonObject` class."""
+
+import json
+import re
+from typing import Any
+
+_JSON_STRUCTURAL_CHARS = re.compile(r'[{}\[\]"\\]')
+_JSON_STRING_SPECIAL_CHARS = re.compile(r'["\\]')
+_JSON_LITERAL_END_CHARS = re.compile(r"[\s,:\]}]")
+_JSON_STRING_DECODER = json.JSONDecoder(strict=False)
+# A trailing `\uXXXX` high surrogate escape whose low surrogate hasn't been streamed yet
+_JSON_TRAILING_HIGH_SURROGATE = re.compile(
+    r"(?:^|[^\\])(?:\\\\)*(\\u[dD][89abAB][0-9a-fA-F]{2})\Z"
+)
+
+
+def _decode_string(raw: str) -> str:
+    """Decodes the raw (still escaped) contents of a JSON string."""
+    if "\\" not in raw:
+        return raw
+    return _JSON_STRING_DECODER.decode(f'"{raw}"')
+
+
+def _decode_string_prefix(raw: str) -> tuple[str, str]:
+    """Decodes the raw contents of a partially streamed JSON string up to its last
+    complete escape sequence, returning the decoded prefix and the raw remainder."""
+    if "\\" not in raw:
+        return raw, ""
+    decoded, end = None, len(raw)
+    try:
+        decoded = _JSON_STRING_DECODER.decode(f'"{raw}"')
+    except ValueError:
+        # The string ends in the middle of an escape sequence
+        end = raw.rfind("\\")
+    if match := _JSON_TRAILING_HIGH_SURROGATE.search(raw, 0, end):
+        # The pair must be decoded together to decode into a single character
+        decoded, end = None, match.start(1)
+    if decoded is None:
+        decoded = _decode_string(raw[:end])
+    return decoded, raw[end:]
+
+
+class StreamedJsonObject:
+    """Accumulates a streamed JSON object and tracks when it is complete.
+
+    Each fragment is scanned exactly once for the characters that affect nesting, so
+    checking for completeness stays linear in the total length of the object no matter
+    how many fragments it is streamed in.
+
+    When constructed with `partial=True`, each fragment is also parsed incrementally
+    into `value` so that the partially streamed object can be used before it's
+    complete without re-parsing everything streamed so far. Each snapshot of `value`
+    only decodes the part of the current string streamed since the last snapshot,
+    and only copies the containers that are still open (i.e. the path to the value
+    being streamed), sharing the completed containers with earlier snapshots.
+
+    Example:
+
+    ```python
+    arguments = StreamedJsonObject(partial=True)
+    arguments.feed('{"title": "The Name')  # False
+    arguments.value  # {"title": "The Name"}
+    arguments.feed(' of the Wind"}')  # True
+    arguments.text  # '{"title": "The Name of the Wind"}'
+    ```
+    """
+
+    def __init__(self, partial: bool = False) -> None:
+        self.complete = False
+        self.partial = partial
+        self._fragments: list[str] = []
+        self._text = ""
+        self._length = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped_position = -1
+        self._root: Any = None
+        self._containers: list[dict[str, Any] | list[Any]] = []
+        self._slots: list[str | int] = []
+        self._keys: list[str | None] = []
+        self._string: list[str] | None = None
+        self._string_prefix = ""
+        self._string_is_key = False
+        self._string_escaped = False
+        self._literal: list[str] | None = None
+
+    @property
+    def text(self) -> str:
+        """Returns the accumulated JSON text."""
+        if self._fragments:
+            self._text += "".join(self._fragments)
+            self._fragments.clear()
+        return self._text
+
+    @property
+    def value(self) -> Any:  # noqa: ANN401
+        """Returns the value parsed so far, including any partially streamed string.
+
+        Incomplete numbers and literals are omitted until they are complete. The
+        returned value is a snapshot that isn't updated as more fragments are fed, but
+        containers that were already complete are shared between snapshots.
+        """
+        if not self.partial:
+            raise ValueError("`value` requires a `StreamedJsonObject(partial=True)`.")
+        if self._string is not None and not self._string_is_key:
+            decoded, rest = _decode_string_prefix("".join(self._string))
+            self._string = [rest]
+            self._string_prefix += decoded
+            self._replace_last_value(self._string_prefix)
+        if not self._containers:
+            return self._root
+        root = parent = self._containers[0].copy()
+        for container, slot in zip(self._containers[1:], self._slots[1:], strict=True):
+            copy = container.copy()
+            parent[slot] = copy  # pyright: ignore [reportArgumentType, reportCallIssue]
+            parent = copy
+        return root
+
+    def feed(self, fragment: str) -> bool:
+        """Adds `fragment` to the object and returns whether the object is complete."""
+        if not fragment:
+            return self.complete
+        self._fragments.append(fragment)
+        if self.partial:
+            self._parse(fragment)
+            return self.complete
+        for match in _JSON_STRUCTURAL_CHARS.finditer(fragment):
+            position = self._length + match.start()
+            if position == self._escaped_position:
+                continue
+            char = match.group()
+            if self._in_string:
+                if char == "\\":
+                    self._escaped_position = position + 1
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.complete = True
+        self._length += len(fragment)
+        return self.complete
+
+    def _parse(self, fragment: str) -> None:
+        """Incrementally parses `fragment` into the partially constructed value."""
+        index, length = 0, len(fragment)
+        while index < length:
+            if self._string is not None:
+                start = index
+                if self._string_escaped:
+                    self._string_escaped = False
+                    index += 1
+                match = _JSON_STRING_SPECIAL_CHARS.search(fragment, index)
+                while match and match.group() == "\\":
+                    if match.end() == length:
+                        self._string_escaped = True
+                        break
+                    match = _JSON_STRING_SPECIAL_CHARS.search(fragment, match.end() + 1)
+                if match is None or self._string_escaped:
+                    self._string.append(fragment[start:])
+                    return
+                self._string.append(fragment[start : match.start()])
+                self._end_string()
+                index = match.end()
+            elif self._literal is not None:
+                match = _JSON_LITERAL_END_CHARS.search(fragment, index)
+                if match is None:
+                    self._literal.append(fragment[index:])
+                    return
+                self._literal.append(fragment[index : match.start()])
+                self._add_value(json.loads("".join(self._literal)))
+                self._literal = None
+                index = match.start()
+            else:
+                char = fragment[index]
+                index += 1
+                if char == '"':
+                    self._start_string()
+                elif char in "{[":
+                    container = {} if char == "{" else []
+                    self._slots.append(self._add_value(container))
+                    self._containers.append(container)
+                    self._keys.append(None)
+                elif char in "}]":
+                    if self._containers:
+                        self._containers.pop()
+                        self._slots.pop()
+                        self._keys.pop()
+                        self.complete = not self._containers
+                elif not char.isspace() and char not in ",:":
+                    self._literal = [char]
+
+    def _add_value(self, value: Any, complete: bool = True) -> str | int:  # noqa: ANN401
+        """Adds a value to the innermost container (or as the root value), returning
+        the key or index at which it was added."""
+        if not self._containers:
+            self._root = value
+            return ""
+        elif isinstance(container := self._containers[-1], list):
+            container.append(value)
+            return len(container) - 1
+        key = self._keys[-1] or ""
+        container[key] = value
+        if complete:
+            self._keys[-1] = None
+        return key
+
+    def _replace_last_value(self, value: Any) -> None:  # noqa: ANN401
+        """Replaces the value most recently added to the innermost container."""
+        if not self._containers:
+            self._root = value
+        elif isinstance(container := self._containers[-1], list):
+            container[-1] = value
+        else:
+            container[self._keys[-1] or ""] = value
+
+    def _start_string(self) -> None:
+        """Starts a new string, which is either a key or a (pending) value."""
+        self._string = []
+        self._string_is_key = bool(self._containers) and (
+            isinstance(self._containers[-1], dict) and self._keys[-1] is None
+        )
+        if not self._string_is_key:
+            self._add_value("", complete=False)
+
+    def _end_string(self) -> None:
+        """Ends the current string, storing it as a key or value."""
+        assert self._string is not None
+        string = self._string_prefix + _decode_string("".join(self._string))
+        self._string, self._string_prefix = None, ""
+        if self._string_is_key:
+            self._keys[-1] = string
+            return
+        self._replace_last_value(string)
+        if self._containers and isinstance(self._containers[-1], dict):
+            self._keys[-1] = None
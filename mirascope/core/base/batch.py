@@ -0,0 +1,269 @@
+"""The `BaseBatch` class for running calls through a provider's batch API.
+
+usage docs: learn/calls.md#batch-processing
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generic, NoReturn, TypeVar
+
+from ._utils import fn_is_async
+
+_ClientT = TypeVar("_ClientT")
+_ResultT = TypeVar("_ResultT")
+
+
+class BatchError(Exception):
+    """Raised when a batch fails or doesn't finish in time."""
+
+
+class BatchRequestError(Exception):
+    """The error of a single request in a batch."""
+
+    def __init__(self, custom_id: str, message: str) -> None:
+        self.custom_id = custom_id
+        super().__init__(f"Request `{custom_id}` failed: {message}")
+
+
+class _BatchRequest(BaseException):  # noqa: N818
+    """Raised to stop a call once its request has been rendered.
+
+    It isn't an error of the call, so it derives from `BaseException` to pass through
+    the error handling of middleware, `fallback`, and retries (like `GeneratorExit`).
+    """
+
+    def __init__(
+        self, call_kwargs: dict[str, Any], parse: Callable[[Any], Any]
+    ) -> None:
+        self.call_kwargs = call_kwargs
+        self.parse = parse
+
+
+class BatchRequestHandler:
+    """Handles the request of a call in place of the provider's create function."""
+
+    def __init__(self, client: object) -> None:
+        self.client = client
+
+    def handle(
+        self, call_kwargs: dict[str, Any], parse: Callable[[Any], Any]
+    ) -> NoReturn:
+        """Stops the call, collecting its request and the function that parses the
+        provider's response into the call's output."""
+        raise _BatchRequest(call_kwargs, parse)
+
+
+_batch_request_handler: ContextVar[BatchRequestHandler | None] = ContextVar(
+    "mirascope_batch_request_handler", default=None
+)
+
+
+def get_batch_request_handler() -> BatchRequestHandler | None:
+    """Returns the handler of the batch being rendered or parsed, if any."""
+    return _batch_request_handler.get()
+
+
+@contextmanager
+def parse_batch_output(
+    parse_output: Callable[[Any], Any],
+) -> Generator[None, None, None]:
+    """Parses the output of a batch request stopped in this context with
+    `parse_output`, e.g. to extract a `response_model` from the call response."""
+    try:
+        yield
+    except _BatchRequest as request:
+        parse = request.parse
+        request.parse = lambda response: parse_output(parse(response))
+        raise
+
+
+@contextmanager
+def _handle_requests(handler: BatchRequestHandler) -> Generator[None, None, None]:
+    token = _batch_request_handler.set(handler)
+    try:
+        yield
+    finally:
+        _batch_request_handler.reset(token)
+
+
+class BaseBatch(Generic[_ClientT, _ResultT], ABC):
+    """A batch of calls to submit through a provider's batch API.
+
+    Each call added to the batch is rendered through the call's decorator exactly as
+    if it were made directly (including dynamic configuration, tools, `json_mode`,
+    and `response_model`), but its request is collected instead of being sent. Once
+    the batch has been submitted and has finished, each result is parsed back into
+    the same output the call would have returned (e.g. a call response or an
+    instance of its `response_model`), without calling the function again.
+
+    Middleware applied to the function (e.g. `with_budget` or `with_cost_ledger`)
+    only runs when a call is added, which stops (without an error) once its request
+    has been rendered, so it doesn't see the batch's results or their usage.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., _ResultT],
+        *,
+        client: _ClientT | None = None,
+        poll_interval: float = 30.0,
+    ) -> None:
+        """Initializes the batch.
+
+        Args:
+            fn: The decorated (sync) call to make for each request in the batch.
+            client: The client with which to render, submit, and poll the batch.
+            poll_interval: The number of seconds to wait between polls in `wait`.
+
+        Raises:
+            ValueError: If `fn` is async.
+        """
+        if fn_is_async(fn):
+            raise ValueError("Batches only support sync calls.")
+        self.fn = fn
+        self.client: _ClientT = self._default_client() if client is None else client
+        self.poll_interval = poll_interval
+        self.id: str | None = None
+        self.status: str | None = None
+        self._finished = False
+        self._requests: dict[str, _BatchRequest] = {}
+        self._results: dict[str, Any] | None = None
+
+    @abstractmethod
+    def _default_client(self) -> _ClientT:
+        """Returns the client to use when none is provided."""
+        ...
+
+    @abstractmethod
+    def _submit(self, requests: dict[str, dict[str, Any]]) -> str:
+        """Submits the requests (call kwargs by custom ID) and returns the batch ID."""
+        ...
+
+    @abstractmethod
+    def _retrieve_status(self) -> tuple[str, bool]:
+        """Returns the status of the batch and whether it has finished."""
+        ...
+
+    @abstractmethod
+    def _retrieve_results(self) -> dict[str, Any]:
+        """Returns the provider response (or `BatchRequestError`) by custom ID."""
+        ...
+
+    def add(self, *args: Any, custom_id: str | None = None, **kwargs: Any) -> str:  # noqa: ANN401
+        """Adds a call with the given arguments to the batch.
+
+        Args:
+            *args: The positional arguments of the call.
+            custom_id: The ID with which to look up the call's result (defaults to
+                `request-{index}`).
+            **kwargs: The keyword arguments of the call.
+
+        Returns:
+            The custom ID of the request.
+
+        Raises:
+            BatchError: If the batch has already been submitted.
+            ValueError: If the custom ID is already in use.
+        """
+        if self.id is not None:
+            raise BatchError("Cannot add requests to a submitted batch.")
+        if custom_id is None:
+            custom_id = f"request-{len(self._requests)}"
+        if custom_id in self._requests:
+            raise ValueError(f"Duplicate custom ID: {custom_id}")
+        with _handle_requests(BatchRequestHandler(self.client)):
+            try:
+                self.fn(*args, **kwargs)
+            except _BatchRequest as request:
+                self._requests[custom_id] = request
+            else:
+                raise ValueError("Only calls can be added to a batch (not streams).")
+        return custom_id
+
+    def submit(self) -> str:
+        """Submits the batch and returns its ID.
+
+        Raises:
+            BatchError: If the batch is empty or has already been submitted.
+        """
+        if self.id is not None:
+            raise BatchError(f"The batch has already been submitted as `{self.id}`.")
+        if not self._requests:
+            raise BatchError("Cannot submit an empty batch.")
+        self.id = self._submit(
+            {
+                custom_id: request.call_kwargs
+                for custom_id, request in self._requests.items()
+            }
+        )
+        return self.id
+
+    def poll(self) -> bool:
+        """Updates the status of the batch and returns whether it has finished.
+
+        Raises:
+            BatchError: If the batch has not been submitted or has failed.
+        """
+        if self.id is None:
+            raise BatchError("The batch has not been submitted.")
+        if not self._finished:
+            self.status, self._finished = self._retrieve_status()
+        return self._finished
+
+    def wait(self, timeout: float | None = None) -> dict[str, _ResultT | Exception]:
+        """Submits the batch (if necessary), waits for it to finish, and returns the
+        results.
+
+        Args:
+            timeout: The maximum number of seconds to wait for the batch to finish.
+
+        Raises:
+            BatchError: If the batch doesn't finish within `timeout` seconds.
+        """
+        if self.id is None:
+            self.submit()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.poll():
+            if (
+                deadline is not None
+                and time.monotonic() + self.poll_interval > deadline
+            ):
+                raise BatchError(
+                    f"Batch `{self.id}` did not finish within {timeout} seconds "
+                    f"(status: {self.status})."
+                )
+            time.sleep(self.poll_interval)
+        return self.results()
+
+    def results(self) -> dict[str, _ResultT | Exception]:
+        """Returns the output of each call in the batch by custom ID.
+
+        The output is what the call would have returned had it been made directly. A
+        request that failed (or that didn't complete before the batch ended) has a
+        `BatchRequestError` as its output, and an error raised while parsing a
+        response (e.g. a `ValidationError`) is returned as the output.
+
+        Raises:
+            BatchError: If the batch has not finished.
+        """
+        if self.id is None or not self.poll():
+            raise BatchError("The batch has not finished.")
+        if self._results is None:
+            self._results = self._retrieve_results()
+        outputs: dict[str, _ResultT | Exception] = {}
+        for custom_id, request in self._requests.items():
+            response = self._results.get(
+                custom_id,
+                BatchRequestError(custom_id, f"Not completed (status: {self.status})."),
+            )
+            if isinstance(response, BatchRequestError):
+                outputs[custom_id] = response
+                continue
+            try:
+                outputs[custom_id] = request.parse(response)
+            except Exception as e:
+                outputs[custom_id] = e
+        return outputs
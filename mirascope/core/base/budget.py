@@ -0,0 +1,353 @@
+"""The `Budget` class for limiting the tokens and cost of concurrent calls."""
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_active_budgets: ContextVar[tuple["Budget", ...]] = ContextVar(
+    "mirascope_active_budgets", default=()
+)
+
+
+class BudgetExceededError(Exception):
+    """Raised when a call would exceed its budget."""
+
+    def __init__(self, budget: "Budget", cost: float, tokens: int | float) -> None:
+        self.budget = budget
+        self.cost = cost
+        self.tokens = tokens
+        name = f" {budget.name!r}" if budget.name else ""
+        super().__init__(
+            f"Reserving ${cost} and {tokens} tokens would exceed the budget{name} "
+            f"(max cost: {budget.max_cost}, max tokens: {budget.max_tokens}, "
+            f"spent: ${budget.spent_cost} and {budget.spent_tokens} tokens, "
+            f"reserved: ${budget.reserved_cost} and {budget.reserved_tokens} tokens)"
+        )
+
+
+class BudgetReservation:
+    """The estimated cost and tokens of a call reserved against a budget."""
+
+    def __init__(
+        self,
+        budget: "Budget",
+        cost: float,
+        tokens: int | float,
+        unestimated: bool = False,
+    ) -> None:
+        self.budget = budget
+        self.cost = cost
+        self.tokens = tokens
+        self.unestimated = unestimated
+        self.settled = False
+
+    def settle(
+        self, cost: float | None = None, tokens: int | float | None = None
+    ) -> None:
+        """Replaces the reservation with the actual cost and tokens of the call.
+
+        If the actual cost or tokens are unknown (`None`), the estimate is spent.
+        """
+        self.budget._settle(
+            self,
+            self.cost if cost is None else cost,
+            self.tokens if tokens is None else tokens,
+        )
+
+    def release(self) -> None:
+        """Releases the reservation without spending anything (e.g. on error)."""
+        self.budget._settle(self, 0, 0)
+
+
+class _Waiter:
+    """A reservation waiting for the budget to have enough room."""
+
+    __slots__ = ("cost", "tokens", "notify", "reservation", "error")
+
+    def __init__(
+        self,
+        cost: float | None,
+        tokens: int | float | None,
+        notify: Callable[[], None],
+    ) -> None:
+        self.cost = cost
+        self.tokens = tokens
+        self.notify = notify
+        self.reservation: BudgetReservation | None = None
+        self.error: BudgetExceededError | None = None
+
+
+class Budget:
+    """A limit on the tokens and cost of calls, enforced across concurrent calls.
+
+    Each call reserves its estimated cost and tokens before it is made and settles
+    the reservation with its actual usage once its response (or stream) is complete,
+    so concurrent calls only exceed the budget together if they use more than their
+    estimates. Calls that would exceed the budget either raise a `BudgetExceededError`
+    or, with `wait=True`, wait in first-in-first-out order until enough reservations
+    have settled.
+
+    Calls without an estimate reserve the usage of the largest call settled so far.
+    Until a call has settled, there is nothing to estimate from, so calls without an
+    estimate are made one at a time.
+
+    Budgets are attached to calls with `with_budget` or with `Budget.scope`, which
+    applies the budget to every call decorated with `with_budget()` in the current
+    context. Scopes can be nested, e.g. for a per-job budget within a per-tenant one.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base.budget import Budget
+    from mirascope.integrations import with_budget
+
+    tenant_budget = Budget(max_cost=10.0, name="tenant")
+
+
+    @with_budget()
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    with tenant_budget.scope(), Budget(max_tokens=10_000, wait=True).scope():
+        recommend_book("fantasy")
+    ```
+    """
+
+    def __init__(
+        self,
+        max_cost: float | None = None,
+        max_tokens: int | None = None,
+        *,
+        wait: bool = False,
+        timeout: float | None = None,
+        name: str = "",
+    ) -> None:
+        """Initializes the budget.
+
+        Args:
+            max_cost: The maximum total cost of calls in dollars, if any.
+            max_tokens: The maximum total input and output tokens of calls, if any.
+            wait: Whether calls that would exceed the budget wait for in-flight calls
+                to settle their reservations instead of raising immediately.
+            timeout: The maximum number of seconds to wait, if any.
+            name: The name of the budget to include in errors.
+        """
+        self.max_cost = max_cost
+        self.max_tokens = max_tokens
+        self.wait = wait
+        self.timeout = timeout
+        self.name = name
+        self.spent_cost = 0.0
+        self.spent_tokens: int | float = 0
+        self.reserved_cost = 0.0
+        self.reserved_tokens: int | float = 0
+        self.calls = 0
+        self.max_call_cost = 0.0
+        self.max_call_tokens: int | float = 0
+        self._estimating = False
+        self._lock = threading.Lock()
+        self._waiters: deque[_Waiter] = deque()
+
+    @property
+    def average_cost(self) -> float:
+        """Returns the average actual cost of the calls settled so far."""
+        return self.spent_cost / self.calls if self.calls else 0.0
+
+    @property
+    def average_tokens(self) -> float:
+        """Returns the average actual tokens of the calls settled so far."""
+        return self.spent_tokens / self.calls if self.calls else 0.0
+
+    @contextmanager
+    def scope(self) -> Generator["Budget", None, None]:
+        """Applies the budget to calls decorated with `with_budget()` in this context."""
+        token = _active_budgets.set((*_active_budgets.get(), self))
+        try:
+            yield self
+        finally:
+            _active_budgets.reset(token)
+
+    @staticmethod
+    def active() -> tuple["Budget", ...]:
+        """Returns the budgets applied in the current context (outermost first)."""
+        return _active_budgets.get()
+
+    def _fits(self, cost: float, tokens: int | float, committed: bool) -> bool:
+        """Returns whether the reservation fits within the committed (i.e. spent) or
+        total (i.e. spent and reserved) usage of the budget."""
+        used_cost = self.spent_cost + (0 if committed else self.reserved_cost)
+        used_tokens = self.spent_tokens + (0 if committed else self.reserved_tokens)
+        return (self.max_cost is None or used_cost + cost <= self.max_cost) and (
+            self.max_tokens is None or used_tokens + tokens <= self.max_tokens
+        )
+
+    def _estimate(
+        self, cost: float | None, tokens: int | float | None
+    ) -> tuple[float, int | float] | None:
+        """Returns the cost and tokens to reserve, estimating any that are missing from
+        the largest call settled so far (or `None` if no call has settled yet)."""
+        if (cost is None or tokens is None) and not self.calls:
+            return None
+        return (
+            self.max_call_cost if cost is None else cost,
+            self.max_call_tokens if tokens is None else tokens,
+        )
+
+    def _try_reserve(
+        self,
+        cost: float | None,
+        tokens: int | float | None,
+        notify: Callable[[], None],
+    ) -> BudgetReservation | _Waiter:
+        """Reserves immediately or returns a queued waiter. Must hold the lock."""
+        estimate = self._estimate(cost, tokens)
+        if estimate is None and (self._waiters or self._estimating):
+            # Until a call settles, calls without an estimate are made one at a time
+            waiter = _Waiter(cost, tokens, notify)
+            self._waiters.append(waiter)
+            return waiter
+        reserved_cost, reserved_tokens = estimate or (cost or 0.0, tokens or 0)
+        if not self._fits(reserved_cost, reserved_tokens, committed=True):
+            raise BudgetExceededError(self, reserved_cost, reserved_tokens)
+        if (not self._waiters or not self.wait) and self._fits(
+            reserved_cost, reserved_tokens, committed=False
+        ):
+            return self._reserve(reserved_cost, reserved_tokens, estimate is None)
+        if not self.wait:
+            raise BudgetExceededError(self, reserved_cost, reserved_tokens)
+        waiter = _Waiter(cost, tokens, notify)
+        self._waiters.append(waiter)
+        return waiter
+
+    def _reserve(
+        self, cost: float, tokens: int | float, unestimated: bool = False
+    ) -> BudgetReservation:
+        self.reserved_cost += cost
+        self.reserved_tokens += tokens
+        if unestimated:
+            self._estimating = True
+        return BudgetReservation(self, cost, tokens, unestimated)
+
+    def _settle(
+        self, reservation: BudgetReservation, cost: float, tokens: int | float
+    ) -> None:
+        with self._lock:
+            if reservation.settled:
+                return
+            reservation.settled = True
+            self.reserved_cost -= reservation.cost
+            self.reserved_tokens -= reservation.tokens
+            if reservation.unestimated:
+                self._estimating = False
+            if cost or tokens:
+                # The call has already been made, so usage beyond the estimate is
+                # spent even if it exceeds the budget (which then rejects every
+                # reservation that doesn't fit in what is left, if anything)
+                self.spent_cost += cost
+                self.spent_tokens += tokens
+                self.calls += 1
+                self.max_call_cost = max(self.max_call_cost, cost)
+                self.max_call_tokens = max(self.max_call_tokens, tokens)
+            notify = self._grant_waiters()
+        for waiter in notify:
+            waiter.notify()
+
+    def _grant_waiters(self) -> list[_Waiter]:
+        """Grants queued reservations in order while they fit. Must hold the lock."""
+        granted = []
+        while self._waiters:
+            waiter = self._waiters[0]
+            estimate = self._estimate(waiter.cost, waiter.tokens)
+            if estimate is None and self._estimating:
+                break
+            cost, tokens = estimate or (waiter.cost or 0.0, waiter.tokens or 0)
+            if not self._fits(cost, tokens, committed=True):
+                waiter.error = BudgetExceededError(self, cost, tokens)
+            elif self._fits(cost, tokens, committed=False):
+                waiter.reservation = self._reserve(cost, tokens, estimate is None)
+            elif not self.wait:
+                waiter.error = BudgetExceededError(self, cost, tokens)
+            else:
+                break
+            granted.append(self._waiters.popleft())
+        return granted
+
+    def _cancel(self, waiter: _Waiter) -> None:
+        """Stops waiting, releasing the reservation if it was granted meanwhile."""
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                notify = self._grant_waiters()
+            else:
+                notify = []
+        if waiter.reservation is not None:
+            waiter.reservation.release()
+        for other in notify:
+            other.notify()
+
+    def _result(self, waiter: _Waiter) -> BudgetReservation:
+        if waiter.error is not None:
+            raise waiter.error
+        assert waiter.reservation is not None
+        return waiter.reservation
+
+    def reserve(
+        self, cost: float | None = 0.0, tokens: int | float | None = 0
+    ) -> BudgetReservation:
+        """Reserves `cost` and `tokens`, waiting for room if the budget waits.
+
+        A cost or tokens of `None` is estimated from the largest call settled so far.
+        Until a call has settled, such reservations are granted one at a time (waiting
+        even if the budget doesn't).
+
+        Raises:
+            BudgetExceededError: If the reservation would exceed the budget (or can't
+                be made within the timeout).
+        """
+        event = threading.Event()
+        with self._lock:
+            result = self._try_reserve(cost, tokens, event.set)
+        if isinstance(result, BudgetReservation):
+            return result
+        if not event.wait(self.timeout):
+            self._cancel(result)
+            raise BudgetExceededError(self, cost or 0.0, tokens or 0)
+        return self._result(result)
+
+    async def reserve_async(
+        self, cost: float | None = 0.0, tokens: int | float | None = 0
+    ) -> BudgetReservation:
+        """Reserves `cost` and `tokens`, asynchronously waiting for room if the budget
+        waits.
+
+        A cost or tokens of `None` is estimated as with `reserve`.
+
+        Raises:
+            BudgetExceededError: If the reservation would exceed the budget (or can't
+                be made within the timeout).
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        with self._lock:
+            result = self._try_reserve(cost, tokens, notify)
+        if isinstance(result, BudgetReservation):
+            return result
+        try:
+            await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            self._cancel(result)
+            raise BudgetExceededError(self, cost or 0.0, tokens or 0) from None
+        except asyncio.CancelledError:
+            self._cancel(result)
+            raise
+        return self._result(result)
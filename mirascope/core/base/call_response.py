@@ -2,8 +2,23 @@
 
 from __future__ import annotations
 
+import copy
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Generic, TypeVar
+from collections.abc import Callable
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ClassVar,
+    Generic,
+    Literal,
+    TypeAlias,
+    TypeVar,
+    cast,
+    get_args,
+    get_origin,
+)
 
 from pydantic import (
     BaseModel,
@@ -13,9 +28,11 @@ from pydantic import (
     computed_field,
     field_serializer,
 )
+from pydantic_core import to_jsonable_python
 
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
+from .call_tools import call_tools, call_tools_async
 from .dynamic_config import BaseDynamicConfig
 from .metadata import Metadata
 from .tool import BaseTool
@@ -28,6 +45,21 @@ _MessageParamT = TypeVar("_MessageParamT", bound=Any)
 _CallParamsT = TypeVar("_CallParamsT", bound=BaseCallParams)
 _UserMessageParamT = TypeVar("_UserMessageParamT", bound=Any)
 
+ResponseRetention: TypeAlias = Literal["full", "lean", "minimal"]
+"""How much of the request context a call response keeps.
+
+- `"full"` keeps all of it.
+- `"lean"` drops `messages` and every non-scalar entry of `call_kwargs` (such as the
+  messages and tool schemas sent to the provider). `messages` is rebuilt from the
+  prompt and the retained `fn_args` and `dynamic_config` each time it's accessed, so
+  `fn_args` is replaced with a deep copy that later changes to the arguments (e.g.
+  appending to a message history) don't affect. For prompts that return their
+  messages (e.g. `Messages.Type`) or arguments that can't be copied, `messages` is
+  kept instead (dropping the messages in `dynamic_config`, if any).
+- `"minimal"` additionally drops `fn_args`, `dynamic_config`, and `prompt_template`,
+  so `messages` can't be rebuilt and is empty.
+"""
+
 
 class BaseCallResponse(
     BaseModel,
@@ -65,7 +97,7 @@ class BaseCallResponse(
     tool_types: list[type[_BaseToolT]] | None = None
     prompt_template: str | None
     fn_args: dict[str, Any]
-    dynamic_config: _BaseDynamicConfigT
+    dynamic_config: SkipValidation[_BaseDynamicConfigT]
     messages: SkipValidation[list[_MessageParamT]]
     call_params: SkipValidation[_CallParamsT]
     call_kwargs: BaseCallKwargs[_ToolSchemaT]
@@ -75,6 +107,9 @@ class BaseCallResponse(
 
     _provider: ClassVar[str] = "NO PROVIDER"
     _model: str = "NO MODEL"
+    _rebuild_messages: (
+        Callable[[dict[str, Any], _BaseDynamicConfigT], list[_MessageParamT]] | None
+    ) = None
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
@@ -84,6 +119,71 @@ class BaseCallResponse(
     ) -> list[dict[str, str]]:
         return [{"type": "function", "name": tool._name()} for tool in tool_types or []]
 
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+            if name == "messages" and self._rebuild_messages is not None:
+                return self._rebuild_messages(self.fn_args, self.dynamic_config)
+            return super().__getattr__(name)
+
+    def _retain(
+        self,
+        retention: ResponseRetention,
+        rebuild_messages: Callable[
+            [dict[str, Any], _BaseDynamicConfigT], list[_MessageParamT]
+        ],
+    ) -> None:
+        """Drops the request context that `retention` doesn't keep."""
+        if retention == "full":
+            return
+        self.call_kwargs = cast(
+            BaseCallKwargs[_ToolSchemaT],
+            {
+                key: value
+                for key, value in self.call_kwargs.items()
+                if value is None or isinstance(value, str | int | float)
+            },
+        )
+        if retention == "lean":
+            if self.dynamic_config is not None and "messages" in self.dynamic_config:
+                # Messages returned by the prompt function can't be rebuilt, so only
+                # their provider-specific copy is kept
+                self.dynamic_config = cast(
+                    _BaseDynamicConfigT,
+                    {k: v for k, v in self.dynamic_config.items() if k != "messages"},
+                )
+            else:
+                try:
+                    # The messages must be rebuilt from the arguments as they were
+                    # when the call was made, even if they're mutated afterwards
+                    self.fn_args = copy.deepcopy(self.fn_args)
+                except Exception:
+                    return
+                del self.messages
+                self._rebuild_messages = rebuild_messages
+        else:
+            self.messages = []
+            self.fn_args = {}
+            self.dynamic_config = cast(_BaseDynamicConfigT, None)
+            self.prompt_template = None
+
+    @classmethod
+    def _dump_response(cls, response: _ResponseT) -> Any:  # noqa: ANN401
+        """Returns the provider's response as JSON data for `_load_response`."""
+        if isinstance(response, BaseModel):
+            return response.model_dump(mode="json", by_alias=True, exclude_unset=True)
+        return to_jsonable_python(response, bytes_mode="base64")
+
+    @classmethod
+    def _load_response(cls, data: Any) -> _ResponseT:  # noqa: ANN401
+        """Returns the provider's response rebuilt from `_dump_response` data."""
+        response_type = cls.model_fields["response"].annotation
+        if get_origin(response_type) is Annotated:
+            response_type = get_args(response_type)[0]
+        if inspect.isclass(response_type) and issubclass(response_type, BaseModel):
+            return cast(_ResponseT, response_type.model_validate(data))
+        return data
+
     def __str__(self) -> str:
         """Returns the string content of the response."""
         return self.content
@@ -178,6 +278,50 @@ class BaseCallResponse(
         """Returns the 0th tool for the 0th choice message."""
         ...
 
+    def call_tools(
+        self, *, timeout: float | None = None, return_exceptions: bool = False
+    ) -> list[tuple[_BaseToolT, Any]]:
+        """Calls all of the response's tools concurrently in a shared thread pool.
+
+        Args:
+            timeout: The maximum number of seconds to wait for each tool.
+            return_exceptions: Whether to return exceptions raised by a tool as its
+                output instead of raising them.
+
+        Returns:
+            The list of `(tool, output)` tuples in order, ready to be passed to
+            `tool_message_params`.
+        """
+        return call_tools(
+            self.tools or [], timeout=timeout, return_exceptions=return_exceptions
+        )
+
+    async def call_tools_async(
+        self,
+        *,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[tuple[_BaseToolT, Any]]:
+        """Calls all of the response's tools concurrently.
+
+        Args:
+            max_concurrency: The maximum number of tools to run at the same time.
+            timeout: The maximum number of seconds each tool may run for.
+            return_exceptions: Whether to return exceptions raised by a tool as its
+                output instead of raising them.
+
+        Returns:
+            The list of `(tool, output)` tuples in order, ready to be passed to
+            `tool_message_params`.
+        """
+        return await call_tools_async(
+            self.tools or [],
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            return_exceptions=return_exceptions,
+        )
+
     @classmethod
     @abstractmethod
     def tool_message_params(
@@ -0,0 +1,217 @@
+"""Functions for executing multiple tool calls concurrently.
+
+usage docs: learn/tools.md#calling-tools-concurrently
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import time
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+from ._utils import fn_is_async
+from .deadline import DeadlineExceededError, limit_timeout
+from .tool import BaseTool
+
+_BaseToolT = TypeVar("_BaseToolT", bound=BaseTool)
+
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Returns the thread pool shared by all concurrent sync tool executions."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix="mirascope-tools"
+                )
+    return _executor
+
+
+def _timeout_error(
+    tool: BaseTool, timeout: float | None, limited_timeout: float | None
+) -> TimeoutError:
+    if limited_timeout != timeout:
+        return DeadlineExceededError(f"Tool `{tool._name()}` exceeded the deadline.")
+    return TimeoutError(f"Tool `{tool._name()}` timed out after {timeout} seconds.")
+
+
+def _call_tool(tool: BaseTool) -> Any:  # noqa: ANN401
+    if fn_is_async(tool.call):
+        return asyncio.run(tool.call())
+    return tool.call()
+
+
+def call_tools(
+    tools: Sequence[_BaseToolT],
+    *,
+    timeout: float | None = None,
+    return_exceptions: bool = False,
+) -> list[tuple[_BaseToolT, Any]]:
+    """Calls all of the given tools concurrently using a shared thread pool.
+
+    Async tools are run to completion inside of their worker thread.
+
+    Example:
+
+    ```python
+    from mirascope.core import call_tools, openai
+
+
+    def get_weather(city: str) -> str:
+        return f"It's sunny in {city}"
+
+
+    @openai.call("gpt-4o-mini", tools=[get_weather])
+    def weather(cities: list[str]) -> str:
+        return f"What's the weather in {cities}?"
+
+
+    response = weather(["Tokyo", "Paris"])
+    if tools := response.tools:
+        tools_and_outputs = call_tools(tools, timeout=10)
+        tool_messages = response.tool_message_params(tools_and_outputs)
+    ```
+
+    Args:
+        tools: The tools to call.
+        timeout: The maximum number of seconds to wait for each tool, counted from
+            when the tools are submitted. Note that a timed out sync tool cannot be
+            interrupted and will continue running in the background. The tools also
+            stop at the deadline of the current `call_deadline` context, if any.
+        return_exceptions: Whether to return exceptions raised by a tool (including
+            `TimeoutError`) as its output instead of raising them.
+
+    Returns:
+        The list of `(tool, output)` tuples in the same order as `tools`, ready to be
+        passed to `tool_message_params`.
+
+    Raises:
+        TimeoutError: If a tool does not finish within `timeout` seconds (or before
+            the deadline, as a `DeadlineExceededError`) and `return_exceptions` is
+            `False`.
+    """
+    executor = get_tool_executor()
+    limited_timeout = limit_timeout(timeout)
+    deadline = None if limited_timeout is None else time.monotonic() + limited_timeout
+    futures = [
+        executor.submit(contextvars.copy_context().run, _call_tool, tool)
+        for tool in tools
+    ]
+    tools_and_outputs: list[tuple[_BaseToolT, Any]] = []
+    try:
+        for tool, future in zip(tools, futures, strict=True):
+            remaining = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            try:
+                output = future.result(timeout=remaining)
+            except concurrent.futures.TimeoutError:
+                error = _timeout_error(tool, timeout, limited_timeout)
+                if not return_exceptions:
+                    raise error
+                output = error
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                output = e
+            tools_and_outputs.append((tool, output))
+    finally:
+        for future in futures:
+            future.cancel()
+    return tools_and_outputs
+
+
+async def call_tools_async(
+    tools: Sequence[_BaseToolT],
+    *,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
+    return_exceptions: bool = False,
+) -> list[tuple[_BaseToolT, Any]]:
+    """Calls all of the given tools concurrently.
+
+    Async tools are awaited on the running event loop while sync tools are run in a
+    shared thread pool so that they don't block the event loop.
+
+    Example:
+
+    ```python
+    import asyncio
+
+    from mirascope.core import call_tools_async, openai
+
+
+    async def get_weather(city: str) -> str:
+        return f"It's sunny in {city}"
+
+
+    @openai.call("gpt-4o-mini", tools=[get_weather])
+    async def weather(cities: list[str]) -> str:
+        return f"What's the weather in {cities}?"
+
+
+    async def main() -> None:
+        response = await weather(["Tokyo", "Paris"])
+        if tools := response.tools:
+            tools_and_outputs = await call_tools_async(tools, max_concurrency=5)
+            tool_messages = response.tool_message_params(tools_and_outputs)
+
+
+    asyncio.run(main())
+    ```
+
+    Args:
+        tools: The tools to call.
+        max_concurrency: The maximum number of tools to run at the same time. If
+            `None`, all tools are run at once.
+        timeout: The maximum number of seconds each tool may run for. Note that a
+            timed out sync tool cannot be interrupted and will continue running in the
+            background. The tools also stop at the deadline of the current
+            `call_deadline` context, if any.
+        return_exceptions: Whether to return exceptions raised by a tool (including
+            `TimeoutError`) as its output instead of raising them.
+
+    Returns:
+        The list of `(tool, output)` tuples in the same order as `tools`, ready to be
+        passed to `tool_message_params`.
+
+    Raises:
+        TimeoutError: If a tool does not finish within `timeout` seconds (or before
+            the deadline, as a `DeadlineExceededError`) and `return_exceptions` is
+            `False`.
+    """
+    loop = asyncio.get_running_loop()
+    limited_timeout = limit_timeout(timeout)
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def run(tool: _BaseToolT) -> Any:  # noqa: ANN401
+        if fn_is_async(tool.call):
+            return await tool.call()
+        return await loop.run_in_executor(
+            get_tool_executor(), contextvars.copy_context().run, tool.call
+        )
+
+    async def run_with_timeout(tool: _BaseToolT) -> Any:  # noqa: ANN401
+        try:
+            if semaphore is None:
+                return await asyncio.wait_for(run(tool), limited_timeout)
+            async with semaphore:
+                return await asyncio.wait_for(run(tool), limited_timeout)
+        except asyncio.TimeoutError:
+            raise _timeout_error(tool, timeout, limited_timeout)
+
+    tasks = [asyncio.ensure_future(run_with_timeout(tool)) for tool in tools]
+    try:
+        outputs = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return list(zip(tools, outputs, strict=True))
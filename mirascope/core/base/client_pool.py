@@ -0,0 +1,348 @@
+"""The `ClientPool` class for load balancing calls across clients.
+
+usage docs: learn/calls.md#client-pools
+"""
+
+import inspect
+import threading
+import time
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from typing import Any, Generic, Literal, TypeVar
+
+from pydantic import BaseModel
+
+_ClientT = TypeVar("_ClientT")
+_SetupCallT = TypeVar("_SetupCallT", bound=Callable[..., tuple])
+
+
+def get_status_code(error: Exception) -> int | None:
+    """Returns the HTTP status code of a provider SDK error, if any."""
+    for attribute in ("status_code", "code", "status"):
+        if isinstance(status_code := getattr(error, attribute, None), int):
+            return status_code
+    response = getattr(error, "response", None)
+    if isinstance(status_code := getattr(response, "status_code", None), int):
+        return status_code
+    if isinstance(response, Mapping):  # e.g. botocore's `ClientError`
+        status_code = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if isinstance(status_code, int):
+            return status_code
+    return None
+
+
+def is_overloaded_error(error: Exception) -> bool:
+    """Returns whether the error is a rate limit (429) or server (5xx) error."""
+    status_code = get_status_code(error)
+    return status_code is not None and (status_code == 429 or status_code >= 500)
+
+
+class EndpointStats(BaseModel):
+    """The statistics of a single endpoint (i.e. client) in a `ClientPool`."""
+
+    name: str
+    weight: float
+    requests: int
+    """The number of requests made with the endpoint."""
+
+    failures: int
+    """The number of requests that raised an error."""
+
+    outstanding: int
+    """The number of requests currently in flight."""
+
+    ejections: int
+    """The number of times the endpoint was ejected from the pool."""
+
+    ejected_for: float
+    """The number of seconds until the endpoint rejoins the pool (0 if healthy)."""
+
+
+class _Endpoint(Generic[_ClientT]):
+    """The mutable state of an endpoint in the pool."""
+
+    __slots__ = (
+        "name",
+        "client",
+        "weight",
+        "current_weight",
+        "requests",
+        "failures",
+        "outstanding",
+        "ejections",
+        "ejected_until",
+    )
+
+    def __init__(self, name: str, client: _ClientT, weight: float) -> None:
+        self.name = name
+        self.client = client
+        self.weight = weight
+        self.current_weight = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.outstanding = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+
+class ClientLease(Generic[_ClientT]):
+    """A client acquired from a `ClientPool` for a single request.
+
+    A lease only counts towards its endpoint's requests once it is started, so a lease
+    that is never used (e.g. a stream that is never iterated) needs no release.
+    """
+
+    def __init__(
+        self, pool: "ClientPool[_ClientT]", endpoint: _Endpoint, started: bool = True
+    ) -> None:
+        self._pool = pool
+        self._endpoint = endpoint
+        self._started = started
+        self._released = False
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the endpoint."""
+        return self._endpoint.name
+
+    @property
+    def client(self) -> _ClientT:
+        """Returns the client of the endpoint."""
+        return self._endpoint.client
+
+    def start(self) -> None:
+        """Counts the request towards the endpoint, if it hasn't been already."""
+        if not self._started:
+            self._started = True
+            self._pool._start(self._endpoint)
+
+    def release(self, error: Exception | None = None) -> None:
+        """Returns the client to the pool, recording the request's error (if any)."""
+        if self._started and not self._released:
+            self._released = True
+            self._pool._release(self._endpoint, error)
+
+    def wrap_create(self, create: Callable, is_async: bool) -> Callable:
+        """Wraps a provider's create function to start the lease when the request is
+        sent and release it once the request (or stream) completes."""
+        if is_async:
+
+            async def create_async(*, stream: bool = False, **kwargs: Any) -> Any:  # noqa: ANN401
+                self.start()
+                try:
+                    response = await create(stream=stream, **kwargs)
+                except BaseException as e:
+                    self.release(e if isinstance(e, Exception) else None)
+                    raise
+                if not stream:
+                    self.release()
+                    return response
+                return self._wrap_stream_async(response)
+
+            return create_async
+
+        def create_sync(*, stream: bool = False, **kwargs: Any) -> Any:  # noqa: ANN401
+            self.start()
+            try:
+                response = create(stream=stream, **kwargs)
+            except BaseException as e:
+                self.release(e if isinstance(e, Exception) else None)
+                raise
+            if not stream:
+                self.release()
+                return response
+            return self._wrap_stream(response)
+
+        return create_sync
+
+    def _wrap_stream(self, stream: Iterable) -> Generator:
+        try:
+            yield from stream
+        except Exception as e:
+            self.release(e)
+            raise
+        finally:
+            self.release()
+
+    async def _wrap_stream_async(self, stream: AsyncGenerator) -> AsyncGenerator:
+        try:
+            async for chunk in stream:
+                yield chunk
+        except Exception as e:
+            self.release(e)
+            raise
+        finally:
+            self.release()
+
+
+class ClientPool(Generic[_ClientT]):
+    """A pool of clients (e.g. API keys or deployments) to balance calls across.
+
+    A pool can be used anywhere a client can, i.e. as the `client` argument of a call
+    decorator or in the `client` of a call's dynamic configuration. Each call uses the
+    client chosen by the pool's `strategy`:
+
+    - `round_robin`: smooth weighted round-robin, so a client with weight 2 is used
+        twice as often as a client with weight 1.
+    - `least_outstanding`: the client with the fewest requests in flight relative to
+        its weight.
+
+    A client whose request raises a rate limit (429) or server (5xx) error is ejected
+    from the pool for `cooldown` seconds. If every client is ejected, the client that
+    rejoins the pool first is used.
+
+    Example:
+
+    ```python
+    from openai import OpenAI
+
+    from mirascope.core import openai
+    from mirascope.core.base.client_pool import ClientPool
+
+    pool = ClientPool(
+        {"primary": OpenAI(api_key="..."), "secondary": OpenAI(api_key="...")},
+        weights={"primary": 2, "secondary": 1},
+    )
+
+
+    @openai.call("gpt-4o-mini", client=pool)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    recommend_book("fantasy")
+    print(pool.stats())
+    ```
+    """
+
+    def __init__(
+        self,
+        clients: Mapping[str, _ClientT] | Sequence[_ClientT],
+        *,
+        weights: Mapping[str, float] | Sequence[float] | None = None,
+        strategy: Literal["round_robin", "least_outstanding"] = "round_robin",
+        cooldown: float = 30.0,
+        should_eject: Callable[[Exception], bool] = is_overloaded_error,
+    ) -> None:
+        """Initializes the pool.
+
+        Args:
+            clients: The clients to use, optionally by name (defaults to their index).
+            weights: The weight of each client, by name or in order (defaults to 1).
+            strategy: How to choose the client for each call.
+            cooldown: The number of seconds for which to eject a client.
+            should_eject: Whether an error raised by a request should eject its client.
+
+        Raises:
+            ValueError: If there are no clients or a weight is not positive.
+        """
+        named = (
+            dict(clients)
+            if isinstance(clients, Mapping)
+            else {str(i): client for i, client in enumerate(clients)}
+        )
+        if not named:
+            raise ValueError("A client pool requires at least one client.")
+        if weights is None:
+            weights = {}
+        elif not isinstance(weights, Mapping):
+            weights = dict(zip(named, weights, strict=True))
+        self._endpoints = [
+            _Endpoint(name, client, weights.get(name, 1.0))
+            for name, client in named.items()
+        ]
+        if any(endpoint.weight <= 0 for endpoint in self._endpoints):
+            raise ValueError("Client weights must be positive.")
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self.should_eject = should_eject
+        self._lock = threading.Lock()
+
+    def _select(self, endpoints: list[_Endpoint]) -> _Endpoint:
+        if self.strategy == "least_outstanding":
+            return min(endpoints, key=lambda e: e.outstanding / e.weight)
+        total = 0.0
+        for endpoint in endpoints:
+            endpoint.current_weight += endpoint.weight
+            total += endpoint.weight
+        selected = max(endpoints, key=lambda e: e.current_weight)
+        selected.current_weight -= total
+        return selected
+
+    def _next(self) -> _Endpoint:
+        now = time.monotonic()
+        healthy = [e for e in self._endpoints if e.ejected_until <= now]
+        if healthy:
+            return self._select(healthy)
+        return min(self._endpoints, key=lambda e: e.ejected_until)
+
+    def acquire(self, start: bool = True) -> ClientLease[_ClientT]:
+        """Returns a lease on the next client, which must be released after use.
+
+        Args:
+            start: Whether to count the request now rather than when the lease starts.
+        """
+        with self._lock:
+            endpoint = self._next()
+            if start:
+                endpoint.requests += 1
+                endpoint.outstanding += 1
+        return ClientLease(self, endpoint, started=start)
+
+    def _start(self, endpoint: _Endpoint) -> None:
+        with self._lock:
+            endpoint.requests += 1
+            endpoint.outstanding += 1
+
+    def _release(self, endpoint: _Endpoint, error: Exception | None) -> None:
+        eject = error is not None and self.should_eject(error)
+        with self._lock:
+            endpoint.outstanding -= 1
+            if error is not None:
+                endpoint.failures += 1
+            if eject:
+                endpoint.ejections += 1
+                endpoint.ejected_until = time.monotonic() + self.cooldown
+                endpoint.current_weight = 0.0
+
+    def stats(self) -> dict[str, EndpointStats]:
+        """Returns the statistics of each client by name."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                endpoint.name: EndpointStats(
+                    name=endpoint.name,
+                    weight=endpoint.weight,
+                    requests=endpoint.requests,
+                    failures=endpoint.failures,
+                    outstanding=endpoint.outstanding,
+                    ejections=endpoint.ejections,
+                    ejected_for=max(endpoint.ejected_until - now, 0.0),
+                )
+                for endpoint in self._endpoints
+            }
+
+
+def pool_setup_call(setup_call: _SetupCallT) -> _SetupCallT:
+    """Wraps a provider's `setup_call` so that it accepts a `ClientPool` as its client.
+
+    Each call chooses a client from the pool, and the returned create function only
+    counts the request once it is sent, releasing it once the request (or stream)
+    completes. A call that fails before its request is sent (or a stream that is never
+    iterated) therefore never holds a client.
+    """
+
+    def inner(*, client: object, fn: Callable, **kwargs: Any) -> tuple:  # noqa: ANN401
+        if not isinstance(client, ClientPool):
+            return setup_call(client=client, fn=fn, **kwargs)
+        lease = client.acquire(start=False)
+        create, *rest = setup_call(client=lease.client, fn=fn, **kwargs)
+        return (lease.wrap_create(create, inspect.iscoroutinefunction(fn)), *rest)
+
+    return inner  # pyright: ignore [reportReturnType]
@@ -0,0 +1,182 @@
+"""Deadlines that bound the total time spent on calls, retries, and tools.
+
+usage docs: learn/calls.md#deadlines
+"""
+
+import asyncio
+import inspect
+import math
+import time
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Generator, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+_deadline: ContextVar[float | None] = ContextVar("mirascope_deadline", default=None)
+
+_TIMEOUT_KWARGS: dict[str, Callable[[float], dict[str, Any]]] = {
+    "anthropic": lambda timeout: {"timeout": timeout},
+    "azure": lambda timeout: {"connection_timeout": timeout, "read_timeout": timeout},
+    "cohere": lambda timeout: {
+        "request_options": {"timeout_in_seconds": math.ceil(timeout)}
+    },
+    "fake": lambda timeout: {"timeout": timeout},
+    "gemini": lambda timeout: {"request_options": {"timeout": timeout}},
+    "groq": lambda timeout: {"timeout": timeout},
+    "litellm": lambda timeout: {"timeout": timeout},
+    "openai": lambda timeout: {"timeout": timeout},
+}
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when the deadline of the current context has passed."""
+
+
+@contextmanager
+def call_deadline(timeout: float) -> Generator[float, None, None]:
+    """Sets a deadline `timeout` seconds from now for everything run in this context.
+
+    Nested deadlines can only shorten the deadline of the enclosing context. Calls
+    pass the remaining time to the provider's SDK as a per-request timeout, streams
+    are closed once it runs out, and retries and tool executions stop at the deadline.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base.deadline import call_deadline
+
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    with call_deadline(5.0):
+        recommend_book("fantasy")
+    ```
+
+    Yields:
+        The deadline as a `time.monotonic()` timestamp.
+    """
+    deadline = time.monotonic() + timeout
+    if (current := _deadline.get()) is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Returns the number of seconds until the current deadline, if any."""
+    if (deadline := _deadline.get()) is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def check_deadline() -> None:
+    """Raises a `DeadlineExceededError` if the current deadline has passed."""
+    if remaining_time() == 0.0:
+        raise DeadlineExceededError("The deadline was exceeded.")
+
+
+def limit_timeout(timeout: float | None) -> float | None:
+    """Returns the smaller of `timeout` and the time remaining until the deadline."""
+    if (remaining := remaining_time()) is None:
+        return timeout
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def with_timeout_kwargs(
+    call_kwargs: dict[str, Any], response_type: type
+) -> dict[str, Any]:
+    """Returns the call kwargs with the provider's per-request timeout arguments for
+    the time remaining until the deadline, if any.
+
+    Providers whose SDKs don't support per-request timeouts get no extra arguments
+    and rely on the deadline checks between stream chunks instead.
+
+    Args:
+        call_kwargs: The kwargs of the provider's create function.
+        response_type: The provider's call response type, which names the provider.
+
+    Raises:
+        DeadlineExceededError: If the current deadline has passed.
+    """
+    if (remaining := remaining_time()) is None:
+        return call_kwargs
+    check_deadline()
+    provider = getattr(response_type, "_provider", None)
+    if provider not in _TIMEOUT_KWARGS:
+        return call_kwargs
+    return call_kwargs | _TIMEOUT_KWARGS[provider](remaining)
+
+
+def _close(stream: object) -> None:
+    if callable(close := getattr(stream, "close", None)):
+        close()
+
+
+async def _close_async(stream: object) -> None:
+    close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+    if callable(close) and inspect.isawaitable(result := close()):
+        await result
+
+
+def limit_stream(stream: Iterable[_T]) -> Generator[_T, None, None]:
+    """Yields from `stream` until the deadline, then closes it.
+
+    Raises:
+        DeadlineExceededError: If the deadline passes before the stream completes.
+    """
+    if _deadline.get() is None:
+        yield from stream
+        return
+    try:
+        for chunk in stream:
+            check_deadline()
+            yield chunk
+    finally:
+        _close(stream)
+
+
+async def limit_stream_async(stream: AsyncIterable[_T]) -> AsyncGenerator[_T, None]:
+    """Yields from the async `stream` until the deadline, then closes it.
+
+    Raises:
+        DeadlineExceededError: If the deadline passes before the stream completes.
+    """
+    if _deadline.get() is None:
+        async for chunk in stream:
+            yield chunk
+        return
+    iterator = aiter(stream)
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(anext(iterator), remaining_time())
+            except StopAsyncIteration:
+                return
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError("The deadline was exceeded.") from None
+            yield chunk
+    finally:
+        await _close_async(stream)
+
+
+async def wait_for_deadline(awaitable: Any) -> Any:  # noqa: ANN401
+    """Awaits `awaitable`, cancelling it once the deadline passes.
+
+    Raises:
+        DeadlineExceededError: If the deadline passes before `awaitable` completes.
+    """
+    if (remaining := remaining_time()) is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, remaining)
+    except asyncio.TimeoutError:
+        raise DeadlineExceededError("The deadline was exceeded.") from None
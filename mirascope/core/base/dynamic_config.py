@@ -6,6 +6,7 @@ from typing import Any, Generic, TypeVar
 from typing_extensions import NotRequired, TypedDict
 
 from .call_params import BaseCallParams
+from .client_pool import ClientPool
 from .metadata import Metadata
 from .tool import BaseTool
 
@@ -18,6 +19,7 @@ class DynamicConfigBase(TypedDict):
     metadata: NotRequired[Metadata]
     computed_fields: NotRequired[dict[str, Any | list[Any] | list[list[Any]]]]
     tools: NotRequired[list[type[BaseTool] | Callable]]
+    priority: NotRequired[str]
 
 
 class DynamicConfigMessages(DynamicConfigBase, Generic[_MessageParamT]):
@@ -29,7 +31,7 @@ class DynamicConfigCallParams(DynamicConfigBase, Generic[_CallParamsT]):
 
 
 class DynamicConfigClient(DynamicConfigBase, Generic[_ClientT]):
-    client: NotRequired[_ClientT | None]
+    client: NotRequired[_ClientT | ClientPool[_ClientT] | None]
 
 
 class DynamicConfigMessagesCallParams(
@@ -41,12 +43,12 @@ class DynamicConfigMessagesCallParams(
 
 class DynamicConfigMessagesClient(DynamicConfigBase, Generic[_MessageParamT, _ClientT]):
     messages: NotRequired[list[_MessageParamT]]
-    client: NotRequired[_ClientT | None]
+    client: NotRequired[_ClientT | ClientPool[_ClientT] | None]
 
 
 class DynamicConfigCallParamsClient(DynamicConfigBase, Generic[_CallParamsT, _ClientT]):
     call_params: NotRequired[_CallParamsT]
-    client: NotRequired[_ClientT | None]
+    client: NotRequired[_ClientT | ClientPool[_ClientT] | None]
 
 
 class DynamicConfigFull(
@@ -54,7 +56,7 @@ class DynamicConfigFull(
 ):
     messages: NotRequired[list[_MessageParamT]]
     call_params: NotRequired[_CallParamsT]
-    client: NotRequired[_ClientT | None]
+    client: NotRequired[_ClientT | ClientPool[_ClientT] | None]
 
 
 BaseDynamicConfig = (
@@ -78,5 +80,6 @@ Attributes:
     messages: Custom message parameters, which will override any other form of writing
         prompts when used.
     call_params: Call parameters to use when making the LLM API call.
-    client: A custom client to use in place of the default client.
+    client: A custom client (or `ClientPool` of clients) to use in place of the
+        default client.
 """
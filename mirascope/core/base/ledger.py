@@ -0,0 +1,198 @@
+"""The `CostLedger` class for aggregating the usage and cost of calls."""
+
+import threading
+from collections.abc import Callable, Iterable
+from copy import copy
+from typing import Literal
+
+from pydantic import BaseModel
+
+from .call_response import BaseCallResponse
+from .stream import BaseStream
+
+_LedgerKey = tuple[str, str, str, tuple[str, ...]]
+
+
+class LedgerUsage(BaseModel):
+    """The aggregated usage and cost of a number of calls."""
+
+    calls: int = 0
+    """The number of calls."""
+
+    unpriced_calls: int = 0
+    """The number of calls whose cost is unknown (and so not included in `cost`)."""
+
+    input_tokens: int | float = 0
+    """The total number of input tokens."""
+
+    output_tokens: int | float = 0
+    """The total number of output tokens."""
+
+    cost: float = 0
+    """The total cost in dollars."""
+
+    def add(self, usage: "LedgerUsage") -> None:
+        """Adds `usage` to this usage."""
+        self.calls += usage.calls
+        self.unpriced_calls += usage.unpriced_calls
+        self.input_tokens += usage.input_tokens
+        self.output_tokens += usage.output_tokens
+        self.cost += usage.cost
+
+
+class LedgerEntry(LedgerUsage):
+    """The aggregated usage and cost of the calls with the same provider, model,
+    function, and tags."""
+
+    provider: str
+    model: str
+    function: str
+    tags: tuple[str, ...] = ()
+
+
+class LedgerSnapshot(BaseModel):
+    """A point-in-time copy of the entries of a `CostLedger`."""
+
+    entries: list[LedgerEntry]
+
+    def total(self) -> LedgerUsage:
+        """Returns the total usage and cost across all entries."""
+        total = LedgerUsage()
+        for entry in self.entries:
+            total.add(entry)
+        return total
+
+    def group_by(
+        self, key: Literal["provider", "model", "function", "tag"]
+    ) -> dict[str, LedgerUsage]:
+        """Returns the usage and cost grouped by provider, model, function, or tag.
+
+        Entries with multiple tags are included in the group of each of their tags, and
+        entries without any tags are not included when grouping by tag.
+        """
+        groups: dict[str, LedgerUsage] = {}
+        for entry in self.entries:
+            names = entry.tags if key == "tag" else (getattr(entry, key),)
+            for name in names:
+                groups.setdefault(name, LedgerUsage()).add(entry)
+        return groups
+
+
+class _Totals:
+    """The mutable running totals of a ledger entry."""
+
+    __slots__ = ("calls", "unpriced_calls", "input_tokens", "output_tokens", "cost")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.unpriced_calls = 0
+        self.input_tokens: int | float = 0
+        self.output_tokens: int | float = 0
+        self.cost = 0.0
+
+
+class CostLedger:
+    """A thread-safe ledger that aggregates the usage and cost of calls.
+
+    Each call is recorded in constant time under a lock that is never held across an
+    `await`, so a single ledger can be shared by threads and concurrent async calls.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base.ledger import cost_ledger
+    from mirascope.integrations import with_cost_ledger
+
+
+    @with_cost_ledger()
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    recommend_book("fantasy")
+    snapshot = cost_ledger.snapshot()
+    print(snapshot.total().cost)
+    print(snapshot.group_by("model"))
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: dict[_LedgerKey, _Totals] = {}
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        input_tokens: int | float | None,
+        output_tokens: int | float | None,
+        cost: float | None,
+        function: str = "",
+        tags: Iterable[str] = (),
+    ) -> None:
+        """Records the usage and cost of a single call."""
+        key = (provider, model, function, tuple(sorted(tags)) if tags else ())
+        with self._lock:
+            if (totals := self._totals.get(key)) is None:
+                totals = self._totals[key] = _Totals()
+            totals.calls += 1
+            totals.input_tokens += input_tokens or 0
+            totals.output_tokens += output_tokens or 0
+            if cost is None:
+                totals.unpriced_calls += 1
+            else:
+                totals.cost += cost
+
+    def record_response(
+        self, response: BaseCallResponse | BaseStream, fn: Callable | None = None
+    ) -> None:
+        """Records the usage and cost of a call response or consumed stream.
+
+        The call is recorded with its metadata tags and, if provided, the name of `fn`.
+        """
+        self.record(
+            response._provider,
+            response.model or "",
+            response.input_tokens,
+            response.output_tokens,
+            response.cost,
+            fn.__name__ if fn else "",
+            response.metadata.get("tags", ()),
+        )
+
+    @staticmethod
+    def _snapshot(totals: Iterable[tuple[_LedgerKey, _Totals]]) -> LedgerSnapshot:
+        return LedgerSnapshot(
+            entries=[
+                LedgerEntry(
+                    provider=provider,
+                    model=model,
+                    function=function,
+                    tags=tags,
+                    calls=entry.calls,
+                    unpriced_calls=entry.unpriced_calls,
+                    input_tokens=entry.input_tokens,
+                    output_tokens=entry.output_tokens,
+                    cost=entry.cost,
+                )
+                for (provider, model, function, tags), entry in totals
+            ]
+        )
+
+    def snapshot(self) -> LedgerSnapshot:
+        """Returns a copy of the ledger's entries."""
+        with self._lock:
+            totals = [(key, copy(entry)) for key, entry in self._totals.items()]
+        return self._snapshot(totals)
+
+    def reset(self) -> LedgerSnapshot:
+        """Clears the ledger and returns a snapshot of its entries before clearing."""
+        with self._lock:
+            totals, self._totals = self._totals, {}
+        return self._snapshot(totals.items())
+
+
+cost_ledger = CostLedger()
+"""The process-wide ledger used by `with_cost_ledger` by default."""
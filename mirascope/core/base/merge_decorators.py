@@ -2,6 +2,8 @@ from collections.abc import Callable
 from functools import reduce, wraps
 from typing import Any, ParamSpec, TypeVar
 
+from ._utils import fn_is_async
+
 _P = ParamSpec("_P")
 _R = TypeVar("_R")
 
@@ -9,6 +11,31 @@ _WP = ParamSpec("_WP")
 _WR = TypeVar("_WR")
 
 
+def _compose(f: Callable, d: Callable) -> Callable:
+    """Applies `d` to `f` once, preserving the metadata of `f`.
+
+    Decorators that already use `functools.wraps` are returned as is. Otherwise, the
+    decorated function is wrapped in a thin forwarding function with `f`'s metadata.
+    """
+    decorated = d(f)
+    if hasattr(decorated, "__wrapped__"):
+        return decorated
+
+    if fn_is_async(decorated):
+
+        @wraps(f)
+        async def wrapped_async(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            return await decorated(*args, **kwargs)
+
+        return wrapped_async
+
+    @wraps(f)
+    def wrapped(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        return decorated(*args, **kwargs)
+
+    return wrapped
+
+
 def merge_decorators(
     decorator: Callable[[Callable[_P, _R]], Callable[_WP, _WR]],
     *additional_decorators: Callable[[Callable], Callable],
@@ -18,6 +45,8 @@ def merge_decorators(
     This function allows you to merge multiple decorators into a single decorator factory.
     The decorators are applied in the order they are passed to the function.
     All function metadata (e.g. docstrings, function name) is preserved through the decoration chain.
+    The decorators are applied once when decorating the function, so calling the
+    decorated function has the same overhead as stacking the decorators directly.
 
     Args:
         decorator: The base decorator that determines the type signature of the decorated function.
@@ -45,14 +74,7 @@ def merge_decorators(
 
     def decorator_factory() -> Callable[[Callable[_P, _R]], Callable[_WP, _WR]]:
         def inner(func: Callable[_P, _R]) -> Callable[_WP, _WR]:
-            def compose(f: Callable, d: Callable) -> Callable:
-                @wraps(f)
-                def wrapped(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
-                    return d(f)(*args, **kwargs)
-
-                return wrapped
-
-            return reduce(compose, reversed(decorators), func)  # pyright: ignore [reportReturnType]
+            return reduce(_compose, reversed(decorators), func)  # pyright: ignore [reportReturnType]
 
         return inner
 
@@ -0,0 +1,236 @@
+"""The pricing registry used to calculate the cost of calls."""
+
+import json
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+_BUNDLED_PRICING = Path(__file__).with_name("pricing.json")
+_MODEL_SEPARATORS = "-@:."
+
+
+class ModelPricing(BaseModel):
+    """The price of a model in dollars per unit (i.e. token or character).
+
+    Example:
+
+    ```python
+    from mirascope.core.base.pricing import ModelPricing, pricing_registry
+
+    pricing_registry.register(
+        "openai",
+        "my-fine-tuned-model",
+        ModelPricing(input=0.000_000_3, output=0.000_001_2),
+    )
+    ```
+    """
+
+    input: float
+    """The price of each input unit."""
+
+    output: float
+    """The price of each output unit."""
+
+    cached_input: float | None = None
+    """The price of each input unit read from the prompt cache (defaults to `input`)."""
+
+    cache_write: float | None = None
+    """The price of each input unit written to the prompt cache (defaults to `input`)."""
+
+    unit_size: int = 1
+    """The number of units each price is for (e.g. 1000 for prices per 1k characters)."""
+
+    long_context_threshold: int | None = None
+    """The context length above which the long context prices apply."""
+
+    long_context_input: float | None = None
+    """The price of each input unit above the long context threshold."""
+
+    long_context_output: float | None = None
+    """The price of each output unit above the long context threshold."""
+
+    def calculate_cost(
+        self,
+        input_tokens: int | float,
+        output_tokens: int | float,
+        cached_input_tokens: int | float | None = None,
+        cache_write_tokens: int | float | None = None,
+        context_length: int = 0,
+    ) -> float | None:
+        """Returns the cost of a call, or `None` if the context length isn't priced.
+
+        Args:
+            input_tokens: The number of input tokens not read from or written to the
+                prompt cache.
+            output_tokens: The number of output tokens.
+            cached_input_tokens: The number of input tokens read from the prompt cache.
+            cache_write_tokens: The number of input tokens written to the prompt cache.
+            context_length: The context length of the call.
+        """
+        input_price, output_price = self.input, self.output
+        if (
+            self.long_context_threshold is not None
+            and context_length > self.long_context_threshold
+        ):
+            if self.long_context_input is None or self.long_context_output is None:
+                return None
+            input_price, output_price = (
+                self.long_context_input,
+                self.long_context_output,
+            )
+        cost = (input_tokens / self.unit_size) * input_price + (
+            output_tokens / self.unit_size
+        ) * output_price
+        if cached_input_tokens:
+            cached_input_price = (
+                input_price if self.cached_input is None else self.cached_input
+            )
+            cost += (cached_input_tokens / self.unit_size) * cached_input_price
+        if cache_write_tokens:
+            cache_write_price = (
+                input_price if self.cache_write is None else self.cache_write
+            )
+            cost += (cache_write_tokens / self.unit_size) * cache_write_price
+        return cost
+
+
+class PricingRegistry:
+    """A registry of model prices by provider, loaded once and overridable at runtime.
+
+    Models are looked up by their exact name, then by alias, and finally by the longest
+    registered name (or alias) that prefixes the model name followed by a separator, so
+    that dated and versioned names like `gpt-4o-2024-08-06`, `claude-3-haiku@20240307`,
+    or `anthropic.claude-3-opus-20240229-v1:0` use the price of their base model. The
+    result of each lookup is cached until the registry is updated.
+
+    Example:
+
+    ```python
+    from mirascope.core.base.pricing import pricing_registry
+
+    pricing_registry.lookup("openai", "gpt-4o-mini-2024-07-18")
+    # ModelPricing(input=1.5e-07, output=6e-07, cached_input=7.5e-08, ...)
+
+    pricing_registry.register_alias("openai", "my-gpt", "gpt-4o")
+    pricing_registry.load("path/to/pricing.json")  # Overrides the bundled prices
+    ```
+    """
+
+    def __init__(self, path: str | Path | None = _BUNDLED_PRICING) -> None:
+        """Initializes the registry, which loads the prices at `path` on first use.
+
+        Args:
+            path: The path of a JSON file containing the prices to load. If `None`, the
+                registry starts out empty.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._models: dict[str, dict[str, ModelPricing]] = {}
+        self._aliases: dict[str, dict[str, str]] = {}
+        self._resolved: dict[tuple[str, str], ModelPricing | None] = {}
+
+    def _ensure_loaded(self) -> None:
+        if self._path is None:
+            return
+        with self._lock:
+            if self._path is None:
+                return  # pragma: no cover
+            self._update(json.loads(Path(self._path).read_text()))
+            self._path = None
+
+    def _update(self, data: Mapping[str, Mapping[str, Any]]) -> None:
+        for provider, provider_data in data.items():
+            models = self._models.setdefault(provider, {})
+            for model, pricing in provider_data.get("models", {}).items():
+                models[model] = ModelPricing.model_validate(pricing)
+            self._aliases.setdefault(provider, {}).update(
+                provider_data.get("aliases", {})
+            )
+        self._resolved = {}
+
+    def load(self, source: str | Path | Mapping[str, Mapping[str, Any]]) -> None:
+        """Loads prices from a JSON file (or its parsed contents), overriding any
+        existing prices for the same models.
+
+        The data maps each provider to its `models` (a mapping from model name to the
+        fields of `ModelPricing`) and `aliases` (a mapping from alias to model name).
+        """
+        self._ensure_loaded()
+        data = (
+            source
+            if isinstance(source, Mapping)
+            else json.loads(Path(source).read_text())
+        )
+        with self._lock:
+            self._update(data)
+
+    def register(
+        self, provider: str, model: str, pricing: ModelPricing | Mapping[str, Any]
+    ) -> None:
+        """Registers the pricing of `model`, overriding any existing pricing."""
+        self.load({provider: {"models": {model: pricing}}})
+
+    def register_alias(self, provider: str, alias: str, model: str) -> None:
+        """Registers `alias` as another name of `model`."""
+        self.load({provider: {"aliases": {alias: model}}})
+
+    def lookup(self, provider: str, model: str) -> ModelPricing | None:
+        """Returns the pricing of `model`, or `None` if it isn't priced."""
+        try:
+            return self._resolved[(provider, model)]
+        except KeyError:
+            pass
+        self._ensure_loaded()
+        pricing = self._resolve(provider, model)
+        self._resolved[(provider, model)] = pricing
+        return pricing
+
+    def _resolve(self, provider: str, model: str) -> ModelPricing | None:
+        models = self._models.get(provider, {})
+        aliases = self._aliases.get(provider, {})
+        name = model.rsplit("/", 1)[-1]
+        if name not in models and name not in aliases:
+            name = max(
+                (
+                    candidate
+                    for candidate in (*models, *aliases)
+                    if name.startswith(candidate)
+                    and name[len(candidate) : len(candidate) + 1] in _MODEL_SEPARATORS
+                ),
+                key=len,
+                default=name,
+            )
+        return models.get(aliases.get(name, name))
+
+    def calculate_cost(
+        self,
+        provider: str,
+        model: str,
+        input_tokens: int | float | None,
+        output_tokens: int | float | None,
+        cached_input_tokens: int | float | None = None,
+        cache_write_tokens: int | float | None = None,
+        context_length: int = 0,
+    ) -> float | None:
+        """Returns the cost of a call, or `None` if the usage or model isn't known.
+
+        See `ModelPricing.calculate_cost` for details on each argument.
+        """
+        if input_tokens is None or output_tokens is None:
+            return None
+        if (pricing := self.lookup(provider, model)) is None:
+            return None
+        return pricing.calculate_cost(
+            input_tokens,
+            output_tokens,
+            cached_input_tokens,
+            cache_write_tokens,
+            context_length,
+        )
+
+
+pricing_registry = PricingRegistry()
+"""The registry used to calculate the cost of every call."""
@@ -1,5 +1,7 @@
 """The `BasePrompt` class for better prompt engineering."""
 
+import threading
+import weakref
 from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
 from functools import reduce, wraps
 from typing import (
@@ -18,7 +20,7 @@ from ._utils import (
     MessagesDecorator,
     fn_is_async,
     format_template,
-    get_fn_args,
+    get_fn_args_binder,
     get_metadata,
     get_prompt_template,
     messages_decorator,
@@ -38,6 +40,14 @@ _ResponseModelT = TypeVar("_ResponseModelT", bound=BaseModel | BaseType)
 
 SUPPORTED_MESSAGE_ROLES = ["system", "user", "assistant"]
 
+# The functions decorated by `BasePrompt.run` and `BasePrompt.run_async`, by their call
+# decorator and then by their prompt class, additional decorators, and whether they're
+# async. Entries are dropped once their call decorator is garbage collected.
+_RUN_FNS: weakref.WeakKeyDictionary[Callable, dict[tuple, Callable]] = (
+    weakref.WeakKeyDictionary()
+)
+_RUN_FNS_LOCK = threading.Lock()
+
 
 class BasePrompt(BaseModel):
     """The base class for engineering prompts.
@@ -106,6 +116,55 @@ class BasePrompt(BaseModel):
             "inputs": self.model_dump(),
         }
 
+    def _run_fn(
+        self,
+        call_decorator: Callable,
+        additional_decorators: tuple[Callable, ...],
+        is_async: bool,
+    ) -> Callable:
+        """Returns the prompt as a function decorated by the provided decorators.
+
+        The decorated function only depends on the prompt's class, so it's created once
+        per call decorator and reused by every run with the same decorators. Prompts
+        with dynamic metadata, and decorators that can't be weakly referenced or hashed,
+        get a new function on every run.
+        """
+        dynamic_config = self.dynamic_config()
+
+        def decorate() -> Callable:
+            args_str = ", ".join(self.model_fields)
+            namespace, fn_name = {}, self.__class__.__name__
+            exec(
+                f"{'async ' if is_async else ''}def {fn_name}({args_str}): ...",
+                namespace,
+            )
+            return reduce(
+                lambda res, f: f(res),  # pyright: ignore [reportArgumentType, reportCallIssue]
+                [
+                    metadata(get_metadata(self, dynamic_config)),
+                    prompt_template(get_prompt_template(self)),
+                    call_decorator,
+                    *additional_decorators,
+                ],
+                namespace[fn_name],
+            )
+
+        if dynamic_config and "metadata" in dynamic_config:
+            return decorate()
+        key = (type(self), get_prompt_template(self), additional_decorators, is_async)
+        try:
+            fns = _RUN_FNS.get(call_decorator)
+            hash(key)
+        except TypeError:
+            return decorate()
+        if fns is not None and (fn := fns.get(key)) is not None:
+            return fn
+        with _RUN_FNS_LOCK:
+            fns = _RUN_FNS.setdefault(call_decorator, {})
+            if key not in fns:
+                fns[key] = decorate()
+            return fns[key]
+
     @overload
     def run(
         self,
@@ -167,6 +226,9 @@ class BasePrompt(BaseModel):
     ):
         """Returns the response of calling the API of the provided decorator.
 
+        The prompt is decorated once per call decorator and reused by later runs, so
+        runs that pass the same decorator object skip decorating the prompt again.
+
         Example:
 
         ```python
@@ -184,19 +246,7 @@ class BasePrompt(BaseModel):
         ```
         """
         kwargs = {field: getattr(self, field) for field in self.model_fields}
-        args_str = ", ".join(kwargs.keys())
-        namespace, fn_name = {}, self.__class__.__name__
-        exec(f"def {fn_name}({args_str}): ...", namespace)
-        return reduce(
-            lambda res, f: f(res),  # pyright: ignore [reportArgumentType, reportCallIssue]
-            [
-                metadata(get_metadata(self, self.dynamic_config())),
-                prompt_template(get_prompt_template(self)),
-                call_decorator,
-                *additional_decorators,
-            ],
-            namespace[fn_name],
-        )(**kwargs)
+        return self._run_fn(call_decorator, additional_decorators, False)(**kwargs)
 
     @overload
     def run_async(
@@ -265,6 +315,9 @@ class BasePrompt(BaseModel):
     ):
         """Returns the response of calling the API of the provided decorator.
 
+        The prompt is decorated once per call decorator and reused by later runs, so
+        runs that pass the same decorator object skip decorating the prompt again.
+
         Example:
 
         ```python
@@ -288,19 +341,7 @@ class BasePrompt(BaseModel):
         ```
         """
         kwargs = {field: getattr(self, field) for field in self.model_fields}
-        args_str = ", ".join(kwargs.keys())
-        namespace, fn_name = {}, self.__class__.__name__
-        exec(f"async def {fn_name}({args_str}): ...", namespace)
-        return reduce(
-            lambda res, f: f(res),  # pyright: ignore [reportArgumentType, reportCallIssue]
-            [
-                metadata(get_metadata(self, self.dynamic_config())),
-                prompt_template(get_prompt_template(self)),
-                call_decorator,
-                *additional_decorators,
-            ],
-            namespace[fn_name],
-        )(**kwargs)
+        return self._run_fn(call_decorator, additional_decorators, True)(**kwargs)
 
 
 _BasePromptT = TypeVar("_BasePromptT", bound=BasePrompt)
@@ -401,6 +442,7 @@ def prompt_template(
         if isinstance(prompt, type):
             return prompt
 
+        bind_fn_args = get_fn_args_binder(prompt)
         if fn_is_async(prompt):
 
             @wraps(prompt)
@@ -410,7 +452,7 @@ def prompt_template(
                 return parse_prompt_messages(
                     roles=SUPPORTED_MESSAGE_ROLES,
                     template=template,
-                    attrs=get_fn_args(prompt, args, kwargs),
+                    attrs=bind_fn_args(args, kwargs),
                     dynamic_config=await prompt(*args, **kwargs),
                 )
 
@@ -426,7 +468,7 @@ def prompt_template(
                 return parse_prompt_messages(
                     roles=SUPPORTED_MESSAGE_ROLES,
                     template=template,
-                    attrs=get_fn_args(prompt, args, kwargs),
+                    attrs=bind_fn_args(args, kwargs),
                     dynamic_config=prompt(*args, **kwargs),
                 )
 
@@ -0,0 +1,448 @@
+"""Recording and replaying the provider requests made by calls.
+
+usage docs: learn/calls.md#recording-and-replay
+"""
+
+import asyncio
+import base64
+import hashlib
+import importlib
+import inspect
+import json
+import pickle
+import queue
+import threading
+import time
+import warnings
+from collections import defaultdict, deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+_T = TypeVar("_T")
+
+# The per-request timeouts set by deadlines change from call to call
+_VOLATILE_KWARGS = {"timeout", "connection_timeout", "read_timeout", "request_options"}
+
+
+class RecordingNotFoundError(LookupError):
+    """Raised when a replayed request has no matching recording."""
+
+
+def _request_key(kwargs: dict[str, Any], stream: bool) -> str:
+    request = {k: v for k, v in kwargs.items() if k not in _VOLATILE_KWARGS}
+    data = json.dumps(
+        [_jsonable(request), stream], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def _jsonable(value: object) -> Any:  # noqa: ANN401
+    return to_jsonable_python(value, fallback=repr, bytes_mode="base64")
+
+
+def _encode(value: object) -> dict[str, Any]:
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        return {
+            "type": f"{cls.__module__}:{cls.__qualname__}",
+            "data": value.model_dump(mode="json", by_alias=True, exclude_unset=True),
+        }
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        # Responses that aren't JSON (e.g. protobuf messages) are pickled
+        return {"pickle": base64.b64encode(pickle.dumps(value)).decode()}
+    return {"data": value}
+
+
+def _decode(value: dict[str, Any]) -> Any:  # noqa: ANN401
+    if "pickle" in value:
+        return pickle.loads(base64.b64decode(value["pickle"]))  # noqa: S301
+    if "type" in value:
+        module, qualname = value["type"].split(":")
+        cls: Any = importlib.import_module(module)
+        for name in qualname.split("."):
+            cls = getattr(cls, name)
+        return cls.model_validate(value["data"])
+    return value["data"]
+
+
+def _close(stream: object) -> None:
+    if callable(close := getattr(stream, "close", None)):
+        close()
+
+
+async def _close_async(stream: object) -> None:
+    close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+    if callable(close) and inspect.isawaitable(result := close()):
+        await result
+
+
+class CallRecorder:
+    """Appends the requests and responses of calls to a JSON Lines recording.
+
+    Each completed request is written as a single line with its kwargs, the time the
+    provider took to respond, and the response. Streams are written once they have
+    been fully consumed, with each chunk and the time spent waiting for it. Requests
+    that fail or streams that are closed early are not recorded.
+
+    Records are encoded and written by a background thread that keeps the recording
+    open until `close` is called, so recording never blocks the calls (or the event
+    loop of async calls). Records that fail to be encoded or written are counted in
+    `errors` with a warning rather than failing calls that already succeeded.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initializes the recorder.
+
+        Args:
+            path: The path of the recording, which is created or appended to.
+        """
+        self.path = Path(path)
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue[tuple[Any, ...] | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+
+    def _write(
+        self,
+        kwargs: dict[str, Any],
+        stream: bool,
+        latency: float,
+        **record: Callable[[], object],
+    ) -> None:
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run, name="mirascope-call-recorder", daemon=True
+                )
+                self._writer.start()
+        self._queue.put((dict(kwargs), stream, latency, record))
+
+    def _run(self) -> None:
+        file = None
+        try:
+            while (item := self._queue.get()) is not None:
+                kwargs, stream, latency, record = item
+                try:
+                    line = json.dumps(
+                        {
+                            "key": _request_key(kwargs, stream),
+                            "request": _jsonable(kwargs),
+                            "stream": stream,
+                            "latency": round(latency, 6),
+                        }
+                        | {name: encode() for name, encode in record.items()},
+                        separators=(",", ":"),
+                    )
+                    if file is None:
+                        file = self.path.open("a")
+                    file.write(line + "\n")
+                    file.flush()
+                except Exception as error:
+                    self.errors += 1
+                    warnings.warn(
+                        f"Failed to record a request to {self.path}: {error!r}",
+                        stacklevel=1,
+                    )
+        finally:
+            if file is not None:
+                file.close()
+
+    def close(self) -> None:
+        """Waits for the pending records to be written and closes the recording."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                self._queue.put(None)
+                writer.join()
+
+    def _write_stream(
+        self,
+        kwargs: dict[str, Any],
+        latency: float,
+        chunks: list[tuple[float, object]],
+    ) -> None:
+        self._write(
+            kwargs,
+            True,
+            latency,
+            chunks=lambda: [[round(wait, 6), _encode(chunk)] for wait, chunk in chunks],
+        )
+
+    def record_response(
+        self, kwargs: dict[str, Any], response: _T, latency: float
+    ) -> _T:
+        """Records the `response` to a request that took `latency` and returns it."""
+        self._write(kwargs, False, latency, response=lambda: _encode(response))
+        return response
+
+    async def record_response_async(
+        self, kwargs: dict[str, Any], response: Awaitable[_T]
+    ) -> _T:
+        """Awaits and records the `response` to a request and returns it."""
+        start = time.perf_counter()
+        result = await response
+        return self.record_response(kwargs, result, time.perf_counter() - start)
+
+    def record_stream(
+        self, kwargs: dict[str, Any], stream: Iterable[_T], latency: float
+    ) -> Generator[_T, None, None]:
+        """Yields from and records the `stream` of a request that took `latency`."""
+        chunks: list[tuple[float, object]] = []
+        iterator = iter(stream)
+        try:
+            while True:
+                before = time.perf_counter()
+                try:
+                    chunk = next(iterator)
+                except StopIteration:
+                    break
+                chunks.append((time.perf_counter() - before, chunk))
+                yield chunk
+        finally:
+            _close(stream)
+        self._write_stream(kwargs, latency, chunks)
+
+    async def record_stream_async(
+        self, kwargs: dict[str, Any], stream: Awaitable[AsyncIterable[_T]]
+    ) -> AsyncGenerator[_T, None]:
+        """Awaits the `stream` of a request and returns a generator that records it."""
+        start = time.perf_counter()
+        iterable = await stream
+        latency = time.perf_counter() - start
+
+        async def _record() -> AsyncGenerator[_T, None]:
+            chunks: list[tuple[float, object]] = []
+            iterator = aiter(iterable)
+            try:
+                while True:
+                    before = time.perf_counter()
+                    try:
+                        chunk = await anext(iterator)
+                    except StopAsyncIteration:
+                        break
+                    chunks.append((time.perf_counter() - before, chunk))
+                    yield chunk
+            finally:
+                await _close_async(iterable)
+            self._write_stream(kwargs, latency, chunks)
+
+        return _record()
+
+
+class CallReplayer:
+    """Serves the responses of a recording in place of the provider.
+
+    Requests are matched to recordings by their kwargs (excluding per-request
+    timeouts). Identical requests are served their recordings in the order they were
+    recorded, cycling once all of them have been served. Responses are delayed by the
+    recorded provider latencies divided by `speed`, so the framework's own overhead
+    is measured as it would be against the provider.
+
+    Responses that could not be recorded as JSON are pickled, so only replay
+    recordings you trust.
+    """
+
+    def __init__(self, path: str | Path, *, speed: float | None = 1.0) -> None:
+        """Initializes the replayer.
+
+        Args:
+            path: The path of the recording to replay.
+            speed: The factor by which to speed up the recorded latencies, or `None`
+                to serve responses without any delay.
+
+        Raises:
+            ValueError: If `speed` is not positive.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"`speed` must be positive, got {speed}.")
+        self.path = Path(path)
+        self.speed = speed
+        self._lock = threading.Lock()
+        self._records: defaultdict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        with self.path.open() as file:
+            for line in file:
+                # Skips a trailing line left incomplete by an interrupted recording
+                if line.endswith("\n"):
+                    record = json.loads(line)
+                    self._records[record["key"]].append(record)
+
+    def _next(self, kwargs: dict[str, Any], stream: bool) -> dict[str, Any]:
+        key = _request_key(kwargs, stream)
+        with self._lock:
+            if not (records := self._records.get(key)):
+                raise RecordingNotFoundError(
+                    f"No recording in {self.path} matches the "
+                    f"{'streamed ' if stream else ''}request `{key}`."
+                )
+            records.rotate(-1)
+            return records[-1]
+
+    def _delay(self, seconds: float) -> float:
+        return 0.0 if self.speed is None else seconds / self.speed
+
+    def response(self, kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Returns the recorded response to a request.
+
+        Raises:
+            RecordingNotFoundError: If no recording matches the request.
+        """
+        record = self._next(kwargs, False)
+        time.sleep(self._delay(record["latency"]))
+        return _decode(record["response"])
+
+    async def response_async(self, kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Returns the recorded response to a request.
+
+        Raises:
+            RecordingNotFoundError: If no recording matches the request.
+        """
+        record = self._next(kwargs, False)
+        await asyncio.sleep(self._delay(record["latency"]))
+        return _decode(record["response"])
+
+    def stream(self, kwargs: dict[str, Any]) -> Generator[Any, None, None]:
+        """Returns a generator of the recorded stream of a request.
+
+        Raises:
+            RecordingNotFoundError: If no recording matches the request.
+        """
+        record = self._next(kwargs, True)
+
+        def _stream() -> Generator[Any, None, None]:
+            time.sleep(self._delay(record["latency"]))
+            for wait, chunk in record["chunks"]:
+                time.sleep(self._delay(wait))
+                yield _decode(chunk)
+
+        return _stream()
+
+    async def stream_async(self, kwargs: dict[str, Any]) -> AsyncGenerator[Any, None]:
+        """Returns an async generator of the recorded stream of a request.
+
+        Raises:
+            RecordingNotFoundError: If no recording matches the request.
+        """
+        record = self._next(kwargs, True)
+        await asyncio.sleep(self._delay(record["latency"]))
+
+        async def _stream() -> AsyncGenerator[Any, None]:
+            for wait, chunk in record["chunks"]:
+                await asyncio.sleep(self._delay(wait))
+                yield _decode(chunk)
+
+        return _stream()
+
+
+_call_recorder: ContextVar[CallRecorder | None] = ContextVar(
+    "mirascope_call_recorder", default=None
+)
+_call_replayer: ContextVar[CallReplayer | None] = ContextVar(
+    "mirascope_call_replayer", default=None
+)
+
+
+def get_call_recorder() -> CallRecorder | None:
+    """Returns the recorder of the current context, if any."""
+    return _call_recorder.get()
+
+
+def get_call_replayer() -> CallReplayer | None:
+    """Returns the replayer of the current context, if any."""
+    return _call_replayer.get()
+
+
+@contextmanager
+def record_calls(path: str | Path) -> Generator[CallRecorder, None, None]:
+    """Records the provider requests of every call made in this context to `path`.
+
+    Recording happens at the boundary of each provider's create function, so it
+    works the same for every provider, streamed or not, sync or async. The recording
+    is an append-only JSON Lines file that can be replayed with `replay_calls`, and
+    all of its records have been written once the context exits.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base.recording import record_calls
+
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    with record_calls("traffic.jsonl"):
+        recommend_book("fantasy")
+    ```
+
+    Yields:
+        The recorder of this context.
+    """
+    recorder = CallRecorder(path)
+    token = _call_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _call_recorder.reset(token)
+        recorder.close()
+
+
+@contextmanager
+def replay_calls(
+    path: str | Path, *, speed: float | None = 1.0
+) -> Generator[CallReplayer, None, None]:
+    """Serves the provider requests of every call made in this context from `path`.
+
+    No requests are sent to the provider while replaying, but the provider's client
+    is still constructed, so any credentials it requires must be set (dummy values
+    are fine).
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base.recording import replay_calls
+
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    with replay_calls("traffic.jsonl", speed=10.0):
+        recommend_book("fantasy")  # served from the recording 10x faster
+    ```
+
+    Args:
+        path: The path of the recording to replay.
+        speed: The factor by which to speed up the recorded latencies, or `None` to
+            serve responses without any delay.
+
+    Yields:
+        The replayer of this context.
+
+    Raises:
+        ValueError: If `speed` is not positive.
+    """
+    replayer = CallReplayer(path, speed=speed)
+    token = _call_replayer.set(replayer)
+    try:
+        yield replayer
+    finally:
+        _call_replayer.reset(token)
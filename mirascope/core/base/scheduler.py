@@ -0,0 +1,371 @@
+"""The `CallScheduler` class for prioritizing calls that share a provider quota.
+
+usage docs: learn/calls.md#priority-scheduling
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Generator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from pydantic import BaseModel
+
+from .deadline import DeadlineExceededError, remaining_time, wait_for_deadline
+
+_call_scheduler: "CallScheduler | None" = None
+_call_priority: ContextVar[str | None] = ContextVar(
+    "mirascope_call_priority", default=None
+)
+
+
+class PriorityClass(BaseModel):
+    """The configuration of a priority class of calls."""
+
+    weight: float = 1.0
+    """The share of the scheduler's concurrency the class receives when other classes
+    are also waiting, relative to the weights of the other classes."""
+
+    max_concurrency: int | None = None
+    """The maximum number of calls of the class to run at the same time, if any."""
+
+
+class PriorityClassStats(BaseModel):
+    """The statistics of a priority class in a `CallScheduler`."""
+
+    name: str
+    queued: int
+    """The number of calls currently waiting to run."""
+
+    running: int
+    """The number of calls currently running."""
+
+    completed: int
+    """The number of calls that have finished running."""
+
+    total_queue_time: float
+    """The total number of seconds calls spent waiting to run."""
+
+    max_queue_time: float
+    """The longest number of seconds a call spent waiting to run."""
+
+    @property
+    def average_queue_time(self) -> float:
+        """Returns the average number of seconds calls spent waiting to run."""
+        started = self.running + self.completed
+        return self.total_queue_time / started if started else 0.0
+
+
+class _Waiter:
+    """A call waiting for the scheduler to grant it a slot, tagged with its virtual
+    start and finish times."""
+
+    __slots__ = ("enqueued_at", "notify", "granted", "start", "finish")
+
+    def __init__(self, notify: Callable[[], None], start: float, weight: float) -> None:
+        self.enqueued_at = time.perf_counter()
+        self.notify = notify
+        self.granted = False
+        self.start = start
+        self.finish = start + 1 / weight
+
+
+class _Class:
+    """The mutable state of a priority class."""
+
+    __slots__ = (
+        "name",
+        "weight",
+        "max_concurrency",
+        "waiters",
+        "running",
+        "completed",
+        "virtual_finish",
+        "total_queue_time",
+        "max_queue_time",
+    )
+
+    def __init__(self, name: str, config: PriorityClass) -> None:
+        self.name = name
+        self.weight = config.weight
+        self.max_concurrency = config.max_concurrency
+        self.waiters: deque[_Waiter] = deque()
+        self.running = 0
+        self.completed = 0
+        self.virtual_finish = 0.0
+        self.total_queue_time = 0.0
+        self.max_queue_time = 0.0
+
+    def can_run(self) -> bool:
+        return self.max_concurrency is None or self.running < self.max_concurrency
+
+
+class CallScheduler:
+    """A scheduler that runs calls by priority class with weighted fair queuing.
+
+    At most `max_concurrency` calls run at the same time across all classes. When a
+    slot frees up, it is granted to the waiting call of the class with the earliest
+    virtual start time, so that under contention each class receives a share of the
+    slots proportional to its weight (and no class is ever starved). Each class can
+    also limit how many of its calls run at the same time.
+
+    Once installed with `set_call_scheduler`, every call waits for a slot before its
+    request is made and releases it once the response (or stream) completes. A call's
+    priority class is taken from, in order of precedence, its dynamic configuration's
+    `priority`, the innermost `call_priority` context, the `priority` argument of its
+    decorator, and the scheduler's `default` class.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base.scheduler import (
+        CallScheduler,
+        PriorityClass,
+        call_priority,
+        set_call_scheduler,
+    )
+
+    set_call_scheduler(
+        CallScheduler(
+            {
+                "interactive": PriorityClass(weight=4),
+                "batch": PriorityClass(weight=1, max_concurrency=8),
+            },
+            max_concurrency=16,
+            default="interactive",
+        )
+    )
+
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    with call_priority("batch"):
+        recommend_book("fantasy")
+    ```
+    """
+
+    def __init__(
+        self,
+        classes: Mapping[str, PriorityClass | Mapping[str, Any]],
+        *,
+        max_concurrency: int,
+        default: str | None = None,
+    ) -> None:
+        """Initializes the scheduler.
+
+        Args:
+            classes: The priority classes by name.
+            max_concurrency: The maximum number of calls to run at the same time.
+            default: The class of calls without a priority (defaults to the first).
+
+        Raises:
+            ValueError: If there are no classes, a weight is not positive, or the
+                default class doesn't exist.
+        """
+        self._classes = {
+            name: _Class(name, PriorityClass.model_validate(config))
+            for name, config in classes.items()
+        }
+        if not self._classes:
+            raise ValueError("A call scheduler requires at least one priority class.")
+        if any(state.weight <= 0 for state in self._classes.values()):
+            raise ValueError("Priority class weights must be positive.")
+        self.default = next(iter(self._classes)) if default is None else default
+        if self.default not in self._classes:
+            raise ValueError(f"Unknown default priority class: {self.default}")
+        self.max_concurrency = max_concurrency
+        self._running = 0
+        self._virtual_time = 0.0
+        self._lock = threading.Lock()
+
+    def _get_class(self, priority: str | None) -> _Class:
+        try:
+            return self._classes[self.default if priority is None else priority]
+        except KeyError:
+            raise ValueError(f"Unknown priority class: {priority}") from None
+
+    def _dispatch(self) -> list[_Waiter]:
+        """Grants free slots to waiting calls in order of virtual start time. Must hold
+        the lock."""
+        granted = []
+        while self._running < self.max_concurrency:
+            eligible = [
+                state
+                for state in self._classes.values()
+                if state.waiters and state.can_run()
+            ]
+            if not eligible:
+                break
+            state = min(
+                eligible, key=lambda s: (s.waiters[0].start, s.waiters[0].finish)
+            )
+            waiter = state.waiters.popleft()
+            self._virtual_time = max(self._virtual_time, waiter.start)
+            waiter.granted = True
+            queue_time = time.perf_counter() - waiter.enqueued_at
+            state.total_queue_time += queue_time
+            state.max_queue_time = max(state.max_queue_time, queue_time)
+            state.running += 1
+            self._running += 1
+            granted.append(waiter)
+        return granted
+
+    def _enqueue(self, state: _Class, notify: Callable[[], None]) -> _Waiter:
+        with self._lock:
+            waiter = _Waiter(
+                notify, max(self._virtual_time, state.virtual_finish), state.weight
+            )
+            state.virtual_finish = waiter.finish
+            state.waiters.append(waiter)
+            # Slots are granted to earlier waiters as soon as they free up, so only
+            # this waiter can be granted one here
+            self._dispatch()
+        return waiter
+
+    def _release(self, state: _Class) -> None:
+        with self._lock:
+            state.running -= 1
+            state.completed += 1
+            self._running -= 1
+            granted = self._dispatch()
+        for waiter in granted:
+            waiter.notify()
+
+    def _cancel(self, state: _Class, waiter: _Waiter) -> None:
+        """Stops waiting, releasing the slot if it was granted meanwhile."""
+        with self._lock:
+            if not waiter.granted:
+                state.waiters.remove(waiter)
+                return
+        self._release(state)
+
+    @contextmanager
+    def slot(self, priority: str | None = None) -> Generator[None, None, None]:
+        """Waits for a slot for a call of the `priority` class, holding it until exit.
+
+        Raises:
+            ValueError: If the priority class doesn't exist.
+            DeadlineExceededError: If the current deadline passes before a slot is
+                granted.
+        """
+        state = self._get_class(priority)
+        event = threading.Event()
+        waiter = self._enqueue(state, event.set)
+        if not waiter.granted:
+            try:
+                if not event.wait(remaining_time()):
+                    raise DeadlineExceededError("The deadline was exceeded.")
+            except BaseException:
+                self._cancel(state, waiter)
+                raise
+        try:
+            yield
+        finally:
+            self._release(state)
+
+    @asynccontextmanager
+    async def slot_async(
+        self, priority: str | None = None
+    ) -> AsyncGenerator[None, None]:
+        """Asynchronously waits for a slot for a call of the `priority` class, holding
+        it until exit.
+
+        Raises:
+            ValueError: If the priority class doesn't exist.
+            DeadlineExceededError: If the current deadline passes before a slot is
+                granted.
+        """
+        state = self._get_class(priority)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = self._enqueue(state, notify)
+        if not waiter.granted:
+            try:
+                await wait_for_deadline(future)
+            except (asyncio.CancelledError, DeadlineExceededError):
+                self._cancel(state, waiter)
+                raise
+        try:
+            yield
+        finally:
+            self._release(state)
+
+    def stats(self) -> dict[str, PriorityClassStats]:
+        """Returns the statistics of each priority class by name."""
+        with self._lock:
+            return {
+                name: PriorityClassStats(
+                    name=name,
+                    queued=len(state.waiters),
+                    running=state.running,
+                    completed=state.completed,
+                    total_queue_time=state.total_queue_time,
+                    max_queue_time=state.max_queue_time,
+                )
+                for name, state in self._classes.items()
+            }
+
+
+def set_call_scheduler(scheduler: CallScheduler | None) -> None:
+    """Installs the scheduler that every call passes through (or removes it)."""
+    global _call_scheduler
+    _call_scheduler = scheduler
+
+
+def get_call_scheduler() -> CallScheduler | None:
+    """Returns the installed scheduler, if any."""
+    return _call_scheduler
+
+
+@contextmanager
+def call_priority(priority: str) -> Generator[None, None, None]:
+    """Sets the priority class of the calls made in this context."""
+    token = _call_priority.set(priority)
+    try:
+        yield
+    finally:
+        _call_priority.reset(token)
+
+
+def _resolve_priority(
+    priority: str | None, dynamic_config: Mapping[str, Any] | None
+) -> str | None:
+    if dynamic_config is not None and (configured := dynamic_config.get("priority")):
+        return configured
+    return _call_priority.get() or priority
+
+
+@contextmanager
+def scheduled_call(
+    priority: str | None, dynamic_config: Mapping[str, Any] | None
+) -> Generator[None, None, None]:
+    """Holds a slot of the installed scheduler (if any) for the duration of a call."""
+    if (scheduler := _call_scheduler) is None:
+        yield
+        return
+    with scheduler.slot(_resolve_priority(priority, dynamic_config)):
+        yield
+
+
+@asynccontextmanager
+async def scheduled_call_async(
+    priority: str | None, dynamic_config: Mapping[str, Any] | None
+) -> AsyncGenerator[None, None]:
+    """Holds a slot of the installed scheduler (if any) for the duration of an async
+    call."""
+    if (scheduler := _call_scheduler) is None:
+        yield
+        return
+    async with scheduler.slot_async(_resolve_priority(priority, dynamic_config)):
+        yield
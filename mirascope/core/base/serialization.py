@@ -0,0 +1,159 @@
+"""Compact serialization of call responses for persisting and reloading them.
+
+usage docs: learn/calls.md#serializing-responses
+"""
+
+import importlib
+import inspect
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+from ._utils import convert_base_model_to_base_tool, convert_function_to_base_tool
+from .call_response import BaseCallResponse
+from .tool import BaseTool
+
+SERIALIZATION_VERSION = 1
+"""The version of the format written by `dump_call_response`."""
+
+_MAGIC = b"MCR"
+_COMPRESSED = 1
+
+
+def _import_call_response_type(path: str) -> type[BaseCallResponse]:
+    module, qualname = path.split(":")
+    cls: Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        cls = getattr(cls, name)
+    if not (inspect.isclass(cls) and issubclass(cls, BaseCallResponse)):
+        raise ValueError(f"`{path}` is not a call response type.")
+    return cls
+
+
+def _tool_type(cls: type[BaseCallResponse]) -> type[BaseTool]:
+    # The provider's tool type is the second type argument of `BaseCallResponse`
+    return next(
+        metadata["args"][1]
+        for base in cls.__mro__
+        if (metadata := getattr(base, "__pydantic_generic_metadata__", None))
+        and metadata["origin"] is BaseCallResponse
+    )
+
+
+def dump_call_response(response: BaseCallResponse, *, compress: bool = False) -> bytes:
+    """Returns the call response serialized into compact, versioned bytes.
+
+    Only the fields of the response are serialized, not its computed properties
+    (e.g. `tools` and `message_param`), which are rebuilt from the provider's response
+    when the response is loaded. Each provider serializes its response in its own
+    format, which `load_call_response` rebuilds exactly. The request context (e.g.
+    `messages` and `fn_args`) is serialized as JSON, so values that aren't JSON (such
+    as bytes) are loaded as their JSON representation. The `dynamic_config` isn't
+    serialized, since it can hold clients and functions. Tool types are serialized by
+    name and must be passed to `load_call_response` to rebuild the response's tools.
+
+    Args:
+        response: The call response to serialize.
+        compress: Whether to compress the serialized response, which makes it smaller
+            but slower to dump and load.
+
+    Returns:
+        The serialized response, to be loaded with `load_call_response`.
+    """
+    cls = type(response)
+    record = {
+        "type": f"{cls.__module__}:{cls.__qualname__}",
+        "model": response._model,
+        "response": cls._dump_response(response.response),
+        "metadata": response.metadata,
+        "tool_types": [tool_type._name() for tool_type in response.tool_types]
+        if response.tool_types is not None
+        else None,
+        "prompt_template": response.prompt_template,
+        "fn_args": response.fn_args,
+        # A response with `retention="lean"` rebuilds its messages when accessed, so
+        # they're read from its fields to serialize only what it retains
+        "messages": response.__dict__.get("messages", []),
+        "call_params": response.call_params,
+        "call_kwargs": response.call_kwargs,
+        "user_message_param": response.user_message_param,
+        "start_time": response.start_time,
+        "end_time": response.end_time,
+    }
+    payload = to_json(record, fallback=repr, bytes_mode="base64")
+    if compress:
+        return (
+            _MAGIC
+            + bytes([SERIALIZATION_VERSION, _COMPRESSED])
+            + zlib.compress(payload)
+        )
+    return _MAGIC + bytes([SERIALIZATION_VERSION, 0]) + payload
+
+
+def load_call_response(
+    data: bytes, *, tools: list[type[BaseTool] | Callable] | None = None
+) -> BaseCallResponse:
+    """Returns the call response loaded from bytes written by `dump_call_response`.
+
+    Args:
+        data: The serialized call response.
+        tools: The tools of the call, which are needed to rebuild the response's tools.
+            Tools that the response didn't use are ignored.
+
+    Returns:
+        The call response, as an instance of its provider's call response type.
+
+    Raises:
+        ValueError: If `data` isn't a serialized call response, or was serialized by
+            a newer version of the format.
+    """
+    if data[: len(_MAGIC)] != _MAGIC or len(data) < len(_MAGIC) + 2:
+        raise ValueError("The data is not a serialized call response.")
+    version, flags = data[len(_MAGIC)], data[len(_MAGIC) + 1]
+    if version > SERIALIZATION_VERSION:
+        raise ValueError(
+            f"The call response was serialized with version {version} of the format, "
+            f"but only versions up to {SERIALIZATION_VERSION} are supported."
+        )
+    payload = data[len(_MAGIC) + 2 :]
+    record = from_json(zlib.decompress(payload) if flags & _COMPRESSED else payload)
+
+    cls = _import_call_response_type(record["type"])
+    tool_types = None
+    if record["tool_types"] is not None:
+        tool_type = _tool_type(cls)
+        converted_tools = {
+            converted._name(): converted
+            for converted in (
+                convert_base_model_to_base_tool(tool, tool_type)  # pyright: ignore [reportArgumentType]
+                if inspect.isclass(tool)
+                else convert_function_to_base_tool(tool, tool_type)
+                for tool in tools or []
+            )
+        }
+        tool_types = [
+            converted_tools[name]
+            for name in record["tool_types"]
+            if name in converted_tools
+        ]
+    metadata = record["metadata"]
+    if "tags" in metadata:
+        metadata["tags"] = set(metadata["tags"])
+    response = cls.model_construct(
+        metadata=metadata,
+        response=cls._load_response(record["response"]),
+        tool_types=tool_types,
+        prompt_template=record["prompt_template"],
+        fn_args=record["fn_args"],
+        dynamic_config=None,
+        messages=record["messages"],
+        call_params=record["call_params"],
+        call_kwargs=record["call_kwargs"],
+        user_message_param=record["user_message_param"],
+        start_time=record["start_time"],
+        end_time=record["end_time"],
+    )
+    response._model = record["model"]
+    return response
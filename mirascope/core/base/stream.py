@@ -21,7 +21,7 @@ from ._utils import (
     SetupCall,
     fn_is_async,
     get_dynamic_configuration,
-    get_fn_args,
+    get_fn_args_binder,
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
@@ -30,10 +30,19 @@ from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
 from .call_response_chunk import BaseCallResponseChunk
+from .call_tools import call_tools, call_tools_async
+from .client_pool import ClientPool, pool_setup_call
+from .deadline import (
+    check_deadline,
+    limit_stream,
+    limit_stream_async,
+    with_timeout_kwargs,
+)
 from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .metadata import Metadata
 from .prompt import prompt_template
+from .scheduler import scheduled_call, scheduled_call_async
 from .tool import BaseTool
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
@@ -91,11 +100,13 @@ class BaseStream(
     call_kwargs: BaseCallKwargs[_ToolSchemaT]
     user_message_param: _UserMessageParamT | None = None
     message_param: _AssistantMessageParamT
+    tools: list[_BaseToolT]
     input_tokens: int | float | None = None
     output_tokens: int | float | None = None
     id: str | None = None
     finish_reasons: list[_FinishReason] | None = None
     start_time: float = 0
+    first_chunk_time: float = 0
     end_time: float = 0
 
     _provider: ClassVar[str] = "NO PROVIDER"
@@ -121,6 +132,7 @@ class BaseStream(
     ) -> None:
         """Initializes an instance of `BaseStream`."""
         self.content = ""
+        self.tools = []
         self.stream = stream
         self.metadata = metadata
         self.tool_types = tool_types
@@ -138,14 +150,21 @@ class BaseStream(
         self,
     ) -> Generator[tuple[_BaseCallResponseChunkT, _BaseToolT | None], None, None]:
         """Iterator over the stream and stores useful information."""
-        assert isinstance(
-            self.stream, Generator
-        ), "Stream must be a generator for __iter__"
-        self.content, tool_calls = "", []
+        assert isinstance(self.stream, Generator), (
+            "Stream must be a generator for __iter__"
+        )
+        self.content, self.tools, tool_calls = "", [], []
         self.start_time = datetime.datetime.now().timestamp() * 1000
+        previous_chunk = None
         for chunk, tool in self.stream:
-            self._update_properties(chunk)
-            if tool:
+            if not self.first_chunk_time:
+                self.first_chunk_time = datetime.datetime.now().timestamp() * 1000
+            # A chunk that completes several tools is yielded once for each of them
+            if chunk is not previous_chunk:
+                self._update_properties(chunk)
+                previous_chunk = chunk
+            if tool and not (isinstance(tool, BaseTool) and tool.delta is not None):
+                self.tools.append(tool)
                 tool_call = getattr(tool, "tool_call", _DEFAULT)
                 if tool_call != _DEFAULT:
                     tool_calls.append(tool_call)
@@ -159,22 +178,30 @@ class BaseStream(
         self,
     ) -> AsyncGenerator[tuple[_BaseCallResponseChunkT, _BaseToolT | None], None]:
         """Iterates over the stream and stores useful information."""
-        self.content = ""
+        self.content, self.tools = "", []
 
-        async def generator() -> (
-            AsyncGenerator[tuple[_BaseCallResponseChunkT, _BaseToolT | None], None]
-        ):
-            assert isinstance(
-                self.stream, AsyncGenerator
-            ), "Stream must be an async generator for __aiter__"
-            tool_calls = []
+        async def generator() -> AsyncGenerator[
+            tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
+        ]:
+            assert isinstance(self.stream, AsyncGenerator), (
+                "Stream must be an async generator for __aiter__"
+            )
+            tool_calls, previous_chunk = [], None
+            self.start_time = datetime.datetime.now().timestamp() * 1000
             async for chunk, tool in self.stream:
-                self._update_properties(chunk)
-                if tool:
+                if not self.first_chunk_time:
+                    self.first_chunk_time = datetime.datetime.now().timestamp() * 1000
+                # A chunk that completes several tools is yielded once for each of them
+                if chunk is not previous_chunk:
+                    self._update_properties(chunk)
+                    previous_chunk = chunk
+                if tool and not (isinstance(tool, BaseTool) and tool.delta is not None):
+                    self.tools.append(tool)
                     tool_call = getattr(tool, "tool_call", _DEFAULT)
                     if tool_call != _DEFAULT:
                         tool_calls.append(tool_call)
                 yield chunk, tool
+            self.end_time = datetime.datetime.now().timestamp() * 1000
             self.message_param = self._construct_message_param(
                 tool_calls or None, self.content
             )
@@ -227,6 +254,50 @@ class BaseStream(
         """
         return self.call_response_type.tool_message_params(tools_and_outputs)
 
+    def call_tools(
+        self, *, timeout: float | None = None, return_exceptions: bool = False
+    ) -> list[tuple[_BaseToolT, Any]]:
+        """Calls all tools streamed so far concurrently in a shared thread pool.
+
+        Args:
+            timeout: The maximum number of seconds to wait for each tool.
+            return_exceptions: Whether to return exceptions raised by a tool as its
+                output instead of raising them.
+
+        Returns:
+            The list of `(tool, output)` tuples in order, ready to be passed to
+            `tool_message_params`.
+        """
+        return call_tools(
+            self.tools, timeout=timeout, return_exceptions=return_exceptions
+        )
+
+    async def call_tools_async(
+        self,
+        *,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[tuple[_BaseToolT, Any]]:
+        """Calls all tools streamed so far concurrently.
+
+        Args:
+            max_concurrency: The maximum number of tools to run at the same time.
+            timeout: The maximum number of seconds each tool may run for.
+            return_exceptions: Whether to return exceptions raised by a tool as its
+                output instead of raising them.
+
+        Returns:
+            The list of `(tool, output)` tuples in order, ready to be passed to
+            `tool_message_params`.
+        """
+        return await call_tools_async(
+            self.tools,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            return_exceptions=return_exceptions,
+        )
+
     @abstractmethod
     def construct_call_response(self) -> _BaseCallResponseT:
         """Constructs the call response."""
@@ -275,6 +346,8 @@ def stream_factory(  # noqa: ANN201
         _AsyncResponseChunkT, _BaseCallResponseChunkT, _BaseToolT
     ],
 ):
+    setup_call = pool_setup_call(setup_call)
+
     @overload
     def decorator(
         fn: Callable[_P, _BaseDynamicConfigT],
@@ -283,6 +356,8 @@ def stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        partial_tools: bool = False,
+        priority: str | None = None,
     ) -> Callable[_P, BaseStream]: ...
 
     @overload
@@ -293,6 +368,8 @@ def stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        partial_tools: bool = False,
+        priority: str | None = None,
     ) -> Callable[_P, BaseStream]: ...
 
     @overload
@@ -307,6 +384,8 @@ def stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        partial_tools: bool = False,
+        priority: str | None = None,
     ) -> Callable[_P, Awaitable[BaseStream]]: ...
 
     @overload
@@ -317,6 +396,8 @@ def stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        partial_tools: bool = False,
+        priority: str | None = None,
     ) -> Callable[_P, Awaitable[BaseStream]]: ...
 
     def decorator(
@@ -331,8 +412,14 @@ def stream_factory(  # noqa: ANN201
         model: str,
         tools: list[type[BaseTool] | Callable] | None,
         json_mode: bool,
-        client: _SameSyncAndAsyncClientT | _SyncBaseClientT | _AsyncBaseClientT | None,
+        client: _SameSyncAndAsyncClientT
+        | _SyncBaseClientT
+        | _AsyncBaseClientT
+        | ClientPool
+        | None,
         call_params: _BaseCallParamsT,
+        partial_tools: bool = False,
+        priority: str | None = None,
     ) -> Callable[_P, BaseStream] | Callable[_P, Awaitable[BaseStream]]:
         if not is_prompt_template(fn):
             fn = cast(
@@ -345,19 +432,22 @@ def stream_factory(  # noqa: ANN201
                 fn,
             )
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
+        fn._provider = getattr(TCallResponse, "_provider", "")  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        bind_fn_args = get_fn_args_binder(fn)
         if fn_is_async(fn):
 
             @wraps(fn)
             async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> BaseStream:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = bind_fn_args(args, kwargs)
                 dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
-                nonlocal client
+                call_client = client
                 if dynamic_config is not None:
-                    client = dynamic_config.get("client", None) or client
+                    call_client = dynamic_config.get("client", None) or client
+                check_deadline()
                 create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
                     model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
+                    client=call_client,  # pyright: ignore [reportArgumentType]
                     fn=fn,
                     fn_args=fn_args,
                     dynamic_config=dynamic_config,
@@ -368,15 +458,21 @@ def stream_factory(  # noqa: ANN201
                     stream=True,
                 )
 
-                async def generator() -> (
-                    AsyncGenerator[
-                        tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
-                    ]
-                ):
-                    async for chunk, tool in handle_stream_async(
-                        await create(stream=True, **call_kwargs), tool_types
-                    ):
-                        yield chunk, tool
+                async def generator() -> AsyncGenerator[
+                    tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
+                ]:
+                    async with scheduled_call_async(priority, dynamic_config):
+                        async for chunk, tool in handle_stream_async(
+                            limit_stream_async(
+                                await create(
+                                    stream=True,
+                                    **with_timeout_kwargs(call_kwargs, TCallResponse),
+                                )
+                            ),
+                            tool_types,
+                            partial_tools=partial_tools,
+                        ):
+                            yield chunk, tool
 
                 return TStream(
                     stream=generator(),
@@ -397,14 +493,15 @@ def stream_factory(  # noqa: ANN201
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> BaseStream:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = bind_fn_args(args, kwargs)
                 dynamic_config = get_dynamic_configuration(fn, args, kwargs)
-                nonlocal client
+                call_client = client
                 if dynamic_config is not None:
-                    client = dynamic_config.get("client", None) or client
+                    call_client = dynamic_config.get("client", None) or client
+                check_deadline()
                 create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
                     model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
+                    client=call_client,  # pyright: ignore [reportArgumentType]
                     fn=fn,
                     fn_args=fn_args,
                     dynamic_config=dynamic_config,
@@ -415,16 +512,22 @@ def stream_factory(  # noqa: ANN201
                     stream=True,
                 )
 
-                def generator() -> (
-                    Generator[
-                        tuple[_BaseCallResponseChunkT, _BaseToolT | None],
-                        None,
-                        None,
-                    ]
-                ):
-                    yield from handle_stream(
-                        create(stream=True, **call_kwargs), tool_types
-                    )
+                def generator() -> Generator[
+                    tuple[_BaseCallResponseChunkT, _BaseToolT | None],
+                    None,
+                    None,
+                ]:
+                    with scheduled_call(priority, dynamic_config):
+                        yield from handle_stream(
+                            limit_stream(
+                                create(
+                                    stream=True,
+                                    **with_timeout_kwargs(call_kwargs, TCallResponse),
+                                )
+                            ),
+                            tool_types,
+                            partial_tools=partial_tools,
+                        )
 
                 return TStream(
                     stream=generator(),
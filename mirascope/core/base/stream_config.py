@@ -0,0 +1,18 @@
+"""The `StreamConfig` typed dictionary for configuring streaming calls.
+
+usage docs: learn/tools.md#streaming-partial-tools
+"""
+
+from typing_extensions import NotRequired, TypedDict
+
+
+class StreamConfig(TypedDict):
+    """The configuration options for streaming calls.
+
+    Attributes:
+        partial_tools: Whether to also stream partial tools as their arguments are
+            streamed. Partial tools have a non-`None` `delta` and are not included in
+            the stream's final `tools`.
+    """
+
+    partial_tools: NotRequired[bool]
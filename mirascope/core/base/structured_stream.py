@@ -30,7 +30,7 @@ from ._utils import (
     setup_extract_tool,
 )
 from ._utils._get_fields_from_call_args import (
-    get_fields_from_call_args,
+    get_fields_from_call_args_binder,
 )
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
@@ -182,6 +182,7 @@ def structured_stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
     ) -> Callable[
         _P,
         Iterable[_ResponseModelT],
@@ -195,6 +196,7 @@ def structured_stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
     ) -> Callable[
         _P,
         Awaitable[AsyncIterable[_ResponseModelT]],
@@ -208,6 +210,7 @@ def structured_stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        priority: str | None = None,
     ) -> Callable[
         _P,
         Iterable[_ResponseModelT] | Awaitable[AsyncIterable[_ResponseModelT]],
@@ -227,6 +230,7 @@ def structured_stream_factory(  # noqa: ANN201
         def handle_stream(
             stream: Generator[_ResponseChunkT, None, None],
             tool_types: list[type[_BaseToolT]] | None,
+            partial_tools: bool = False,
         ) -> Generator[tuple[_BaseCallResponseChunkT, None], None, None]:
             for chunk in stream:
                 yield handle_chunk(chunk)
@@ -234,6 +238,7 @@ def structured_stream_factory(  # noqa: ANN201
         async def handle_stream_async(
             stream: AsyncGenerator[_AsyncResponseChunkT, None],
             tool_types: list[type[_BaseToolT]] | None,
+            partial_tools: bool = False,
         ) -> AsyncGenerator[tuple[_BaseCallResponseChunkT, None], None]:
             async for chunk in stream:
                 yield handle_chunk(chunk)
@@ -253,38 +258,37 @@ def structured_stream_factory(  # noqa: ANN201
             "json_mode": json_mode,
             "client": client,
             "call_params": call_params,
+            "priority": priority,
         }
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
+        fn._provider = getattr(TCallResponse, "_provider", "")  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        bind_fields_from_call_args = get_fields_from_call_args_binder(
+            response_model, fn
+        )
         if fn_is_async(fn):
+            create_stream_async = stream_decorator(fn=fn, **stream_decorator_kwargs)
 
             @wraps(fn)
             async def inner_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> AsyncIterable[_ResponseModelT]:
-                fields_from_call_args = get_fields_from_call_args(
-                    response_model, fn, args, kwargs
-                )
+                fields_from_call_args = bind_fields_from_call_args(args, kwargs)
                 return BaseStructuredStream[_ResponseModelT](
-                    stream=await stream_decorator(fn=fn, **stream_decorator_kwargs)(
-                        *args, **kwargs
-                    ),
+                    stream=await create_stream_async(*args, **kwargs),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
                 )
 
             return inner_async
         else:
+            create_stream = stream_decorator(fn=fn, **stream_decorator_kwargs)
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> Iterable[_ResponseModelT]:
-                fields_from_call_args = get_fields_from_call_args(
-                    response_model, fn, args, kwargs
-                )
+                fields_from_call_args = bind_fields_from_call_args(args, kwargs)
                 return BaseStructuredStream[_ResponseModelT](
-                    stream=stream_decorator(fn=fn, **stream_decorator_kwargs)(
-                        *args, **kwargs
-                    ),
+                    stream=create_stream(*args, **kwargs),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
                 )
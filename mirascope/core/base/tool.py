@@ -11,7 +11,7 @@ from abc import abstractmethod
 from collections.abc import Callable
 from typing import Any, ClassVar, TypeVar
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from pydantic.json_schema import (
     DEFAULT_REF_TEMPLATE,
     GenerateJsonSchema,
@@ -84,6 +84,7 @@ class BaseTool(BaseModel):
     __custom_name__: ClassVar[str] = ""
     tool_config: ClassVar[ToolConfig] = ToolConfig()
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    _delta: str | None = PrivateAttr(default=None)
 
     @classmethod
     def _name(cls) -> str:
@@ -108,6 +109,15 @@ class BaseTool(BaseModel):
             if field != "tool_call"
         }
 
+    @property
+    def delta(self) -> str | None:
+        """The latest streamed arguments fragment if this is a partial tool.
+
+        Partial tools are only streamed when using `stream={"partial_tools": True}`.
+        Fully streamed tools always have a `delta` of `None`.
+        """
+        return self._delta
+
     @abstractmethod
     def call(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
         """The method to call the tool."""
@@ -11,6 +11,7 @@ from ._types import (
 from .call_params import BedrockCallParams
 from .call_response import BedrockCallResponse
 from .call_response_chunk import BedrockCallResponseChunk
+from .client_pool import BedrockClientPool
 from .dynamic_config import AsyncBedrockDynamicConfig, BedrockDynamicConfig
 from .stream import BedrockStream
 from .tool import BedrockTool, BedrockToolConfig
@@ -24,6 +25,7 @@ __all__ = [
     "BedrockCallParams",
     "BedrockCallResponse",
     "BedrockCallResponseChunk",
+    "BedrockClientPool",
     "BedrockDynamicConfig",
     "BedrockMessageParam",
     "BedrockStream",
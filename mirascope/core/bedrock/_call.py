@@ -50,7 +50,8 @@ print(response.content)
 
 Args:
     model (str): The Bedrock model to use in the API call.
-    stream (bool): Whether to stream the response from the API call.
+    stream (bool | StreamConfig): Whether to stream the response from the API call,
+        optionally with a `StreamConfig` (e.g. `{"partial_tools": True}`).
     tools (list[BaseTool | Callable]): The tools to use in the Bedrock API call.
     response_model (BaseModel | BaseType): The response model into which the response
         should be structured.
@@ -61,6 +62,9 @@ Args:
     client (object): An optional custom client to use in place of the default client.
     call_params (BedrockCallParams): The `BedrockCallParams` call parameters to use in the
         API call.
+    priority (str): The priority class of the call when a `CallScheduler` is installed.
+    retention (str): How much of the request context the call response keeps
+        (`"full"`, `"lean"`, or `"minimal"`).
 
 Returns:
     decorator (Callable): The decorator for turning a typed function into an Bedrock API
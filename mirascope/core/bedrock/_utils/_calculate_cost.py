@@ -1,12 +1,19 @@
 """Calculate the cost of a completion using the Bedrock API."""
 
+from ...base.pricing import pricing_registry
+
 
 def calculate_cost(
-    input_tokens: int | float | None, output_tokens: int | float | None, model: str
+    input_tokens: int | float | None,
+    output_tokens: int | float | None,
+    model: str,
 ) -> float | None:
-    """Calculate the cost of a completion using the Bedrock API."""
-    # NOTE: We are currently investigating a dynamic approach to determine costs
-    # for Bedrock models. This is needed due to the large number of models
-    # available through Bedrock, making it impractical to hardcode all pricing
-    # information in this initial implementation.
-    return None
+    """Calculate the cost of a completion using the Bedrock API.
+
+    The prices are looked up in `mirascope.core.base.pricing.pricing_registry`, which
+    doesn't include Bedrock models by default due to the large number of models
+    available through Bedrock.
+    """
+    return pricing_registry.calculate_cost(
+        "bedrock", model, input_tokens, output_tokens
+    )
@@ -48,3 +48,8 @@ def convert_message_params(
                 {"role": message_param.role, "content": converted_content}
             )
     return converted_message_params
+
+
+def convert_text_message(role: str, text: str) -> list[InternalBedrockMessageParam]:
+    """Converts a message with only text into Bedrock message parameters."""
+    return [{"role": cast(ConversationRoleType, role), "content": [{"text": text}]}]
@@ -8,6 +8,7 @@ from mypy_boto3_bedrock_runtime.type_defs import (
 )
 from typing_extensions import TypedDict
 
+from ...base._utils import PartialToolConstructor, StreamedJsonObject
 from .._types import (
     AsyncStreamOutputChunk,
     StreamOutputChunk,
@@ -19,7 +20,7 @@ from ..tool import BedrockTool
 
 class ToolUseChunk(TypedDict):
     tool_use_id: str
-    input_chunk: str
+    input_chunk: StreamedJsonObject
     name: str
     stop: bool
 
@@ -28,12 +29,17 @@ def _handle_chunk(
     chunk: StreamOutputChunk | AsyncStreamOutputChunk,
     current_tool_use_chunk: ToolUseChunk | None,
     tool_types: list[type[BedrockTool]] | None,
+    construct_partial_tool: PartialToolConstructor[BedrockTool] | None = None,
 ) -> tuple[
     BedrockCallResponseChunk | None,
     BedrockTool | None,
     ToolUseChunk | None,
 ]:
-    """Handles a chunk of the stream."""
+    """Handles a chunk of the stream.
+
+    When `construct_partial_tool` is provided, tool input deltas are returned along with
+    a partial tool instead of being skipped.
+    """
     if not tool_types:
         return BedrockCallResponseChunk(chunk=chunk), None, None
     elif (content_block_start := chunk.get("contentBlockStart")) and (
@@ -41,7 +47,7 @@ def _handle_chunk(
     ):
         current_tool_use_chunk = ToolUseChunk(
             tool_use_id=tool_use["toolUseId"],
-            input_chunk="",
+            input_chunk=StreamedJsonObject(partial=construct_partial_tool is not None),
             name=tool_use["name"],
             stop=False,
         )
@@ -51,7 +57,29 @@ def _handle_chunk(
         and current_tool_use_chunk
         and not current_tool_use_chunk["stop"]
     ):
-        current_tool_use_chunk["input_chunk"] += tool_use["input"]
+        current_tool_use_chunk["input_chunk"].feed(delta := tool_use["input"])
+        if construct_partial_tool and delta:
+            for tool_type in tool_types:
+                if current_tool_use_chunk["name"] == tool_type._name():
+                    arguments = current_tool_use_chunk["input_chunk"].value or {}
+                    partial_tool = construct_partial_tool(
+                        tool_type,
+                        arguments,
+                        ToolUseBlockContentTypeDef(
+                            toolUse=ToolUseBlockOutputTypeDef(
+                                toolUseId=current_tool_use_chunk["tool_use_id"],
+                                input=arguments,
+                                name=current_tool_use_chunk["name"],
+                            )
+                        ),
+                        delta,
+                    )
+                    if partial_tool:
+                        return (
+                            BedrockCallResponseChunk(chunk=chunk),
+                            partial_tool,
+                            current_tool_use_chunk,
+                        )
         return None, None, current_tool_use_chunk
     elif "contentBlockStop" in chunk and current_tool_use_chunk:
         current_tool_use_chunk["stop"] = True
@@ -62,7 +90,7 @@ def _handle_chunk(
                 current_tool_use = ToolUseBlockContentTypeDef(
                     toolUse=ToolUseBlockOutputTypeDef(
                         toolUseId=current_tool_use_chunk["tool_use_id"],
-                        input=json.loads(current_tool_use_chunk["input_chunk"]),
+                        input=json.loads(current_tool_use_chunk["input_chunk"].text),
                         name=current_tool_use_chunk["name"],
                     )
                 )
@@ -77,12 +105,16 @@ def _handle_chunk(
 def handle_stream(
     stream: Generator[StreamOutputChunk, None, None],
     tool_types: list[type[BedrockTool]] | None,
+    partial_tools: bool = False,
 ) -> Generator[tuple[BedrockCallResponseChunk, BedrockTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
     current_tool_use_chunk = None
+    construct_partial_tool = (
+        PartialToolConstructor[BedrockTool]() if partial_tools else None
+    )
     for chunk in stream:
         call_response, tool, current_tool_use_chunk = _handle_chunk(
-            chunk, current_tool_use_chunk, tool_types
+            chunk, current_tool_use_chunk, tool_types, construct_partial_tool
         )
         if call_response:
             yield call_response, tool
@@ -91,12 +123,16 @@ def handle_stream(
 async def handle_stream_async(
     stream: AsyncGenerator[AsyncStreamOutputChunk, None],
     tool_types: list[type[BedrockTool]] | None,
+    partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[BedrockCallResponseChunk, BedrockTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
     current_tool_use_chunk = None
+    construct_partial_tool = (
+        PartialToolConstructor[BedrockTool]() if partial_tools else None
+    )
     async for chunk in stream:
         call_response, tool, current_tool_use_chunk = _handle_chunk(
-            chunk, current_tool_use_chunk, tool_types
+            chunk, current_tool_use_chunk, tool_types, construct_partial_tool
         )
         if call_response:
             yield call_response, tool
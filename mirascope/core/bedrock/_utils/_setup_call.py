@@ -2,13 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator
 from functools import wraps
 from typing import Any, ParamSpec, cast, overload
 
-from aiobotocore.session import AioSession, get_session
-from boto3.session import Session
 from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
 from mypy_boto3_bedrock_runtime.type_defs import (
     ConverseResponseTypeDef,
@@ -43,10 +40,11 @@ from .._types import (
     StreamOutputChunk,
 )
 from ..call_params import BedrockCallParams
+from ..client_pool import default_client_pool
 from ..dynamic_config import AsyncBedrockDynamicConfig, BedrockDynamicConfig
 from ..tool import BedrockTool
 from ._convert_common_call_params import convert_common_call_params
-from ._convert_message_params import convert_message_params
+from ._convert_message_params import convert_message_params, convert_text_message
 
 _P = ParamSpec("_P")
 
@@ -84,9 +82,16 @@ def _extract_async_stream_fn(
     return _inner
 
 
-async def _get_async_client(session: AioSession) -> AsyncBedrockRuntimeClient:
-    async with session.create_client("bedrock-runtime") as client:
-        return client
+async def _converse_async(**kwargs: Any) -> AsyncConverseResponseTypeDef:  # noqa: ANN401
+    client = await default_client_pool.get_async_client()
+    return await client.converse(**kwargs)
+
+
+async def _converse_stream_async(
+    **kwargs: Any,  # noqa: ANN401
+) -> AsyncConverseStreamResponseTypeDef:
+    client = await default_client_pool.get_async_client()
+    return await client.converse_stream(**kwargs)
 
 
 @overload
@@ -162,6 +167,7 @@ def setup_call(
         BedrockTool,
         call_params,
         convert_common_call_params,
+        convert_text_message=convert_text_message,
     )
     call_kwargs = cast(BedrockCallKwargs, base_call_kwargs)
     messages = cast(list[InternalBedrockMessageParam | BaseMessageParam], messages)
@@ -200,13 +206,21 @@ def setup_call(
 
     call_kwargs |= cast(BedrockCallKwargs, {"modelId": model, "messages": messages})
 
+    if client is None and fn_is_async(fn):
+        # Async clients are bound to the running event loop, so they're fetched
+        # from the pool when the request is made rather than here
+        return (
+            get_async_create_fn(
+                _converse_async,
+                _extract_async_stream_fn(_converse_stream_async, model),
+            ),
+            prompt_template,
+            messages,
+            tool_types,
+            call_kwargs,
+        )
     if client is None:
-        if fn_is_async(fn):
-            session = get_session()
-            client = asyncio.run(_get_async_client(session))
-        else:
-            session = Session()
-            client = session.client("bedrock-runtime")
+        client = default_client_pool.get_client()
 
     create = (
         get_async_create_fn(
@@ -0,0 +1,166 @@
+"""The `BedrockClientPool` class for reusing Bedrock runtime clients across calls.
+
+usage docs: learn/calls.md#bedrock-clients
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AsyncExitStack
+
+from aiobotocore.session import AioSession, get_session
+from boto3.session import Session
+from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
+from types_aiobotocore_bedrock_runtime import (
+    BedrockRuntimeClient as AsyncBedrockRuntimeClient,
+)
+
+
+class _LoopClients:
+    """The async clients of a single event loop and the stack that exits them."""
+
+    def __init__(self) -> None:
+        self.stack = AsyncExitStack()
+        self.clients: dict[str | None, asyncio.Future[AsyncBedrockRuntimeClient]] = {}
+        self.lifecycle: AsyncGenerator[None, None] | None = None
+
+
+async def _lifecycle(
+    stack: AsyncExitStack, forget: Callable[[], None]
+) -> AsyncGenerator[None, None]:
+    # The event loop finalizes unfinished async generators when it shuts down (e.g.
+    # at the end of `asyncio.run`), which exits the clients inside their loop. The
+    # clients' futures reference their loop, so the pool must also forget them here
+    # for the loop to be garbage collected
+    try:
+        yield
+    finally:
+        forget()
+        await stack.aclose()
+
+
+class BedrockClientPool:
+    """Creates Bedrock runtime clients once and reuses them across calls and streams.
+
+    Creating a Bedrock client resolves credentials and loads endpoint data, which is
+    slow, so calls without a `client` use the clients of `default_client_pool`. Sync
+    clients are created once per region and shared across threads. Async clients are
+    bound to the event loop they were created in, so they are created once per event
+    loop and region, and they are exited when their event loop shuts down (or when
+    `aclose` is called).
+
+    Example:
+
+    ```python
+    from mirascope.core import bedrock
+
+    pool = bedrock.BedrockClientPool()
+
+
+    @bedrock.call(
+        "anthropic.claude-3-haiku-20240307-v1:0",
+        client=pool.get_client("us-west-2"),
+    )
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+    ```
+    """
+
+    def __init__(
+        self, session: Session | None = None, async_session: AioSession | None = None
+    ) -> None:
+        """Initializes the pool.
+
+        Args:
+            session: The `boto3` session of the sync clients. Defaults to a new
+                session, created when the first sync client is.
+            async_session: The `aiobotocore` session of the async clients. Defaults
+                to a new session, created when the first async client is.
+        """
+        self._session = session
+        self._async_session = async_session
+        self._lock = threading.Lock()
+        self._clients: dict[str | None, BedrockRuntimeClient] = {}
+        self._loop_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopClients
+        ] = weakref.WeakKeyDictionary()
+
+    def get_client(self, region_name: str | None = None) -> BedrockRuntimeClient:
+        """Returns the sync client for the region, creating it on first use.
+
+        Args:
+            region_name: The AWS region of the client, or `None` for the session's
+                default region.
+        """
+        if (client := self._clients.get(region_name)) is None:
+            with self._lock:
+                if (client := self._clients.get(region_name)) is None:
+                    if self._session is None:
+                        self._session = Session()
+                    client = self._session.client(
+                        "bedrock-runtime", region_name=region_name
+                    )
+                    self._clients[region_name] = client
+        return client
+
+    async def get_async_client(
+        self, region_name: str | None = None
+    ) -> AsyncBedrockRuntimeClient:
+        """Returns the async client for the region and running event loop, creating
+        it on first use.
+
+        Args:
+            region_name: The AWS region of the client, or `None` for the session's
+                default region.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if (loop_clients := self._loop_clients.get(loop)) is None:
+                loop_clients = self._loop_clients[loop] = _LoopClients()
+        if loop_clients.lifecycle is None:
+            loop_clients.lifecycle = _lifecycle(
+                loop_clients.stack, lambda: self._forget(loop, loop_clients)
+            )
+            await anext(loop_clients.lifecycle)
+        if (client := loop_clients.clients.get(region_name)) is None:
+            client = loop_clients.clients[region_name] = asyncio.ensure_future(
+                self._create_async_client(loop_clients, region_name)
+            )
+        return await asyncio.shield(client)
+
+    async def _create_async_client(
+        self, loop_clients: _LoopClients, region_name: str | None
+    ) -> AsyncBedrockRuntimeClient:
+        if self._async_session is None:
+            self._async_session = get_session()
+        try:
+            return await loop_clients.stack.enter_async_context(
+                self._async_session.create_client(
+                    "bedrock-runtime", region_name=region_name
+                )
+            )
+        except BaseException:
+            # Lets the next call retry instead of raising the same error forever
+            del loop_clients.clients[region_name]
+            raise
+
+    def _forget(
+        self, loop: asyncio.AbstractEventLoop, loop_clients: _LoopClients
+    ) -> None:
+        with self._lock:
+            if self._loop_clients.get(loop) is loop_clients:
+                del self._loop_clients[loop]
+
+    async def aclose(self) -> None:
+        """Exits the async clients of the running event loop."""
+        with self._lock:
+            loop_clients = self._loop_clients.pop(asyncio.get_running_loop(), None)
+        if loop_clients is not None and loop_clients.lifecycle is not None:
+            await loop_clients.lifecycle.aclose()
+
+
+default_client_pool = BedrockClientPool()
+"""The pool of the clients used by calls without a `client`."""
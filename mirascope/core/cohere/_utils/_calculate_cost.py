@@ -1,5 +1,7 @@
 """Calculate the cost of a completion using the Cohere API."""
 
+from ...base.pricing import pricing_registry
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -10,30 +12,6 @@ def calculate_cost(
 
     https://cohere.com/pricing
 
-    Model              Input               Output
-    command-r          $0.5 / 1M tokens	   $1.5 / 1M tokens
-    command-r-plus     $3 / 1M tokens	   $15 / 1M tokens
+    The prices are looked up in `mirascope.core.base.pricing.pricing_registry`.
     """
-    pricing = {
-        "command-r": {
-            "prompt": 0.000_000_5,
-            "completion": 0.000_001_5,
-        },
-        "command-r-plus": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-        },
-    }
-    if input_tokens is None or output_tokens is None:
-        return None
-
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
-        return None
-
-    prompt_cost = input_tokens * model_pricing["prompt"]
-    completion_cost = output_tokens * model_pricing["completion"]
-    total_cost = prompt_cost + completion_cost
-
-    return total_cost
+    return pricing_registry.calculate_cost("cohere", model, input_tokens, output_tokens)
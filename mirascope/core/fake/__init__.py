@@ -0,0 +1,55 @@
+"""The Mirascope Fake Module.
+
+A provider that returns scripted or generated responses without a network.
+"""
+
+from typing import TypeAlias
+
+from ..base import BaseMessageParam
+from ._call import fake_call
+from ._call import fake_call as call
+from .call_params import FakeCallParams
+from .call_response import FakeCallResponse
+from .call_response_chunk import FakeCallResponseChunk
+from .client import (
+    AsyncFakeClient,
+    FakeAPIError,
+    FakeClient,
+    FakeRateLimitError,
+    FakeResponse,
+    FakeTimeoutError,
+    Latency,
+    lognormal_latency,
+    uniform_latency,
+)
+from .dynamic_config import AsyncFakeDynamicConfig, FakeDynamicConfig
+from .stream import FakeStream
+from .tool import FakeTool
+from .types import FakeCompletion, FakeCompletionChunk, FakeToolCall, MessageParam
+
+FakeMessageParam: TypeAlias = MessageParam | BaseMessageParam
+
+__all__ = [
+    "AsyncFakeClient",
+    "AsyncFakeDynamicConfig",
+    "call",
+    "FakeAPIError",
+    "FakeCallParams",
+    "FakeCallResponse",
+    "FakeCallResponseChunk",
+    "FakeClient",
+    "FakeCompletion",
+    "FakeCompletionChunk",
+    "FakeDynamicConfig",
+    "FakeMessageParam",
+    "FakeRateLimitError",
+    "FakeResponse",
+    "FakeStream",
+    "FakeTimeoutError",
+    "FakeTool",
+    "FakeToolCall",
+    "fake_call",
+    "Latency",
+    "lognormal_latency",
+    "uniform_latency",
+]
@@ -0,0 +1,75 @@
+"""The `fake_call` decorator for functions as fake LLM calls."""
+
+from ..base import call_factory
+from ._utils import (
+    get_json_output,
+    handle_stream,
+    handle_stream_async,
+    setup_call,
+)
+from .call_params import FakeCallParams
+from .call_response import FakeCallResponse
+from .call_response_chunk import FakeCallResponseChunk
+from .stream import FakeStream
+from .tool import FakeTool
+
+fake_call = call_factory(
+    TCallResponse=FakeCallResponse,
+    TCallResponseChunk=FakeCallResponseChunk,
+    TToolType=FakeTool,
+    TStream=FakeStream,
+    default_call_params=FakeCallParams(),
+    setup_call=setup_call,
+    get_json_output=get_json_output,
+    handle_stream=handle_stream,
+    handle_stream_async=handle_stream_async,
+)
+"""A decorator for calling the fake provider with a typed function.
+
+usage docs: learn/calls.md#fake-provider
+
+This decorator is used to wrap a typed function that calls the fake provider, which
+returns scripted or generated responses without a network. It goes through the same
+setup, parsing, and streaming as the other providers, which makes it suitable for
+tests, load tests, and benchmarks.
+
+Example:
+
+```python
+from mirascope.core import fake
+
+
+client = fake.FakeClient(["The Name of the Wind"], latency=0.5)
+
+
+@fake.call("fake-model", client=client)
+def recommend_book(genre: str) -> str:
+    return f"Recommend a {genre} book"
+
+response = recommend_book("fantasy")
+print(response.content)  # prints "The Name of the Wind"
+```
+
+Args:
+    model (str): The name of the fake model, which is echoed in its responses.
+    stream (bool | StreamConfig): Whether to stream the response from the API call,
+        optionally with a `StreamConfig` (e.g. `{"partial_tools": True}`).
+    tools (list[BaseTool | Callable]): The tools to use in the fake API call.
+    response_model (BaseModel | BaseType): The response model into which the response
+        should be structured.
+    output_parser (Callable[[FakeCallResponse | ResponseModelT], Any]): A function for
+        parsing the call response whose value will be returned in place of the original
+        call response.
+    json_mode (bool): Whether to use JSON Mode.
+    client (object): An optional `FakeClient` or `AsyncFakeClient` to use in place of
+        the default client, which generates its responses instantly.
+    call_params (FakeCallParams): The `FakeCallParams` call parameters to use in the
+        API call.
+    priority (str): The priority class of the call when a `CallScheduler` is installed.
+    retention (str): How much of the request context the call response keeps
+        (`"full"`, `"lean"`, or `"minimal"`).
+
+Returns:
+    decorator (Callable): The decorator for turning a typed function into a fake API
+        call.
+"""
@@ -0,0 +1,10 @@
+"""This module contains the type definition for the fake call keyword arguments."""
+
+from ..base import BaseCallKwargs
+from .call_params import FakeCallParams
+from .types import MessageParam, ToolParam
+
+
+class FakeCallKwargs(FakeCallParams, BaseCallKwargs[ToolParam]):
+    model: str
+    messages: list[MessageParam]
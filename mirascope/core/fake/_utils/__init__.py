@@ -0,0 +1,17 @@
+"""Fake provider utilities for decorator factories."""
+
+from ._calculate_cost import calculate_cost
+from ._convert_message_params import convert_message_params, convert_text_message
+from ._get_json_output import get_json_output
+from ._handle_stream import handle_stream, handle_stream_async
+from ._setup_call import setup_call
+
+__all__ = [
+    "calculate_cost",
+    "convert_message_params",
+    "convert_text_message",
+    "get_json_output",
+    "handle_stream",
+    "handle_stream_async",
+    "setup_call",
+]
@@ -0,0 +1,17 @@
+"""Calculate the cost of a completion using the fake provider."""
+
+from ...base.pricing import pricing_registry
+
+
+def calculate_cost(
+    input_tokens: int | float | None,
+    output_tokens: int | float | None,
+    model: str = "fake-model",
+) -> float | None:
+    """Calculate the cost of a completion using the fake provider.
+
+    Fake models are free unless a price is registered for them in
+    `mirascope.core.base.pricing.pricing_registry` under the `"fake"` provider, e.g. to
+    exercise budgets and cost tracking in load tests.
+    """
+    return pricing_registry.calculate_cost("fake", model, input_tokens, output_tokens)
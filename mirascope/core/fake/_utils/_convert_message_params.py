@@ -0,0 +1,40 @@
+"""Utility for converting `BaseMessageParam` to `MessageParam`"""
+
+from typing import cast
+
+from ...base import BaseMessageParam
+from ..types import MessageParam
+
+
+def convert_message_params(
+    message_params: list[BaseMessageParam | MessageParam],
+) -> list[MessageParam]:
+    """Converts the message parameters into fake message parameters.
+
+    The fake provider never reads media, so only the type and media type of each
+    non-text part are kept.
+    """
+    converted_message_params = []
+    for message_param in message_params:
+        if not isinstance(message_param, BaseMessageParam):
+            converted_message_params.append(message_param)
+        elif isinstance(content := message_param.content, str):
+            converted_message_params.append(message_param.model_dump())
+        else:
+            converted_content = []
+            for part in content:
+                if part.type == "text":
+                    converted_content.append(part.model_dump())
+                elif part.type != "cache_control":
+                    converted_content.append(
+                        {"type": part.type, "media_type": part.media_type}
+                    )
+            converted_message_params.append(
+                {"role": message_param.role, "content": converted_content}
+            )
+    return converted_message_params
+
+
+def convert_text_message(role: str, text: str) -> list[MessageParam]:
+    """Converts a message with only text into fake message parameters."""
+    return [cast(MessageParam, {"role": role, "content": text})]
@@ -0,0 +1,22 @@
+"""Get the JSON output from a completion response."""
+
+from ..call_response import FakeCallResponse
+from ..call_response_chunk import FakeCallResponseChunk
+
+
+def get_json_output(
+    response: FakeCallResponse | FakeCallResponseChunk, json_mode: bool
+) -> str:
+    """Get the JSON output from a completion response."""
+    if isinstance(response, FakeCallResponse):
+        if json_mode and response.content:
+            return response.content
+        elif tool_calls := response.response.tool_calls:
+            return tool_calls[0].arguments
+        raise ValueError("No tool call or JSON object found in response.")
+    else:
+        if json_mode:
+            return response.content
+        elif tool_calls := response.chunk.tool_calls:
+            return tool_calls[0].arguments
+        return ""
@@ -0,0 +1,125 @@
+"""Handles the stream of completion chunks."""
+
+from collections.abc import AsyncGenerator, Generator
+
+from ...base._utils import PartialToolConstructor, StreamedJsonObject
+from ..call_response_chunk import FakeCallResponseChunk
+from ..tool import FakeTool
+from ..types import FakeCompletionChunk, FakeToolCall
+
+_StreamedToolCall = tuple[str, str, type[FakeTool], StreamedJsonObject]
+
+
+def _construct_tool_call(streamed_tool_call: _StreamedToolCall) -> FakeToolCall:
+    """Constructs the tool call from a (possibly incomplete) streamed tool call."""
+    id, name, _, arguments = streamed_tool_call
+    return FakeToolCall(id=id, name=name, arguments=arguments.text)
+
+
+def _construct_tool(streamed_tool_call: _StreamedToolCall) -> FakeTool:
+    """Constructs the tool from a (possibly incomplete) streamed tool call."""
+    tool_type = streamed_tool_call[2]
+    return tool_type.from_tool_call(_construct_tool_call(streamed_tool_call))
+
+
+def _flush_tools(current_tool_calls: dict[int, _StreamedToolCall]) -> list[FakeTool]:
+    """Constructs any remaining tools in the order in which they were requested."""
+    tools = [_construct_tool(current_tool_calls[i]) for i in sorted(current_tool_calls)]
+    current_tool_calls.clear()
+    return tools
+
+
+def _handle_chunk(
+    chunk: FakeCompletionChunk,
+    current_tool_calls: dict[int, _StreamedToolCall],
+    tool_types: list[type[FakeTool]],
+    construct_partial_tool: PartialToolConstructor[FakeTool] | None,
+) -> list[FakeTool]:
+    """Handles a chunk of the stream, returning any tools completed by the chunk.
+
+    Tool calls are tracked by their `index`, and each tool is constructed as soon as
+    its arguments form a complete JSON object. When `construct_partial_tool` is
+    provided, a partial tool is also returned for each arguments fragment that doesn't
+    complete its tool call.
+    """
+    tools = []
+    for tool_call in chunk.tool_calls or []:
+        index = tool_call.index
+        # Start tracking a new tool
+        if tool_call.id and tool_call.name:
+            for tool_type in tool_types:
+                if tool_type._name() == tool_call.name:
+                    break
+            else:
+                raise RuntimeError(f"Unknown tool type in stream: {tool_call.name}")
+            current_tool_calls[index] = (
+                tool_call.id,
+                tool_call.name,
+                tool_type,
+                StreamedJsonObject(partial=construct_partial_tool is not None),
+            )
+
+        # Update arguments with each chunk
+        if index not in current_tool_calls or not tool_call.arguments:
+            continue
+        streamed_tool_call = current_tool_calls[index]
+        if streamed_tool_call[3].feed(tool_call.arguments):
+            tools.append(_construct_tool(current_tool_calls.pop(index)))
+        elif construct_partial_tool and (
+            partial_tool := construct_partial_tool(
+                streamed_tool_call[2],
+                streamed_tool_call[3].value,
+                _construct_tool_call(streamed_tool_call),
+                tool_call.arguments,
+            )
+        ):
+            tools.append(partial_tool)
+    return tools
+
+
+def handle_stream(
+    stream: Generator[FakeCompletionChunk, None, None],
+    tool_types: list[type[FakeTool]] | None,
+    partial_tools: bool = False,
+) -> Generator[tuple[FakeCallResponseChunk, FakeTool | None], None, None]:
+    """Iterator over the stream and constructs tools as they are streamed."""
+    current_tool_calls: dict[int, _StreamedToolCall] = {}
+    construct_partial_tool = (
+        PartialToolConstructor[FakeTool]() if partial_tools else None
+    )
+    for chunk in stream:
+        if not tool_types or not chunk.tool_calls:
+            tools = _flush_tools(current_tool_calls)
+            if not tools:
+                yield FakeCallResponseChunk(chunk=chunk), None
+            for tool in tools:
+                yield FakeCallResponseChunk(chunk=chunk), tool
+            continue
+        for tool in _handle_chunk(
+            chunk, current_tool_calls, tool_types, construct_partial_tool
+        ):
+            yield FakeCallResponseChunk(chunk=chunk), tool
+
+
+async def handle_stream_async(
+    stream: AsyncGenerator[FakeCompletionChunk, None],
+    tool_types: list[type[FakeTool]] | None,
+    partial_tools: bool = False,
+) -> AsyncGenerator[tuple[FakeCallResponseChunk, FakeTool | None], None]:
+    """Async iterator over the stream and constructs tools as they are streamed."""
+    current_tool_calls: dict[int, _StreamedToolCall] = {}
+    construct_partial_tool = (
+        PartialToolConstructor[FakeTool]() if partial_tools else None
+    )
+    async for chunk in stream:
+        if not tool_types or not chunk.tool_calls:
+            tools = _flush_tools(current_tool_calls)
+            if not tools:
+                yield FakeCallResponseChunk(chunk=chunk), None
+            for tool in tools:
+                yield FakeCallResponseChunk(chunk=chunk), tool
+            continue
+        for tool in _handle_chunk(
+            chunk, current_tool_calls, tool_types, construct_partial_tool
+        ):
+            yield FakeCallResponseChunk(chunk=chunk), tool
@@ -0,0 +1,126 @@
+"""This module contains the setup_call function for the fake provider."""
+
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any, cast, overload
+
+from ...base import BaseMessageParam, BaseTool, _utils
+from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
+from ...base.call_params import CommonCallParams
+from .._call_kwargs import FakeCallKwargs
+from ..call_params import FakeCallParams
+from ..client import AsyncFakeClient, FakeClient
+from ..dynamic_config import AsyncFakeDynamicConfig, FakeDynamicConfig
+from ..tool import FakeTool
+from ..types import FakeCompletion, FakeCompletionChunk, MessageParam
+from ._convert_common_call_params import convert_common_call_params
+from ._convert_message_params import convert_message_params, convert_text_message
+
+
+@overload
+def setup_call(
+    *,
+    model: str,
+    client: AsyncFakeClient | None,
+    fn: Callable[..., Awaitable[AsyncFakeDynamicConfig]],
+    fn_args: dict[str, Any],
+    dynamic_config: AsyncFakeDynamicConfig,
+    tools: list[type[BaseTool] | Callable] | None,
+    json_mode: bool,
+    call_params: FakeCallParams | CommonCallParams,
+    extract: bool,
+    stream: bool,
+) -> tuple[
+    AsyncCreateFn[FakeCompletion, FakeCompletionChunk],
+    str | None,
+    list[MessageParam],
+    list[type[FakeTool]] | None,
+    FakeCallKwargs,
+]: ...
+
+
+@overload
+def setup_call(
+    *,
+    model: str,
+    client: FakeClient | None,
+    fn: Callable[..., FakeDynamicConfig],
+    fn_args: dict[str, Any],
+    dynamic_config: FakeDynamicConfig,
+    tools: list[type[BaseTool] | Callable] | None,
+    json_mode: bool,
+    call_params: FakeCallParams | CommonCallParams,
+    extract: bool,
+    stream: bool,
+) -> tuple[
+    CreateFn[FakeCompletion, FakeCompletionChunk],
+    str | None,
+    list[MessageParam],
+    list[type[FakeTool]] | None,
+    FakeCallKwargs,
+]: ...
+
+
+def setup_call(
+    *,
+    model: str,
+    client: FakeClient | AsyncFakeClient | None,
+    fn: Callable[..., FakeDynamicConfig | Awaitable[AsyncFakeDynamicConfig]],
+    fn_args: dict[str, Any],
+    dynamic_config: FakeDynamicConfig | AsyncFakeDynamicConfig,
+    tools: list[type[BaseTool] | Callable] | None,
+    json_mode: bool,
+    call_params: FakeCallParams | CommonCallParams,
+    extract: bool,
+    stream: bool,
+) -> tuple[
+    CreateFn[FakeCompletion, FakeCompletionChunk]
+    | AsyncCreateFn[FakeCompletion, FakeCompletionChunk],
+    str | None,
+    list[MessageParam],
+    list[type[FakeTool]] | None,
+    FakeCallKwargs,
+]:
+    prompt_template, messages, tool_types, base_call_kwargs = _utils.setup_call(
+        fn,
+        fn_args,
+        dynamic_config,
+        tools,
+        FakeTool,
+        call_params,
+        convert_common_call_params,
+        convert_text_message=convert_text_message,
+    )
+    call_kwargs = cast(FakeCallKwargs, base_call_kwargs)
+    messages = cast(list[BaseMessageParam | MessageParam], messages)
+    messages = convert_message_params(messages)
+    if json_mode:
+        call_kwargs["response_format"] = {"type": "json_object"}
+        json_mode_content = _utils.json_mode_content(
+            tool_types[0] if tool_types else None
+        )
+        if messages[-1]["role"] == "user":
+            if isinstance(messages[-1]["content"], str):
+                messages[-1]["content"] += json_mode_content
+            else:
+                messages[-1]["content"] = list(messages[-1]["content"]) + [
+                    {"type": "text", "text": json_mode_content.strip()}
+                ]
+        else:
+            messages.append({"role": "user", "content": json_mode_content.strip()})
+        call_kwargs.pop("tools", None)
+    elif extract:
+        assert tool_types, "At least one tool must be provided for extraction."
+        call_kwargs["tool_choice"] = {"name": tool_types[0]._name()}
+    call_kwargs |= {"model": model, "messages": messages}
+
+    if client is None:
+        client = AsyncFakeClient() if inspect.iscoroutinefunction(fn) else FakeClient()
+
+    create = (
+        get_async_create_fn(client.create)
+        if isinstance(client, AsyncFakeClient)
+        else get_create_fn(client.create)
+    )
+
+    return create, prompt_template, messages, tool_types, call_kwargs
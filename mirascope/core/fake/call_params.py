@@ -0,0 +1,37 @@
+"""usage docs: learn/calls.md#provider-specific-parameters"""
+
+from __future__ import annotations
+
+from typing_extensions import NotRequired
+
+from ..base import BaseCallParams
+
+
+class FakeCallParams(BaseCallParams):
+    """The parameters to use when calling the fake provider.
+
+    The fake provider accepts the common parameters of the other providers so that
+    calls are set up the same way, but only `max_tokens` affects its responses (by
+    capping the length of generated responses).
+
+    Attributes:
+        frequency_penalty: ...
+        max_tokens: ...
+        presence_penalty: ...
+        response_format: ...
+        seed: ...
+        stop: ...
+        temperature: ...
+        tool_choice: ...
+        top_p: ...
+    """
+
+    frequency_penalty: NotRequired[float | None]
+    max_tokens: NotRequired[int | None]
+    presence_penalty: NotRequired[float | None]
+    response_format: NotRequired[dict]
+    seed: NotRequired[int | None]
+    stop: NotRequired[str | list[str] | None]
+    temperature: NotRequired[float | None]
+    tool_choice: NotRequired[dict]
+    top_p: NotRequired[float | None]
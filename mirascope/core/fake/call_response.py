@@ -0,0 +1,161 @@
+"""This module contains the `FakeCallResponse` class.
+
+usage docs: learn/calls.md#handling-responses
+"""
+
+from pydantic import SerializeAsAny, computed_field
+
+from ..base import BaseCallResponse
+from ._utils import calculate_cost
+from .call_params import FakeCallParams
+from .dynamic_config import AsyncFakeDynamicConfig, FakeDynamicConfig
+from .tool import FakeTool
+from .types import (
+    FakeCompletion,
+    FakeUsage,
+    MessageParam,
+    ToolCallParam,
+    ToolParam,
+)
+
+
+class FakeCallResponse(
+    BaseCallResponse[
+        FakeCompletion,
+        FakeTool,
+        ToolParam,
+        AsyncFakeDynamicConfig | FakeDynamicConfig,
+        MessageParam,
+        FakeCallParams,
+        MessageParam,
+    ]
+):
+    """A convenience wrapper around the `FakeCompletion` response.
+
+    When calling the fake provider using a function decorated with `fake_call`, the
+    response will be a `FakeCallResponse` instance with properties that allow for
+    more convenient access to commonly used attributes.
+
+    Example:
+
+    ```python
+    from mirascope.core.fake import fake_call
+
+
+    @fake_call("fake-model")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    response = recommend_book("fantasy")  # response is a `FakeCallResponse` instance
+    print(response.content)
+    ```
+    """
+
+    _provider = "fake"
+
+    @property
+    def content(self) -> str:
+        """Returns the content of the completion."""
+        return self.response.content
+
+    @property
+    def finish_reasons(self) -> list[str]:
+        """Returns the finish reasons of the response."""
+        return [self.response.finish_reason]
+
+    @property
+    def model(self) -> str:
+        """Returns the name of the response model."""
+        return self.response.model
+
+    @property
+    def id(self) -> str:
+        """Returns the id of the response."""
+        return self.response.id
+
+    @property
+    def usage(self) -> FakeUsage | None:
+        """Returns the usage of the completion."""
+        return self.response.usage
+
+    @property
+    def input_tokens(self) -> int | None:
+        """Returns the number of input tokens."""
+        return self.usage.input_tokens if self.usage else None
+
+    @property
+    def output_tokens(self) -> int | None:
+        """Returns the number of output tokens."""
+        return self.usage.output_tokens if self.usage else None
+
+    @property
+    def cost(self) -> float | None:
+        """Returns the cost of the call."""
+        return calculate_cost(self.input_tokens, self.output_tokens, self.model)
+
+    @computed_field
+    @property
+    def message_param(self) -> SerializeAsAny[MessageParam]:
+        """Returns the assistants's response as a message parameter."""
+        message_param = MessageParam(role="assistant", content=self.content)
+        if tool_calls := self.response.tool_calls:
+            message_param["tool_calls"] = [
+                ToolCallParam(**tool_call.model_dump()) for tool_call in tool_calls
+            ]
+        return message_param
+
+    @computed_field
+    @property
+    def tools(self) -> list[FakeTool] | None:
+        """Returns any available tool calls as their `FakeTool` definition.
+
+        Raises:
+            ValidationError: if a tool call doesn't match the tool's schema.
+        """
+        tool_calls = self.response.tool_calls
+        if not self.tool_types or not tool_calls:
+            return None
+
+        extracted_tools = []
+        for tool_call in tool_calls:
+            for tool_type in self.tool_types:
+                if tool_call.name == tool_type._name():
+                    extracted_tools.append(tool_type.from_tool_call(tool_call))
+                    break
+
+        return extracted_tools
+
+    @computed_field
+    @property
+    def tool(self) -> FakeTool | None:
+        """Returns the 0th tool of the completion.
+
+        Raises:
+            ValidationError: if the tool call doesn't match the tool's schema.
+        """
+        if tools := self.tools:
+            return tools[0]
+        return None
+
+    @classmethod
+    def tool_message_params(
+        cls, tools_and_outputs: list[tuple[FakeTool, str]]
+    ) -> list[MessageParam]:
+        """Returns the tool message parameters for tool call results.
+
+        Args:
+            tools_and_outputs: The list of tools and their outputs from which the tool
+                message parameters should be constructed.
+
+        Returns:
+            The list of constructed `MessageParam` parameters.
+        """
+        return [
+            MessageParam(
+                role="tool",
+                content=output,
+                tool_call_id=tool.tool_call.id,
+                name=tool._name(),
+            )
+            for tool, output in tools_and_outputs
+        ]
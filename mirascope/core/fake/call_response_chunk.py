@@ -0,0 +1,66 @@
+"""This module contains the `FakeCallResponseChunk` class.
+
+usage docs: learn/streams.md#handling-streamed-responses
+"""
+
+from ..base import BaseCallResponseChunk
+from .types import FakeCompletionChunk, FakeUsage, FinishReason
+
+
+class FakeCallResponseChunk(BaseCallResponseChunk[FakeCompletionChunk, FinishReason]):
+    """A convenience wrapper around the `FakeCompletionChunk` streamed chunks.
+
+    When calling the fake provider using a function decorated with `fake_call` and
+    `stream` set to `True`, the stream will contain `FakeCallResponseChunk` instances
+    with properties that allow for more convenient access to commonly used attributes.
+
+    Example:
+
+    ```python
+    from mirascope.core.fake import fake_call
+
+
+    @fake_call("fake-model", stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    stream = recommend_book("fantasy")  # response is a `FakeStream`
+    for chunk, _ in stream:
+        print(chunk.content, end="", flush=True)
+    ```
+    """
+
+    @property
+    def content(self) -> str:
+        """Returns the content of the chunk."""
+        return self.chunk.content
+
+    @property
+    def finish_reasons(self) -> list[FinishReason]:
+        """Returns the finish reasons of the response."""
+        return [self.chunk.finish_reason] if self.chunk.finish_reason else []
+
+    @property
+    def model(self) -> str:
+        """Returns the name of the response model."""
+        return self.chunk.model
+
+    @property
+    def id(self) -> str:
+        """Returns the id of the response."""
+        return self.chunk.id
+
+    @property
+    def usage(self) -> FakeUsage | None:
+        """Returns the usage of the completion, which is sent with the last chunk."""
+        return self.chunk.usage
+
+    @property
+    def input_tokens(self) -> int | None:
+        """Returns the number of input tokens."""
+        return self.usage.input_tokens if self.usage else None
+
+    @property
+    def output_tokens(self) -> int | None:
+        """Returns the number of output tokens."""
+        return self.usage.output_tokens if self.usage else None
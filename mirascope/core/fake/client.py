@@ -0,0 +1,477 @@
+"""The fake clients that return scripted or generated responses without a network.
+
+usage docs: learn/calls.md#fake-provider
+"""
+
+import asyncio
+import inspect
+import math
+import random
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable, Sequence
+from functools import partial
+from typing import Any, Literal, TypeAlias, overload
+
+from pydantic import BaseModel
+
+from .types import (
+    FakeCompletion,
+    FakeCompletionChunk,
+    FakeToolCall,
+    FakeToolCallDelta,
+    FakeUsage,
+)
+
+Latency: TypeAlias = float | Callable[[random.Random], float]
+"""A latency in seconds, or a distribution that samples one from a random generator."""
+
+_WORDS = (
+    "the",
+    "quick",
+    "brown",
+    "fox",
+    "jumps",
+    "over",
+    "lazy",
+    "dog",
+    "a",
+    "book",
+    "about",
+    "magic",
+    "and",
+    "wind",
+    "in",
+    "time",
+)
+
+
+def uniform_latency(low: float, high: float) -> Callable[[random.Random], float]:
+    """Returns a latency distribution that is uniform between `low` and `high`."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float) -> Callable[[random.Random], float]:
+    """Returns a log-normal latency distribution, i.e. one with a long tail.
+
+    Args:
+        median: The median latency in seconds.
+        sigma: The standard deviation of the latency's natural logarithm. Higher
+            values make for a longer tail.
+    """
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+class FakeAPIError(Exception):
+    """An error response of the fake provider."""
+
+    status_code: int = 500
+
+    def __init__(
+        self, message: str = "Internal server error.", status_code: int | None = None
+    ) -> None:
+        super().__init__(message)
+        if status_code is not None:
+            self.status_code = status_code
+
+
+class FakeRateLimitError(FakeAPIError):
+    """A rate limit (429) error response of the fake provider."""
+
+    status_code = 429
+
+    def __init__(self, message: str = "Rate limit exceeded.") -> None:
+        super().__init__(message)
+
+
+class FakeTimeoutError(TimeoutError):
+    """Raised when a fake request takes longer than its `timeout`."""
+
+    def __init__(self, message: str = "Request timed out.") -> None:
+        super().__init__(message)
+
+
+class FakeResponse(BaseModel):
+    """A scripted response of a fake client.
+
+    Token counts that are not set are estimated at four characters per token.
+    """
+
+    content: str = ""
+    tool_calls: list[FakeToolCall] = []
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    latency: float | None = None
+    """The time to the first token in seconds, overriding the client's `latency`."""
+
+
+ScriptedResponse: TypeAlias = (
+    str | FakeResponse | BaseException | type[BaseException] | None
+)
+"""A scripted response, an error to raise, or `None` for a generated response."""
+
+
+def _sample(latency: Latency, rng: random.Random) -> float:
+    return max(latency(rng) if callable(latency) else latency, 0.0)
+
+
+def _count_tokens(text: str) -> int:
+    return math.ceil(len(text) / 4)
+
+
+def _count_input_tokens(messages: list[dict[str, Any]]) -> int:
+    text = ""
+    for message in messages:
+        if isinstance(content := message.get("content"), str):
+            text += content
+        else:
+            text += "".join(part.get("text", "") for part in content or [])
+    return _count_tokens(text)
+
+
+def _split(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def _chunks(completion: FakeCompletion, size: int) -> list[FakeCompletionChunk]:
+    """Splits a completion into the chunks in which it is streamed."""
+    chunk = partial(FakeCompletionChunk, id=completion.id, model=completion.model)
+    chunks = [chunk(content=content) for content in _split(completion.content, size)]
+    for index, tool_call in enumerate(completion.tool_calls or []):
+        arguments = _split(tool_call.arguments, size) or [""]
+        chunks.append(
+            chunk(
+                tool_calls=[
+                    FakeToolCallDelta(
+                        index=index,
+                        id=tool_call.id,
+                        name=tool_call.name,
+                        arguments=arguments[0],
+                    )
+                ],
+            )
+        )
+        chunks += [
+            chunk(
+                tool_calls=[FakeToolCallDelta(index=index, arguments=fragment)],
+            )
+            for fragment in arguments[1:]
+        ]
+    chunks.append(chunk(finish_reason=completion.finish_reason, usage=completion.usage))
+    return chunks
+
+
+class _DelayedError(Exception):  # noqa: N818
+    """Carries an error to raise once the latency of the request has passed."""
+
+    def __init__(self, delay: float, error: BaseException) -> None:
+        self.delay = delay
+        self.error = error
+
+
+class _BaseFakeClient:
+    """The configuration shared by the sync and async fake clients."""
+
+    def __init__(
+        self,
+        responses: Iterable[ScriptedResponse]
+        | Callable[[dict[str, Any]], ScriptedResponse]
+        | None = None,
+        *,
+        latency: Latency = 0.0,
+        chunk_latency: Latency = 0.0,
+        chunk_size: int = 4,
+        output_tokens: int = 32,
+        error_rate: float = 0.0,
+        error_types: Sequence[type[BaseException]] = (
+            FakeRateLimitError,
+            FakeTimeoutError,
+        ),
+        seed: int | None = None,
+    ) -> None:
+        """Initializes a fake client.
+
+        Args:
+            responses: The scripted responses, returned in order until they run out,
+                or a function that returns the response to a request from its keyword
+                arguments. Responses are generated when there are none (left).
+            latency: The time to the first token, i.e. the latency of the request.
+            chunk_latency: The time between streamed chunks. Responses that aren't
+                streamed take as long as their chunks would in total.
+            chunk_size: The number of characters of content or tool call arguments in
+                each streamed chunk.
+            output_tokens: The number of tokens (words) in generated responses, up to
+                the `max_tokens` of the request.
+            error_rate: The probability of a request raising an error.
+            error_types: The types of the errors to raise, chosen uniformly at random.
+                Each is instantiated without arguments.
+            seed: The seed of the random generator for the latencies, errors, and
+                generated responses.
+        """
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be at least 1.")
+        if callable(responses):
+            self._respond, self._responses = responses, None
+        else:
+            self._respond, self._responses = None, iter(responses or ())
+        self.latency = latency
+        self.chunk_latency = chunk_latency
+        self.chunk_size = chunk_size
+        self.output_tokens = output_tokens
+        self.error_rate = error_rate
+        self.error_types = list(error_types)
+        self.request_count = 0
+        self.last_request: dict[str, Any] | None = None
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _plan(self, kwargs: dict[str, Any]) -> tuple[FakeCompletion, list[float]]:
+        """Returns the completion of a request and the delay before each of its chunks.
+
+        Raises:
+            _DelayedError: With the scripted or injected error of the request, to raise
+                once the latency of the request has passed.
+        """
+        scripted: ScriptedResponse = None
+        with self._lock:
+            self.request_count += 1
+            self.last_request = kwargs
+            request_number = self.request_count
+            if self._responses is not None:
+                scripted = next(self._responses, None)
+        if self._respond is not None:
+            scripted = self._respond(kwargs)
+
+        with self._lock:
+            rng = self._rng
+            latency = _sample(self.latency, rng)
+            if self.error_rate and rng.random() < self.error_rate:
+                scripted = rng.choice(self.error_types)
+            if isinstance(scripted, BaseException) or (
+                inspect.isclass(scripted) and issubclass(scripted, BaseException)
+            ):
+                raise _DelayedError(
+                    latency,
+                    scripted if isinstance(scripted, BaseException) else scripted(),
+                )
+            finish_reason = "stop"
+            if scripted is None:
+                max_tokens = kwargs.get("max_tokens") or self.output_tokens
+                output_tokens = min(self.output_tokens, max_tokens)
+                if output_tokens < self.output_tokens:
+                    finish_reason = "length"
+                response = FakeResponse(
+                    content=" ".join(rng.choice(_WORDS) for _ in range(output_tokens)),
+                    output_tokens=output_tokens,
+                )
+            elif isinstance(scripted, str):
+                response = FakeResponse(content=scripted)
+            else:
+                response = scripted
+
+            tool_calls = [
+                tool_call
+                if tool_call.id
+                else tool_call.model_copy(update={"id": f"call_{request_number}_{i}"})
+                for i, tool_call in enumerate(response.tool_calls)
+            ]
+            completion = FakeCompletion(
+                id=f"fake-{request_number}",
+                model=kwargs["model"],
+                content=response.content,
+                tool_calls=tool_calls or None,
+                finish_reason="tool_calls" if tool_calls else finish_reason,
+                usage=FakeUsage(
+                    input_tokens=response.input_tokens
+                    if response.input_tokens is not None
+                    else _count_input_tokens(kwargs["messages"]),
+                    output_tokens=response.output_tokens
+                    if response.output_tokens is not None
+                    else _count_tokens(
+                        response.content
+                        + "".join(tool_call.arguments for tool_call in tool_calls)
+                    ),
+                ),
+            )
+            num_chunks = (
+                len(_split(completion.content, self.chunk_size))
+                + sum(
+                    len(_split(tool_call.arguments, self.chunk_size)) or 1
+                    for tool_call in tool_calls
+                )
+                + 1
+            )
+            delays = [latency if response.latency is None else response.latency] + [
+                _sample(self.chunk_latency, rng) for _ in range(num_chunks - 1)
+            ]
+        return completion, delays
+
+
+class FakeClient(_BaseFakeClient):
+    """A client for the fake provider that never touches the network.
+
+    Example:
+
+    ```python
+    from mirascope.core import fake
+
+
+    client = fake.FakeClient(["Mistborn", "Dune"], latency=0.2)
+
+
+    @fake.call("fake-model", client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    print(recommend_book("fantasy"))  # prints "Mistborn" after 0.2 seconds
+    ```
+    """
+
+    @overload
+    def create(
+        self,
+        *,
+        stream: Literal[False] = False,
+        timeout: float | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> FakeCompletion: ...
+
+    @overload
+    def create(
+        self,
+        *,
+        stream: Literal[True],
+        timeout: float | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Generator[FakeCompletionChunk, None, None]: ...
+
+    def create(
+        self,
+        *,
+        stream: bool = False,
+        timeout: float | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> FakeCompletion | Generator[FakeCompletionChunk, None, None]:
+        """Creates a fake completion, or streams it if `stream` is `True`.
+
+        Args:
+            stream: Whether to stream the completion.
+            timeout: The maximum number of seconds to wait for the completion (or each
+                chunk of the stream) before raising a `FakeTimeoutError`.
+            **kwargs: The keyword arguments of the request, which must include the
+                `model` and `messages`.
+        """
+        try:
+            completion, delays = self._plan(kwargs)
+        except _DelayedError as e:
+            _sleep(e.delay, timeout)
+            raise e.error from None
+        if stream:
+            return self._stream(completion, delays, timeout)
+        _sleep(sum(delays), timeout)
+        return completion
+
+    def _stream(
+        self, completion: FakeCompletion, delays: list[float], timeout: float | None
+    ) -> Generator[FakeCompletionChunk, None, None]:
+        for chunk, delay in zip(
+            _chunks(completion, self.chunk_size), delays, strict=True
+        ):
+            _sleep(delay, timeout)
+            yield chunk
+
+
+class AsyncFakeClient(_BaseFakeClient):
+    """An async client for the fake provider that never touches the network.
+
+    Example:
+
+    ```python
+    import asyncio
+
+    from mirascope.core import fake
+
+
+    client = fake.AsyncFakeClient(latency=fake.lognormal_latency(0.5, 0.3))
+
+
+    @fake.call("fake-model", client=client)
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    print(asyncio.run(recommend_book("fantasy")))  # prints a generated response
+    ```
+    """
+
+    @overload
+    async def create(
+        self,
+        *,
+        stream: Literal[False] = False,
+        timeout: float | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> FakeCompletion: ...
+
+    @overload
+    async def create(
+        self,
+        *,
+        stream: Literal[True],
+        timeout: float | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncGenerator[FakeCompletionChunk, None]: ...
+
+    async def create(
+        self,
+        *,
+        stream: bool = False,
+        timeout: float | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> FakeCompletion | AsyncGenerator[FakeCompletionChunk, None]:
+        """Creates a fake completion, or streams it if `stream` is `True`.
+
+        Args:
+            stream: Whether to stream the completion.
+            timeout: The maximum number of seconds to wait for the completion (or each
+                chunk of the stream) before raising a `FakeTimeoutError`.
+            **kwargs: The keyword arguments of the request, which must include the
+                `model` and `messages`.
+        """
+        try:
+            completion, delays = self._plan(kwargs)
+        except _DelayedError as e:
+            await _sleep_async(e.delay, timeout)
+            raise e.error from None
+        if stream:
+            return self._stream(completion, delays, timeout)
+        await _sleep_async(sum(delays), timeout)
+        return completion
+
+    async def _stream(
+        self, completion: FakeCompletion, delays: list[float], timeout: float | None
+    ) -> AsyncGenerator[FakeCompletionChunk, None]:
+        for chunk, delay in zip(
+            _chunks(completion, self.chunk_size), delays, strict=True
+        ):
+            await _sleep_async(delay, timeout)
+            yield chunk
+
+
+def _sleep(delay: float, timeout: float | None) -> None:
+    """Sleeps for `delay` seconds, raising a `FakeTimeoutError` past the timeout."""
+    if timeout is not None and delay > timeout:
+        time.sleep(timeout)
+        raise FakeTimeoutError()
+    if delay:
+        time.sleep(delay)
+
+
+async def _sleep_async(delay: float, timeout: float | None) -> None:
+    """Sleeps for `delay` seconds, raising a `FakeTimeoutError` past the timeout."""
+    if timeout is not None and delay > timeout:
+        await asyncio.sleep(timeout)
+        raise FakeTimeoutError()
+    if delay:
+        await asyncio.sleep(delay)
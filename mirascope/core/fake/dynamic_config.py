@@ -0,0 +1,28 @@
+"""This module defines the function return type for functions as LLM calls."""
+
+from ..base import BaseDynamicConfig, BaseMessageParam
+from .call_params import FakeCallParams
+from .client import AsyncFakeClient, FakeClient
+from .types import MessageParam
+
+AsyncFakeDynamicConfig = BaseDynamicConfig[
+    MessageParam | BaseMessageParam, FakeCallParams, AsyncFakeClient
+]
+FakeDynamicConfig = BaseDynamicConfig[
+    MessageParam | BaseMessageParam, FakeCallParams, FakeClient
+]
+"""The function return type for functions wrapped with the `fake_call` decorator.
+
+Example:
+
+```python
+from mirascope.core import prompt_template
+from mirascope.core.fake import FakeDynamicConfig, fake_call
+
+
+@fake_call("fake-model")
+@prompt_template("Recommend a {capitalized_genre} book")
+def recommend_book(genre: str) -> FakeDynamicConfig:
+    return {"computed_fields": {"capitalized_genre": genre.capitalize()}}
+```
+"""
@@ -0,0 +1,118 @@
+"""The `FakeStream` class for convenience around streaming fake LLM calls.
+
+usage docs: learn/streams.md
+"""
+
+from ..base.stream import BaseStream
+from ._utils import calculate_cost
+from .call_params import FakeCallParams
+from .call_response import FakeCallResponse
+from .call_response_chunk import FakeCallResponseChunk
+from .dynamic_config import AsyncFakeDynamicConfig, FakeDynamicConfig
+from .tool import FakeTool
+from .types import (
+    FakeCompletion,
+    FakeToolCall,
+    FakeUsage,
+    FinishReason,
+    MessageParam,
+    ToolCallParam,
+    ToolParam,
+)
+
+
+class FakeStream(
+    BaseStream[
+        FakeCallResponse,
+        FakeCallResponseChunk,
+        MessageParam,
+        MessageParam,
+        MessageParam,
+        MessageParam,
+        FakeTool,
+        ToolParam,
+        AsyncFakeDynamicConfig | FakeDynamicConfig,
+        FakeCallParams,
+        FinishReason,
+    ]
+):
+    """A class for convenience around streaming fake LLM calls.
+
+    Example:
+
+    ```python
+    from mirascope.core.fake import fake_call
+
+
+    @fake_call("fake-model", stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    stream = recommend_book("fantasy")  # returns `FakeStream` instance
+    for chunk, _ in stream:
+        print(chunk.content, end="", flush=True)
+    ```
+    """
+
+    _provider = "fake"
+
+    @property
+    def cost(self) -> float | None:
+        """Returns the cost of the call."""
+        return calculate_cost(self.input_tokens, self.output_tokens, self.model)
+
+    def _construct_message_param(
+        self,
+        tool_calls: list[FakeToolCall] | None = None,
+        content: str | None = None,
+    ) -> MessageParam:
+        message_param = MessageParam(role="assistant", content=content or "")
+        if tool_calls:
+            message_param["tool_calls"] = [
+                ToolCallParam(**tool_call.model_dump()) for tool_call in tool_calls
+            ]
+        return message_param
+
+    def construct_call_response(self) -> FakeCallResponse:
+        """Constructs the call response from a consumed FakeStream.
+
+        Raises:
+            ValueError: if the stream has not yet been consumed.
+        """
+        if not hasattr(self, "message_param"):
+            raise ValueError(
+                "No stream response, check if the stream has been consumed."
+            )
+        if not self.input_tokens and not self.output_tokens:
+            usage = None
+        else:
+            usage = FakeUsage(
+                input_tokens=int(self.input_tokens or 0),
+                output_tokens=int(self.output_tokens or 0),
+            )
+        tool_calls = [
+            FakeToolCall.model_validate(tool_call)
+            for tool_call in self.message_param.get("tool_calls", [])
+        ]
+        completion = FakeCompletion(
+            id=self.id if self.id else "",
+            model=self.model,
+            content=self.content,
+            tool_calls=tool_calls or None,
+            finish_reason=self.finish_reasons[0] if self.finish_reasons else "stop",
+            usage=usage,
+        )
+        return FakeCallResponse(
+            metadata=self.metadata,
+            response=completion,
+            tool_types=self.tool_types,
+            prompt_template=self.prompt_template,
+            fn_args=self.fn_args if self.fn_args else {},
+            dynamic_config=self.dynamic_config,
+            messages=self.messages,
+            call_params=self.call_params,
+            call_kwargs=self.call_kwargs,
+            user_message_param=self.user_message_param,
+            start_time=self.start_time,
+            end_time=self.end_time,
+        )
@@ -0,0 +1,88 @@
+"""The `FakeTool` class for easy tool usage with fake LLM calls.
+
+usage docs: learn/tools.md
+"""
+
+from __future__ import annotations
+
+import jiter
+from pydantic.json_schema import SkipJsonSchema
+
+from ..base import BaseTool
+from .types import FakeToolCall, ToolParam
+
+
+class FakeTool(BaseTool):
+    """A class for defining tools for fake LLM calls.
+
+    Example:
+
+    ```python
+    from mirascope.core import fake
+
+
+    def format_book(title: str, author: str) -> str:
+        return f"{title} by {author}"
+
+
+    client = fake.FakeClient(
+        [
+            fake.FakeResponse(
+                tool_calls=[
+                    fake.FakeToolCall(
+                        name="format_book",
+                        arguments='{"title": "Dune", "author": "Frank Herbert"}',
+                    )
+                ]
+            )
+        ]
+    )
+
+
+    @fake.call("fake-model", tools=[format_book], client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    response = recommend_book("fantasy")
+    if tool := response.tool:  # returns a `FakeTool` instance
+        print(tool.call())
+    ```
+    """
+
+    __provider__ = "fake"
+
+    tool_call: SkipJsonSchema[FakeToolCall]
+
+    @classmethod
+    def tool_schema(cls) -> ToolParam:
+        """Constructs a JSON Schema tool schema from the `BaseModel` schema defined.
+
+        Example:
+        ```python
+        from mirascope.core.fake import FakeTool
+
+
+        def format_book(title: str, author: str) -> str:
+            return f"{title} by {author}"
+
+
+        tool_type = FakeTool.type_from_fn(format_book)
+        print(tool_type.tool_schema())  # prints the fake tool schema
+        ```
+        """
+        schema = ToolParam(name=cls._name(), description=cls._description())
+        model_schema = cls.model_json_schema()
+        if model_schema["properties"]:
+            schema["parameters"] = model_schema
+        return schema
+
+    @classmethod
+    def from_tool_call(cls, tool_call: FakeToolCall) -> FakeTool:
+        """Constructs a `FakeTool` instance from a `tool_call`.
+
+        Args:
+            tool_call: The fake tool call from which to construct this tool instance.
+        """
+        model_json = jiter.from_json(tool_call.arguments.encode())
+        model_json["tool_call"] = tool_call.model_dump()
+        return cls.model_validate(model_json)
@@ -0,0 +1,104 @@
+"""The request and response types of the fake provider.
+
+The fake provider has no SDK, so these types play the role of the SDK types of the
+other providers. They follow the shape of a chat completions API.
+
+usage docs: learn/calls.md#fake-provider
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel
+from typing_extensions import NotRequired, TypedDict
+
+FinishReason = Literal["stop", "length", "tool_calls"]
+
+
+class FakeToolCall(BaseModel):
+    """A tool call in a fake completion.
+
+    Example:
+
+    ```python
+    from mirascope.core.fake import FakeToolCall
+
+    tool_call = FakeToolCall(name="format_book", arguments='{"title": "Dune"}')
+    ```
+    """
+
+    id: str = ""
+    """The ID of the tool call, which the client fills in when left empty."""
+
+    name: str
+    """The name of the tool to call."""
+
+    arguments: str
+    """The arguments of the tool call as a JSON string."""
+
+
+class FakeUsage(BaseModel):
+    """The token usage of a fake completion."""
+
+    input_tokens: int
+    output_tokens: int
+
+
+class FakeCompletion(BaseModel):
+    """A fake completion returned by a `FakeClient`."""
+
+    id: str
+    model: str
+    content: str = ""
+    tool_calls: list[FakeToolCall] | None = None
+    finish_reason: FinishReason = "stop"
+    usage: FakeUsage | None = None
+
+
+class FakeToolCallDelta(BaseModel):
+    """A streamed fragment of a tool call.
+
+    The first fragment of each tool call has its `id` and `name`, and the fragments of
+    a tool call share its `index`.
+    """
+
+    index: int
+    id: str | None = None
+    name: str | None = None
+    arguments: str = ""
+
+
+class FakeCompletionChunk(BaseModel):
+    """A chunk of a fake completion streamed by a `FakeClient`."""
+
+    id: str
+    model: str
+    content: str = ""
+    tool_calls: list[FakeToolCallDelta] | None = None
+    finish_reason: FinishReason | None = None
+    usage: FakeUsage | None = None
+
+
+class ToolCallParam(TypedDict):
+    """A tool call of an assistant message parameter."""
+
+    id: str
+    name: str
+    arguments: str
+
+
+class MessageParam(TypedDict):
+    """A message parameter of the fake provider."""
+
+    role: Literal["system", "user", "assistant", "tool"]
+    content: str | list[dict]
+    tool_calls: NotRequired[list[ToolCallParam]]
+    tool_call_id: NotRequired[str]
+    name: NotRequired[str]
+
+
+class ToolParam(TypedDict):
+    """The schema of a tool of the fake provider."""
+
+    name: str
+    description: str
+    parameters: NotRequired[dict]
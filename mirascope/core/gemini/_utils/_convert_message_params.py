@@ -84,3 +84,13 @@ def convert_message_params(
                 }
             )
     return converted_message_params
+
+
+def convert_text_message(role: str, text: str) -> list[ContentDict]:
+    """Converts a message with only text into Gemini message parameters."""
+    if role == "system":
+        return [
+            {"role": "user", "parts": [text]},
+            {"role": "model", "parts": ["Ok! I will adhere to this system message."]},
+        ]
+    return [{"role": role if role == "user" else "model", "parts": [text]}]
@@ -27,7 +27,7 @@ from ..call_params import GeminiCallParams
 from ..dynamic_config import GeminiDynamicConfig
 from ..tool import GeminiTool
 from ._convert_common_call_params import convert_common_call_params
-from ._convert_message_params import convert_message_params
+from ._convert_message_params import convert_message_params, convert_text_message
 
 
 @overload
@@ -102,6 +102,7 @@ def setup_call(
         GeminiTool,
         call_params,
         convert_common_call_params,
+        convert_text_message=convert_text_message,
     )
     call_kwargs = cast(GeminiCallKwargs, base_call_kwargs)
     messages = cast(list[BaseMessageParam | ContentDict], messages)
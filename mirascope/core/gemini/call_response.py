@@ -3,6 +3,9 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from typing import Any
+
+from google.generativeai import protos
 from google.generativeai.protos import FunctionResponse
 from google.generativeai.types import (
     AsyncGenerateContentResponse,
@@ -57,6 +60,20 @@ class GeminiCallResponse(
 
     _provider = "gemini"
 
+    @classmethod
+    def _dump_response(
+        cls, response: GenerateContentResponse | AsyncGenerateContentResponse
+    ) -> dict[str, Any]:
+        """Returns the `GenerateContentResponse` as JSON data."""
+        return response.to_dict()
+
+    @classmethod
+    def _load_response(cls, data: dict[str, Any]) -> GenerateContentResponse:
+        """Returns the `GenerateContentResponse` rebuilt from its JSON data."""
+        return GenerateContentResponse.from_response(
+            protos.GenerateContentResponse(data)
+        )
+
     @property
     def content(self) -> str:
         """Returns the contained string content for the 0th choice."""
@@ -1,7 +1,7 @@
 """Groq utilities for decorator factories."""
 
 from ._calculate_cost import calculate_cost
-from ._convert_message_params import convert_message_params
+from ._convert_message_params import convert_message_params, convert_text_message
 from ._get_json_output import get_json_output
 from ._handle_stream import handle_stream, handle_stream_async
 from ._setup_call import setup_call
@@ -9,6 +9,7 @@ from ._setup_call import setup_call
 __all__ = [
     "calculate_cost",
     "convert_message_params",
+    "convert_text_message",
     "get_json_output",
     "handle_stream",
     "handle_stream_async",
@@ -5,117 +5,143 @@ from collections.abc import AsyncGenerator, Generator
 from groq.types.chat import ChatCompletionChunk, ChatCompletionMessageToolCall
 from groq.types.chat.chat_completion_message_tool_call import Function
 
+from ...base._utils import PartialToolConstructor, StreamedJsonObject
 from ..call_response_chunk import GroqCallResponseChunk
 from ..tool import GroqTool
 
+_StreamedToolCall = tuple[str, str, type[GroqTool], StreamedJsonObject]
+
+
+def _construct_tool_call(
+    streamed_tool_call: _StreamedToolCall,
+) -> ChatCompletionMessageToolCall:
+    """Constructs the tool call from a (possibly incomplete) streamed tool call."""
+    id, name, _, arguments = streamed_tool_call
+    return ChatCompletionMessageToolCall(
+        id=id,
+        function=Function(arguments=arguments.text, name=name),
+        type="function",
+    )
+
+
+def _construct_tool(streamed_tool_call: _StreamedToolCall) -> GroqTool:
+    """Constructs the tool from a (possibly incomplete) streamed tool call."""
+    tool_type = streamed_tool_call[2]
+    return tool_type.from_tool_call(_construct_tool_call(streamed_tool_call))
+
+
+def _flush_tools(
+    current_tool_calls: dict[int, _StreamedToolCall],
+) -> list[GroqTool]:
+    """Constructs any remaining tools in the order in which they were requested."""
+    tools = [_construct_tool(current_tool_calls[i]) for i in sorted(current_tool_calls)]
+    current_tool_calls.clear()
+    return tools
+
 
 def _handle_chunk(
     chunk: ChatCompletionChunk,
-    current_tool_call: ChatCompletionMessageToolCall,
-    current_tool_type: type[GroqTool] | None,
-    tool_types: list[type[GroqTool]] | None,
-) -> tuple[
-    GroqTool | None,
-    ChatCompletionMessageToolCall,
-    type[GroqTool] | None,
-]:
-    """Handles a chunk of the stream."""
-    if not tool_types or not (tool_calls := chunk.choices[0].delta.tool_calls):
-        return None, current_tool_call, current_tool_type
-
-    tool_call = tool_calls[0]
-    # Reset on new tool
-    if tool_call.id and tool_call.function is not None:
-        previous_tool_call = current_tool_call.model_copy()
-        previous_tool_type = current_tool_type
-        current_tool_call = ChatCompletionMessageToolCall(
-            id=tool_call.id,
-            function=Function(
-                arguments="",
-                name=tool_call.function.name if tool_call.function.name else "",
-            ),
-            type="function",
-        )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
-        if current_tool_type is None:
-            raise RuntimeError(
-                f"Unknown tool type in stream: {tool_call.function.name}"
-            )  # pragma: no cover
+    current_tool_calls: dict[int, _StreamedToolCall],
+    tool_types: list[type[GroqTool]],
+    construct_partial_tool: PartialToolConstructor[GroqTool] | None,
+) -> list[GroqTool]:
+    """Handles a chunk of the stream, returning any tools completed by the chunk.
+
+    Tool calls are tracked by their `index` so that interleaved deltas for parallel
+    tool calls are accumulated correctly, and each tool is constructed as soon as its
+    arguments form a complete JSON object.
+
+    When `construct_partial_tool` is provided, a partial tool is also returned for each
+    arguments fragment that doesn't complete its tool call.
+    """
+    tools = []
+    for tool_call in chunk.choices[0].delta.tool_calls or []:
+        index = tool_call.index
+        # Start tracking a new tool
+        if tool_call.id and tool_call.function is not None:
+            name = tool_call.function.name or ""
+            for tool_type in tool_types:
+                if tool_type._name() == name:
+                    break
+            else:
+                raise RuntimeError(
+                    f"Unknown tool type in stream: {name}"
+                )  # pragma: no cover
+            current_tool_calls[index] = (
+                tool_call.id,
+                name,
+                tool_type,
+                StreamedJsonObject(partial=construct_partial_tool is not None),
+            )
+
+        # Update arguments with each chunk
         if (
-            previous_tool_call.id
-            and previous_tool_call.function.arguments
-            and previous_tool_type is not None
+            index not in current_tool_calls
+            or not tool_call.function
+            or not tool_call.function.arguments
         ):
-            return (
-                previous_tool_type.from_tool_call(previous_tool_call),
-                current_tool_call,
-                current_tool_type,
+            continue
+        delta = tool_call.function.arguments
+        streamed_tool_call = current_tool_calls[index]
+        if streamed_tool_call[3].feed(delta):
+            tools.append(_construct_tool(current_tool_calls.pop(index)))
+        elif construct_partial_tool and (
+            partial_tool := construct_partial_tool(
+                streamed_tool_call[2],
+                streamed_tool_call[3].value,
+                _construct_tool_call(streamed_tool_call),
+                delta,
             )
-
-    # Update arguments with each chunk
-    if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
-
-    return None, current_tool_call, current_tool_type
+        ):
+            tools.append(partial_tool)
+    return tools
 
 
 def handle_stream(
     stream: Generator[ChatCompletionChunk, None, None],
     tool_types: list[type[GroqTool]] | None,
+    partial_tools: bool = False,
 ) -> Generator[tuple[GroqCallResponseChunk, GroqTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
-    current_tool_call = ChatCompletionMessageToolCall(
-        id="", function=Function(arguments="", name=""), type="function"
+    current_tool_calls: dict[int, _StreamedToolCall] = {}
+    construct_partial_tool = (
+        PartialToolConstructor[GroqTool]() if partial_tools else None
     )
-    current_tool_type = None
     for chunk in stream:
-        if not tool_types or not chunk.choices[0].delta.tool_calls:
-            if current_tool_type:
-                yield (
-                    GroqCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
-                )
-                current_tool_type = None
-            else:
-                yield GroqCallResponseChunk(chunk=chunk), None
-        tool, current_tool_call, current_tool_type = _handle_chunk(
-            chunk,
-            current_tool_call,
-            current_tool_type,
-            tool_types,
-        )
-        if tool is not None:
-            yield GroqCallResponseChunk(chunk=chunk), tool
+        call_response_chunk = GroqCallResponseChunk(chunk=chunk)
+        if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
+            tools = _flush_tools(current_tool_calls)
+            if not tools:
+                yield call_response_chunk, None
+            for tool in tools:
+                yield call_response_chunk, tool
+            continue
+        for tool in _handle_chunk(
+            chunk, current_tool_calls, tool_types, construct_partial_tool
+        ):
+            yield call_response_chunk, tool
 
 
 async def handle_stream_async(
     stream: AsyncGenerator[ChatCompletionChunk, None],
     tool_types: list[type[GroqTool]] | None,
+    partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[GroqCallResponseChunk, GroqTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
-    current_tool_call = ChatCompletionMessageToolCall(
-        id="", function=Function(arguments="", name=""), type="function"
+    current_tool_calls: dict[int, _StreamedToolCall] = {}
+    construct_partial_tool = (
+        PartialToolConstructor[GroqTool]() if partial_tools else None
     )
-    current_tool_type = None
     async for chunk in stream:
-        if not tool_types or not chunk.choices[0].delta.tool_calls:
-            if current_tool_type:
-                yield (
-                    GroqCallResponseChunk(chunk=chunk),
-                    current_tool_type.from_tool_call(current_tool_call),
-                )
-                current_tool_type = None
-            else:
-                yield GroqCallResponseChunk(chunk=chunk), None
-        tool, current_tool_call, current_tool_type = _handle_chunk(
-            chunk,
-            current_tool_call,
-            current_tool_type,
-            tool_types,
-        )
-        if tool is not None:
-            yield GroqCallResponseChunk(chunk=chunk), tool
+        call_response_chunk = GroqCallResponseChunk(chunk=chunk)
+        if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
+            tools = _flush_tools(current_tool_calls)
+            if not tools:
+                yield call_response_chunk, None
+            for tool in tools:
+                yield call_response_chunk, tool
+            continue
+        for tool in _handle_chunk(
+            chunk, current_tool_calls, tool_types, construct_partial_tool
+        ):
+            yield call_response_chunk, tool
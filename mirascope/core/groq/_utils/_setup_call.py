@@ -19,7 +19,7 @@ from ..call_params import GroqCallParams
 from ..dynamic_config import AsyncGroqDynamicConfig, GroqDynamicConfig
 from ..tool import GroqTool
 from ._convert_common_call_params import convert_common_call_params
-from ._convert_message_params import convert_message_params
+from ._convert_message_params import convert_message_params, convert_text_message
 
 
 @overload
@@ -94,6 +94,7 @@ def setup_call(
         GroqTool,
         call_params,
         convert_common_call_params,
+        convert_text_message=convert_text_message,
     )
     call_kwargs = cast(GroqCallKwargs, base_call_kwargs)
     messages = cast(list[BaseMessageParam | ChatCompletionMessageParam], messages)
@@ -8,7 +8,13 @@ from openai import OpenAI
 from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
 
 from ...base import BaseTool
-from ...base._utils import AsyncCreateFn, CreateFn, fn_is_async
+from ...base._utils import (
+    AsyncCreateFn,
+    CreateFn,
+    fn_is_async,
+    get_async_create_fn,
+    get_create_fn,
+)
 from ...base.call_params import CommonCallParams
 from ...openai import (
     AsyncOpenAIDynamicConfig,
@@ -96,8 +102,9 @@ def setup_call(
         extract=extract,
         stream=stream,
     )
-    create = cast(
-        Callable[..., ChatCompletion] | Callable[..., Awaitable[ChatCompletion]],
-        acompletion if fn_is_async(fn) else completion,
+    create = (
+        get_async_create_fn(acompletion)
+        if fn_is_async(fn)
+        else get_create_fn(cast(Callable[..., ChatCompletion], completion))
     )
     return create, prompt_template, messages, tool_types, call_kwargs
@@ -1,6 +1,7 @@
 """Utility for converting `BaseMessageParam` to `ChatCompletionMessageParam`."""
 
 import base64
+from typing import cast
 
 from openai.types.chat import ChatCompletionMessageParam
 
@@ -69,3 +70,8 @@ def convert_message_params(
                 {"role": message_param.role, "content": converted_content}
             )
     return converted_message_params
+
+
+def convert_text_message(role: str, text: str) -> list[ChatCompletionMessageParam]:
+    """Converts a message with only text into OpenAI message parameters."""
+    return [cast(ChatCompletionMessageParam, {"role": role, "content": text})]
@@ -21,7 +21,7 @@ from ..call_params import OpenAICallParams
 from ..dynamic_config import AsyncOpenAIDynamicConfig, OpenAIDynamicConfig
 from ..tool import GenerateOpenAIStrictToolJsonSchema, OpenAITool
 from ._convert_common_call_params import convert_common_call_params
-from ._convert_message_params import convert_message_params
+from ._convert_message_params import convert_message_params, convert_text_message
 
 
 @overload
@@ -97,6 +97,7 @@ def setup_call(
         OpenAITool,
         call_params,
         convert_common_call_params,
+        convert_text_message=convert_text_message,
     )
     call_kwargs = cast(OpenAICallKwargs, base_call_kwargs)
     messages = cast(list[BaseMessageParam | ChatCompletionMessageParam], messages)
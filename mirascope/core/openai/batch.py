@@ -0,0 +1,110 @@
+"""The `OpenAIBatch` class for running calls through the OpenAI Batch API.
+
+usage docs: learn/calls.md#batch-processing
+"""
+
+import json
+from typing import Any, TypeVar
+
+from openai import OpenAI
+from openai.types import Batch
+from openai.types.chat import ChatCompletion
+from pydantic_core import to_jsonable_python
+
+from ..base.batch import BaseBatch, BatchError, BatchRequestError
+
+_ResultT = TypeVar("_ResultT")
+
+_ENDPOINT = "/v1/chat/completions"
+_FINISHED_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class OpenAIBatch(BaseBatch[OpenAI, _ResultT]):
+    """A batch of OpenAI calls to run through the OpenAI Batch API.
+
+    The requests are uploaded as a JSONL file and the batch is created with a 24 hour
+    completion window. Each result is parsed into the output of the call, e.g. an
+    `OpenAICallResponse` or an instance of its `response_model`.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    batch = openai.OpenAIBatch(recommend_book)
+    for genre in ["fantasy", "mystery", "horror"]:
+        batch.add(genre, custom_id=genre)
+    results = batch.wait()
+    print(results["fantasy"])
+    ```
+    """
+
+    _batch: Batch | None = None
+
+    def _default_client(self) -> OpenAI:
+        return OpenAI()
+
+    def _submit(self, requests: dict[str, dict[str, Any]]) -> str:
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": _ENDPOINT,
+                    "body": call_kwargs,
+                },
+                default=to_jsonable_python,
+            )
+            for custom_id, call_kwargs in requests.items()
+        ]
+        input_file = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()), purpose="batch"
+        )
+        return self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=_ENDPOINT,
+            completion_window="24h",
+        ).id
+
+    def _retrieve_status(self) -> tuple[str, bool]:
+        assert self.id is not None
+        batch = self.client.batches.retrieve(self.id)
+        self._batch = batch
+        if batch.status == "failed" and batch.errors and batch.errors.data:
+            raise BatchError(
+                f"Batch `{self.id}` failed: "
+                + "; ".join(str(error.message) for error in batch.errors.data)
+            )
+        return batch.status, batch.status in _FINISHED_STATUSES
+
+    def _retrieve_results(self) -> dict[str, Any]:
+        batch = self._batch
+        assert batch is not None
+        results: dict[str, Any] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id is None:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                custom_id = result["custom_id"]
+                response = result.get("response") or {}
+                body = response.get("body") or {}
+                if error := result.get("error") or body.get("error"):
+                    results[custom_id] = BatchRequestError(
+                        custom_id, error.get("message", str(error))
+                    )
+                elif response.get("status_code", 200) != 200:
+                    results[custom_id] = BatchRequestError(
+                        custom_id, f"Status code {response['status_code']}."
+                    )
+                else:
+                    results[custom_id] = ChatCompletion.model_validate(body)
+        return results
@@ -110,10 +110,19 @@ class OpenAICallResponse(
         """Returns the number of output tokens."""
         return self.usage.completion_tokens if self.usage else None
 
+    @property
+    def cached_input_tokens(self) -> int | None:
+        """Returns the number of input tokens read from the prompt cache."""
+        if self.usage and (details := self.usage.prompt_tokens_details):
+            return details.cached_tokens
+        return None
+
     @property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
-        return calculate_cost(self.input_tokens, self.output_tokens, self.model)
+        return calculate_cost(
+            self.input_tokens, self.output_tokens, self.model, self.cached_input_tokens
+        )
 
     @computed_field
     @property
@@ -92,6 +92,13 @@ class OpenAICallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishR
             return self.usage.completion_tokens
         return None
 
+    @property
+    def cached_input_tokens(self) -> int | None:
+        """Returns the number of input tokens read from the prompt cache."""
+        if self.usage and (details := self.usage.prompt_tokens_details):
+            return details.cached_tokens
+        return None
+
     @computed_field
     @property
     def audio(self) -> bytes | None:
@@ -18,7 +18,7 @@ from openai.types.chat import (
 )
 from openai.types.chat.chat_completion import Choice
 from openai.types.chat.chat_completion_message_tool_call_param import Function
-from openai.types.completion_usage import CompletionUsage
+from openai.types.completion_usage import CompletionUsage, PromptTokensDetails
 
 from ..base.stream import BaseStream
 from ._utils import calculate_cost
@@ -67,6 +67,7 @@ class OpenAIStream(
     """
 
     audio_id: str | None = None
+    cached_input_tokens: int | None = None
 
     _provider = "openai"
 
@@ -80,10 +81,18 @@ class OpenAIStream(
                 self.audio_id = audio_id
             yield chunk, tool
 
+    def _update_properties(self, chunk: OpenAICallResponseChunk) -> None:
+        """Updates the properties of the stream, including prompt cache usage."""
+        super()._update_properties(chunk)
+        if (tokens := chunk.cached_input_tokens) is not None:
+            self.cached_input_tokens = (self.cached_input_tokens or 0) + tokens
+
     @property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
-        return calculate_cost(self.input_tokens, self.output_tokens, self.model)
+        return calculate_cost(
+            self.input_tokens, self.output_tokens, self.model, self.cached_input_tokens
+        )
 
     def _construct_message_param(
         self,
@@ -133,6 +142,10 @@ class OpenAIStream(
                 completion_tokens=int(self.output_tokens or 0),
                 total_tokens=int(self.input_tokens or 0) + int(self.output_tokens or 0),
             )
+            if self.cached_input_tokens is not None:
+                usage.prompt_tokens_details = PromptTokensDetails(
+                    cached_tokens=self.cached_input_tokens
+                )
         completion = ChatCompletion(
             id=self.id if self.id else "",
             model=self.model,
@@ -11,6 +11,7 @@ from ..tool import VertexTool
 def handle_stream(
     stream: Generator[GenerationResponse, None, None],
     tool_types: list[type[VertexTool]] | None = None,
+    partial_tools: bool = False,
 ) -> Generator[tuple[VertexCallResponseChunk, None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed.
 
@@ -23,6 +24,7 @@ def handle_stream(
 async def handle_stream_async(
     stream: AsyncGenerator[GenerationResponse, None],
     tool_types: list[type[VertexTool]] | None = None,
+    partial_tools: bool = False,
 ) -> AsyncGenerator[tuple[VertexCallResponseChunk, None], None]:
     """
     Async iterator over the stream and constructs tools as they are streamed.
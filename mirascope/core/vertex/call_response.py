@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from typing import Any
+
 from google.cloud.aiplatform_v1beta1.types import GenerateContentResponse
 from pydantic import computed_field
 from vertexai.generative_models import Content, GenerationResponse, Part, Tool
@@ -50,6 +52,16 @@ class VertexCallResponse(
 
     _provider = "vertex"
 
+    @classmethod
+    def _dump_response(cls, response: GenerationResponse) -> dict[str, Any]:
+        """Returns the `GenerationResponse` as JSON data."""
+        return response.to_dict()
+
+    @classmethod
+    def _load_response(cls, data: dict[str, Any]) -> GenerationResponse:
+        """Returns the `GenerationResponse` rebuilt from its JSON data."""
+        return GenerationResponse.from_dict(data)
+
     @property
     def content(self) -> str:
         """Returns the contained string content for the 0th choice."""
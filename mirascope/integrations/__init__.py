@@ -3,6 +3,9 @@
 from contextlib import suppress
 
 from ._middleware_factory import middleware_factory
+from ._payload import PayloadPolicy, PayloadWorker
+from ._with_budget import with_budget
+from ._with_cost_ledger import with_cost_ledger
 
 with suppress(ImportError):
     from . import logfire as logfire
@@ -13,4 +16,13 @@ with suppress(ImportError):
 with suppress(ImportError):
     from . import otel as otel
 
-__all__ = ["langfuse", "logfire", "middleware_factory", "otel"]
+__all__ = [
+    "PayloadPolicy",
+    "PayloadWorker",
+    "langfuse",
+    "logfire",
+    "middleware_factory",
+    "otel",
+    "with_budget",
+    "with_cost_ledger",
+]
@@ -46,6 +46,343 @@ def default_context_manager(
     yield None
 
 
+class _Middleware:
+    """The hooks of a single middleware created by `middleware_factory`."""
+
+    def __init__(self, **hooks: Any) -> None:  # noqa: ANN401
+        self.custom_context_manager: Callable[
+            [SyncFunc | AsyncFunc], AbstractContextManager
+        ] = hooks["custom_context_manager"]
+        self.custom_decorator: Callable | None = hooks["custom_decorator"]
+        self.handle_call_response: Callable | None = hooks["handle_call_response"]
+        self.handle_call_response_async: Callable | None = hooks[
+            "handle_call_response_async"
+        ]
+        self.handle_stream: Callable | None = hooks["handle_stream"]
+        self.handle_stream_async: Callable | None = hooks["handle_stream_async"]
+        self.handle_response_model: Callable | None = hooks["handle_response_model"]
+        self.handle_response_model_async: Callable | None = hooks[
+            "handle_response_model_async"
+        ]
+        self.handle_structured_stream: Callable | None = hooks[
+            "handle_structured_stream"
+        ]
+        self.handle_structured_stream_async: Callable | None = hooks[
+            "handle_structured_stream_async"
+        ]
+        self.handle_error: Callable | None = hooks["handle_error"]
+        self.handle_error_async: Callable | None = hooks["handle_error_async"]
+
+
+# The middleware, the function it decorates, its context manager, and its context
+_LayerState = tuple[_Middleware, Callable, AbstractContextManager, Any]
+
+
+def _exit_interrupted(states: list[_LayerState]) -> None:
+    """Exits the layers of a call interrupted by an exception that isn't an error of
+    the call (e.g. `KeyboardInterrupt`, or a batch stopping the call once its request
+    is rendered), without running their hooks."""
+    for _, _, context_manager, _ in reversed(states):
+        context_manager.__exit__(None, None, None)
+
+
+def _exit_call(
+    state: _LayerState,
+    result: Any,  # noqa: ANN401
+    error: Exception | None,
+    deferred: list,
+) -> tuple[Any, Exception | None]:
+    """Runs a layer's hooks for the result (or error) of the call it wraps.
+
+    Returns the result and the error to pass on to the next (outer) layer. Streams
+    are added to `deferred` since their hooks run once they've been iterated.
+    """
+    middleware, fn, context_manager, context = state
+    try:
+        if error is not None:
+            if not middleware.handle_error:
+                # No handle_error provided, exit context manager with exception and re-raise
+                context_manager.__exit__(type(error), error, error.__traceback__)
+                raise error
+            try:
+                result = middleware.handle_error(error, fn, context)
+            except Exception as new_e:
+                # If handle_error raises an exception, exit context manager and re-raise
+                context_manager.__exit__(type(new_e), new_e, new_e.__traceback__)
+                raise
+            # Exception was handled, exit context manager and continue
+            context_manager.__exit__(None, None, None)
+
+        if (
+            isinstance(result, BaseCallResponse)
+            and middleware.handle_call_response is not None
+        ):
+            middleware.handle_call_response(result, fn, context)
+            context_manager.__exit__(None, None, None)
+        elif isinstance(result, BaseStream):
+            deferred.append(state)
+        elif (
+            isinstance(result, ResponseModel)
+            and middleware.handle_response_model is not None
+        ):
+            middleware.handle_response_model(result, fn, context)
+            context_manager.__exit__(None, None, None)
+        elif isinstance(result, BaseStructuredStream):
+            deferred.append(state)
+        else:
+            context_manager.__exit__(None, None, None)
+    except Exception as e:
+        return None, e
+    return result, None
+
+
+async def _exit_call_async(
+    state: _LayerState,
+    result: Any,  # noqa: ANN401
+    error: Exception | None,
+    deferred: list,
+) -> tuple[Any, Exception | None]:
+    """Runs a layer's async hooks for the result (or error) of the call it wraps."""
+    middleware, fn, context_manager, context = state
+    try:
+        if error is not None:
+            if not middleware.handle_error_async:
+                # No handle_error_async provided, exit context manager with exception and re-raise
+                context_manager.__exit__(type(error), error, error.__traceback__)
+                raise error
+            try:
+                result = await middleware.handle_error_async(error, fn, context)
+            except Exception as new_e:
+                # If handle_error_async raises an exception, exit context manager and re-raise
+                context_manager.__exit__(type(new_e), new_e, new_e.__traceback__)
+                raise
+            # Exception was handled, exit context manager and continue
+            context_manager.__exit__(None, None, None)
+
+        if (
+            isinstance(result, BaseCallResponse)
+            and middleware.handle_call_response_async is not None
+        ):
+            await middleware.handle_call_response_async(result, fn, context)
+            context_manager.__exit__(None, None, None)
+        elif isinstance(result, BaseStream):
+            deferred.append(state)
+        elif (
+            isinstance(result, ResponseModel)
+            and middleware.handle_response_model_async is not None
+        ):
+            await middleware.handle_response_model_async(result, fn, context)
+            context_manager.__exit__(None, None, None)
+        elif isinstance(result, BaseStructuredStream):
+            deferred.append(state)
+        else:
+            context_manager.__exit__(None, None, None)
+    except Exception as e:
+        return None, e
+    return result, None
+
+
+def _exit_stream(
+    state: _LayerState,
+    stream: BaseStream | BaseStructuredStream,
+    error: BaseException | None,
+) -> BaseException | None:
+    """Runs a layer's hooks once the stream it wraps is exhausted (or fails).
+
+    Returns the error to pass on to the next (outer) layer.
+    """
+    middleware, fn, context_manager, context = state
+    handle_stream = (
+        middleware.handle_stream
+        if isinstance(stream, BaseStream)
+        else middleware.handle_structured_stream
+    )
+    try:
+        try:
+            if error is not None:
+                raise error
+        except Exception as e:
+            if not middleware.handle_error:
+                context_manager.__exit__(type(e), e, e.__traceback__)
+                raise
+            try:
+                middleware.handle_error(e, fn, context)
+            except Exception as new_e:
+                context_manager.__exit__(type(new_e), new_e, new_e.__traceback__)
+                raise
+            context_manager.__exit__(None, None, None)
+        finally:
+            if handle_stream is not None:
+                handle_stream(stream, fn, context)
+            context_manager.__exit__(None, None, None)
+    except BaseException as e:
+        return e
+    return None
+
+
+async def _exit_stream_async(
+    state: _LayerState,
+    stream: BaseStream | BaseStructuredStream,
+    error: BaseException | None,
+) -> BaseException | None:
+    """Runs a layer's async hooks once the stream it wraps is exhausted (or fails)."""
+    middleware, fn, context_manager, context = state
+    handle_stream_async = (
+        middleware.handle_stream_async
+        if isinstance(stream, BaseStream)
+        else middleware.handle_structured_stream_async
+    )
+    try:
+        try:
+            if error is not None:
+                raise error
+        except Exception as e:
+            if not middleware.handle_error_async:
+                context_manager.__exit__(type(e), e, e.__traceback__)
+                raise
+            try:
+                await middleware.handle_error_async(e, fn, context)
+            except Exception as new_e:
+                context_manager.__exit__(type(new_e), new_e, new_e.__traceback__)
+                raise
+            context_manager.__exit__(None, None, None)
+        finally:
+            if handle_stream_async is not None:
+                await handle_stream_async(stream, fn, context)
+            context_manager.__exit__(None, None, None)
+    except BaseException as e:
+        return e
+    return None
+
+
+class _MiddlewarePipeline:
+    """Runs the hooks of one or more stacked middleware around a single function.
+
+    Stacking middleware created by `middleware_factory` composes them into a single
+    pipeline, so each call (and each streamed chunk) only goes through one wrapper no
+    matter how many middleware are stacked. The hooks still run in the same order as
+    if each middleware wrapped the next.
+
+    The stream subclasses used to run the hooks once a stream is exhausted are created
+    once per stream class, with the state of each call stored on the stream itself.
+    """
+
+    def __init__(
+        self,
+        fn: Callable,
+        layers: list[tuple[_Middleware, Callable]],
+    ) -> None:
+        self.fn = fn
+        self.layers = layers  # outermost first
+        self.wrapper: Callable | None = None
+        self._stream_classes: dict[type, type] = {}
+
+    def _enter(self, states: list[_LayerState]) -> None:
+        for middleware, fn in self.layers:
+            context_manager = middleware.custom_context_manager(fn)
+            states.append(
+                (middleware, fn, context_manager, context_manager.__enter__())
+            )
+
+    def call(self, args: tuple, kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+        states: list[_LayerState] = []
+        result, error = None, None
+        try:
+            self._enter(states)
+            result = self.fn(*args, **kwargs)
+        except Exception as e:
+            error = e
+        except BaseException:
+            _exit_interrupted(states)
+            raise
+        deferred: list[_LayerState] = []
+        for state in reversed(states):
+            result, error = _exit_call(state, result, error, deferred)
+        if error is not None:
+            raise error
+        if deferred:
+            self._defer(result, deferred, is_async=False)
+        return result
+
+    async def call_async(self, args: tuple, kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+        states: list[_LayerState] = []
+        result, error = None, None
+        try:
+            self._enter(states)
+            result = await self.fn(*args, **kwargs)
+        except Exception as e:
+            error = e
+        except BaseException:
+            _exit_interrupted(states)
+            raise
+        deferred: list[_LayerState] = []
+        for state in reversed(states):
+            result, error = await _exit_call_async(state, result, error, deferred)
+        if error is not None:
+            raise error
+        if deferred:
+            self._defer(result, deferred, is_async=True)
+        return result
+
+    def _defer(
+        self,
+        stream: Any,  # noqa: ANN401
+        states: list[_LayerState],
+        is_async: bool,
+    ) -> None:
+        """Runs the hooks in `states` once the stream has been iterated."""
+        stream.__dict__.setdefault("_middleware_states", {})[self] = states
+        original_class = type(stream)
+        if (stream_class := self._stream_classes.get(original_class)) is None:
+            stream_class = self._create_stream_class(original_class, is_async)
+            self._stream_classes[original_class] = stream_class
+        stream.__class__ = stream_class
+
+    def _create_stream_class(self, original_class: type, is_async: bool) -> type:
+        pipeline = self
+        middleware, fn = self.layers[0]
+
+        def new_iter(
+            self: Any,  # noqa: ANN401
+        ) -> Generator[Any, None, None]:
+            error = None
+            try:
+                yield from original_class.__iter__(self)
+            except BaseException as e:
+                error = e
+            for state in self._middleware_states[pipeline]:
+                error = _exit_stream(state, self, error)
+            if error is not None:
+                raise error
+
+        def new_aiter(
+            self: Any,  # noqa: ANN401
+        ) -> AsyncGenerator[Any, None]:
+            async def generator() -> AsyncGenerator[Any, None]:
+                error = None
+                try:
+                    async for chunk in original_class.__aiter__(self):
+                        yield chunk
+                except BaseException as e:
+                    error = e
+                for state in self._middleware_states[pipeline]:
+                    error = await _exit_stream_async(state, self, error)
+                if error is not None:
+                    raise error
+
+            return generator()
+
+        name = "__aiter__" if is_async else "__iter__"
+        method = new_aiter if is_async else new_iter
+        if middleware.custom_decorator:
+            method = middleware.custom_decorator(fn)(method)
+        prefix = "MiddlewareAsync" if is_async else "Middleware"
+        suffix = (
+            "Stream" if issubclass(original_class, BaseStream) else "StructuredStream"
+        )
+        return type(f"{prefix}{suffix}", (original_class,), {name: method})
+
+
 def middleware_factory(
     custom_context_manager: Callable[
         [SyncFunc | AsyncFunc], AbstractContextManager[_T]
@@ -90,6 +427,11 @@ def middleware_factory(
 ) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
     '''A factory method for creating middleware decorators.
 
+    Stacking multiple middleware decorators (e.g. `with_otel` and `with_logfire`)
+    composes them into a single wrapper, so the per-call and per-chunk overhead stays
+    that of a single middleware. Middleware with a `custom_decorator` are only composed
+    with the middleware they wrap.
+
     Example:
 
     ```python
@@ -125,6 +467,20 @@ def middleware_factory(
     print(response.content)
     ```
     '''
+    middleware = _Middleware(
+        custom_context_manager=custom_context_manager,
+        custom_decorator=custom_decorator,
+        handle_call_response=handle_call_response,
+        handle_call_response_async=handle_call_response_async,
+        handle_stream=handle_stream,
+        handle_stream_async=handle_stream_async,
+        handle_response_model=handle_response_model,
+        handle_response_model_async=handle_response_model_async,
+        handle_structured_stream=handle_structured_stream,
+        handle_structured_stream_async=handle_structured_stream_async,
+        handle_error=handle_error,
+        handle_error_async=handle_error_async,
+    )
 
     @overload
     def decorator(fn: Callable[_P, _R]) -> Callable[_P, _R]: ...
@@ -135,268 +491,33 @@ def middleware_factory(
     def decorator(
         fn: Callable[_P, _R | Awaitable[_R]],
     ) -> Callable[_P, _R | Awaitable[_R]]:
+        inner = getattr(fn, "_middleware_pipeline", None)
+        # `functools.wraps` copies the pipeline onto other wrappers, so only compose
+        # with the pipeline when `fn` is its (undecorated) wrapper
+        if isinstance(inner, _MiddlewarePipeline) and inner.wrapper is fn:
+            pipeline = _MiddlewarePipeline(inner.fn, [(middleware, fn), *inner.layers])
+        else:
+            pipeline = _MiddlewarePipeline(fn, [(middleware, fn)])
+
         if inspect.iscoroutinefunction(fn):
 
             @wraps(fn)
             async def wrapper_async(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-                context_manager = custom_context_manager(fn)
-                context = context_manager.__enter__()
-                try:
-                    result = await fn(*args, **kwargs)
-                except Exception as e:
-                    if handle_error_async:
-                        try:
-                            result = await handle_error_async(e, fn, context)
-                        except Exception as new_e:
-                            # If handle_error_async raises an exception, exit context manager and re-raise
-                            context_manager.__exit__(
-                                type(new_e), new_e, new_e.__traceback__
-                            )
-                            raise
-                        else:
-                            # Exception was handled, exit context manager and continue
-                            context_manager.__exit__(None, None, None)
-                    else:
-                        # No handle_error_async provided, exit context manager with exception and re-raise
-                        context_manager.__exit__(type(e), e, e.__traceback__)
-                        raise
-
-                if (
-                    isinstance(result, BaseCallResponse)
-                    and handle_call_response_async is not None
-                ):
-                    await handle_call_response_async(result, fn, context)
-                    context_manager.__exit__(None, None, None)
-                elif isinstance(result, BaseStream):
-                    original_class = type(result)
-                    original_aiter = result.__aiter__
-
-                    def new_stream_aiter(
-                        self: Any,  # noqa: ANN401
-                    ) -> AsyncGenerator[tuple[Any, Any | None], Any]:  # noqa: ANN401
-                        async def generator() -> (
-                            AsyncGenerator[tuple[Any, Any | None], Any]
-                        ):
-                            try:
-                                async for chunk, tool in original_aiter():
-                                    yield chunk, tool
-                            except Exception as e:
-                                if handle_error_async:
-                                    try:
-                                        await handle_error_async(e, fn, context)
-                                    except Exception as new_e:
-                                        context_manager.__exit__(
-                                            type(new_e), new_e, new_e.__traceback__
-                                        )
-                                        raise
-                                    else:
-                                        context_manager.__exit__(None, None, None)
-                                        return
-                                else:
-                                    context_manager.__exit__(
-                                        type(e), e, e.__traceback__
-                                    )
-                                    raise
-                            finally:
-                                if handle_stream_async is not None:
-                                    await handle_stream_async(result, fn, context)
-                                context_manager.__exit__(None, None, None)
-
-                        return generator()
-
-                    class MiddlewareAsyncStream(original_class):
-                        __aiter__ = (
-                            custom_decorator(fn)(new_stream_aiter)
-                            if custom_decorator
-                            else new_stream_aiter
-                        )
-
-                    result.__class__ = MiddlewareAsyncStream
-                elif (
-                    isinstance(result, ResponseModel)
-                    and handle_response_model_async is not None
-                ):
-                    await handle_response_model_async(result, fn, context)
-                    context_manager.__exit__(None, None, None)
-                elif isinstance(result, BaseStructuredStream):
-                    original_class = type(result)
-                    original_aiter = result.__aiter__
-
-                    def new_aiter(
-                        self: Any,  # noqa: ANN401
-                    ) -> AsyncGenerator[tuple[Any, Any | None], Any]:  # noqa: ANN401
-                        async def generator() -> (
-                            AsyncGenerator[tuple[Any, Any | None], Any]
-                        ):
-                            try:
-                                async for chunk in original_aiter():
-                                    yield chunk
-                            except Exception as e:
-                                if handle_error_async:
-                                    try:
-                                        await handle_error_async(e, fn, context)
-                                    except Exception as new_e:
-                                        context_manager.__exit__(
-                                            type(new_e), new_e, new_e.__traceback__
-                                        )
-                                        raise
-                                    else:
-                                        context_manager.__exit__(None, None, None)
-                                        return
-                                else:
-                                    context_manager.__exit__(
-                                        type(e), e, e.__traceback__
-                                    )
-                                    raise
-                            finally:
-                                if handle_structured_stream_async is not None:
-                                    await handle_structured_stream_async(
-                                        result, fn, context
-                                    )
-                                context_manager.__exit__(None, None, None)
-
-                        return generator()
-
-                    class MiddlewareAsyncStructuredStream(original_class):
-                        __aiter__ = (
-                            custom_decorator(fn)(new_aiter)
-                            if custom_decorator
-                            else new_aiter
-                        )
-
-                    result.__class__ = MiddlewareAsyncStructuredStream
-                else:
-                    context_manager.__exit__(None, None, None)
-                return cast(_R, result)
-
-            return (
-                custom_decorator(fn)(wrapper_async)
-                if custom_decorator
-                else wrapper_async
-            )
+                return cast(_R, await pipeline.call_async(args, kwargs))
+
+            wrapper = wrapper_async
         else:
 
             @wraps(fn)
-            def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-                context_manager = custom_context_manager(fn)
-                context = context_manager.__enter__()
-                try:
-                    result = fn(*args, **kwargs)
-                except Exception as e:
-                    if handle_error:
-                        try:
-                            result = handle_error(e, fn, context)
-                        except Exception as new_e:
-                            # If handle_error raises an exception, exit context manager and re-raise
-                            context_manager.__exit__(
-                                type(new_e), new_e, new_e.__traceback__
-                            )
-                            raise
-                        else:
-                            # Exception was handled, exit context manager and continue
-                            context_manager.__exit__(None, None, None)
-                    else:
-                        # No handle_error provided, exit context manager with exception and re-raise
-                        context_manager.__exit__(type(e), e, e.__traceback__)
-                        raise
-
-                if (
-                    isinstance(result, BaseCallResponse)
-                    and handle_call_response is not None
-                ):
-                    handle_call_response(result, fn, context)
-                    context_manager.__exit__(None, None, None)
-                elif isinstance(result, BaseStream):
-                    original_class = type(result)
-                    original_iter = result.__iter__
-
-                    def new_stream_iter(
-                        self: Any,  # noqa: ANN401
-                    ) -> Generator[tuple[Any, Any | None], None, None]:  # noqa: ANN401
-                        # Create the context manager when user iterates over the stream
-                        try:
-                            yield from original_iter()
-                        except Exception as e:
-                            if handle_error:
-                                try:
-                                    handle_error(e, fn, context)
-                                except Exception as new_e:
-                                    context_manager.__exit__(
-                                        type(new_e), new_e, new_e.__traceback__
-                                    )
-                                    raise
-                                else:
-                                    context_manager.__exit__(None, None, None)
-                                    return
-                            else:
-                                context_manager.__exit__(type(e), e, e.__traceback__)
-                                raise
-                        finally:
-                            if handle_stream is not None:
-                                handle_stream(result, fn, context)
-                            context_manager.__exit__(None, None, None)
-
-                    class MiddlewareStream(original_class):  # pyright: ignore [reportGeneralTypeIssues]
-                        __iter__ = (
-                            custom_decorator(fn)(new_stream_iter)
-                            if custom_decorator
-                            else new_stream_iter
-                        )
-
-                    result.__class__ = MiddlewareStream
-                elif (
-                    isinstance(result, ResponseModel)
-                    and handle_response_model is not None
-                ):
-                    handle_response_model(result, fn, context)
-                    context_manager.__exit__(None, None, None)
-                elif isinstance(result, BaseStructuredStream):
-                    original_class = type(result)
-                    original_iter = result.__iter__
-
-                    def new_iter(
-                        self: Any,  # noqa: ANN401
-                    ) -> Generator[
-                        Generator[tuple[Any, Any | None], None, None]
-                        | Generator[Any, None, None],
-                        Any,
-                        None,
-                    ]:  # noqa: ANN401
-                        # Create the context manager when user iterates over the stream
-                        try:
-                            yield from original_iter()
-                        except Exception as e:
-                            if handle_error:
-                                try:
-                                    handle_error(e, fn, context)
-                                except Exception as new_e:
-                                    context_manager.__exit__(
-                                        type(new_e), new_e, new_e.__traceback__
-                                    )
-                                    raise
-                                else:
-                                    context_manager.__exit__(None, None, None)
-                                    return
-                            else:
-                                context_manager.__exit__(type(e), e, e.__traceback__)
-                                raise
-                        finally:
-                            if handle_structured_stream is not None:
-                                handle_structured_stream(result, fn, context)
-                            context_manager.__exit__(None, None, None)
-
-                    class MiddlewareStructuredStream(original_class):  # pyright: ignore [reportGeneralTypeIssues]
-                        __iter__ = (
-                            custom_decorator(fn)(new_iter)
-                            if custom_decorator
-                            else new_iter
-                        )
-
-                    result.__class__ = MiddlewareStructuredStream
-                else:
-                    context_manager.__exit__(None, None, None)
-                return cast(_R, result)
-
-            return custom_decorator(fn)(wrapper) if custom_decorator else wrapper
+            def wrapper_sync(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+                return cast(_R, pipeline.call(args, kwargs))
+
+            wrapper = wrapper_sync
+
+        if custom_decorator:
+            return custom_decorator(fn)(wrapper)
+        pipeline.wrapper = wrapper
+        wrapper._middleware_pipeline = pipeline  # pyright: ignore [reportAttributeAccessIssue]
+        return wrapper
 
     return decorator
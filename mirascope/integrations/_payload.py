@@ -0,0 +1,214 @@
+"""Policies for trimming the payloads that integrations send to observability tools."""
+
+import atexit
+import random
+import threading
+import time
+from collections.abc import Callable
+from functools import partial
+from queue import Full, Queue
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+_BASE64_MARKER = ";base64,"
+
+_HandlerT = TypeVar("_HandlerT", bound=Callable)
+
+
+class PayloadWorker:
+    """Runs payload serialization and submission on a background thread.
+
+    Tasks are queued in a bounded queue so that a slow or unavailable observability
+    backend can never block calls or grow memory without bound. Tasks submitted while
+    the queue is full are dropped and counted in `dropped`.
+
+    Example:
+
+    ```python
+    from mirascope.integrations import PayloadPolicy, PayloadWorker
+    from mirascope.integrations.logfire import with_logfire
+
+    worker = PayloadWorker(max_queue_size=1000)
+
+
+    @with_logfire(payload_policy=PayloadPolicy(strip_media=True, worker=worker))
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    recommend_book("fantasy")
+    print(worker.dropped)  # The number of payloads dropped because the queue was full
+    ```
+    """
+
+    def __init__(self, max_queue_size: int = 1000) -> None:
+        self.dropped = 0
+        self.failed = 0
+        self._queue: Queue[Callable[[], None]] = Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, task: Callable[[], None]) -> bool:
+        """Queues `task` to run on the worker thread.
+
+        Returns:
+            Whether the task was queued (`False` if the queue is full).
+        """
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(task)
+        except Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits for all queued tasks to finish.
+
+        Returns:
+            Whether all tasks finished before `timeout` seconds passed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="mirascope-payload-worker", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.flush, 5.0)
+
+    def _run(self) -> None:
+        while True:
+            task = self._queue.get()
+            try:
+                task()
+            except Exception:
+                with self._lock:
+                    self.failed += 1
+            finally:
+                self._queue.task_done()
+
+
+class PayloadPolicy(BaseModel):
+    """Controls the payload (e.g. messages, raw responses) sent by an integration.
+
+    Integrations always send lightweight data such as the model, usage, and cost. The
+    policy only applies to the potentially large payload fields of each integration
+    (e.g. `messages`, `call_kwargs`, and `response_data` for Logfire, or `input`,
+    `metadata`, and `output` for Langfuse).
+
+    Example:
+
+    ```python
+    from mirascope.integrations import PayloadPolicy
+    from mirascope.integrations.langfuse import with_langfuse
+
+
+    @with_langfuse(
+        payload_policy=PayloadPolicy(
+            allowed_fields={"input", "output"},
+            max_string_length=2000,
+            strip_media=True,
+            sample_rate=0.1,
+        )
+    )
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+    ```
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    allowed_fields: set[str] | None = None
+    """The payload fields to send. If `None`, all payload fields are sent."""
+
+    max_string_length: int | None = None
+    """The maximum length of each string in the payload before it's truncated."""
+
+    strip_media: bool = False
+    """Whether to replace media (bytes, base64 data) with a short description."""
+
+    sample_rate: float = Field(default=1.0, ge=0, le=1)
+    """The fraction of calls whose payload is sent."""
+
+    worker: PayloadWorker | None = None
+    """The worker to trim and send payloads on. If `None`, they're sent inline."""
+
+    def sample(self) -> bool:
+        """Returns whether the payload of the current call should be sent."""
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def apply(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Returns the allowed fields of `payload`, trimmed according to the policy."""
+        if self.allowed_fields is not None:
+            payload = {
+                key: value
+                for key, value in payload.items()
+                if key in self.allowed_fields
+            }
+        if self.max_string_length is None and not self.strip_media:
+            return payload
+        return {key: self._trim(value) for key, value in payload.items()}
+
+    def _trim(self, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, BaseModel):
+            value = value.model_dump()
+        if isinstance(value, str):
+            return self._trim_string(value)
+        elif isinstance(value, bytes | bytearray):
+            return f"<{len(value)} bytes>" if self.strip_media else value
+        elif isinstance(value, dict):
+            if (
+                self.strip_media
+                and isinstance(data := value.get("data"), str)
+                and ("media_type" in value or "mime_type" in value)
+            ):
+                media_type = value.get("media_type", value.get("mime_type"))
+                return {
+                    key: f"<{media_type} data: {len(data)} chars>"
+                    if key == "data"
+                    else self._trim(item)
+                    for key, item in value.items()
+                }
+            return {key: self._trim(item) for key, item in value.items()}
+        elif isinstance(value, list | tuple):
+            return [self._trim(item) for item in value]
+        return value
+
+    def _trim_string(self, value: str) -> str:
+        if (
+            self.strip_media
+            and value.startswith("data:")
+            and (index := value.find(_BASE64_MARKER, 0, 256)) != -1
+        ):
+            return f"<{value[5:index]} data: {len(value)} chars>"
+        if self.max_string_length is not None and len(value) > self.max_string_length:
+            return (
+                f"{value[: self.max_string_length]}..."
+                f"[{len(value) - self.max_string_length} more characters]"
+            )
+        return value
+
+
+def bind_payload_policy(
+    handler: _HandlerT, payload_policy: "PayloadPolicy | None"
+) -> _HandlerT:
+    """Returns `handler` with `payload_policy` bound (if there is one)."""
+    if payload_policy is None:
+        return handler
+    return partial(handler, payload_policy=payload_policy)  # pyright: ignore [reportReturnType]
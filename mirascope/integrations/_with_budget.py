@@ -0,0 +1,232 @@
+"""The `with_budget` decorator for enforcing budgets on calls."""
+
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from pydantic import BaseModel
+
+from ..core.base import BaseCallResponse, BaseStream, BaseStructuredStream, BaseType
+from ..core.base._utils import fn_is_async
+from ..core.base.budget import Budget, BudgetReservation
+from ._middleware_factory import middleware_factory
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+_Reservations = tuple[BudgetReservation, ...]
+
+_reservations: ContextVar[_Reservations] = ContextVar(
+    "mirascope_budget_reservations", default=()
+)
+
+
+@contextmanager
+def _settle_reservations(
+    fn: Callable,
+) -> Generator[_Reservations, None, None]:
+    """Releases any reservations that weren't settled by the call's usage (e.g. if the
+    call raised an error).
+
+    A stream's reservations are held until it's consumed. If it's garbage collected
+    without being consumed, this generator is closed with it, which releases them.
+    """
+    reservations = _reservations.get()
+    try:
+        yield reservations
+    finally:
+        for reservation in reservations:
+            reservation.release()
+
+
+def _settle(
+    response: BaseCallResponse | BaseStream, reservations: _Reservations | None
+) -> None:
+    if not reservations:
+        return
+    input_tokens, output_tokens = response.input_tokens, response.output_tokens
+    tokens = (
+        None
+        if input_tokens is None and output_tokens is None
+        else (input_tokens or 0) + (output_tokens or 0)
+    )
+    cost = response.cost
+    for reservation in reservations:
+        reservation.settle(cost, tokens)
+
+
+def _handle_call_response(
+    result: BaseCallResponse, fn: Callable, reservations: _Reservations | None
+) -> None:
+    _settle(result, reservations)
+
+
+def _handle_stream(
+    stream: BaseStream, fn: Callable, reservations: _Reservations | None
+) -> None:
+    _settle(stream, reservations)
+
+
+def _handle_response_model(
+    result: BaseModel | BaseType,
+    fn: Callable,
+    reservations: _Reservations | None,
+) -> None:
+    if isinstance(response := getattr(result, "_response", None), BaseCallResponse):
+        _settle(response, reservations)
+    else:
+        for reservation in reservations or ():
+            reservation.settle()
+
+
+def _handle_structured_stream(
+    result: BaseStructuredStream,
+    fn: Callable,
+    reservations: _Reservations | None,
+) -> None:
+    _settle(result.stream, reservations)
+
+
+async def _handle_call_response_async(
+    result: BaseCallResponse, fn: Callable, reservations: _Reservations | None
+) -> None:
+    _handle_call_response(result, fn, reservations)
+
+
+async def _handle_stream_async(
+    stream: BaseStream, fn: Callable, reservations: _Reservations | None
+) -> None:
+    _handle_stream(stream, fn, reservations)
+
+
+async def _handle_response_model_async(
+    result: BaseModel | BaseType,
+    fn: Callable,
+    reservations: _Reservations | None,
+) -> None:
+    _handle_response_model(result, fn, reservations)
+
+
+async def _handle_structured_stream_async(
+    result: BaseStructuredStream,
+    fn: Callable,
+    reservations: _Reservations | None,
+) -> None:
+    _handle_structured_stream(result, fn, reservations)
+
+
+def with_budget(
+    budget: Budget | None = None,
+    *,
+    estimated_cost: float | None = None,
+    estimated_tokens: int | None = None,
+) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Enforces budgets on the calls of a Mirascope function.
+
+    Before each call, its estimated cost and tokens are reserved against `budget` and
+    every budget applied with `Budget.scope` in the current context. Once the call's
+    response (or stream) is complete, each reservation is settled with the actual
+    usage. If a call raises an error, or its stream is garbage collected without being
+    consumed, its reservations are released. Without an estimate, calls are made one
+    at a time until a call has settled against the budget, since there is nothing to
+    estimate their usage from.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+    from mirascope.core.base.budget import Budget, BudgetExceededError
+    from mirascope.integrations import with_budget
+
+    job_budget = Budget(max_cost=1.0, max_tokens=100_000, wait=True)
+
+
+    @with_budget(job_budget, estimated_tokens=1_000)
+    @openai.call("gpt-4o-mini", call_params={"max_tokens": 500})
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    try:
+        print(recommend_book("fantasy"))
+    except BudgetExceededError as e:
+        print(e)
+    ```
+
+    Args:
+        budget: The budget to enforce in addition to the budgets in the current
+            context, if any.
+        estimated_cost: The estimated cost of each call to reserve. Defaults to the
+            cost of the most expensive call settled against each budget so far.
+        estimated_tokens: The estimated input and output tokens of each call to
+            reserve. Defaults to the tokens of the largest call settled against each
+            budget so far.
+
+    Raises:
+        BudgetExceededError: If a call would exceed one of its budgets.
+    """
+    settle_middleware = middleware_factory(
+        custom_context_manager=_settle_reservations,
+        handle_call_response=_handle_call_response,
+        handle_call_response_async=_handle_call_response_async,
+        handle_stream=_handle_stream,
+        handle_stream_async=_handle_stream_async,
+        handle_response_model=_handle_response_model,
+        handle_response_model_async=_handle_response_model_async,
+        handle_structured_stream=_handle_structured_stream,
+        handle_structured_stream_async=_handle_structured_stream_async,
+    )
+
+    def get_budgets() -> tuple[Budget, ...]:
+        active = Budget.active()
+        return active if budget is None or budget in active else (*active, budget)
+
+    def decorator(fn: Callable[_P, _R]) -> Callable[_P, _R]:
+        settled_fn: Callable[..., Any] = settle_middleware(fn)
+
+        if fn_is_async(fn):
+
+            @wraps(fn)
+            async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> Any:  # noqa: ANN401
+                reservations: list[BudgetReservation] = []
+                try:
+                    for active_budget in get_budgets():
+                        reservations.append(
+                            await active_budget.reserve_async(
+                                estimated_cost, estimated_tokens
+                            )
+                        )
+                except BaseException:
+                    for reservation in reservations:
+                        reservation.release()
+                    raise
+                token = _reservations.set(tuple(reservations))
+                try:
+                    return await settled_fn(*args, **kwargs)
+                finally:
+                    _reservations.reset(token)
+
+            return inner_async  # pyright: ignore [reportReturnType]
+
+        @wraps(fn)
+        def inner(*args: _P.args, **kwargs: _P.kwargs) -> Any:  # noqa: ANN401
+            reservations: list[BudgetReservation] = []
+            try:
+                for active_budget in get_budgets():
+                    reservations.append(
+                        active_budget.reserve(estimated_cost, estimated_tokens)
+                    )
+            except BaseException:
+                for reservation in reservations:
+                    reservation.release()
+                raise
+            token = _reservations.set(tuple(reservations))
+            try:
+                return settled_fn(*args, **kwargs)
+            finally:
+                _reservations.reset(token)
+
+        return inner
+
+    return decorator
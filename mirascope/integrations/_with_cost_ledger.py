@@ -0,0 +1,110 @@
+"""The `with_cost_ledger` decorator for recording calls in a `CostLedger`."""
+
+from collections.abc import Callable
+from contextlib import nullcontext
+from typing import ParamSpec, TypeVar
+
+from pydantic import BaseModel
+
+from ..core.base import BaseCallResponse, BaseStream, BaseStructuredStream, BaseType
+from ..core.base.ledger import CostLedger, cost_ledger
+from ._middleware_factory import middleware_factory
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _handle_call_response(
+    result: BaseCallResponse, fn: Callable, ledger: CostLedger | None
+) -> None:
+    if ledger is not None:
+        ledger.record_response(result, fn)
+
+
+def _handle_stream(stream: BaseStream, fn: Callable, ledger: CostLedger | None) -> None:
+    if ledger is not None:
+        ledger.record_response(stream, fn)
+
+
+def _handle_response_model(
+    result: BaseModel | BaseType, fn: Callable, ledger: CostLedger | None
+) -> None:
+    if ledger is not None and isinstance(
+        response := getattr(result, "_response", None), BaseCallResponse
+    ):
+        ledger.record_response(response, fn)
+
+
+def _handle_structured_stream(
+    result: BaseStructuredStream, fn: Callable, ledger: CostLedger | None
+) -> None:
+    if ledger is not None:
+        ledger.record_response(result.stream, fn)
+
+
+async def _handle_call_response_async(
+    result: BaseCallResponse, fn: Callable, ledger: CostLedger | None
+) -> None:
+    _handle_call_response(result, fn, ledger)
+
+
+async def _handle_stream_async(
+    stream: BaseStream, fn: Callable, ledger: CostLedger | None
+) -> None:
+    _handle_stream(stream, fn, ledger)
+
+
+async def _handle_response_model_async(
+    result: BaseModel | BaseType, fn: Callable, ledger: CostLedger | None
+) -> None:
+    _handle_response_model(result, fn, ledger)
+
+
+async def _handle_structured_stream_async(
+    result: BaseStructuredStream, fn: Callable, ledger: CostLedger | None
+) -> None:
+    _handle_structured_stream(result, fn, ledger)
+
+
+def with_cost_ledger(
+    ledger: CostLedger = cost_ledger,
+) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Records the usage and cost of each call of a Mirascope function in a ledger.
+
+    Calls are recorded by provider, model, function name, and metadata tags. Streams
+    are recorded once they have been consumed.
+
+    Example:
+
+    ```python
+    from mirascope.core import anthropic, metadata
+    from mirascope.core.base.ledger import cost_ledger
+    from mirascope.integrations import with_cost_ledger
+
+
+    @with_cost_ledger()
+    @anthropic.call(model="claude-3-5-sonnet-20240620")
+    @metadata({"tags": {"recommendations"}})
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    recommend_book("fantasy")
+    print(cost_ledger.snapshot().group_by("tag"))
+    ```
+
+    Args:
+        ledger: The ledger to record calls in (the process-wide `cost_ledger` by
+            default).
+    """
+    return middleware_factory(
+        custom_context_manager=lambda fn: nullcontext(ledger),
+        handle_call_response=_handle_call_response,
+        handle_call_response_async=_handle_call_response_async,
+        handle_stream=_handle_stream,
+        handle_stream_async=_handle_stream_async,
+        handle_response_model=_handle_response_model,
+        handle_response_model_async=_handle_response_model_async,
+        handle_structured_stream=_handle_structured_stream,
+        handle_structured_stream_async=_handle_structured_stream_async,
+    )
@@ -1,6 +1,7 @@
 from collections.abc import Callable
 from typing import Any
 
+from langfuse.client import StatefulGenerationClient, StateType
 from langfuse.decorators import langfuse_context
 from pydantic import BaseModel
 
@@ -10,6 +11,9 @@ from ...core.base import BaseCallResponse
 from ...core.base._utils import get_metadata
 from ...core.base.stream import BaseStream
 from ...core.base.structured_stream import BaseStructuredStream
+from .._payload import PayloadPolicy
+
+_PAYLOAD_FIELDS = ("input", "metadata", "output")
 
 
 class ModelUsage(BaseModel):
@@ -33,8 +37,55 @@ def get_call_response_observation(
     }
 
 
-def handle_call_response(result: BaseCallResponse, fn: Callable, context: None) -> None:
-    langfuse_context.update_current_observation(
+def _update_observation(
+    observation_id: str, trace_id: str, payload: dict[str, Any]
+) -> None:
+    client = langfuse_context.client_instance
+    StatefulGenerationClient(
+        client.client,
+        observation_id,
+        StateType.OBSERVATION,
+        trace_id,
+        client.task_manager,
+        client.environment,
+    ).update(**payload)
+
+
+def update_current_observation(
+    payload_policy: PayloadPolicy | None,
+    **observation: Any,  # noqa: ANN401
+) -> None:
+    """Updates the current observation, applying `payload_policy` to the payload.
+
+    When the policy has a worker, the payload is trimmed and sent as an update of the
+    current observation on the worker thread.
+    """
+    if payload_policy is not None:
+        payload = {
+            key: observation.pop(key) for key in _PAYLOAD_FIELDS if key in observation
+        }
+        if payload and payload_policy.sample():
+            if payload_policy.worker is None:
+                observation |= payload_policy.apply(payload)
+            elif (observation_id := langfuse_context.get_current_observation_id()) and (
+                trace_id := langfuse_context.get_current_trace_id()
+            ):
+                payload_policy.worker.submit(
+                    lambda: _update_observation(
+                        observation_id, trace_id, payload_policy.apply(payload)
+                    )
+                )
+    langfuse_context.update_current_observation(**observation)
+
+
+def handle_call_response(
+    result: BaseCallResponse,
+    fn: Callable,
+    context: None,
+    payload_policy: PayloadPolicy | None = None,
+) -> None:
+    update_current_observation(
+        payload_policy,
         **get_call_response_observation(result, fn),
         usage=ModelUsage(
             input=result.input_tokens, output=result.output_tokens, unit="TOKENS"
@@ -42,26 +93,36 @@ def handle_call_response(result: BaseCallResponse, fn: Callable, context: None)
     )
 
 
-def handle_stream(stream: BaseStream, fn: Callable, context: None) -> None:
+def handle_stream(
+    stream: BaseStream,
+    fn: Callable,
+    context: None,
+    payload_policy: PayloadPolicy | None = None,
+) -> None:
     usage = ModelUsage(
         input=stream.input_tokens,
         output=stream.output_tokens,
         unit="TOKENS",
     )
-    langfuse_context.update_current_observation(
+    update_current_observation(
+        payload_policy,
         **get_call_response_observation(stream.construct_call_response(), fn),
         usage=usage,
     )
 
 
 def handle_response_model(
-    result: BaseModel | BaseType, fn: Callable, context: None
+    result: BaseModel | BaseType,
+    fn: Callable,
+    context: None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
     if isinstance(result, BaseModel):
         response: BaseCallResponse = result._response  # pyright: ignore [reportAttributeAccessIssue]
         call_response_observation = get_call_response_observation(response, fn)
         call_response_observation.pop("output")
-        langfuse_context.update_current_observation(
+        update_current_observation(
+            payload_policy,
             **call_response_observation,
             usage=ModelUsage(
                 input=response.input_tokens,
@@ -71,13 +132,14 @@ def handle_response_model(
             output=result,
         )
     else:
-        langfuse_context.update_current_observation(
-            output=result,
-        )
+        update_current_observation(payload_policy, output=result)
 
 
 def handle_structured_stream(
-    result: BaseStructuredStream, fn: Callable, context: None
+    result: BaseStructuredStream,
+    fn: Callable,
+    context: None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
     stream: BaseStream = result.stream
     usage = ModelUsage(
@@ -85,7 +147,8 @@ def handle_structured_stream(
         output=stream.output_tokens,
         unit="TOKENS",
     )
-    langfuse_context.update_current_observation(
+    update_current_observation(
+        payload_policy,
         **get_call_response_observation(stream.construct_call_response(), fn),
         usage=usage,
         output=result.constructed_response_model,
@@ -93,22 +156,36 @@ def handle_structured_stream(
 
 
 async def handle_call_response_async(
-    result: BaseCallResponse, fn: Callable, context: None
+    result: BaseCallResponse,
+    fn: Callable,
+    context: None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
-    handle_call_response(result, fn, None)
+    handle_call_response(result, fn, None, payload_policy)
 
 
-async def handle_stream_async(stream: BaseStream, fn: Callable, context: None) -> None:
-    handle_stream(stream, fn, None)
+async def handle_stream_async(
+    stream: BaseStream,
+    fn: Callable,
+    context: None,
+    payload_policy: PayloadPolicy | None = None,
+) -> None:
+    handle_stream(stream, fn, None, payload_policy)
 
 
 async def handle_response_model_async(
-    result: BaseModel | BaseType, fn: Callable, context: None
+    result: BaseModel | BaseType,
+    fn: Callable,
+    context: None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
-    handle_response_model(result, fn, None)
+    handle_response_model(result, fn, None, payload_policy)
 
 
 async def handle_structured_stream_async(
-    result: BaseStructuredStream, fn: Callable, context: None
+    result: BaseStructuredStream,
+    fn: Callable,
+    context: None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
-    handle_structured_stream(result, fn, None)
+    handle_structured_stream(result, fn, None, payload_policy)
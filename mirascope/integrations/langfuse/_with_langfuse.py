@@ -6,6 +6,7 @@ from typing import Any, ParamSpec, TypeVar
 from langfuse.decorators import observe
 
 from .._middleware_factory import middleware_factory
+from .._payload import PayloadPolicy, bind_payload_policy
 from ._utils import (
     handle_call_response,
     handle_call_response_async,
@@ -33,7 +34,9 @@ _P = ParamSpec("_P")
 _R = TypeVar("_R")
 
 
-def with_langfuse() -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+def with_langfuse(
+    payload_policy: PayloadPolicy | None = None,
+) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
     """Wraps a Mirascope function with Langfuse.
 
     Example:
@@ -55,16 +58,30 @@ def with_langfuse() -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
 
     print(recommend_book("fantasy"))
     ```
+
+    Args:
+        payload_policy: The policy for the payload (e.g. messages and raw responses)
+            sent with each call, which can trim, sample, or send it in the background.
     """
 
     return middleware_factory(
         custom_decorator=custom_decorator,
-        handle_call_response=handle_call_response,
-        handle_call_response_async=handle_call_response_async,
-        handle_stream=handle_stream,
-        handle_stream_async=handle_stream_async,
-        handle_response_model=handle_response_model,
-        handle_response_model_async=handle_response_model_async,
-        handle_structured_stream=handle_structured_stream,
-        handle_structured_stream_async=handle_structured_stream_async,
+        handle_call_response=bind_payload_policy(handle_call_response, payload_policy),
+        handle_call_response_async=bind_payload_policy(
+            handle_call_response_async, payload_policy
+        ),
+        handle_stream=bind_payload_policy(handle_stream, payload_policy),
+        handle_stream_async=bind_payload_policy(handle_stream_async, payload_policy),
+        handle_response_model=bind_payload_policy(
+            handle_response_model, payload_policy
+        ),
+        handle_response_model_async=bind_payload_policy(
+            handle_response_model_async, payload_policy
+        ),
+        handle_structured_stream=bind_payload_policy(
+            handle_structured_stream, payload_policy
+        ),
+        handle_structured_stream_async=bind_payload_policy(
+            handle_structured_stream_async, payload_policy
+        ),
     )
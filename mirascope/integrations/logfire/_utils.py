@@ -7,6 +7,7 @@ from typing import (
 )
 
 import logfire
+from opentelemetry import context as otel_context
 from pydantic import BaseModel
 
 from mirascope.core.base._utils._base_type import BaseType
@@ -15,6 +16,15 @@ from ...core.base import BaseCallResponse, _utils
 from ...core.base.metadata import Metadata
 from ...core.base.stream import BaseStream
 from ...core.base.structured_stream import BaseStructuredStream
+from .._payload import PayloadPolicy
+
+_PAYLOAD_FIELDS = (
+    "call_params",
+    "call_kwargs",
+    "template_variables",
+    "messages",
+    "response_data",
+)
 
 
 @contextmanager
@@ -68,8 +78,49 @@ def get_tool_calls(result: BaseCallResponse) -> list[dict] | None:
     return None
 
 
+def _log_payload(
+    context: otel_context.Context, fn: Callable, payload: dict[str, Any]
+) -> None:
+    token = otel_context.attach(context)
+    try:
+        logfire.with_settings(custom_scope_suffix="mirascope").log(
+            "info", f"{fn.__name__} payload", attributes=payload
+        )
+    finally:
+        otel_context.detach(token)
+
+
+def set_span_data(
+    logfire_span: logfire.LogfireSpan,
+    span_data: dict[str, Any],
+    fn: Callable,
+    payload_policy: PayloadPolicy | None,
+) -> None:
+    """Sets the span data, applying `payload_policy` to the payload fields.
+
+    When the policy has a worker, the payload is trimmed and logged as a child of the
+    span on the worker thread instead of being set on the span.
+    """
+    if payload_policy is not None:
+        payload = {
+            key: span_data.pop(key) for key in _PAYLOAD_FIELDS if key in span_data
+        }
+        if payload and payload_policy.sample():
+            if payload_policy.worker is not None:
+                context = otel_context.get_current()
+                payload_policy.worker.submit(
+                    lambda: _log_payload(context, fn, payload_policy.apply(payload))
+                )
+            else:
+                span_data |= payload_policy.apply(payload)
+    logfire_span.set_attributes(span_data)
+
+
 def handle_call_response(
-    result: BaseCallResponse, fn: Callable, logfire_span: logfire.LogfireSpan | None
+    result: BaseCallResponse,
+    fn: Callable,
+    logfire_span: logfire.LogfireSpan | None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
     if logfire_span is None:
         return
@@ -78,15 +129,18 @@ def handle_call_response(
     tool_calls = get_tool_calls(result)
     if tool_calls:
         span_data["output"]["tool_calls"] = tool_calls
-    logfire_span.set_attributes(span_data)
+    set_span_data(logfire_span, span_data, fn, payload_policy)
 
 
 def handle_stream(
     stream: BaseStream,
     fn: Callable,
     logfire_span: logfire.LogfireSpan | None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
-    handle_call_response(stream.construct_call_response(), fn, logfire_span)
+    handle_call_response(
+        stream.construct_call_response(), fn, logfire_span, payload_policy
+    )
 
 
 def set_response_model_output(
@@ -102,7 +156,10 @@ def set_response_model_output(
 
 
 def handle_response_model(
-    result: BaseModel | BaseType, fn: Callable, logfire_span: logfire.LogfireSpan | None
+    result: BaseModel | BaseType,
+    fn: Callable,
+    logfire_span: logfire.LogfireSpan | None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
     if logfire_span is None:
         return
@@ -111,7 +168,7 @@ def handle_response_model(
         response: BaseCallResponse = result._response  # pyright: ignore [reportAttributeAccessIssue]
         span_data |= get_call_response_span_data(response)
     set_response_model_output(result, span_data["output"])
-    logfire_span.set_attributes(span_data)
+    set_span_data(logfire_span, span_data, fn, payload_policy)
 
 
 def get_structured_stream_span_data(result: BaseStructuredStream) -> dict:
@@ -131,17 +188,23 @@ def get_structured_stream_span_data(result: BaseStructuredStream) -> dict:
 
 
 def handle_structured_stream(
-    result: BaseStructuredStream, fn: Callable, logfire_span: logfire.LogfireSpan | None
+    result: BaseStructuredStream,
+    fn: Callable,
+    logfire_span: logfire.LogfireSpan | None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
     if logfire_span is None:
         return
     span_data = get_structured_stream_span_data(result)
     span_data["async"] = False
-    logfire_span.set_attributes(span_data)
+    set_span_data(logfire_span, span_data, fn, payload_policy)
 
 
 async def handle_call_response_async(
-    result: BaseCallResponse, fn: Callable, logfire_span: logfire.LogfireSpan | None
+    result: BaseCallResponse,
+    fn: Callable,
+    logfire_span: logfire.LogfireSpan | None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
     if logfire_span is None:
         return
@@ -150,21 +213,25 @@ async def handle_call_response_async(
     tool_calls = get_tool_calls(result)
     if tool_calls:
         span_data["output"]["tool_calls"] = tool_calls
-    logfire_span.set_attributes(span_data)
+    set_span_data(logfire_span, span_data, fn, payload_policy)
 
 
 async def handle_stream_async(
     stream: BaseStream,
     fn: Callable,
     logfire_span: logfire.LogfireSpan | None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
-    await handle_call_response_async(stream.construct_call_response(), fn, logfire_span)
+    await handle_call_response_async(
+        stream.construct_call_response(), fn, logfire_span, payload_policy
+    )
 
 
 async def handle_response_model_async(
     result: BaseModel | BaseType,
     fn: Callable,
     logfire_span: logfire.LogfireSpan | None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
     if logfire_span is None:
         return
@@ -173,16 +240,17 @@ async def handle_response_model_async(
         response: BaseCallResponse = result._response  # pyright: ignore [reportAttributeAccessIssue]
         span_data |= get_call_response_span_data(response)
     set_response_model_output(result, span_data["output"])
-    logfire_span.set_attributes(span_data)
+    set_span_data(logfire_span, span_data, fn, payload_policy)
 
 
 async def handle_structured_stream_async(
     result: BaseStructuredStream,
     fn: Callable,
     logfire_span: logfire.LogfireSpan | None,
+    payload_policy: PayloadPolicy | None = None,
 ) -> None:
     if logfire_span is None:
         return
     span_data = get_structured_stream_span_data(result)
     span_data["async"] = True
-    logfire_span.set_attributes(span_data)
+    set_span_data(logfire_span, span_data, fn, payload_policy)
@@ -4,6 +4,7 @@ from collections.abc import Callable
 from typing import ParamSpec, TypeVar
 
 from .._middleware_factory import middleware_factory
+from .._payload import PayloadPolicy, bind_payload_policy
 from ._utils import (
     custom_context_manager,
     handle_call_response,
@@ -20,7 +21,9 @@ _P = ParamSpec("_P")
 _R = TypeVar("_R")
 
 
-def with_logfire() -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+def with_logfire(
+    payload_policy: PayloadPolicy | None = None,
+) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
     """Wraps a Mirascope function with Logfire tracing.
 
     Example:
@@ -45,15 +48,29 @@ def with_logfire() -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
 
     print(recommend_book("fantasy"))
     ```
+
+    Args:
+        payload_policy: The policy for the payload (e.g. messages and raw responses)
+            sent with each call, which can trim, sample, or send it in the background.
     """
     return middleware_factory(
         custom_context_manager=custom_context_manager,
-        handle_call_response=handle_call_response,
-        handle_call_response_async=handle_call_response_async,
-        handle_stream=handle_stream,
-        handle_stream_async=handle_stream_async,
-        handle_response_model=handle_response_model,
-        handle_response_model_async=handle_response_model_async,
-        handle_structured_stream=handle_structured_stream,
-        handle_structured_stream_async=handle_structured_stream_async,
+        handle_call_response=bind_payload_policy(handle_call_response, payload_policy),
+        handle_call_response_async=bind_payload_policy(
+            handle_call_response_async, payload_policy
+        ),
+        handle_stream=bind_payload_policy(handle_stream, payload_policy),
+        handle_stream_async=bind_payload_policy(handle_stream_async, payload_policy),
+        handle_response_model=bind_payload_policy(
+            handle_response_model, payload_policy
+        ),
+        handle_response_model_async=bind_payload_policy(
+            handle_response_model_async, payload_policy
+        ),
+        handle_structured_stream=bind_payload_policy(
+            handle_structured_stream, payload_policy
+        ),
+        handle_structured_stream_async=bind_payload_policy(
+            handle_structured_stream_async, payload_policy
+        ),
     )
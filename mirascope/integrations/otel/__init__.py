@@ -1,5 +1,5 @@
-from ._utils import configure
+from ._utils import ContentCapture, configure
 from ._with_hyperdx import with_hyperdx
 from ._with_otel import with_otel
 
-__all__ = ["configure", "with_hyperdx", "with_otel"]
+__all__ = ["ContentCapture", "configure", "with_hyperdx", "with_otel"]
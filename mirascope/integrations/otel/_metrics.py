@@ -0,0 +1,222 @@
+"""Mirascope x OpenTelemetry Integration metrics"""
+
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from functools import cache
+from typing import Any, NamedTuple
+
+from opentelemetry.metrics import Counter, Histogram, UpDownCounter, get_meter
+from opentelemetry.util.types import AttributeValue
+from pydantic import BaseModel
+
+from mirascope.core.base._utils._base_type import BaseType
+
+from ...core.base import BaseCallResponse
+from ...core.base.stream import BaseStream
+from ...core.base.structured_stream import BaseStructuredStream
+
+
+class _Instruments(NamedTuple):
+    duration: Histogram
+    time_to_first_token: Histogram
+    input_tokens: Counter
+    output_tokens: Counter
+    cost: Counter
+    errors: Counter
+    in_flight: UpDownCounter
+
+
+@cache
+def _get_instruments() -> _Instruments:
+    """Returns the metric instruments, which are only created once."""
+    meter = get_meter("mirascope")
+    return _Instruments(
+        duration=meter.create_histogram(
+            "gen_ai.client.operation.duration",
+            unit="s",
+            description="The duration of each call, or of consuming each stream.",
+        ),
+        time_to_first_token=meter.create_histogram(
+            "gen_ai.client.time_to_first_token",
+            unit="s",
+            description="The time from starting to iterate a stream to its first chunk.",
+        ),
+        input_tokens=meter.create_counter(
+            "gen_ai.client.input_tokens",
+            unit="{token}",
+            description="The number of input tokens used.",
+        ),
+        output_tokens=meter.create_counter(
+            "gen_ai.client.output_tokens",
+            unit="{token}",
+            description="The number of output tokens used.",
+        ),
+        cost=meter.create_counter(
+            "gen_ai.client.cost",
+            unit="USD",
+            description="The cost of the calls in dollars.",
+        ),
+        errors=meter.create_counter(
+            "gen_ai.client.errors",
+            unit="{error}",
+            description="The number of calls that raised an error, by error type.",
+        ),
+        in_flight=meter.create_up_down_counter(
+            "gen_ai.client.requests.in_flight",
+            unit="{request}",
+            description="The number of calls currently in flight.",
+        ),
+    )
+
+
+class CallMetrics:
+    """The state of a single call whose metrics are being recorded."""
+
+    def __init__(self, fn: Callable) -> None:
+        self.instruments = _get_instruments()
+        self.function = fn.__name__
+        # Calls are labeled with their provider and model when they're decorated, so
+        # that metrics recorded before there is a response (e.g. errors) have them too
+        self.provider = getattr(fn, "_provider", "")
+        self.model = getattr(fn, "_model", "")
+        self.start = time.perf_counter()
+
+    def attributes(self, provider: str = "", model: str = "") -> dict[str, Any]:
+        return {
+            "gen_ai.system": provider or self.provider,
+            "gen_ai.request.model": model or self.model,
+            "mirascope.function": self.function,
+        }
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        input_tokens: int | float | None,
+        output_tokens: int | float | None,
+        cost: float | None,
+        duration: float | None = None,
+        time_to_first_token: float | None = None,
+    ) -> None:
+        attributes = self.attributes(provider, model)
+        if duration is None:
+            duration = time.perf_counter() - self.start
+        self.instruments.duration.record(duration, attributes=attributes)
+        if time_to_first_token is not None:
+            self.instruments.time_to_first_token.record(
+                time_to_first_token, attributes=attributes
+            )
+        if input_tokens:
+            self.instruments.input_tokens.add(input_tokens, attributes=attributes)
+        if output_tokens:
+            self.instruments.output_tokens.add(output_tokens, attributes=attributes)
+        if cost:
+            self.instruments.cost.add(cost, attributes=attributes)
+
+    def record_call_response(self, response: BaseCallResponse) -> None:
+        self.record(
+            response._provider,
+            response.call_kwargs.get("model", response.model or ""),
+            response.input_tokens,
+            response.output_tokens,
+            response.cost,
+        )
+
+    def record_stream(self, stream: BaseStream) -> None:
+        # A stream is timed from when it started being iterated rather than from when
+        # it was made, which can be arbitrarily earlier
+        self.record(
+            stream._provider,
+            stream.call_kwargs.get("model", stream.model),
+            stream.input_tokens,
+            stream.output_tokens,
+            stream.cost,
+            max(stream.end_time - stream.start_time, 0) / 1000,
+            max(stream.first_chunk_time - stream.start_time, 0) / 1000
+            if stream.first_chunk_time
+            else None,
+        )
+
+
+@contextmanager
+def custom_context_manager(fn: Callable) -> Generator[CallMetrics, Any, None]:
+    metrics = CallMetrics(fn)
+    attributes: dict[str, AttributeValue] = metrics.attributes()
+    metrics.instruments.in_flight.add(1, attributes=attributes)
+    try:
+        yield metrics
+    finally:
+        metrics.instruments.in_flight.add(-1, attributes=attributes)
+
+
+def handle_call_response(
+    result: BaseCallResponse, fn: Callable, metrics: CallMetrics | None
+) -> None:
+    if metrics is not None:
+        metrics.record_call_response(result)
+
+
+def handle_stream(
+    stream: BaseStream, fn: Callable, metrics: CallMetrics | None
+) -> None:
+    if metrics is not None:
+        metrics.record_stream(stream)
+
+
+def handle_response_model(
+    result: BaseModel | BaseType, fn: Callable, metrics: CallMetrics | None
+) -> None:
+    if metrics is None:
+        return
+    if isinstance(result, BaseModel) and isinstance(
+        response := getattr(result, "_response", None), BaseCallResponse
+    ):
+        metrics.record_call_response(response)
+    else:
+        metrics.record("", "", None, None, None)
+
+
+def handle_structured_stream(
+    result: BaseStructuredStream, fn: Callable, metrics: CallMetrics | None
+) -> None:
+    if metrics is not None:
+        metrics.record_stream(result.stream)
+
+
+def handle_error(e: Exception, fn: Callable, metrics: CallMetrics | None) -> None:
+    if metrics is not None:
+        metrics.instruments.errors.add(
+            1, attributes=metrics.attributes() | {"error.type": type(e).__name__}
+        )
+    raise e
+
+
+async def handle_call_response_async(
+    result: BaseCallResponse, fn: Callable, metrics: CallMetrics | None
+) -> None:
+    handle_call_response(result, fn, metrics)
+
+
+async def handle_stream_async(
+    stream: BaseStream, fn: Callable, metrics: CallMetrics | None
+) -> None:
+    handle_stream(stream, fn, metrics)
+
+
+async def handle_response_model_async(
+    result: BaseModel | BaseType, fn: Callable, metrics: CallMetrics | None
+) -> None:
+    handle_response_model(result, fn, metrics)
+
+
+async def handle_structured_stream_async(
+    result: BaseStructuredStream, fn: Callable, metrics: CallMetrics | None
+) -> None:
+    handle_structured_stream(result, fn, metrics)
+
+
+async def handle_error_async(
+    e: Exception, fn: Callable, metrics: CallMetrics | None
+) -> None:
+    handle_error(e, fn, metrics)
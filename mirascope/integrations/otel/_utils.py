@@ -1,22 +1,31 @@
 """Mirascope x OpenTelemetry Integration utils"""
 
+import hashlib
 import json
 from collections.abc import Callable, Generator, Sequence
 from contextlib import contextmanager
-from typing import Any
-
-from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
+from typing import Any, Literal
+
+from opentelemetry.context import Context
+from opentelemetry.metrics import set_meter_provider
+from opentelemetry.sdk import trace as sdk_trace
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import MetricReader
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
     ConsoleSpanExporter,
     SimpleSpanProcessor,
+    SpanExporter,
 )
+from opentelemetry.sdk.trace.sampling import Sampler
 from opentelemetry.trace import (
     Tracer,
     get_tracer,
     set_tracer_provider,
 )
 from opentelemetry.trace.span import Span
-from opentelemetry.util.types import Attributes, AttributeValue
+from opentelemetry.util.types import AttributeValue
 from pydantic import BaseModel
 
 from mirascope.core.base._utils._base_type import BaseType
@@ -25,30 +34,122 @@ from ...core.base import BaseCallResponse
 from ...core.base.stream import BaseStream
 from ...core.base.structured_stream import BaseStructuredStream
 
+ContentCapture = Literal["off", "truncate", "hash", "full"]
+
+_content_capture: ContentCapture = "full"
+_content_max_bytes: int = 4096
+
+
+class _TailSamplingSpanProcessor(SpanProcessor):
+    """Only passes the spans that `should_export` keeps on to `processor`."""
+
+    def __init__(
+        self, processor: SpanProcessor, should_export: Callable[[ReadableSpan], bool]
+    ) -> None:
+        self.processor = processor
+        self.should_export = should_export
+
+    def on_start(
+        self, span: sdk_trace.Span, parent_context: Context | None = None
+    ) -> None:
+        self.processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if self.should_export(span):
+            self.processor.on_end(span)
+
+    def shutdown(self) -> None:
+        self.processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.processor.force_flush(timeout_millis)
+
 
 def configure(
     processors: Sequence[SpanProcessor] | None = None,
+    *,
+    exporter: SpanExporter | None = None,
+    batch: bool = True,
+    sampler: Sampler | None = None,
+    tail_sampler: Callable[[ReadableSpan], bool] | None = None,
+    content_capture: ContentCapture | None = None,
+    content_max_bytes: int | None = None,
+    metric_readers: Sequence[MetricReader] | None = None,
 ) -> Tracer:
     """Configures the OpenTelemetry tracer, this function should only be called once.
 
+    By default, spans are exported in batches on a background thread so that exporting
+    never adds latency to the call itself.
+
     Args:
         processors: Optional[Sequence[SpanProcessor]]
-            The span processors to use, if None, a console exporter will be used.
+            The span processors to use, if None, a processor for `exporter` is used.
+        exporter: The exporter to use when no `processors` are provided. Defaults to a
+            console exporter.
+        batch: Whether to export spans from `exporter` in batches on a background
+            thread (`BatchSpanProcessor`) rather than synchronously when each span ends
+            (`SimpleSpanProcessor`).
+        sampler: The head sampler deciding which traces are recorded when they start
+            (e.g. `ParentBased(TraceIdRatioBased(0.1))`). Prompts and completions are
+            only serialized for spans that are recorded.
+        tail_sampler: A function deciding which recorded spans are exported once they
+            end (e.g. only spans that errored or were slow).
+        content_capture: How prompt and completion contents are added to spans:
+            `"off"` doesn't add them, `"truncate"` truncates them to
+            `content_max_bytes`, `"hash"` adds their SHA-256 hash, and `"full"` adds
+            them as is. If None, the current setting is kept (`"full"` by default).
+        content_max_bytes: The maximum size of each content when truncating. If None,
+            the current setting is kept (4096 by default).
+        metric_readers: The metric readers (e.g. a `PeriodicExportingMetricReader`)
+            to export the metrics recorded by `with_otel(metrics=True)` with. If None,
+            the global meter provider is left as is.
 
     Returns:
         The configured tracer.
     """
-    provider = TracerProvider()
+    global _content_capture, _content_max_bytes
+    if content_capture is not None:
+        _content_capture = content_capture
+    if content_max_bytes is not None:
+        _content_max_bytes = content_max_bytes
+
+    provider = TracerProvider(sampler=sampler)
     if processors is None:
-        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
-    else:
-        for processor in processors:
-            provider.add_span_processor(processor)
+        exporter = exporter or ConsoleSpanExporter()
+        processors = [
+            BatchSpanProcessor(exporter) if batch else SimpleSpanProcessor(exporter)
+        ]
+    for processor in processors:
+        if tail_sampler is not None:
+            processor = _TailSamplingSpanProcessor(processor, tail_sampler)
+        provider.add_span_processor(processor)
     # NOTE: Sets the global trace provider, should only be called once
     set_tracer_provider(provider)
+    if metric_readers is not None:
+        set_meter_provider(MeterProvider(metric_readers=metric_readers))
     return get_tracer("otel")
 
 
+def _capture_content(content: AttributeValue) -> AttributeValue:
+    """Applies the configured content capture policy to `content`."""
+    if _content_capture == "hash":
+        return f"sha256:{hashlib.sha256(str(content).encode()).hexdigest()}"
+    elif _content_capture == "truncate" and isinstance(content, str):
+        encoded = content.encode()
+        if len(encoded) > _content_max_bytes:
+            return encoded[:_content_max_bytes].decode(errors="ignore")
+    return content
+
+
+def _add_content_event(
+    span: Span, name: str, key: str, content: Callable[[], AttributeValue]
+) -> None:
+    """Adds the (lazily serialized) `content` as an event unless capture is off."""
+    if _content_capture == "off":
+        return
+    span.add_event(name, attributes={key: _capture_content(content())})
+
+
 @contextmanager
 def custom_context_manager(
     fn: Callable,
@@ -84,26 +185,24 @@ def get_call_response_attributes(result: BaseCallResponse) -> dict[str, Attribut
 
 
 def set_call_response_event_attributes(result: BaseCallResponse, span: Span) -> None:
-    prompt_attributes = {
-        "gen_ai.prompt": json.dumps(result.user_message_param),
-    }
-    completion_attributes: Attributes = {
-        "gen_ai.completion": json.dumps(result.message_param),
-    }
-    span.add_event(
+    _add_content_event(
+        span,
         "gen_ai.content.prompt",
-        attributes=prompt_attributes,
+        "gen_ai.prompt",
+        lambda: json.dumps(result.user_message_param),
     )
-    span.add_event(
+    _add_content_event(
+        span,
         "gen_ai.content.completion",
-        attributes=completion_attributes,
+        "gen_ai.completion",
+        lambda: json.dumps(result.message_param),
     )
 
 
 def handle_call_response(
     result: BaseCallResponse, fn: Callable, span: Span | None
 ) -> None:
-    if span is None:
+    if span is None or not span.is_recording():
         return
 
     attributes = get_call_response_attributes(result)
@@ -113,7 +212,7 @@ def handle_call_response(
 
 
 def handle_stream(stream: BaseStream, fn: Callable, span: Span | None) -> None:
-    if span is None:
+    if span is None or not span.is_recording():
         return
     constructed_call_response = stream.construct_call_response()
     attributes = get_call_response_attributes(constructed_call_response)
@@ -125,68 +224,62 @@ def handle_stream(stream: BaseStream, fn: Callable, span: Span | None) -> None:
 def handle_response_model(
     result: BaseModel | BaseType, fn: Callable, span: Span | None
 ) -> None:
-    if span is None:
+    if span is None or not span.is_recording():
         return
     if isinstance(result, BaseModel):
         response: BaseCallResponse = result._response  # pyright: ignore [reportAttributeAccessIssue]
         attributes = get_call_response_attributes(response)
         attributes["async"] = False
         span.set_attributes(attributes)
-        prompt_attributes = {
-            "gen_ai.prompt": json.dumps(response.user_message_param),
-        }
-        completion_attributes: Attributes = {
-            "gen_ai.completion": result.model_dump_json(),
-        }
-        span.add_event(
+        _add_content_event(
+            span,
             "gen_ai.content.prompt",
-            attributes=prompt_attributes,
+            "gen_ai.prompt",
+            lambda: json.dumps(response.user_message_param),
         )
+        completion = result.model_dump_json
     else:
         span.set_attributes({"async": False})
-        if not isinstance(result, str | int | float | bool):
-            result = str(result)
-        completion_attributes: Attributes = {
-            "gen_ai.completion": result,
-        }
-    span.add_event(
-        "gen_ai.content.completion",
-        attributes=completion_attributes,
+        completion = (
+            (lambda: result)
+            if isinstance(result, str | int | float | bool)
+            else (lambda: str(result))
+        )
+    _add_content_event(
+        span, "gen_ai.content.completion", "gen_ai.completion", completion
     )
 
 
 def handle_structured_stream(
     result: BaseStructuredStream, fn: Callable, span: Span | None
 ) -> None:
-    if span is None:
+    if span is None or not span.is_recording():
         return
     attributes = get_call_response_attributes(result.stream.construct_call_response())
     attributes["async"] = False
     span.set_attributes(attributes)
-    prompt_attributes = {
-        "gen_ai.prompt": json.dumps(result.stream.user_message_param),
-    }
-    if isinstance(result.constructed_response_model, BaseModel):
-        completion = result.constructed_response_model.model_dump_json()
-    else:
-        completion = result.constructed_response_model
-    completion_attributes: Attributes = {
-        "gen_ai.completion": completion,
-    }
-    span.add_event(
+    _add_content_event(
+        span,
         "gen_ai.content.prompt",
-        attributes=prompt_attributes,
+        "gen_ai.prompt",
+        lambda: json.dumps(result.stream.user_message_param),
     )
-    span.add_event(
+    _add_content_event(
+        span,
         "gen_ai.content.completion",
-        attributes=completion_attributes,
+        "gen_ai.completion",
+        lambda: (
+            result.constructed_response_model.model_dump_json()
+            if isinstance(result.constructed_response_model, BaseModel)
+            else result.constructed_response_model
+        ),
     )
 
 
 async def handle_call_response_async(
     result: BaseCallResponse, fn: Callable, span: Span | None
 ) -> None:
-    if span is None:
+    if span is None or not span.is_recording():
         return
 
     attributes = get_call_response_attributes(result)
@@ -198,7 +291,7 @@ async def handle_call_response_async(
 async def handle_stream_async(
     stream: BaseStream, fn: Callable, span: Span | None
 ) -> None:
-    if span is None:
+    if span is None or not span.is_recording():
         return
     constructed_call_response = stream.construct_call_response()
     attributes = get_call_response_attributes(constructed_call_response)
@@ -210,59 +303,53 @@ async def handle_stream_async(
 async def handle_response_model_async(
     result: BaseModel | BaseType, fn: Callable, span: Span | None
 ) -> None:
-    if span is None:
+    if span is None or not span.is_recording():
         return
     if isinstance(result, BaseModel):
         response: BaseCallResponse = result._response  # pyright: ignore [reportAttributeAccessIssue]
         attributes = get_call_response_attributes(response)
         attributes["async"] = True
         span.set_attributes(attributes)
-        prompt_attributes = {
-            "gen_ai.prompt": json.dumps(response.user_message_param),
-        }
-        completion_attributes: Attributes = {
-            "gen_ai.completion": result.model_dump_json(),
-        }
-        span.add_event(
+        _add_content_event(
+            span,
             "gen_ai.content.prompt",
-            attributes=prompt_attributes,
+            "gen_ai.prompt",
+            lambda: json.dumps(response.user_message_param),
         )
+        completion = result.model_dump_json
     else:
         span.set_attributes({"async": True})
-        if not isinstance(result, str | int | float | bool):
-            result = str(result)
-        completion_attributes: Attributes = {
-            "gen_ai.completion": result,
-        }
-    span.add_event(
-        "gen_ai.content.completion",
-        attributes=completion_attributes,
+        completion = (
+            (lambda: result)
+            if isinstance(result, str | int | float | bool)
+            else (lambda: str(result))
+        )
+    _add_content_event(
+        span, "gen_ai.content.completion", "gen_ai.completion", completion
     )
 
 
 async def handle_structured_stream_async(
     result: BaseStructuredStream, fn: Callable, span: Span | None
 ) -> None:
-    if span is None:
+    if span is None or not span.is_recording():
         return
     attributes = get_call_response_attributes(result.stream.construct_call_response())
     attributes["async"] = True
     span.set_attributes(attributes)
-    prompt_attributes = {
-        "gen_ai.prompt": json.dumps(result.stream.user_message_param),
-    }
-    if isinstance(result.constructed_response_model, BaseModel):
-        completion = result.constructed_response_model.model_dump_json()
-    else:
-        completion = result.constructed_response_model
-    completion_attributes: Attributes = {
-        "gen_ai.completion": completion,
-    }
-    span.add_event(
+    _add_content_event(
+        span,
         "gen_ai.content.prompt",
-        attributes=prompt_attributes,
+        "gen_ai.prompt",
+        lambda: json.dumps(result.stream.user_message_param),
     )
-    span.add_event(
+    _add_content_event(
+        span,
         "gen_ai.content.completion",
-        attributes=completion_attributes,
+        "gen_ai.completion",
+        lambda: (
+            result.constructed_response_model.model_dump_json()
+            if isinstance(result.constructed_response_model, BaseModel)
+            else result.constructed_response_model
+        ),
     )
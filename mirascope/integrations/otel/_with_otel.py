@@ -4,6 +4,7 @@ from collections.abc import Callable
 from typing import ParamSpec, TypeVar
 
 from .._middleware_factory import middleware_factory
+from . import _metrics
 from ._utils import (
     custom_context_manager,
     handle_call_response,
@@ -20,9 +21,13 @@ _P = ParamSpec("_P")
 _R = TypeVar("_R")
 
 
-def with_otel() -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+def with_otel(metrics: bool = False) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
     """Wraps a Mirascope function with OpenTelemetry.
 
+    With `metrics=True`, the call's duration, time to first token (for streams), token
+    usage, cost, errors, and the number of calls in flight are also recorded as
+    OpenTelemetry metrics labeled by provider, model, and function name.
+
     Example:
 
     ```python
@@ -44,9 +49,11 @@ def with_otel() -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
 
     print(recommend_book("fantasy"))
     ```
-    """
 
-    return middleware_factory(
+    Args:
+        metrics: Whether to also record metrics for each call.
+    """
+    with_spans = middleware_factory(
         custom_context_manager=custom_context_manager,
         handle_call_response=handle_call_response,
         handle_call_response_async=handle_call_response_async,
@@ -57,3 +64,19 @@ def with_otel() -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
         handle_structured_stream=handle_structured_stream,
         handle_structured_stream_async=handle_structured_stream_async,
     )
+    if not metrics:
+        return with_spans
+    with_metrics = middleware_factory(
+        custom_context_manager=_metrics.custom_context_manager,
+        handle_call_response=_metrics.handle_call_response,
+        handle_call_response_async=_metrics.handle_call_response_async,
+        handle_stream=_metrics.handle_stream,
+        handle_stream_async=_metrics.handle_stream_async,
+        handle_response_model=_metrics.handle_response_model,
+        handle_response_model_async=_metrics.handle_response_model_async,
+        handle_structured_stream=_metrics.handle_structured_stream,
+        handle_structured_stream_async=_metrics.handle_structured_stream_async,
+        handle_error=_metrics.handle_error,
+        handle_error_async=_metrics.handle_error_async,
+    )
+    return lambda fn: with_metrics(with_spans(fn))
@@ -2,5 +2,7 @@
 
 from contextlib import suppress
 
+from . import fallback as fallback
+
 with suppress(ImportError):
     from . import tenacity as tenacity
@@ -0,0 +1,405 @@
+"""Fallback and hedging across calls to different providers and models."""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Generator, Sequence
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from ..core.base import BaseStream, BaseStructuredStream
+from ..core.base._utils import fn_is_async
+from ..core.base.deadline import (
+    DeadlineExceededError,
+    check_deadline,
+    limit_timeout,
+    remaining_time,
+)
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+# Hedges wait for a free thread once this many are running across all sync fallbacks
+_MAX_HEDGE_WORKERS = 32
+
+_hedge_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_hedge_executor_lock = threading.Lock()
+
+
+def _get_hedge_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Returns the bounded thread pool that runs the hedges of sync calls."""
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _hedge_executor_lock:
+            if _hedge_executor is None:
+                _hedge_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_MAX_HEDGE_WORKERS,
+                    thread_name_prefix="mirascope-hedge",
+                )
+    return _hedge_executor
+
+
+class FallbackError(Exception):
+    """Raised when every call in a fallback has failed."""
+
+    def __init__(self, errors: list[Exception]) -> None:
+        self.errors = errors
+        super().__init__(
+            f"All {len(errors)} calls failed: "
+            + "; ".join(f"{type(error).__name__}: {error}" for error in errors)
+        )
+
+
+class HedgeDelay:
+    """A hedging delay set to a percentile of the latencies of recent calls.
+
+    The latency of a call is the time its winning attempt took to return (or, for
+    streams, to produce its first chunk). Until `min_samples` latencies have been
+    recorded, the `initial` delay is used.
+
+    Example:
+
+    ```python
+    from mirascope.retries.fallback import HedgeDelay
+
+    delay = HedgeDelay(95, initial=2.0)  # hedge calls slower than the p95 latency
+    ```
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        *,
+        initial: float = 1.0,
+        min_delay: float = 0.0,
+        window: int = 100,
+        min_samples: int = 10,
+    ) -> None:
+        """Initializes the delay.
+
+        Args:
+            percentile: The percentile (between 0 and 100) of recent latencies after
+                which to hedge.
+            initial: The delay in seconds to use until enough latencies are recorded.
+            min_delay: The minimum delay in seconds.
+            window: The number of most recent latencies to consider.
+            min_samples: The number of latencies required before using the percentile.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {percentile}")
+        self.percentile = percentile
+        self.initial = initial
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """Records the latency of a call in seconds."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def delay(self) -> float:
+        """Returns the current delay in seconds."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies or len(latencies) < self.min_samples:
+            return self.initial
+        index = max(math.ceil(self.percentile / 100 * len(latencies)) - 1, 0)
+        return max(latencies[index], self.min_delay)
+
+
+def _replay(
+    first: _T, generator: Generator[_T, None, None]
+) -> Generator[_T, None, None]:
+    try:
+        yield first
+        yield from generator
+    finally:
+        generator.close()
+
+
+async def _replay_async(
+    first: _T, generator: AsyncGenerator[_T, None]
+) -> AsyncGenerator[_T, None]:
+    try:
+        yield first
+        async for item in generator:
+            yield item
+    finally:
+        await generator.aclose()
+
+
+def _get_stream(result: object) -> BaseStream | None:
+    if isinstance(result, BaseStructuredStream):
+        return result.stream
+    return result if isinstance(result, BaseStream) else None
+
+
+def _attempt(call: Callable[..., _R], args: tuple, kwargs: dict[str, Any]) -> _R:
+    """Makes the call and, for streams, waits for its first chunk."""
+    result = call(*args, **kwargs)
+    if (stream := _get_stream(result)) is not None and isinstance(
+        stream.stream, Generator
+    ):
+        try:
+            first = next(stream.stream)
+        except StopIteration:
+            return result
+        stream.stream = _replay(first, stream.stream)
+    return result
+
+
+async def _attempt_async(
+    call: Callable[..., Any], args: tuple, kwargs: dict[str, Any]
+) -> Any:  # noqa: ANN401
+    """Makes the async call and, for streams, waits for its first chunk."""
+    result = await call(*args, **kwargs)
+    if (stream := _get_stream(result)) is not None and isinstance(
+        stream.stream, AsyncGenerator
+    ):
+        try:
+            first = await stream.stream.__anext__()
+        except StopAsyncIteration:
+            return result
+        stream.stream = _replay_async(first, stream.stream)
+    return result
+
+
+def _close(result: object) -> None:
+    """Closes the stream of an attempt that lost the race, if any."""
+    if (stream := _get_stream(result)) is not None and isinstance(
+        stream.stream, Generator
+    ):
+        stream.stream.close()
+
+
+async def _close_async(task: asyncio.Task) -> None:
+    """Closes the stream of an async attempt that lost the race, if any."""
+    if task.cancelled() or task.exception() is not None:
+        return
+    if (stream := _get_stream(task.result())) is not None and isinstance(
+        stream.stream, AsyncGenerator
+    ):
+        await stream.stream.aclose()
+
+
+def fallback(
+    *calls: Callable[_P, _R],
+    catch: type[Exception] | tuple[type[Exception], ...] = Exception,
+    hedge: float | HedgeDelay | None = None,
+) -> Callable[_P, _R]:
+    """Returns a function that makes the first of `calls` that succeeds.
+
+    Each call is made with the same arguments, so they can be different providers or
+    models decorating the same prompt. Without `hedge`, the next call is made when the
+    previous one fails with one of the `catch` errors. With `hedge`, the next call is
+    also made if the previous one hasn't returned (or, for streams, produced its first
+    chunk) within the hedging delay. The first successful result is returned and the
+    calls still in flight are cancelled (sync calls already running finish in the
+    background, and their streams are closed).
+
+    Sync calls make the first call on the caller's thread and their hedges on a
+    bounded thread pool. Since the first call can't be interrupted, a hedge that
+    succeeds before it is returned once the first call returns or fails.
+
+    Works for calls, streams, and `response_model` extractions (including structured
+    streams). No further calls are made once the deadline of the current
+    `call_deadline` context (if any) has passed.
+
+    Example:
+
+    ```python
+    from mirascope.core import anthropic, openai, prompt_template
+    from mirascope.retries.fallback import HedgeDelay, fallback
+
+
+    @prompt_template()
+    def recommend_book_prompt(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    recommend_book = fallback(
+        openai.call("gpt-4o-mini")(recommend_book_prompt),
+        anthropic.call("claude-3-5-sonnet-20240620")(recommend_book_prompt),
+        hedge=HedgeDelay(95),
+    )
+    print(recommend_book("fantasy"))
+    ```
+
+    Args:
+        calls: The calls to make in order, which must all be sync or all be async.
+        catch: The errors after which to fall back to the next call. Other errors are
+            raised immediately.
+        hedge: The delay in seconds (or a `HedgeDelay` based on recent latencies)
+            after which to also make the next call, if any.
+
+    Returns:
+        The decorated function with the signature of the calls.
+
+    Raises:
+        FallbackError: If every call fails.
+        DeadlineExceededError: If the current deadline passes before a call succeeds.
+        ValueError: If no calls are provided or they aren't all sync or all async.
+    """
+    if not calls:
+        raise ValueError("At least one call is required for a fallback.")
+    is_async = fn_is_async(calls[0])
+    if any(fn_is_async(call) != is_async for call in calls[1:]):
+        raise ValueError("Calls must either all be sync or all be async.")
+
+    def get_delay() -> float:
+        return hedge.delay() if isinstance(hedge, HedgeDelay) else hedge or 0.0
+
+    def record(latency: float) -> None:
+        if isinstance(hedge, HedgeDelay):
+            hedge.record(latency)
+
+    if is_async:
+
+        @wraps(calls[0])
+        async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            errors: list[Exception] = []
+            if hedge is None:
+                for call in calls:
+                    check_deadline()
+                    try:
+                        return await _attempt_async(call, args, kwargs)
+                    except DeadlineExceededError:
+                        raise
+                    except catch as e:
+                        errors.append(e)
+                raise FallbackError(errors)
+
+            delay = get_delay()
+            remaining: Sequence[Callable[_P, _R]] = calls
+            pending: set[asyncio.Task] = set()
+            starts: dict[asyncio.Task, float] = {}
+            try:
+                while remaining or pending:
+                    if remaining:
+                        call, remaining = remaining[0], remaining[1:]
+                        task = asyncio.ensure_future(_attempt_async(call, args, kwargs))
+                        starts[task] = time.perf_counter()
+                        pending.add(task)
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=limit_timeout(delay if remaining else None),
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if not done:
+                        check_deadline()
+                    for task in done:
+                        if (error := task.exception()) is None:
+                            record(time.perf_counter() - starts[task])
+                            for other in done - {task}:
+                                await _close_async(other)
+                            return task.result()
+                        if not isinstance(error, catch) or isinstance(
+                            error, DeadlineExceededError
+                        ):
+                            raise error
+                        errors.append(error)  # pyright: ignore [reportArgumentType]
+            finally:
+                for task in pending:
+                    task.cancel()
+            raise FallbackError(errors)
+
+        return inner_async  # pyright: ignore [reportReturnType]
+
+    @wraps(calls[0])
+    def inner(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        errors: list[Exception] = []
+        if hedge is None:
+            for call in calls:
+                check_deadline()
+                try:
+                    return _attempt(call, args, kwargs)
+                except DeadlineExceededError:
+                    raise
+                except catch as e:
+                    errors.append(e)
+            raise FallbackError(errors)
+
+        delay = get_delay()
+        condition = threading.Condition()
+        # The `(result, latency)` or error of each attempt, in the order they finished
+        outcomes: list[tuple[Any, float] | BaseException] = []
+        finished = False
+
+        def run(index: int) -> None:
+            start = time.perf_counter()
+            try:
+                result = _attempt(calls[index], args, kwargs)
+                outcome = (result, time.perf_counter() - start)
+            except BaseException as e:
+                outcome = e
+            with condition:
+                if not finished:
+                    outcomes.append(outcome)
+                    condition.notify_all()
+                    return
+            if isinstance(outcome, tuple):
+                _close(outcome[0])
+
+        def run_hedge(index: int, launch_at: float, failures: int) -> None:
+            """Makes the `index` call once the previous one is slow or an attempt fails."""
+            with condition:
+                condition.wait_for(
+                    lambda: (
+                        finished
+                        or sum(not isinstance(o, tuple) for o in outcomes) > failures
+                    ),
+                    timeout=limit_timeout(max(launch_at - time.perf_counter(), 0)),
+                )
+                if finished or remaining_time() == 0.0:
+                    return
+                failures = sum(not isinstance(o, tuple) for o in outcomes)
+            submit_hedge(index + 1, failures)
+            run(index)
+
+        def submit_hedge(index: int, failures: int) -> None:
+            if index < len(calls):
+                _get_hedge_executor().submit(
+                    contextvars.copy_context().run,
+                    run_hedge,
+                    index,
+                    time.perf_counter() + delay,
+                    failures,
+                )
+
+        index = 0
+        try:
+            submit_hedge(1, 0)
+            run(0)
+            with condition:
+                while True:
+                    for outcome in outcomes[index:]:
+                        index += 1
+                        if isinstance(outcome, tuple):
+                            record(outcome[1])
+                            return outcome[0]
+                        if not isinstance(outcome, catch) or isinstance(
+                            outcome, DeadlineExceededError
+                        ):
+                            raise outcome
+                        errors.append(outcome)  # pyright: ignore [reportArgumentType]
+                    if len(errors) == len(calls):
+                        raise FallbackError(errors)
+                    if not condition.wait(limit_timeout(None)):
+                        check_deadline()
+        finally:
+            with condition:
+                finished = True
+                losers, outcomes[:] = outcomes[index:], []
+                condition.notify_all()
+            for outcome in losers:
+                if isinstance(outcome, tuple):
+                    _close(outcome[0])
+
+    return inner
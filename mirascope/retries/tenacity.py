@@ -4,6 +4,8 @@ from collections.abc import Callable
 
 from tenacity import RetryCallState
 
+from ..core.base.deadline import remaining_time
+
 
 def collect_errors(
     *args: type[Exception],
@@ -48,3 +50,30 @@ def collect_errors(
             )
 
     return inner
+
+
+def stop_at_deadline(retry_state: RetryCallState) -> bool:
+    """Stops retrying once the next attempt would start after the current deadline.
+
+    The deadline is the one set by the current `call_deadline` context, if any.
+
+    Example:
+
+    ```python
+    from tenacity import retry, stop_after_attempt
+
+    from mirascope.core.base.deadline import call_deadline
+    from mirascope.retries.tenacity import stop_at_deadline
+
+
+    @retry(stop=stop_after_attempt(5) | stop_at_deadline)
+    def flaky_call() -> str: ...
+
+
+    with call_deadline(10.0):
+        flaky_call()
+    ```
+    """
+    if (remaining := remaining_time()) is None:
+        return False
+    return remaining <= (retry_state.upcoming_sleep or 0.0)
@@ -0,0 +1,120 @@
+"""Tests the `anthropic._utils.auto_cache_control` module."""
+
+from anthropic.types import TextBlock
+
+from mirascope.core.anthropic._utils._auto_cache_control import (
+    MAX_CACHE_BREAKPOINTS,
+    apply_auto_cache_control,
+)
+
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _tools() -> list[dict]:
+    return [
+        {"name": "a", "description": "a", "input_schema": {}},
+        {"name": "b", "description": "b", "input_schema": {}},
+    ]
+
+
+def test_apply_auto_cache_control_first_call() -> None:
+    """Tests that no breakpoints are placed before a stable prefix is observed."""
+
+    def fn() -> None: ...
+
+    call_kwargs = {
+        "model": "claude-3-5-sonnet-20240620",
+        "max_tokens": 1000,
+        "system": "system",
+        "messages": [{"role": "user", "content": "hi"}],
+        "tools": _tools(),
+    }
+    messages = apply_auto_cache_control(fn, call_kwargs)  # pyright: ignore [reportArgumentType]
+    assert messages == [{"role": "user", "content": "hi"}]
+    assert call_kwargs["system"] == "system"
+    assert all("cache_control" not in tool for tool in call_kwargs["tools"])
+
+
+def test_apply_auto_cache_control_growing_conversation() -> None:
+    """Tests breakpoint placement as the conversation grows."""
+
+    def fn() -> None: ...
+
+    history = [{"role": "user", "content": "hi"}]
+    apply_auto_cache_control(
+        fn,
+        {"system": "system", "messages": list(history), "tools": _tools()},  # pyright: ignore [reportArgumentType]
+    )
+    history += [
+        {"role": "assistant", "content": [TextBlock(text="hello", type="text")]},
+        {"role": "user", "content": "bye"},
+    ]
+    tools = _tools()
+    call_kwargs = {"system": "system", "messages": list(history), "tools": tools}
+    messages = apply_auto_cache_control(fn, call_kwargs)  # pyright: ignore [reportArgumentType]
+    assert messages == [
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "hi", "cache_control": _EPHEMERAL}],
+        },
+        history[1],
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "bye", "cache_control": _EPHEMERAL}],
+        },
+    ]
+    assert call_kwargs["system"] == [
+        {"type": "text", "text": "system", "cache_control": _EPHEMERAL}
+    ]
+    assert call_kwargs["tools"][-1]["cache_control"] == _EPHEMERAL
+    assert "cache_control" not in call_kwargs["tools"][0]
+    assert all("cache_control" not in tool for tool in tools)
+    assert history[0] == {"role": "user", "content": "hi"}
+
+
+def test_apply_auto_cache_control_changing_messages() -> None:
+    """Tests that only the stable tools and system prompt are cached."""
+
+    def fn() -> None: ...
+
+    system = [{"type": "text", "text": "system"}]
+    apply_auto_cache_control(
+        fn,
+        {"system": system, "messages": [{"role": "user", "content": "hi"}]},  # pyright: ignore [reportArgumentType]
+    )
+    call_kwargs = {"system": system, "messages": [{"role": "user", "content": "bye"}]}
+    messages = apply_auto_cache_control(fn, call_kwargs)  # pyright: ignore [reportArgumentType]
+    assert messages == [{"role": "user", "content": "bye"}]
+    assert call_kwargs["system"] == [
+        {"type": "text", "text": "system", "cache_control": _EPHEMERAL}
+    ]
+    assert system == [{"type": "text", "text": "system"}]
+
+
+def test_apply_auto_cache_control_respects_limit() -> None:
+    """Tests that user-provided breakpoints count against the limit."""
+
+    def fn() -> None: ...
+
+    messages = [
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "hi", "cache_control": _EPHEMERAL}],
+        }
+        for _ in range(MAX_CACHE_BREAKPOINTS)
+    ]
+    apply_auto_cache_control(fn, {"system": "system", "messages": list(messages)})  # pyright: ignore [reportArgumentType]
+    call_kwargs = {"system": "system", "messages": list(messages)}
+    assert apply_auto_cache_control(fn, call_kwargs) == messages  # pyright: ignore [reportArgumentType]
+    assert call_kwargs["system"] == "system"
+
+
+def test_apply_auto_cache_control_empty_content() -> None:
+    """Tests that segments without content blocks are skipped."""
+
+    def fn() -> None: ...
+
+    call_kwargs = {"system": [], "messages": [{"role": "user", "content": []}]}
+    apply_auto_cache_control(fn, call_kwargs)  # pyright: ignore [reportArgumentType]
+    messages = apply_auto_cache_control(fn, call_kwargs)  # pyright: ignore [reportArgumentType]
+    assert messages == [{"role": "user", "content": []}]
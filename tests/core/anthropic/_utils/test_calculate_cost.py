@@ -1,5 +1,7 @@
 """Tests the `anthropic._utils.calculate_cost` function."""
 
+import pytest
+
 from mirascope.core.anthropic._utils._calculate_cost import calculate_cost
 
 
@@ -8,3 +10,9 @@ def test_calculate_cost() -> None:
     assert calculate_cost(None, None, model="claude-3-5-sonnet-20240620") is None
     assert calculate_cost(1, 1, model="unknown") is None
     assert calculate_cost(1, 1, model="claude-3-5-sonnet-20240620") == 0.000018
+    assert calculate_cost(
+        1, 1, model="claude-3-5-sonnet-20241022", cache_read_input_tokens=10
+    ) == pytest.approx(0.000021)
+    assert calculate_cost(
+        1, 1, model="claude-3-5-sonnet-20240620", cache_creation_input_tokens=10
+    ) == pytest.approx(0.0000555)
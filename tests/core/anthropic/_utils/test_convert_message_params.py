@@ -5,6 +5,7 @@ from anthropic.types import MessageParam
 
 from mirascope.core.anthropic._utils._convert_message_params import (
     convert_message_params,
+    convert_text_message,
 )
 from mirascope.core.base import (
     AudioPart,
@@ -120,3 +121,11 @@ def test_convert_message_params() -> None:
                 )
             ]
         )
+
+
+def test_convert_text_message() -> None:
+    """Tests that text messages are converted the same as `BaseMessageParam`."""
+    for role in ["system", "user", "assistant"]:
+        assert convert_text_message(role, "Hello") == convert_message_params(
+            [BaseMessageParam(role=role, content="Hello")]
+        )
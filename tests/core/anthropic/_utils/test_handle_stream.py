@@ -36,6 +36,7 @@ from mirascope.core.anthropic._utils._handle_stream import (
     handle_stream_async,
 )
 from mirascope.core.anthropic.tool import AnthropicTool
+from mirascope.core.base._utils import StreamedJsonObject
 
 
 class FormatBook(AnthropicTool):
@@ -143,14 +144,61 @@ def test_handle_chunk_no_tool_types() -> None:
     """Tests the `_handle_chunk` function with no tool types."""
     mock_chunk = MagicMock(spec=MessageStreamEvent)
     mock_current_tool_call = MagicMock(spec=ToolUseBlock)
+    streamed = StreamedJsonObject()
     buffer, chunk, current_tool_call, current_tool_type = _handle_chunk(
-        "",
+        streamed,
         mock_chunk,
         mock_current_tool_call,
         None,
         None,
     )
-    assert buffer == ""
+    assert buffer is streamed
     assert chunk is None
     assert current_tool_call == mock_current_tool_call
     assert current_tool_type is None
+
+
+def test_handle_stream_partial_tools(mock_chunks: list[MessageStreamEvent]) -> None:
+    """Tests streaming partial tools as the tool input is streamed."""
+    mock_chunks[5:6] = [
+        RawContentBlockDeltaEvent(
+            delta=InputJSONDelta(partial_json=partial_json, type="input_json_delta"),
+            index=1,
+            type="content_block_delta",
+        )
+        for partial_json in ['{"title": "The Name', ' of the Wind", "author": "Pat']
+    ]
+    mock_chunks.insert(
+        7,
+        RawContentBlockDeltaEvent(
+            delta=InputJSONDelta(
+                partial_json='rick Rothfuss"}', type="input_json_delta"
+            ),
+            index=1,
+            type="content_block_delta",
+        ),
+    )
+    result = list(
+        handle_stream(
+            (c for c in mock_chunks), tool_types=[FormatBook], partial_tools=True
+        )
+    )
+    tools = [tool for _, tool in result if isinstance(tool, FormatBook)]
+    assert [tool.delta for tool in tools] == [
+        '{"title": "The Name',
+        ' of the Wind", "author": "Pat',
+        'rick Rothfuss"}',
+        None,
+    ]
+    assert tools[0].title == "The Name" and tools[0].author is None
+    assert tools[1].author == "Pat"
+    assert tools[1].tool_call.id == "id"
+    assert tools[1].tool_call.input == {
+        "title": "The Name of the Wind",
+        "author": "Pat",
+    }
+    assert isinstance(tools[3], FormatBook)
+    assert tools[3].model_dump(exclude={"tool_call"}) == {
+        "title": "The Name of the Wind",
+        "author": "Patrick Rothfuss",
+    }
@@ -1,14 +1,18 @@
 """Tests the `anthropic._utils.setup_call` module."""
 
-import inspect
+from typing import cast
 from unittest.mock import MagicMock, patch
 
 import pytest
 from anthropic import Anthropic
 
-from mirascope.core.anthropic._utils import convert_common_call_params
+from mirascope.core.anthropic._utils import (
+    convert_common_call_params,
+    convert_text_message,
+)
 from mirascope.core.anthropic._utils._setup_call import setup_call
 from mirascope.core.anthropic.tool import AnthropicTool
+from mirascope.core.base._utils import MessagesOnlyClient
 
 
 @pytest.fixture()
@@ -19,6 +23,7 @@ def mock_base_setup_call() -> MagicMock:
     return mock_setup_call
 
 
+@patch("mirascope.core.anthropic._utils._setup_call.Anthropic", new_callable=MagicMock)
 @patch(
     "mirascope.core.anthropic._utils._setup_call.convert_message_params",
     new_callable=MagicMock,
@@ -27,6 +32,7 @@ def mock_base_setup_call() -> MagicMock:
 def test_setup_call(
     mock_utils: MagicMock,
     mock_convert_message_params: MagicMock,
+    mock_anthropic: MagicMock,
     mock_base_setup_call: MagicMock,
 ) -> None:
     """Tests the `setup_call` function."""
@@ -59,12 +65,18 @@ def test_setup_call(
         AnthropicTool,
         {"max_tokens": 1000},
         convert_common_call_params,
+        convert_text_message=convert_text_message,
     )
     mock_convert_message_params.assert_called_once_with(
         mock_base_setup_call.return_value[1]
     )
     assert messages == mock_convert_message_params.return_value
-    assert inspect.signature(create) == inspect.signature(Anthropic().messages.create)
+    mock_create = mock_anthropic.return_value.messages.create
+    assert create(**call_kwargs)
+    mock_create.assert_called_once_with(**call_kwargs)
+    mock_create.reset_mock()
+    assert create(stream=True, **call_kwargs)
+    mock_create.assert_called_once_with(**call_kwargs, stream=True)
 
 
 @patch("mirascope.core.anthropic._utils._setup_call._utils", new_callable=MagicMock)
@@ -178,3 +190,58 @@ def test_setup_call_extract(
         "type": "tool",
         "name": tool_types[0]._name(),
     }
+
+
+@patch(
+    "mirascope.core.anthropic._utils._setup_call.apply_auto_cache_control",
+    new_callable=MagicMock,
+)
+@patch("mirascope.core.anthropic._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_auto_cache_control(
+    mock_utils: MagicMock,
+    mock_apply_auto_cache_control: MagicMock,
+    mock_base_setup_call: MagicMock,
+) -> None:
+    """Tests the `setup_call` function with automatic cache control."""
+    mock_base_setup_call.return_value[1] = [{"role": "user", "content": "test"}]
+    mock_base_setup_call.return_value[3] = {
+        "max_tokens": 1000,
+        "auto_cache_control": True,
+    }
+    mock_utils.setup_call = mock_base_setup_call
+    fn = MagicMock()
+    _, _, messages, _, call_kwargs = setup_call(
+        model="claude-3-5-sonnet-20240620",
+        client=None,
+        fn=fn,
+        fn_args={},
+        dynamic_config=None,
+        tools=None,
+        json_mode=False,
+        call_params={"max_tokens": 1000, "auto_cache_control": True},
+        extract=False,
+        stream=False,
+    )
+    assert "auto_cache_control" not in call_kwargs
+    mock_apply_auto_cache_control.assert_called_once_with(fn, call_kwargs)
+    assert messages == mock_apply_auto_cache_control.return_value
+
+    mock_apply_auto_cache_control.reset_mock()
+    mock_base_setup_call.return_value[3] = {
+        "max_tokens": 1000,
+        "auto_cache_control": True,
+    }
+    _, _, messages, _, call_kwargs = setup_call(
+        model="claude-3-5-sonnet-20240620",
+        client=cast(Anthropic, MessagesOnlyClient()),
+        fn=fn,
+        fn_args={},
+        dynamic_config=None,
+        tools=None,
+        json_mode=False,
+        call_params={"max_tokens": 1000, "auto_cache_control": True},
+        extract=False,
+        stream=False,
+    )
+    assert "auto_cache_control" not in call_kwargs
+    mock_apply_auto_cache_control.assert_not_called()
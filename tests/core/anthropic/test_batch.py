@@ -0,0 +1,179 @@
+"""Tests the `AnthropicBatch` class against a local stub of the Message Batches API."""
+
+import json
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from anthropic import Anthropic
+from pydantic import BaseModel
+
+from mirascope.core import anthropic
+from mirascope.core.base.batch import BatchRequestError
+
+
+class MessageBatchesAPIStub(BaseHTTPRequestHandler):
+    """Implements the Message Batches endpoints used by `AnthropicBatch`."""
+
+    requests: list[dict]
+    processing_status: list[str]
+
+    def _send(self, body: object) -> None:
+        data = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _batch(self, status: str) -> dict:
+        host, port = self.server.server_address[:2]  # pyright: ignore [reportIndexIssue]
+        return {
+            "id": "msgbatch_1",
+            "type": "message_batch",
+            "processing_status": status,
+            "request_counts": {
+                "processing": 0,
+                "succeeded": 2,
+                "errored": 1,
+                "canceled": 0,
+                "expired": 1,
+            },
+            "created_at": "2024-10-01T00:00:00Z",
+            "expires_at": "2024-10-02T00:00:00Z",
+            "ended_at": None,
+            "cancel_initiated_at": None,
+            "archived_at": None,
+            "results_url": f"http://{host}:{port}/v1/messages/batches/msgbatch_1/results"
+            if status == "ended"
+            else None,
+        }
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        type(self).requests = json.loads(body)["requests"]
+        self._send(self._batch("in_progress"))
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.endswith("/results"):
+            self._send("\n".join(_result(r) for r in self.requests))
+        else:
+            statuses = self.processing_status
+            self._send(
+                self._batch(statuses.pop(0) if len(statuses) > 1 else statuses[0])
+            )
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _result(request: dict) -> str:
+    params, custom_id = request["params"], request["custom_id"]
+    if custom_id == "horror":
+        result = {
+            "type": "errored",
+            "error": {
+                "type": "error",
+                "error": {"type": "overloaded_error", "message": "Overloaded"},
+            },
+        }
+    elif custom_id == "mystery":
+        result = {"type": "expired"}
+    else:
+        text = params["messages"][0]["content"]
+        if "tools" in params:
+            content = [
+                {
+                    "type": "tool_use",
+                    "id": "toolu_1",
+                    "name": "Book",
+                    "input": {"title": text},
+                }
+            ]
+        else:
+            content = [{"type": "text", "text": text}]
+        result = {
+            "type": "succeeded",
+            "message": {
+                "id": "msg_1",
+                "type": "message",
+                "role": "assistant",
+                "model": params["model"],
+                "content": content,
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": 1, "output_tokens": 2},
+            },
+        }
+    return json.dumps({"custom_id": custom_id, "result": result})
+
+
+@pytest.fixture
+def client() -> Generator[Anthropic, None, None]:
+    """Returns a client for a stub Message Batches API server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MessageBatchesAPIStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield Anthropic(
+        api_key="test",
+        base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        max_retries=0,
+    )
+    server.shutdown()
+    server.server_close()
+
+
+class Book(BaseModel):
+    title: str
+
+
+def test_anthropic_batch(client: Anthropic) -> None:
+    """Tests submitting a batch and parsing its results into call outputs."""
+
+    @anthropic.call("claude-3-5-sonnet-20240620")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    MessageBatchesAPIStub.processing_status = ["in_progress", "ended"]
+    batch = anthropic.AnthropicBatch(recommend_book, client=client, poll_interval=0)
+    for genre in ("fantasy", "mystery", "horror"):
+        batch.add(genre, custom_id=genre)
+    results = batch.wait()
+    assert batch.status == "ended"
+
+    assert MessageBatchesAPIStub.requests[0] == {
+        "custom_id": "fantasy",
+        "params": {
+            "model": "claude-3-5-sonnet-20240620",
+            "max_tokens": 1000,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": "Recommend a fantasy book",
+                }
+            ],
+        },
+    }
+    response = results["fantasy"]
+    assert isinstance(response, anthropic.AnthropicCallResponse)
+    assert response.content == "Recommend a fantasy book"
+    assert response.output_tokens == 2
+    assert isinstance(results["mystery"], BatchRequestError)
+    assert "Request expired" in str(results["mystery"])
+    assert isinstance(results["horror"], BatchRequestError)
+    assert "Overloaded" in str(results["horror"])
+
+
+def test_anthropic_batch_response_model(client: Anthropic) -> None:
+    """Tests parsing batch results into `response_model` outputs."""
+
+    @anthropic.call("claude-3-5-sonnet-20240620", response_model=Book)
+    def extract_book(text: str) -> str:
+        return text
+
+    MessageBatchesAPIStub.processing_status = ["ended"]
+    batch = anthropic.AnthropicBatch(extract_book, client=client, poll_interval=0)
+    batch.add("The Name of the Wind")
+    assert batch.wait() == {"request-0": Book(title="The Name of the Wind")}
+    assert MessageBatchesAPIStub.requests[0]["params"]["tools"][0]["name"] == "Book"
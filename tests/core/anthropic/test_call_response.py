@@ -1,5 +1,6 @@
 """Tests the `anthropic.call_response` module."""
 
+import pytest
 from anthropic.types import (
     Message,
     MessageParam,
@@ -119,3 +120,41 @@ def test_anthropic_call_response_with_tools() -> None:
             ],
         )
     ]
+
+
+def test_anthropic_call_response_cache_usage() -> None:
+    """Tests the prompt cache usage of the `AnthropicCallResponse` class."""
+    completion = Message(
+        id="id",
+        content=[TextBlock(text="content", type="text")],
+        model="claude-3-5-sonnet-20240620",
+        role="assistant",
+        stop_reason="end_turn",
+        stop_sequence=None,
+        type="message",
+        usage=Usage.model_validate(
+            {
+                "input_tokens": 1,
+                "output_tokens": 1,
+                "cache_creation_input_tokens": 2,
+                "cache_read_input_tokens": 3,
+            }
+        ),
+    )
+    call_response = AnthropicCallResponse(
+        metadata={},
+        response=completion,
+        tool_types=None,
+        prompt_template="",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params=AnthropicCallParams(max_tokens=1000),
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )
+    assert call_response.cache_creation_input_tokens == 2
+    assert call_response.cache_read_input_tokens == 3
+    assert call_response.cost == pytest.approx(2.64e-05)
@@ -353,3 +353,68 @@ def test_construct_call_response_string_content() -> None:
         "role": "assistant",
         "content": [{"text": "content", "type": "text"}],
     }
+
+
+def test_anthropic_stream_cache_usage() -> None:
+    """Tests that the `AnthropicStream` accumulates prompt cache usage."""
+    chunks = [
+        RawMessageStartEvent(
+            message=Message(
+                id="id",
+                content=[],
+                model="claude-3-5-sonnet-20240620",
+                role="assistant",
+                stop_reason=None,
+                stop_sequence=None,
+                type="message",
+                usage=Usage.model_validate(
+                    {
+                        "input_tokens": 1,
+                        "output_tokens": 1,
+                        "cache_creation_input_tokens": 2,
+                        "cache_read_input_tokens": 3,
+                    }
+                ),
+            ),
+            type="message_start",
+        ),
+        RawContentBlockDeltaEvent(
+            delta=TextDelta(text="content", type="text_delta"),
+            index=0,
+            type="content_block_delta",
+        ),
+        RawMessageDeltaEvent(
+            delta=Delta(stop_reason="end_turn", stop_sequence=None),
+            type="message_delta",
+            usage=MessageDeltaUsage(output_tokens=1),
+        ),
+    ]
+
+    def generator():
+        for chunk in chunks:
+            yield AnthropicCallResponseChunk(chunk=chunk), None
+
+    stream = AnthropicStream(
+        stream=generator(),
+        metadata={},
+        tool_types=None,
+        call_response_type=AnthropicCallResponse,
+        model="claude-3-5-sonnet-20240620",
+        prompt_template="",
+        fn_args={},
+        dynamic_config=None,
+        messages=[{"role": "user", "content": "content"}],
+        call_params=AnthropicCallParams(max_tokens=1000),
+        call_kwargs={},
+    )
+    assert stream.cache_creation_input_tokens is None
+    assert stream.cache_read_input_tokens is None
+    for _ in stream:
+        pass
+    assert stream.cache_creation_input_tokens == 2
+    assert stream.cache_read_input_tokens == 3
+    assert stream.cost == pytest.approx(4.14e-05)
+    call_response = stream.construct_call_response()
+    assert call_response.cache_creation_input_tokens == 2
+    assert call_response.cache_read_input_tokens == 3
+    assert call_response.cost == pytest.approx(4.14e-05)
@@ -1,9 +1,12 @@
 """Tests the `azure._utils.handle_stream` module."""
 
+import copy
 from datetime import datetime
+from typing import cast
 
 import pytest
 from azure.ai.inference.models import (
+    CompletionsFinishReason,
     CompletionsUsage,
     FunctionCall,
     StreamingChatChoiceUpdate,
@@ -161,10 +164,11 @@ def test_handle_stream(mock_chunks: list[StreamingChatCompletionsUpdate]) -> Non
     """Tests the `handle_stream` function."""
 
     result = list(handle_stream((c for c in mock_chunks), tool_types=[FormatBook]))
-    # Check we get three tuples back.
-    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook)
-    assert len(result) == 3
+    # Check we get four tuples back, with each tool emitted as soon as it's complete.
+    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook), (chunk, None)
+    assert len(result) == 4
     assert result[0][1] is None
+    assert result[3][1] is None
     assert (
         (tool := result[1][1]) is not None
         and isinstance(tool, FormatBook)
@@ -192,10 +196,11 @@ async def test_handle_stream_async(
     result = []
     async for t in handle_stream_async(generator(), tool_types=[FormatBook]):
         result.append(t)
-    # Check we get three tuples back.
-    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook)
-    assert len(result) == 3
+    # Check we get four tuples back, with each tool emitted as soon as it's complete.
+    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook), (chunk, None)
+    assert len(result) == 4
     assert result[0][1] is None
+    assert result[3][1] is None
     assert (
         (tool := result[1][1]) is not None
         and isinstance(tool, FormatBook)
@@ -208,3 +213,92 @@ async def test_handle_stream_async(
         and tool.model_dump(exclude={"tool_call"})
         == {"title": "The Name of the Wind", "author": "Patrick Rothfuss"}
     )
+
+
+def test_handle_stream_parallel_tool_calls() -> None:
+    """Tests that interleaved tool calls are tracked by the raw payload's index."""
+
+    def chunk(tool_calls: list[dict]) -> StreamingChatCompletionsUpdate:
+        return StreamingChatCompletionsUpdate(
+            id="id",
+            choices=[
+                StreamingChatChoiceUpdate(
+                    delta=StreamingChatResponseMessageUpdate(
+                        content=None,
+                        tool_calls=[
+                            StreamingChatResponseToolCallUpdate(tool_call)
+                            for tool_call in tool_calls
+                        ],
+                    ),
+                    index=0,
+                    finish_reason=cast(CompletionsFinishReason, None),
+                )
+            ],
+            created=datetime.fromtimestamp(0),
+            model="gpt-4o",
+            usage=CompletionsUsage(
+                completion_tokens=0, prompt_tokens=0, total_tokens=0
+            ),
+        )
+
+    chunks = [
+        chunk(
+            [
+                {
+                    "index": 0,
+                    "id": "id0",
+                    "function": {"name": "FormatBook", "arguments": '{"title": "A", '},
+                },
+                {
+                    "index": 1,
+                    "id": "id1",
+                    "function": {"name": "FormatBook", "arguments": '{"title": "B", '},
+                },
+            ]
+        ),
+        chunk(
+            [
+                {"index": 1, "id": "", "function": {"arguments": '"author": "b"}'}},
+                {"index": 0, "id": "", "function": {"arguments": '"author": "a"}'}},
+            ]
+        ),
+    ]
+    result = list(handle_stream((c for c in chunks), tool_types=[FormatBook]))
+    assert [tool.model_dump(exclude={"tool_call"}) for _, tool in result] == [  # pyright: ignore [reportOptionalMemberAccess]
+        {"title": "B", "author": "b"},
+        {"title": "A", "author": "a"},
+    ]
+    assert [tool.tool_call.id for _, tool in result] == ["id1", "id0"]  # pyright: ignore [reportOptionalMemberAccess]
+
+
+def test_handle_stream_partial_tools(
+    mock_chunks: list[StreamingChatCompletionsUpdate],
+) -> None:
+    """Tests streaming partial tools as the tool arguments are streamed."""
+    chunks = [
+        mock_chunks[1],
+        copy.deepcopy(mock_chunks[2]),
+        copy.deepcopy(mock_chunks[2]),
+        mock_chunks[-1],
+    ]
+    for chunk, arguments in zip(
+        chunks[1:3],
+        ['{"title": "The Name', ' of the Wind", "author": "Patrick Rothfuss"}'],
+        strict=True,
+    ):
+        chunk.choices[0].delta.tool_calls[0].function.arguments = arguments  # pyright: ignore [reportOptionalSubscript]
+    tools = [
+        tool
+        for _, tool in handle_stream(
+            (c for c in chunks), tool_types=[FormatBook], partial_tools=True
+        )
+    ]
+    assert [tool.delta if tool else None for tool in tools] == [
+        '{"title": "The Name',
+        None,
+        None,
+    ]
+    assert isinstance(tools[0], FormatBook)
+    assert tools[0].title == "The Name" and tools[0].author is None
+    assert isinstance(tools[1], FormatBook)
+    assert tools[1].author == "Patrick Rothfuss"
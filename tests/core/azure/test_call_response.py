@@ -64,6 +64,9 @@ def test_azure_call_response() -> None:
     assert call_response.tools is None
     assert call_response.tool is None
 
+    data = AzureCallResponse._dump_response(completion)
+    assert AzureCallResponse._load_response(data) == completion
+
 
 def test_azure_call_response_with_tools() -> None:
     """Tests the `AzureCallResponse` class with tools."""
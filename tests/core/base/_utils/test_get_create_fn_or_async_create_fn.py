@@ -151,6 +151,24 @@ def test_get_create_fn_streaming_without_generator():
     assert results == ["streaming result 1", "streaming result 2"]
 
 
+def test_get_create_fn_streaming_closes_upstream():
+    class Stream:
+        closed = False
+
+        def __iter__(self) -> Iterator[str]:
+            yield from ["streaming result 1", "streaming result 2"]
+
+        def close(self) -> None:
+            self.closed = True
+
+    upstream = Stream()
+    create_or_stream = get_create_fn(lambda **kwargs: upstream)
+    stream_result = create_or_stream(stream=True)
+    assert next(stream_result) == "streaming result 1"
+    stream_result.close()
+    assert upstream.closed
+
+
 def test_get_create_fn_streaming_with_iterable():
     def sync_func(**kwargs: Any) -> Iterable[str]:
         return ["streaming result 1", "streaming result 2"]
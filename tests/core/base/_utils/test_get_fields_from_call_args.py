@@ -4,7 +4,9 @@ import pytest
 from pydantic import BaseModel
 
 from mirascope.core.base._utils._get_fields_from_call_args import (
+    get_call_args_fields,
     get_fields_from_call_args,
+    get_fields_from_call_args_binder,
 )
 from mirascope.core.base.from_call_args import FromCallArgs
 
@@ -115,3 +117,22 @@ def test_get_fields_from_call_args_built_in():
 
     result = get_fields_from_call_args(list[str], dummy_fn, (10,), {})
     assert result == {}
+
+
+def test_get_fields_from_call_args_binder():
+    class ResponseModel(BaseModel):
+        field1: Annotated[int, FromCallArgs()]
+        field2: str
+
+    def dummy_fn(field1, field2="test"): ...
+
+    assert get_call_args_fields(ResponseModel) == {"field1"}
+    assert get_call_args_fields(list[ResponseModel]) == frozenset()
+    bind_fields_from_call_args = get_fields_from_call_args_binder(
+        ResponseModel, dummy_fn
+    )
+    assert bind_fields_from_call_args((10,), {}) == {"field1": 10}
+    assert bind_fields_from_call_args((), {"field1": 20}) == {"field1": 20}
+
+    # Without `FromCallArgs` fields, the function is never inspected
+    assert get_fields_from_call_args_binder(list, None)((10,), {}) == {}  # pyright: ignore [reportArgumentType]
@@ -1,6 +1,10 @@
 """Tests the `_utils.get_fn_args` module."""
 
-from mirascope.core.base._utils._get_fn_args import get_fn_args
+import inspect
+
+import pytest
+
+from mirascope.core.base._utils._get_fn_args import get_fn_args, get_fn_args_binder
 
 
 def test_get_fn_args() -> None:
@@ -45,3 +49,42 @@ def test_get_fn_args() -> None:
         "d": {"5": "6"},
         "e": 7,
     }
+
+
+def test_get_fn_args_binder() -> None:
+    """Tests that the binder binds the same arguments as `inspect.Signature`."""
+
+    def fn(a: int, /, b: str = "b", *, c: int, d: int = 4, **kwargs) -> None:
+        """Dummy fn."""
+
+    def fn_no_kwargs(a: int, b: str = "b") -> None:
+        """Dummy fn."""
+
+    def fn_var_args(a: int, *args: int, b: str = "b") -> None:
+        """Dummy fn."""
+
+    cases = [
+        (fn, (1,), {"c": 3}),
+        (fn, (1, "2"), {"c": 3, "d": 5, "e": 6}),
+        (fn, (), {"b": "2"}),
+        (fn, (1,), {"a": 2, "c": 3}),
+        (fn_no_kwargs, (), {}),
+        (fn_no_kwargs, (1,), {"b": "2"}),
+        (fn_var_args, (1, 2, 3), {"b": "2"}),
+    ]
+    for dummy_fn, args, kwargs in cases:
+        bound_args = inspect.signature(dummy_fn).bind_partial(*args, **kwargs)
+        bound_args.apply_defaults()
+        expected = dict(bound_args.arguments)
+        expected |= expected.pop("kwargs", {})
+        assert get_fn_args_binder(dummy_fn)(args, kwargs) == expected
+
+    bind_fn_args = get_fn_args_binder(fn_no_kwargs)
+    with pytest.raises(TypeError, match="too many positional arguments"):
+        bind_fn_args((1, "2", 3), {})
+    with pytest.raises(TypeError, match="unexpected keyword argument 'c'"):
+        bind_fn_args((1,), {"c": 3})
+    with pytest.raises(TypeError, match="multiple values for argument 'a'"):
+        bind_fn_args((1,), {"a": 2})
+    with pytest.raises(TypeError, match="'a' parameter is positional only"):
+        get_fn_args_binder(fn)((), {"a": 1})
@@ -0,0 +1,15 @@
+"""Tests the `_utils.MessagesOnlyClient` class."""
+
+import pytest
+
+from mirascope.core.base._utils import MessagesOnlyClient
+
+
+def test_messages_only_client() -> None:
+    """Tests that the client stands in for any client but can't make requests."""
+    client = MessagesOnlyClient()
+    assert client.chat.completions.create is client
+    with pytest.raises(AttributeError):
+        _ = client.__name__  # pyright: ignore [reportAttributeAccessIssue]
+    with pytest.raises(RuntimeError, match="can't make requests"):
+        client.chat.completions.create(model="model")
@@ -4,7 +4,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from mirascope.core.base._utils._parse_content_template import parse_content_template
+from mirascope.core.base._utils._parse_content_template import (
+    format_text_template,
+    is_text_template,
+    parse_content_template,
+)
 from mirascope.core.base.message_param import (
     AudioPart,
     BaseMessageParam,
@@ -28,6 +32,22 @@ def test_parse_content_template() -> None:
     assert parse_content_template("user", template, values) == expected
 
 
+def test_text_template() -> None:
+    """Test the is_text_template and format_text_template functions."""
+    template = "This is a {var1} template with {var2} variables."
+    assert is_text_template(template)
+    assert not is_text_template("")
+    assert not is_text_template("{image:image}")
+    assert not is_text_template("Describe {image:image}")
+    values = {"var1": "test", "var2": "two", "empty": ""}
+    assert (
+        format_text_template(template, values)
+        == "This is a test template with two variables."
+    )
+    assert format_text_template(" {empty} ", values) is None
+    assert format_text_template("var1", values) == "test"
+
+
 @patch(
     "mirascope.core.base._utils._parse_content_template.open", new_callable=MagicMock
 )
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 
+from mirascope.core.base import BaseMessageParam
 from mirascope.core.base._utils._parse_prompt_messages import parse_prompt_messages
 
 
@@ -70,3 +71,35 @@ def test_parse_prompt_messages_invalid_messages() -> None:
             template="MESSAGES: {messages}",
             attrs={"messages": "not a list"},
         )
+
+
+def test_parse_prompt_messages_convert_text_message() -> None:
+    """Test converting text messages directly with `convert_text_message`."""
+
+    def convert_text_message(role: str, text: str) -> list[dict]:
+        return [{"role": role, "text": text}]
+
+    prompt_template = """
+    SYSTEM: You are a {role}.
+    USER: {query:image} Describe it.
+    ASSISTANT: {empty}
+    USER: Recommend a {genre} book.
+    """
+    attrs = {"role": "librarian", "query": b"", "empty": "", "genre": "fantasy"}
+    messages = parse_prompt_messages(
+        roles=["system", "user", "assistant"],
+        template=prompt_template,
+        attrs=attrs,
+        convert_text_message=convert_text_message,
+    )
+    assert messages == [
+        {"role": "system", "text": "You are a librarian."},
+        BaseMessageParam(role="user", content="Describe it."),
+        {"role": "user", "text": "Recommend a fantasy book."},
+    ]
+    assert parse_prompt_messages(
+        roles=["user"],
+        template="Recommend a {genre} book.",
+        attrs=attrs,
+        convert_text_message=convert_text_message,
+    ) == [{"role": "user", "text": "Recommend a fantasy book."}]
@@ -0,0 +1,44 @@
+"""Tests the `_utils.partial_tool_constructor` module."""
+
+from pydantic import Field
+from pydantic.json_schema import SkipJsonSchema
+
+from mirascope.core.base._utils._partial_tool_constructor import (
+    PartialToolConstructor,
+)
+from mirascope.core.base.tool import BaseTool
+
+
+class WriteFile(BaseTool):
+    """Writes content to a file."""
+
+    tool_call: SkipJsonSchema[str]
+    path: str
+    content: str = Field(..., max_length=5)
+
+    def call(self) -> None:
+        """Dummy call."""
+
+
+def test_partial_tool_constructor() -> None:
+    """Tests constructing partial tools from partially streamed arguments."""
+    construct_partial_tool = PartialToolConstructor[WriteFile]()
+    tool = construct_partial_tool(WriteFile, {"path": "a.py"}, "tool_call", '.py"')
+    assert isinstance(tool, WriteFile)
+    assert tool._name() == "WriteFile"
+    assert tool.path == "a.py"
+    assert tool.content is None
+    assert tool.tool_call == "tool_call"  # pyright: ignore [reportAttributeAccessIssue]
+    assert tool.delta == '.py"'
+
+    tool = construct_partial_tool(WriteFile, None, "tool_call", "{")
+    assert tool is not None and tool.path is None
+    assert len(construct_partial_tool._partial_tool_types) == 1
+
+    assert (
+        construct_partial_tool(
+            WriteFile, {"path": "a.py", "content": "too long"}, "tool_call", "g"
+        )
+        is None
+    )
+    assert WriteFile(tool_call="", path="a.py", content="").delta is None
@@ -0,0 +1,112 @@
+"""Tests the `_utils.streamed_json_object` module."""
+
+import json
+
+import pytest
+
+from mirascope.core.base._utils._streamed_json_object import StreamedJsonObject
+
+
+@pytest.mark.parametrize(
+    "fragments,complete",
+    [
+        (['{"title": "The Name', ' of the Wind"}'], [False, True]),
+        (['{"a": {"b": [1, ', "2]}", "}"], [False, False, True]),
+        (['{"a": "}', '{]"', "}"], [False, False, True]),
+        (['{"a": "\\', '"}"', "}"], [False, False, True]),
+        (['{"a": "\\\\', '"}'], [False, True]),
+        (["", "{}"], [False, True]),
+    ],
+)
+@pytest.mark.parametrize("partial", [False, True])
+def test_streamed_json_object(
+    fragments: list[str], complete: list[bool], partial: bool
+) -> None:
+    """Tests the `StreamedJsonObject` class."""
+    streamed_json_object = StreamedJsonObject(partial=partial)
+    assert [streamed_json_object.feed(fragment) for fragment in fragments] == complete
+    assert streamed_json_object.complete
+    assert streamed_json_object.text == "".join(fragments)
+    assert streamed_json_object.text == "".join(fragments)
+
+
+def test_streamed_json_object_partial_value() -> None:
+    """Tests incrementally parsing the partial value of a `StreamedJsonObject`."""
+    fragments = [
+        '{"path": "a.py", "content": "print(\\"',
+        'hi\\")\\n\\u00',
+        'e9", "lines": [1, 2',
+        ".5, true, nul",
+        'l, {"a": []}], "done": fals',
+        "e}",
+    ]
+    values = [
+        {"path": "a.py", "content": 'print("'},
+        {"path": "a.py", "content": 'print("hi")\n'},
+        {"path": "a.py", "content": 'print("hi")\n\u00e9', "lines": [1]},
+        {"path": "a.py", "content": 'print("hi")\n\u00e9', "lines": [1, 2.5, True]},
+        {
+            "path": "a.py",
+            "content": 'print("hi")\n\u00e9',
+            "lines": [1, 2.5, True, None, {"a": []}],
+        },
+        {
+            "path": "a.py",
+            "content": 'print("hi")\n\u00e9',
+            "lines": [1, 2.5, True, None, {"a": []}],
+            "done": False,
+        },
+    ]
+    streamed_json_object = StreamedJsonObject(partial=True)
+    for fragment, value in zip(fragments, values, strict=True):
+        streamed_json_object.feed(fragment)
+        assert streamed_json_object.value == value
+    assert streamed_json_object.complete
+
+    streamed_json_object = StreamedJsonObject(partial=True)
+    assert streamed_json_object.value is None
+    streamed_json_object.feed('"a\\')
+    assert streamed_json_object.value == "a"
+
+    with pytest.raises(ValueError, match="requires"):
+        _ = StreamedJsonObject().value
+
+
+def test_streamed_json_object_partial_value_snapshots() -> None:
+    """Tests that snapshots only copy the open containers of the partial value."""
+    streamed_json_object = StreamedJsonObject(partial=True)
+    streamed_json_object.feed('{"book": {"title": "The Name"}, "genres": ["fan')
+    first = streamed_json_object.value
+    streamed_json_object.feed('tasy", "adventure"], "summary": "\\ud83d')
+    second = streamed_json_object.value
+    assert first == {"book": {"title": "The Name"}, "genres": ["fan"]}
+    assert second == {
+        "book": {"title": "The Name"},
+        "genres": ["fantasy", "adventure"],
+        "summary": "",
+    }
+    assert second["book"] is first["book"]
+    assert second["genres"] is not first["genres"]
+
+    streamed_json_object.feed('\\ude00 \\u00e9\\\\ud83d"}')
+    third = streamed_json_object.value
+    assert third["summary"] == "\U0001f600 é\\ud83d"
+    assert third["genres"] is second["genres"]
+    assert third is streamed_json_object.value
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '"a \\ud83d\\ude00 \\\\ud83d\\\\ \\u00e9\\n\\"b\\""',
+        '"\\\\\\ud83d\\ude00\\ud83d\\ude00"',
+    ],
+)
+def test_streamed_json_object_partial_value_by_character(text: str) -> None:
+    """Tests that each snapshot of a string streamed by character is a prefix of it."""
+    expected = json.loads(text)
+    streamed_json_object = StreamedJsonObject(partial=True)
+    for char in text:
+        streamed_json_object.feed(char)
+        assert expected.startswith(streamed_json_object.value)
+    assert streamed_json_object.value == expected
@@ -0,0 +1,179 @@
+"""Tests the `BaseBatch` class."""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from functools import partial
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base._create import create_factory
+from mirascope.core.base.batch import (
+    BaseBatch,
+    BatchError,
+    BatchRequestError,
+    get_batch_request_handler,
+)
+from mirascope.integrations import middleware_factory
+from mirascope.retries.fallback import fallback
+
+
+class Batch(BaseBatch[str, Any]):
+    """A batch that completes its requests in memory."""
+
+    statuses: list[str]
+    submitted: dict[str, dict[str, Any]]
+
+    def _default_client(self) -> str:
+        return "default_client"
+
+    def _submit(self, requests: dict[str, dict[str, Any]]) -> str:
+        self.submitted = requests
+        return "batch_1"
+
+    def _retrieve_status(self) -> tuple[str, bool]:
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return status, status == "ended"
+
+    def _retrieve_results(self) -> dict[str, Any]:
+        return {
+            "fantasy": "The Name of the Wind",
+            "horror": BatchRequestError("horror", "Rate limited."),
+            "invalid": ValueError,
+        }
+
+
+def _recommend_book_call(clients: list) -> Any:  # noqa: ANN401
+    def setup_call(*, client: str, fn_args: dict, **kwargs: object) -> tuple:
+        clients.append(client)
+        return MagicMock(), None, [], None, {"genre": fn_args["genre"]}
+
+    def output_parser(response: MagicMock) -> str:
+        if response.response is ValueError:
+            raise ValueError("Invalid response")
+        return response.response
+
+    @partial(
+        create_factory(TCallResponse=MagicMock, setup_call=setup_call),  # pyright: ignore [reportArgumentType]
+        model="model",
+        tools=None,
+        output_parser=output_parser,
+        json_mode=False,
+        client="call_client",
+        call_params={},
+    )
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    return recommend_book
+
+
+def test_batch() -> None:
+    """Tests rendering, submitting, and parsing the calls of a batch."""
+    clients = []
+    batch = Batch(_recommend_book_call(clients), poll_interval=0)
+    batch.statuses = ["in_progress", "ended"]
+    assert batch.client == "default_client"
+    assert batch.add("fantasy", custom_id="fantasy") == "fantasy"
+    assert batch.add(genre="horror", custom_id="horror") == "horror"
+    assert batch.add("invalid", custom_id="invalid") == "invalid"
+    assert batch.add("mystery") == "request-3"
+    with pytest.raises(ValueError, match="Duplicate custom ID: fantasy"):
+        batch.add("fantasy", custom_id="fantasy")
+    with pytest.raises(BatchError, match="not been submitted"):
+        batch.poll()
+
+    results = batch.wait()
+    assert batch.submitted == {
+        "fantasy": {"genre": "fantasy"},
+        "horror": {"genre": "horror"},
+        "invalid": {"genre": "invalid"},
+        "request-3": {"genre": "mystery"},
+    }
+    assert batch.status == "ended"
+    assert results["fantasy"] == "The Name of the Wind"
+    assert str(results["horror"]) == "Request `horror` failed: Rate limited."
+    assert isinstance(results["invalid"], ValueError)
+    assert isinstance(results["request-3"], BatchRequestError)
+    assert "Not completed (status: ended)" in str(results["request-3"])
+    assert clients == ["default_client"] * 4
+    assert get_batch_request_handler() is None
+
+    with pytest.raises(BatchError, match="Cannot add requests"):
+        batch.add("fantasy")
+    with pytest.raises(BatchError, match="already been submitted as `batch_1`"):
+        batch.submit()
+
+
+def test_batch_results_do_not_call_again() -> None:
+    """Tests that results are parsed without calling the function or its middleware."""
+    clients = []
+    recommend_book = _recommend_book_call(clients)
+    calls = []
+
+    def middleware(genre: str) -> str:
+        calls.append(genre)
+        return recommend_book(genre)
+
+    batch = Batch(middleware, poll_interval=0)
+    batch.statuses = ["ended"]
+    batch.add("fantasy", custom_id="fantasy")
+    assert calls == ["fantasy"]
+    results = batch.wait()
+    assert results["fantasy"] == "The Name of the Wind"
+    assert calls == ["fantasy"]
+    assert clients == ["default_client"]
+
+
+def test_batch_request_is_not_an_error() -> None:
+    """Tests that adding a request doesn't go through error handling."""
+    events = []
+
+    @contextmanager
+    def context_manager(fn: Any) -> Generator[None, None, None]:  # noqa: ANN401
+        events.append("enter")
+        yield
+        events.append("exit")
+
+    def handle_error(e: Exception, fn: Any, context: None) -> None:  # noqa: ANN401
+        events.append("error")  # pragma: no cover
+
+    recommend_book = middleware_factory(
+        custom_context_manager=context_manager, handle_error=handle_error
+    )(fallback(_recommend_book_call([]), _recommend_book_call([])))
+    batch = Batch(recommend_book, poll_interval=0)
+    batch.statuses = ["ended"]
+    batch.add("fantasy", custom_id="fantasy")
+    assert events == ["enter", "exit"]
+    assert batch.wait()["fantasy"] == "The Name of the Wind"
+
+
+def test_batch_errors() -> None:
+    """Tests the errors of invalid batches."""
+
+    async def recommend_book_async(genre: str) -> str: ...  # pragma: no cover
+
+    with pytest.raises(ValueError, match="only support sync calls"):
+        Batch(recommend_book_async)
+
+    batch = Batch(lambda genre: MagicMock(), client="client")
+    with pytest.raises(ValueError, match="Only calls can be added"):
+        batch.add("fantasy")
+    with pytest.raises(BatchError, match="empty batch"):
+        batch.submit()
+    with pytest.raises(BatchError, match="has not finished"):
+        batch.results()
+
+    batch = Batch(_recommend_book_call([]), client="client", poll_interval=10)
+    batch.statuses = ["in_progress"]
+    batch.add("fantasy")
+    with (
+        patch("mirascope.core.base.batch.time.sleep") as mock_sleep,
+        patch("mirascope.core.base.batch.time.monotonic", side_effect=[0, 0, 10]),
+        pytest.raises(BatchError, match="did not finish within 15 seconds"),
+    ):
+        batch.wait(timeout=15)
+    mock_sleep.assert_called_once_with(10)
+    with pytest.raises(BatchError, match="has not finished"):
+        batch.results()
@@ -0,0 +1,196 @@
+"""Tests the `Budget` class."""
+
+import asyncio
+import threading
+
+import pytest
+
+from mirascope.core.base.budget import Budget, BudgetExceededError
+
+
+def test_budget_reserve_and_settle() -> None:
+    """Tests reserving and settling against a budget."""
+    budget = Budget(max_cost=1.0, max_tokens=100, name="job")
+    reservation = budget.reserve(0.5, 50)
+    assert (budget.reserved_cost, budget.reserved_tokens) == (0.5, 50)
+    with pytest.raises(BudgetExceededError, match="budget 'job'") as exc_info:
+        budget.reserve(0.6, 10)
+    assert exc_info.value.budget is budget
+    assert (exc_info.value.cost, exc_info.value.tokens) == (0.6, 10)
+
+    reservation.settle(0.2, 20)
+    reservation.settle(0.5, 50)  # settling twice is a no-op
+    assert (budget.spent_cost, budget.spent_tokens) == (0.2, 20)
+    assert (budget.reserved_cost, budget.reserved_tokens) == (0, 0)
+    assert (budget.average_cost, budget.average_tokens) == (0.2, 20)
+
+    budget.reserve(0.3, 30).settle()  # unknown usage spends the estimate
+    budget.reserve(0.3, 30).release()
+    assert budget.calls == 2
+    assert budget.spent_cost == pytest.approx(0.5)
+    assert budget.spent_tokens == 50
+
+
+def test_budget_no_limits() -> None:
+    """Tests that a budget without limits never rejects reservations."""
+    budget = Budget()
+    assert (budget.average_cost, budget.average_tokens) == (0, 0)
+    budget.reserve(1_000.0, 1_000_000).settle()
+    assert budget.calls == 1
+
+
+def test_budget_wait() -> None:
+    """Tests that waiting reservations are granted in order once others settle."""
+    budget = Budget(max_tokens=10, wait=True)
+    reservation = budget.reserve(tokens=5)
+    granted = []
+
+    def reserve(tokens: int) -> None:
+        granted.append(budget.reserve(tokens=tokens).tokens)
+
+    threads = [threading.Thread(target=reserve, args=(tokens,)) for tokens in (8, 2)]
+    for i, thread in enumerate(threads, start=1):
+        thread.start()
+        while len(budget._waiters) < i:
+            pass
+    assert [waiter.tokens for waiter in budget._waiters] == [8, 2]
+    reservation.settle(tokens=0)
+    for thread in threads:
+        thread.join()
+    assert sorted(granted) == [2, 8]
+    assert budget.reserved_tokens == 10
+
+
+def test_budget_wait_never_fits() -> None:
+    """Tests that waiting reservations fail once the spent usage leaves no room."""
+    budget = Budget(max_tokens=10, wait=True)
+    with pytest.raises(BudgetExceededError):
+        budget.reserve(tokens=11)
+
+    reservation = budget.reserve(tokens=5)
+    errors = []
+
+    def reserve() -> None:
+        try:
+            budget.reserve(tokens=8)
+        except BudgetExceededError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=reserve)
+    thread.start()
+    while not budget._waiters:
+        pass
+    reservation.settle(tokens=5)
+    thread.join()
+    assert len(errors) == 1
+
+
+def test_budget_wait_timeout() -> None:
+    """Tests that waiting reservations time out and leave the queue."""
+    budget = Budget(max_cost=1.0, wait=True, timeout=0.01)
+    reservation = budget.reserve(1.0)
+    with pytest.raises(BudgetExceededError):
+        budget.reserve(0.5)
+    assert not budget._waiters
+    reservation.release()
+    assert budget.reserve(1.0).cost == 1.0
+
+
+def test_budget_scope() -> None:
+    """Tests applying nested budgets to the current context."""
+    tenant, job = Budget(name="tenant"), Budget(name="job")
+    assert Budget.active() == ()
+    with tenant.scope():
+        with job.scope() as scoped:
+            assert scoped is job
+            assert Budget.active() == (tenant, job)
+        assert Budget.active() == (tenant,)
+    assert Budget.active() == ()
+
+
+@pytest.mark.asyncio
+async def test_budget_reserve_async() -> None:
+    """Tests that many concurrent tasks never exceed the budget together."""
+    budget = Budget(max_tokens=20, wait=True)
+    in_flight, peak = 0, 0
+
+    async def call() -> None:
+        nonlocal in_flight, peak
+        reservation = await budget.reserve_async(tokens=4)
+        in_flight += 4
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 4
+        reservation.settle(tokens=1)
+
+    await asyncio.gather(*(call() for _ in range(10)))
+    assert peak == 20
+    assert (budget.spent_tokens, budget.calls) == (10, 10)
+    assert budget.reserved_tokens == 0
+
+    with pytest.raises(BudgetExceededError):
+        await budget.reserve_async(tokens=11)
+
+
+@pytest.mark.asyncio
+async def test_budget_reserve_async_timeout_and_cancel() -> None:
+    """Tests that timed out and cancelled async reservations leave the queue."""
+    budget = Budget(max_cost=1.0, wait=True, timeout=0.01)
+    reservation = await budget.reserve_async(1.0)
+    with pytest.raises(BudgetExceededError):
+        await budget.reserve_async(0.5)
+    assert not budget._waiters
+
+    budget.timeout = None
+    task = asyncio.create_task(budget.reserve_async(0.5))
+    await asyncio.sleep(0)
+    assert len(budget._waiters) == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not budget._waiters
+
+    task = asyncio.create_task(budget.reserve_async(0.5))
+    await asyncio.sleep(0)
+    waiter = budget._waiters[0]
+    reservation.release()
+    assert waiter.reservation is not None
+    task.cancel()  # cancelled after being granted, so the reservation is released
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert budget.reserved_cost == 0
+
+
+@pytest.mark.asyncio
+async def test_budget_reserve_unestimated() -> None:
+    """Tests that reservations without an estimate are granted one at a time until a
+    call settles, and then reserve the usage of the largest call."""
+    budget = Budget(max_cost=1.0, max_tokens=100)
+    first = await budget.reserve_async(0.1, None)
+    assert (first.cost, first.tokens) == (0.1, 0)
+    assert budget.reserve(0.1, 10).tokens == 10  # estimated reservations aren't held
+    tasks = [asyncio.create_task(budget.reserve_async(None, None)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert len(budget._waiters) == 3
+
+    first.release()  # no usage to estimate from, so the next waiter goes alone
+    await asyncio.sleep(0)
+    second = await tasks[0]
+    assert len(budget._waiters) == 2
+    second.settle(0.2, 60)
+    assert (budget.max_call_cost, budget.max_call_tokens) == (0.2, 60)
+    with pytest.raises(BudgetExceededError):
+        await tasks[1]
+    with pytest.raises(BudgetExceededError):
+        await tasks[2]
+    assert not budget._waiters
+    assert budget.reserve(None, 20).cost == 0.2
+
+    budget = Budget(max_tokens=100)
+    first = budget.reserve(0, None)
+    budget.reserve(0, 50)
+    task = asyncio.create_task(budget.reserve_async(0, None))
+    await asyncio.sleep(0)
+    first.settle(0, 40)  # the estimate fits the spent tokens but not the reserved
+    with pytest.raises(BudgetExceededError):
+        await task
@@ -48,6 +48,8 @@ def test_call_factory_create(
         mock_create_factory.return_value,
         **create_kwargs,
         call_params=mock_call_factory_kwargs["default_call_params"],
+        priority=None,
+        retention="full",
     )
 
 
@@ -76,7 +78,19 @@ def test_call_factory_stream(
         handle_stream_async=mock_call_factory_kwargs["handle_stream_async"],
     )
     mock_partial.assert_called_once_with(
-        mock_stream_factory.return_value, **stream_kwargs
+        mock_stream_factory.return_value,
+        **stream_kwargs,
+        partial_tools=False,
+        priority=None,
+    )
+
+    mock_partial.reset_mock()
+    _ = call(stream={"partial_tools": True}, **stream_kwargs)
+    mock_partial.assert_called_once_with(
+        mock_stream_factory.return_value,
+        **stream_kwargs,
+        partial_tools=True,
+        priority=None,
     )
 
 
@@ -105,7 +119,10 @@ def test_call_factory_extract(
         get_json_output=mock_call_factory_kwargs["get_json_output"],
     )
     mock_partial.assert_called_once_with(
-        mock_extract_factory.return_value, **extract_kwargs
+        mock_extract_factory.return_value,
+        **extract_kwargs,
+        priority=None,
+        retention="full",
     )
 
 
@@ -138,7 +155,9 @@ def test_call_factory_structured_stream(
         get_json_output=mock_call_factory_kwargs["get_json_output"],
     )
     mock_partial.assert_called_once_with(
-        mock_structured_stream_factory.return_value, **structured_stream_kwargs
+        mock_structured_stream_factory.return_value,
+        **structured_stream_kwargs,
+        priority=None,
     )
 
 
@@ -151,3 +170,12 @@ def test_call_decorator_invalid_output_parser_with_stream(
         ValueError, match="Cannot use `output_parser` with `stream=True`"
     ):
         call("model", stream=True, output_parser=MagicMock())
+
+
+def test_call_decorator_invalid_retention_with_stream(
+    mock_call_factory_kwargs: dict,
+) -> None:
+    """Tests a ValueError is raised if `retention` is provided and `stream=True`."""
+    call = call_factory(**mock_call_factory_kwargs)
+    with pytest.raises(ValueError, match="Cannot use `retention` with `stream=True`"):
+        call("model", stream=True, retention="lean")
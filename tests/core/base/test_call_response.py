@@ -1,8 +1,14 @@
 """Tests the `call_response` module."""
 
+import threading
+from typing import cast
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from mirascope.core import Messages, fake, prompt_template
 from mirascope.core.base.call_response import BaseCallResponse
+from mirascope.core.base.client_pool import ClientPool
 
 
 def test_base_call_response() -> None:
@@ -32,3 +38,78 @@ def test_base_call_response() -> None:
     assert call_response.serialize_tool_types([tool], info=MagicMock()) == [
         {"type": "function", "name": "mock_tool"}
     ]
+    assert MyCallResponse._dump_response(b"content") == "Y29udGVudA=="
+    assert MyCallResponse._load_response({"content": "content"}) == {
+        "content": "content"
+    }
+
+
+def test_call_response_retention() -> None:
+    """Tests keeping less of the request context with `retention`."""
+    client = fake.FakeClient([fake.FakeResponse(content="Dune")] * 6)
+
+    def format_book(title: str) -> str:
+        """Returns the formatted book title."""
+        return title
+
+    @prompt_template("MESSAGES: {history} USER: Recommend a {genre} book")
+    def recommend_book(genre: str, history: list) -> None: ...
+
+    call = fake.call("fake-model", client=client, tools=[format_book])
+    history = [Messages.User("Hi")]
+    full = call(recommend_book)("fantasy", history)
+    lean = fake.call(
+        "fake-model", client=client, tools=[format_book], retention="lean"
+    )(recommend_book)("fantasy", history)
+    minimal = fake.call(
+        "fake-model", client=client, tools=[format_book], retention="minimal"
+    )(recommend_book)("fantasy", history)
+
+    assert "tools" in full.call_kwargs
+
+    assert "messages" not in lean.__dict__
+    assert lean.messages == full.messages
+    assert lean.call_kwargs == {"model": "fake-model"}
+    assert lean.fn_args == full.fn_args
+    assert lean.content == "Dune"
+    with pytest.raises(AttributeError):
+        _ = lean.missing  # pyright: ignore [reportAttributeAccessIssue]
+
+    # The messages are rebuilt from the arguments as they were when the call was made
+    history.append(Messages.Assistant("Hello"))
+    assert lean.messages == full.messages
+    assert len(lean.messages) == 2
+    history.pop()
+
+    @fake.call("fake-model", client=client, retention="lean")
+    @prompt_template("Recommend a {genre} book")
+    def recommend_locked_book(genre: str, lock: threading.Lock) -> None: ...
+
+    # Arguments that can't be copied keep the messages instead
+    lock = threading.Lock()
+    uncopyable = recommend_locked_book("fantasy", lock)
+    assert uncopyable.__dict__["messages"] == [
+        {"role": "user", "content": "Recommend a fantasy book"}
+    ]
+    assert uncopyable.fn_args["lock"] is lock
+
+    pool = ClientPool([client])
+    pooled = fake.call(
+        "fake-model", client=cast(fake.FakeClient, pool), retention="lean"
+    )
+    lean = pooled(recommend_book)("fantasy", history)
+    assert lean.messages == full.messages
+    assert pool.stats()["0"].requests == 1
+
+    @fake.call("fake-model", client=client, retention="lean")
+    def recommend_fantasy_book() -> Messages.Type:
+        return Messages.User("Recommend a fantasy book")
+
+    lean = recommend_fantasy_book()
+    assert lean.messages == [{"role": "user", "content": "Recommend a fantasy book"}]
+    assert lean.dynamic_config == {}
+
+    assert minimal.messages == []
+    assert minimal.call_kwargs == {"model": "fake-model"}
+    assert minimal.fn_args == {} and minimal.dynamic_config is None
+    assert minimal.user_message_param == full.user_message_param
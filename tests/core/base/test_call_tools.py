@@ -0,0 +1,210 @@
+"""Tests the `call_tools` module."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base.call_response import BaseCallResponse
+from mirascope.core.base.call_tools import (
+    call_tools,
+    call_tools_async,
+    get_tool_executor,
+)
+from mirascope.core.base.deadline import DeadlineExceededError, call_deadline
+from mirascope.core.base.stream import BaseStream
+from mirascope.core.base.tool import BaseTool
+
+
+class SleepTool(BaseTool):
+    """Sleeps and then returns the tool's value."""
+
+    value: str
+    seconds: float = 0.1
+
+    def call(self) -> str:
+        time.sleep(self.seconds)
+        return self.value
+
+
+class AsyncSleepTool(BaseTool):
+    """Sleeps asynchronously and then returns the tool's value."""
+
+    value: str
+    seconds: float = 0.1
+
+    async def call(self) -> str:
+        await asyncio.sleep(self.seconds)
+        return self.value
+
+
+_request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "request_id", default=None
+)
+
+
+class ContextTool(BaseTool):
+    """Returns the request id of the context it's called in."""
+
+    def call(self) -> str | None:
+        return _request_id.get()
+
+
+class ErrorTool(BaseTool):
+    """Raises an error."""
+
+    def call(self) -> str:
+        raise ValueError("error")
+
+
+def test_get_tool_executor() -> None:
+    """Tests that the tool executor is shared."""
+    assert get_tool_executor() is get_tool_executor()
+
+
+def test_call_tools() -> None:
+    """Tests that sync and async tools are called concurrently and in order."""
+    tools = [SleepTool(value="a"), AsyncSleepTool(value="b"), SleepTool(value="c")]
+    start = time.monotonic()
+    tools_and_outputs = call_tools(tools)
+    assert time.monotonic() - start < 0.25
+    assert tools_and_outputs == [(tools[0], "a"), (tools[1], "b"), (tools[2], "c")]
+
+
+def test_call_tools_errors() -> None:
+    """Tests error and timeout handling when calling tools."""
+    with pytest.raises(ValueError, match="error"):
+        call_tools([SleepTool(value="a"), ErrorTool()])
+
+    with pytest.raises(TimeoutError, match="`SleepTool` timed out"):
+        call_tools([SleepTool(value="a", seconds=0.2)], timeout=0.01)
+
+    tools = [
+        SleepTool(value="a", seconds=0.2),
+        ErrorTool(),
+        SleepTool(value="c", seconds=0),
+    ]
+    tools_and_outputs = call_tools(tools, timeout=0.1, return_exceptions=True)
+    assert isinstance(tools_and_outputs[0][1], TimeoutError)
+    assert isinstance(tools_and_outputs[1][1], ValueError)
+    assert tools_and_outputs[2] == (tools[2], "c")
+
+    with call_deadline(0.01), pytest.raises(DeadlineExceededError, match="deadline"):
+        call_tools([SleepTool(value="a", seconds=0.2)], timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_call_tools_context() -> None:
+    """Tests that sync tools run in the context of the caller."""
+    token = _request_id.set("request")
+    try:
+        assert call_tools([ContextTool()])[0][1] == "request"
+        assert (await call_tools_async([ContextTool()]))[0][1] == "request"
+    finally:
+        _request_id.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_call_tools_async() -> None:
+    """Tests that sync and async tools are called concurrently and in order."""
+    tools = [SleepTool(value="a"), AsyncSleepTool(value="b"), SleepTool(value="c")]
+    start = time.monotonic()
+    tools_and_outputs = await call_tools_async(tools)
+    assert time.monotonic() - start < 0.25
+    assert tools_and_outputs == [(tools[0], "a"), (tools[1], "b"), (tools[2], "c")]
+
+
+@pytest.mark.asyncio
+async def test_call_tools_async_max_concurrency() -> None:
+    """Tests that the number of concurrently running tools is capped."""
+    lock, running, max_running = threading.Lock(), [0], [0]
+
+    class CountingTool(BaseTool):
+        async def call(self) -> None:
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            await asyncio.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+    await call_tools_async([CountingTool() for _ in range(6)], max_concurrency=2)
+    assert max_running[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_call_tools_async_errors() -> None:
+    """Tests error and timeout handling when calling tools asynchronously."""
+    with pytest.raises(ValueError, match="error"):
+        await call_tools_async([AsyncSleepTool(value="a"), ErrorTool()])
+
+    with pytest.raises(TimeoutError, match="`AsyncSleepTool` timed out"):
+        await call_tools_async([AsyncSleepTool(value="a")], timeout=0.01)
+
+    tools = [AsyncSleepTool(value="a"), ErrorTool(), SleepTool(value="c", seconds=0)]
+    tools_and_outputs = await call_tools_async(
+        tools, max_concurrency=1, timeout=0.05, return_exceptions=True
+    )
+    assert isinstance(tools_and_outputs[0][1], TimeoutError)
+    assert isinstance(tools_and_outputs[1][1], ValueError)
+    assert tools_and_outputs[2] == (tools[2], "c")
+
+    with call_deadline(0.01), pytest.raises(DeadlineExceededError, match="deadline"):
+        await call_tools_async([AsyncSleepTool(value="a")])
+
+
+@patch.multiple(BaseCallResponse, __abstractmethods__=set())
+@pytest.mark.asyncio
+async def test_call_response_call_tools() -> None:
+    """Tests the `call_tools` methods of `BaseCallResponse`."""
+    tools = [SleepTool(value="a", seconds=0), AsyncSleepTool(value="b", seconds=0)]
+    with patch.object(BaseCallResponse, "tools", tools):
+        call_response = BaseCallResponse(
+            metadata={},
+            response="",
+            tool_types=None,
+            prompt_template="",
+            fn_args={},
+            dynamic_config=None,
+            messages=[],
+            call_params={},
+            call_kwargs={},
+            user_message_param=None,
+            start_time=0,
+            end_time=0,
+        )  # type: ignore
+        expected = [(tools[0], "a"), (tools[1], "b")]
+        assert call_response.call_tools() == expected
+        assert await call_response.call_tools_async(max_concurrency=1) == expected
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+@pytest.mark.asyncio
+async def test_stream_call_tools() -> None:
+    """Tests the `call_tools` methods of `BaseStream`."""
+    BaseStream._construct_message_param = MagicMock()
+    tools = [SleepTool(value="a", seconds=0), AsyncSleepTool(value="b", seconds=0)]
+    chunk = MagicMock(content="", input_tokens=None, output_tokens=None)
+    stream = BaseStream(
+        stream=((chunk, tool) for tool in [tools[0], None, tools[1]]),
+        metadata={},
+        tool_types=[],
+        call_response_type=MagicMock,
+        model="model",
+        prompt_template="prompt_template",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )  # type: ignore
+    assert stream.call_tools() == []
+    for _ in stream:
+        pass
+    expected = [(tools[0], "a"), (tools[1], "b")]
+    assert stream.tools == tools
+    assert stream.call_tools() == expected
+    assert await stream.call_tools_async() == expected
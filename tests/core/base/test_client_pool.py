@@ -0,0 +1,273 @@
+"""Tests the `ClientPool` class."""
+
+from collections.abc import AsyncGenerator, Generator
+from functools import partial
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base._create import create_factory
+from mirascope.core.base.client_pool import (
+    ClientPool,
+    get_status_code,
+    is_overloaded_error,
+    pool_setup_call,
+)
+from mirascope.core.base.stream import stream_factory
+
+
+class APIStatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+
+def test_get_status_code() -> None:
+    """Tests getting the status code of provider SDK errors."""
+    assert get_status_code(APIStatusError(429)) == 429
+    error = Exception()
+    error.response = MagicMock(status_code=503)  # pyright: ignore [reportAttributeAccessIssue]
+    assert get_status_code(error) == 503
+    error.response = {"ResponseMetadata": {"HTTPStatusCode": 500}}  # pyright: ignore [reportAttributeAccessIssue]
+    assert get_status_code(error) == 500
+    error.response = {}  # pyright: ignore [reportAttributeAccessIssue]
+    assert get_status_code(error) is None
+    assert get_status_code(ValueError()) is None
+
+    assert is_overloaded_error(APIStatusError(429))
+    assert is_overloaded_error(APIStatusError(502))
+    assert not is_overloaded_error(APIStatusError(400))
+    assert not is_overloaded_error(ValueError())
+
+
+def test_client_pool_round_robin() -> None:
+    """Tests smooth weighted round-robin selection."""
+    pool = ClientPool({"a": "client_a", "b": "client_b"}, weights={"a": 2})
+    leases = [pool.acquire() for _ in range(6)]
+    assert [lease.name for lease in leases] == ["a", "b", "a", "a", "b", "a"]
+    assert leases[0].client == "client_a"
+    for lease in leases:
+        lease.release()
+        lease.release()  # releasing twice is a no-op
+    stats = pool.stats()
+    assert stats["a"].requests == 4
+    assert stats["b"].requests == 2
+    assert stats["a"].outstanding == stats["b"].outstanding == 0
+
+
+def test_client_pool_least_outstanding() -> None:
+    """Tests least-outstanding-requests selection."""
+    pool = ClientPool(["a", "b"], weights=[1, 2], strategy="least_outstanding")
+    leases = [pool.acquire() for _ in range(3)]
+    assert [lease.client for lease in leases] == ["a", "b", "b"]
+    leases[0].release()
+    assert pool.acquire().client == "a"
+
+
+def test_client_pool_ejection() -> None:
+    """Tests ejecting clients after rate limit and server errors."""
+    pool = ClientPool({"a": "a", "b": "b"}, cooldown=10)
+    with patch("mirascope.core.base.client_pool.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100
+        pool.acquire().release(APIStatusError(429))
+        assert [pool.acquire().client for _ in range(2)] == ["b", "b"]
+        pool.acquire().release(APIStatusError(400))  # not ejected
+        mock_monotonic.return_value = 105
+        pool.acquire().release(APIStatusError(500))
+        # Every client is ejected, so the client that rejoins first is used
+        assert pool.acquire().client == "a"
+        stats = pool.stats()
+        assert stats["a"].ejected_for == 5
+        assert (stats["b"].failures, stats["b"].ejections) == (2, 1)
+        mock_monotonic.return_value = 115
+        assert pool.stats()["a"].ejected_for == 0
+        assert {pool.acquire().client for _ in range(2)} == {"a", "b"}
+
+
+def test_client_pool_validation() -> None:
+    """Tests validating the clients and weights of a pool."""
+    with pytest.raises(ValueError, match="at least one client"):
+        ClientPool([])
+    with pytest.raises(ValueError, match="must be positive"):
+        ClientPool(["a"], weights=[0])
+
+
+def test_pool_setup_call() -> None:
+    """Tests setting up calls and streams with a client from the pool."""
+    client = MagicMock()
+    client.create.return_value = "response"
+    client.stream.return_value = iter(["chunk"])
+
+    def setup_call(*, client: Any, fn: object, **kwargs: object) -> tuple:
+        def create(*, stream: bool = False, **kwargs: object) -> object:
+            return client.stream(**kwargs) if stream else client.create(**kwargs)
+
+        return create, "template", [], None, {}
+
+    pool = ClientPool([client])
+    pooled_setup_call = pool_setup_call(setup_call)
+    assert pooled_setup_call(client=client, fn=lambda: None)[1] == "template"
+
+    create, *_ = pooled_setup_call(client=pool, fn=lambda: None)
+    assert create(stream=False) == "response"
+    create, *_ = pooled_setup_call(client=pool, fn=lambda: None)
+    stream = create(stream=True)
+    assert pool.stats()["0"].outstanding == 1
+    assert list(stream) == ["chunk"]
+    assert pool.stats()["0"].outstanding == 0
+
+    client.create.side_effect = APIStatusError(503)
+    create, *_ = pooled_setup_call(client=pool, fn=lambda: None)
+    with pytest.raises(APIStatusError):
+        create(stream=False)
+
+    def failing_stream() -> Generator:
+        yield "chunk"
+        raise APIStatusError(500)
+
+    client.stream.return_value = failing_stream()
+    create, *_ = pooled_setup_call(client=pool, fn=lambda: None)
+    with pytest.raises(APIStatusError):
+        list(create(stream=True))
+
+    def failing_setup_call(**kwargs: object) -> tuple:
+        raise ValueError("Invalid call")
+
+    with pytest.raises(ValueError):
+        pool_setup_call(failing_setup_call)(client=pool, fn=lambda: None)
+    stats = pool.stats()["0"]
+    assert (stats.requests, stats.failures, stats.outstanding) == (4, 2, 0)
+
+
+def test_pool_setup_call_unsent_request() -> None:
+    """Tests that a call whose request is never sent doesn't hold a client."""
+
+    def setup_call(*, client: Any, fn: object, **kwargs: object) -> tuple:
+        def create(*, stream: bool = False, **kwargs: object) -> object:
+            return iter(["chunk"]) if stream else "response"
+
+        return create, None, [], None, {}
+
+    pool = ClientPool(["a", "b"])
+    pooled_setup_call = pool_setup_call(setup_call)
+    pooled_setup_call(client=pool, fn=lambda: None)
+    create, *_ = pooled_setup_call(client=pool, fn=lambda: None)
+    stats = pool.stats()
+    assert stats["0"].requests == stats["1"].requests == 0
+    assert stats["0"].outstanding == stats["1"].outstanding == 0
+
+    assert create(stream=False) == "response"
+    stats = pool.stats()
+    assert (stats["1"].requests, stats["1"].outstanding) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_pool_setup_call_async() -> None:
+    """Tests setting up async calls and streams with a client from the pool."""
+
+    async def stream() -> AsyncGenerator:
+        yield "chunk"
+
+    async def failing_stream() -> AsyncGenerator:
+        yield "chunk"
+        raise APIStatusError(500)
+
+    def setup_call(*, client: Any, fn: object, **kwargs: object) -> tuple:
+        async def create(*, stream: bool = False, **kwargs: object) -> object:
+            if client == "failing":
+                raise APIStatusError(429)
+            return client() if stream else "response"
+
+        return create, None, [], None, {}
+
+    async def fn() -> None: ...
+
+    pooled_setup_call = pool_setup_call(setup_call)
+    pool = ClientPool([stream])
+    create, *_ = pooled_setup_call(client=pool, fn=fn)
+    assert await create(stream=False) == "response"
+    create, *_ = pooled_setup_call(client=pool, fn=fn)
+    assert [chunk async for chunk in await create(stream=True)] == ["chunk"]
+
+    pool = ClientPool(["failing", failing_stream])
+    create, *_ = pooled_setup_call(client=pool, fn=fn)
+    with pytest.raises(APIStatusError):
+        await create(stream=False)
+    create, *_ = pooled_setup_call(client=pool, fn=fn)
+    with pytest.raises(APIStatusError):
+        _ = [chunk async for chunk in await create(stream=True)]
+    stats = pool.stats()
+    assert stats["0"].ejections == stats["1"].ejections == 1
+    assert stats["0"].outstanding == stats["1"].outstanding == 0
+
+
+def test_create_factory_with_client_pool() -> None:
+    """Tests that calls made with a pool use a client chosen by the pool."""
+    clients = []
+
+    def setup_call(*, client: str, **kwargs: object) -> tuple:
+        clients.append(client)
+        return lambda **kwargs: MagicMock(), None, [], None, {}
+
+    pool = ClientPool(["a", "b"])
+
+    @partial(
+        create_factory(TCallResponse=MagicMock, setup_call=setup_call),  # pyright: ignore [reportArgumentType]
+        model="model",
+        tools=None,
+        output_parser=None,
+        json_mode=False,
+        client=pool,
+        call_params={},
+    )
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    recommend_book("fantasy")
+    recommend_book("fantasy")
+    assert clients == ["a", "b"]
+    assert pool.stats()["1"].requests == 1
+
+
+def test_stream_factory_with_client_pool() -> None:
+    """Tests that a stream only holds a client from the pool while it is iterated."""
+
+    def setup_call(*, client: str, **kwargs: object) -> tuple:
+        def create(*, stream: bool = False, **kwargs: object) -> object:
+            return iter(["chunk"])
+
+        return create, None, [], None, {}
+
+    def handle_stream(
+        stream: Generator, tool_types: Any, partial_tools: bool = False
+    ) -> Generator[tuple[Any, None], None, None]:
+        for chunk in stream:
+            yield chunk, None
+
+    pool = ClientPool(["a"])
+
+    @partial(
+        stream_factory(
+            TCallResponse=MagicMock,
+            TStream=MagicMock,
+            setup_call=setup_call,  # pyright: ignore [reportArgumentType]
+            handle_stream=handle_stream,
+            handle_stream_async=MagicMock(),
+        ),
+        model="model",
+        tools=None,
+        json_mode=False,
+        client=pool,
+        call_params={},
+    )
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    recommend_book("fantasy")
+    assert (pool.stats()["0"].requests, pool.stats()["0"].outstanding) == (0, 0)
+    stream = recommend_book("fantasy").stream
+    assert isinstance(stream, Generator)
+    assert next(stream) == ("chunk", None)
+    assert (pool.stats()["0"].requests, pool.stats()["0"].outstanding) == (1, 1)
+    assert list(stream) == []
+    assert (pool.stats()["0"].requests, pool.stats()["0"].outstanding) == (1, 0)
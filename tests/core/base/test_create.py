@@ -174,6 +174,14 @@ def test_create_factory_sync_dynamic_config_cases(
     # Other asserts as in previous test
     mock_create.assert_called_once_with(stream=False, **mock_call_kwargs)
 
+    # The dynamic client is only used for the call that configured it
+    mock_get_dynamic_configuration.return_value = None
+    decorated_fn("fantasy", topic="magic")  # type: ignore
+    assert (
+        mock_setup_call.call_args.kwargs["client"]
+        == mock_create_decorator_kwargs["client"]
+    )
+
 
 @patch("mirascope.core.base._create.prompt_template", new_callable=MagicMock)
 @patch(
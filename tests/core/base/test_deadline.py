@@ -0,0 +1,216 @@
+"""Tests the `deadline` module."""
+
+import asyncio
+from collections.abc import AsyncGenerator, Generator
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base._create import create_factory
+from mirascope.core.base.client_pool import ClientPool
+from mirascope.core.base.deadline import (
+    DeadlineExceededError,
+    call_deadline,
+    check_deadline,
+    limit_stream,
+    limit_stream_async,
+    limit_timeout,
+    remaining_time,
+    wait_for_deadline,
+    with_timeout_kwargs,
+)
+from mirascope.core.base.stream import stream_factory
+from mirascope.core.openai import OpenAICallResponse
+
+
+def test_call_deadline() -> None:
+    """Tests setting nested deadlines and reading the remaining time."""
+    assert remaining_time() is None
+    assert limit_timeout(5) == 5
+    with patch("mirascope.core.base.deadline.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100
+        with call_deadline(10) as deadline:
+            assert deadline == 110
+            with call_deadline(20) as inner_deadline:
+                assert inner_deadline == 110
+            with call_deadline(5):
+                assert remaining_time() == 5
+            assert limit_timeout(None) == 10
+            assert limit_timeout(3) == 3
+            check_deadline()
+            mock_monotonic.return_value = 111
+            assert remaining_time() == 0
+            with pytest.raises(DeadlineExceededError):
+                check_deadline()
+    assert remaining_time() is None
+
+
+def test_with_timeout_kwargs() -> None:
+    """Tests translating the deadline into per-request SDK timeouts."""
+    call_kwargs = {"model": "gpt-4o-mini"}
+    assert with_timeout_kwargs(call_kwargs, OpenAICallResponse) is call_kwargs
+    with patch("mirascope.core.base.deadline.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100
+        with call_deadline(2.5):
+            assert with_timeout_kwargs(call_kwargs, OpenAICallResponse) == {
+                "model": "gpt-4o-mini",
+                "timeout": 2.5,
+            }
+            cohere_response = MagicMock(_provider="cohere")
+            assert with_timeout_kwargs({}, cohere_response) == {
+                "request_options": {"timeout_in_seconds": 3}
+            }
+            assert with_timeout_kwargs(call_kwargs, MagicMock) is call_kwargs
+            mock_monotonic.return_value = 103
+            with pytest.raises(DeadlineExceededError):
+                with_timeout_kwargs(call_kwargs, OpenAICallResponse)
+
+
+def test_limit_stream() -> None:
+    """Tests closing a stream once the deadline passes."""
+    closed = []
+
+    def generator() -> Generator[int, None, None]:
+        try:
+            yield from range(3)
+        finally:
+            closed.append(True)
+
+    assert list(limit_stream(generator())) == [0, 1, 2]
+    with call_deadline(10):
+        assert list(limit_stream(iter([0, 1]))) == [0, 1]
+
+    with patch("mirascope.core.base.deadline.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100
+        with call_deadline(10):
+            stream = limit_stream(generator())
+            assert next(stream) == 0
+            mock_monotonic.return_value = 110
+            with pytest.raises(DeadlineExceededError):
+                next(stream)
+    assert closed == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_limit_stream_async() -> None:
+    """Tests closing an async stream that doesn't finish before the deadline."""
+    closed = []
+
+    async def generator(delay: float) -> AsyncGenerator[int, None]:
+        try:
+            for i in range(2):
+                await asyncio.sleep(delay * i)
+                yield i
+        finally:
+            closed.append(True)
+
+    assert [chunk async for chunk in limit_stream_async(generator(0))] == [0, 1]
+    with call_deadline(1):
+        assert [chunk async for chunk in limit_stream_async(generator(0))] == [0, 1]
+        assert closed == [True, True]
+
+    class Stream:
+        def __init__(self) -> None:
+            self.iterator = generator(5)
+
+        def __aiter__(self) -> AsyncGenerator[int, None]:
+            return self.iterator
+
+        async def close(self) -> None:
+            closed.append("close")
+
+    with call_deadline(0.05):
+        chunks = []
+        with pytest.raises(DeadlineExceededError):
+            async for chunk in limit_stream_async(Stream()):
+                chunks.append(chunk)
+    assert chunks == [0]
+    assert closed[-2:] == [True, "close"]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_deadline() -> None:
+    """Tests cancelling an awaitable once the deadline passes."""
+    assert await wait_for_deadline(asyncio.sleep(0, "result")) == "result"
+    with call_deadline(0.05):
+        assert await wait_for_deadline(asyncio.sleep(0, "result")) == "result"
+        with pytest.raises(DeadlineExceededError):
+            await wait_for_deadline(asyncio.sleep(5))
+
+
+class MockCallResponse(MagicMock):
+    _provider = "openai"
+
+
+def test_create_and_stream_factory_with_deadline() -> None:
+    """Tests that calls and streams pass the remaining time as a timeout."""
+    requests = []
+
+    def setup_call(**kwargs: object) -> tuple:
+        def create(*, stream: bool, **kwargs: object) -> object:
+            requests.append(kwargs)
+            return iter(["chunk"]) if stream else MagicMock()
+
+        return create, None, [], None, {"model": "model"}
+
+    def handle_stream(stream: object, tool_types: object, **kwargs: object) -> object:
+        for chunk in stream:  # pyright: ignore [reportGeneralTypeIssues]
+            yield chunk, None
+
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    kwargs = {"model": "model", "tools": None, "json_mode": False, "client": None}
+    call = partial(
+        create_factory(TCallResponse=MockCallResponse, setup_call=setup_call),  # pyright: ignore [reportArgumentType]
+        output_parser=None,
+        call_params={},
+        **kwargs,
+    )(recommend_book)
+    stream = partial(
+        stream_factory(
+            TCallResponse=MockCallResponse,
+            TStream=MagicMock,
+            setup_call=setup_call,  # pyright: ignore [reportArgumentType]
+            handle_stream=handle_stream,  # pyright: ignore [reportArgumentType]
+            handle_stream_async=MagicMock(),
+        ),
+        call_params={},
+        **kwargs,
+    )(recommend_book)
+
+    with (
+        patch("mirascope.core.base.deadline.time.monotonic", return_value=100),
+        call_deadline(4),
+    ):
+        call("fantasy")
+        assert list(stream("fantasy").stream) == [("chunk", None)]  # pyright: ignore [reportArgumentType]
+    assert requests == [{"model": "model", "timeout": 4}] * 2
+
+
+@pytest.mark.asyncio
+async def test_create_factory_with_exceeded_deadline() -> None:
+    """Tests that calls past the deadline raise before setting up the call."""
+    setup_call = MagicMock()
+    pool = ClientPool(["a"])
+    kwargs = {"model": "model", "tools": None, "json_mode": False, "client": pool}
+    factory = create_factory(TCallResponse=MockCallResponse, setup_call=setup_call)
+
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    async def recommend_book_async(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    call = partial(factory, output_parser=None, call_params={}, **kwargs)
+    with (
+        patch("mirascope.core.base.deadline.time.monotonic", return_value=100),
+        call_deadline(0),
+    ):
+        with pytest.raises(DeadlineExceededError):
+            call(recommend_book)("fantasy")
+        with pytest.raises(DeadlineExceededError):
+            await call(recommend_book_async)("fantasy")
+    setup_call.assert_not_called()
+    assert pool.stats()["0"].outstanding == 0
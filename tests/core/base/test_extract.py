@@ -77,6 +77,8 @@ def test_extract_factory_sync(
         json_mode=mock_extract_decorator_kwargs["json_mode"],
         client=mock_extract_decorator_kwargs["client"],
         call_params=mock_extract_decorator_kwargs["call_params"],
+        priority=None,
+        retention="full",
     )
     mock_create_inner.assert_called_once_with(genre="fantasy", topic="magic")
     mock_get_json_output.assert_called_once_with(
@@ -146,6 +148,8 @@ async def test_extract_factory_async(
         json_mode=mock_extract_decorator_kwargs["json_mode"],
         client=mock_extract_decorator_kwargs["client"],
         call_params=mock_extract_decorator_kwargs["call_params"],
+        priority=None,
+        retention="full",
     )
     mock_get_json_output.assert_called_once_with(
         mock_create_inner.return_value, mock_extract_decorator_kwargs["json_mode"]
@@ -0,0 +1,95 @@
+"""Tests for the `ledger` module."""
+
+import threading
+from unittest.mock import MagicMock
+
+from mirascope.core.base.ledger import CostLedger, LedgerEntry, LedgerUsage
+
+
+def test_cost_ledger() -> None:
+    """Tests recording calls in the ledger and exporting snapshots."""
+    ledger = CostLedger()
+    ledger.record("openai", "gpt-4o-mini", 10, 5, 0.5, "a", {"y", "x"})
+    ledger.record("openai", "gpt-4o-mini", 10, 5, 0.25, "a", ["x", "y"])
+    ledger.record("anthropic", "claude-3-5-sonnet", None, None, None)
+
+    response = MagicMock(
+        _provider="openai",
+        model="gpt-4o",
+        input_tokens=1,
+        output_tokens=2,
+        cost=0.125,
+        metadata={"tags": {"x"}},
+    )
+    fn = MagicMock(__name__="b")
+    ledger.record_response(response, fn)
+
+    snapshot = ledger.snapshot()
+    assert snapshot.entries == [
+        LedgerEntry(
+            provider="openai",
+            model="gpt-4o-mini",
+            function="a",
+            tags=("x", "y"),
+            calls=2,
+            input_tokens=20,
+            output_tokens=10,
+            cost=0.75,
+        ),
+        LedgerEntry(
+            provider="anthropic",
+            model="claude-3-5-sonnet",
+            function="",
+            calls=1,
+            unpriced_calls=1,
+        ),
+        LedgerEntry(
+            provider="openai",
+            model="gpt-4o",
+            function="b",
+            tags=("x",),
+            calls=1,
+            input_tokens=1,
+            output_tokens=2,
+            cost=0.125,
+        ),
+    ]
+    assert snapshot.total() == LedgerUsage(
+        calls=4, unpriced_calls=1, input_tokens=21, output_tokens=12, cost=0.875
+    )
+    assert snapshot.group_by("provider") == {
+        "openai": LedgerUsage(calls=3, input_tokens=21, output_tokens=12, cost=0.875),
+        "anthropic": LedgerUsage(calls=1, unpriced_calls=1),
+    }
+    assert snapshot.group_by("tag") == {
+        "x": LedgerUsage(calls=3, input_tokens=21, output_tokens=12, cost=0.875),
+        "y": LedgerUsage(calls=2, input_tokens=20, output_tokens=10, cost=0.75),
+    }
+    assert set(snapshot.group_by("function")) == {"a", "", "b"}
+
+    ledger.record("openai", "gpt-4o", 1, 1, 1)
+    assert snapshot.total().calls == 4
+    assert ledger.reset().total().calls == 5
+    assert ledger.snapshot().entries == []
+
+    response.metadata = {}
+    ledger.record_response(response)
+    assert ledger.snapshot().entries[0].function == ""
+
+
+def test_cost_ledger_threads() -> None:
+    """Tests recording calls in the ledger from many threads at once."""
+    ledger = CostLedger()
+
+    def record() -> None:
+        for _ in range(1000):
+            ledger.record("openai", "gpt-4o-mini", 1, 2, 0.5)
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert ledger.snapshot().total() == LedgerUsage(
+        calls=8000, input_tokens=8000, output_tokens=16000, cost=4000
+    )
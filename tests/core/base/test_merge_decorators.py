@@ -205,3 +205,41 @@ def test_metadata_preservation():
     assert func.__doc__ == "Convert int to str."
     assert func.__name__ == "func"
     assert func(16) == "16"
+
+
+def test_decorators_applied_once():
+    """Test that the decorators are applied once at decoration time."""
+    import asyncio
+    from functools import wraps
+
+    applications: list[str] = []
+
+    def counting_decorator(f: Callable) -> Callable:
+        applications.append("counting")
+
+        @wraps(f)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            return f(*args, **kwargs)
+
+        return wrapper
+
+    def async_decorator(f: Callable) -> Callable:
+        applications.append("async")
+
+        async def wrapper(*args: object, **kwargs: object) -> object:
+            return await f(*args, **kwargs)
+
+        return wrapper
+
+    merged = merge_decorators(counting_decorator, async_decorator)()
+
+    @merged
+    async def func(x: int) -> int:
+        """Async test function."""
+        return x
+
+    assert applications == ["async", "counting"]
+    assert [asyncio.run(func(i)) for i in range(3)] == [0, 1, 2]
+    assert applications == ["async", "counting"]
+    assert asyncio.iscoroutinefunction(func.__wrapped__)  # pyright: ignore [reportFunctionMemberAccess]
+    assert func.__name__ == "func"
@@ -0,0 +1,84 @@
+"""Tests for the `pricing` module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mirascope.core.base.pricing import ModelPricing, PricingRegistry, pricing_registry
+
+
+def test_model_pricing_calculate_cost() -> None:
+    """Tests calculating the cost of a call with a model's pricing."""
+    pricing = ModelPricing(input=1, output=2, cached_input=0.5, cache_write=1.5)
+    assert pricing.calculate_cost(10, 5) == 20
+    assert pricing.calculate_cost(10, 5, 4, 2) == 25
+    assert ModelPricing(input=1, output=2).calculate_cost(10, 5, 4, 2) == 26
+
+    pricing = ModelPricing(
+        input=1,
+        output=2,
+        unit_size=10,
+        long_context_threshold=100,
+        long_context_input=2,
+        long_context_output=4,
+    )
+    assert pricing.calculate_cost(10, 5, context_length=100) == 2
+    assert pricing.calculate_cost(10, 5, context_length=101) == 4
+    pricing.long_context_input = None
+    assert pricing.calculate_cost(10, 5, context_length=101) is None
+
+
+@pytest.mark.parametrize(
+    "provider,model,expected",
+    [
+        ("openai", "gpt-4o-mini", 1.5e-07),
+        ("openai", "gpt-4o-mini-2024-07-18", 1.5e-07),
+        ("openai", "gpt-4o-2024-08-06", 2.5e-06),
+        ("openai", "gpt-4o-2024-05-13", 5e-06),
+        ("openai", "chatgpt-4o-latest", 2.5e-06),
+        ("openai", "gpt-3.5-turbo-0613", 5e-07),
+        ("openai", "gpt-4omega", None),
+        ("anthropic", "claude-3-5-sonnet-20241022", 3e-06),
+        ("anthropic", "claude-3-haiku@20240307", 2.5e-06),
+        ("anthropic", "anthropic.claude-3-opus-20240229-v1:0", 1.5e-05),
+        ("vertex", "models/gemini-1.5-flash-002", 1.875e-05),
+        ("gemini", "gemini-1.5-flash", None),
+        ("unknown", "gpt-4o", None),
+    ],
+)
+def test_pricing_registry_lookup(
+    provider: str, model: str, expected: float | None
+) -> None:
+    """Tests looking up models by exact name, alias, and prefix."""
+    pricing = pricing_registry.lookup(provider, model)
+    assert (pricing.input if pricing else None) == expected
+
+
+def test_pricing_registry_overrides(tmp_path: Path) -> None:
+    """Tests overriding the registry's prices at runtime."""
+    registry = PricingRegistry()
+    assert registry.calculate_cost("openai", "gpt-4o-mini", None, 1) is None
+    assert registry.calculate_cost("openai", "my-model", 1, 1) is None
+
+    registry.register("openai", "my-model", ModelPricing(input=1, output=2))
+    assert registry.calculate_cost("openai", "my-model-v2", 1, 1) == 3
+    registry.register_alias("openai", "my-alias", "my-model")
+    assert registry.calculate_cost("openai", "my-alias", 1, 1) == 3
+    registry.register("openai", "my-model", {"input": 2, "output": 2})
+    assert registry.calculate_cost("openai", "my-alias", 1, 1) == 4
+
+    path = tmp_path / "pricing.json"
+    path.write_text(
+        json.dumps({"openai": {"models": {"gpt-4o": {"input": 1, "output": 1}}}})
+    )
+    registry.load(path)
+    assert registry.calculate_cost("openai", "gpt-4o-2024-08-06", 1, 1) == 2
+    assert registry.lookup("openai", "gpt-4o-mini") == pricing_registry.lookup(
+        "openai", "gpt-4o-mini"
+    )
+
+    registry = PricingRegistry(path=None)
+    assert registry.lookup("openai", "gpt-4o") is None
+    registry.load(path)
+    assert registry.calculate_cost("openai", "gpt-4o", 1, 1) == 2
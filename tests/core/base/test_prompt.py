@@ -1,6 +1,8 @@
 """Tests for the `base_prompt` module."""
 
 import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import ClassVar
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock
@@ -8,7 +10,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from pydantic import computed_field
 
-from mirascope.core import BaseMessageParam
+from mirascope.core import BaseDynamicConfig, BaseMessageParam
 from mirascope.core.base.prompt import BasePrompt, metadata, prompt_template
 
 
@@ -137,6 +139,53 @@ def test_base_prompt_run() -> None:
     mock_call_fn.assert_called_once_with(genre="fantasy")
 
 
+def test_base_prompt_run_reuses_decorated_fn() -> None:
+    """Tests that `BasePrompt.run` decorates the prompt once per set of decorators."""
+    mock_decorator = MagicMock()
+    mock_decorator.return_value.return_value = "response"
+
+    @prompt_template("Recommend a {genre} book.")
+    class BookRecommendationPrompt(BasePrompt):
+        genre: str
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(
+            executor.map(
+                lambda genre: BookRecommendationPrompt(genre=genre).run(mock_decorator),
+                ["fantasy", "mystery"] * 8,
+            )
+        )
+    assert responses == ["response"] * 16
+    mock_decorator.assert_called_once()
+    assert mock_decorator.return_value.call_count == 16
+
+    additional_decorator = MagicMock()
+    BookRecommendationPrompt(genre="fantasy").run(mock_decorator, additional_decorator)
+    BookRecommendationPrompt(genre="fantasy").run(mock_decorator, additional_decorator)
+    assert mock_decorator.call_count == 2
+    additional_decorator.assert_called_once()
+
+    class DynamicMetadataPrompt(BookRecommendationPrompt):
+        def dynamic_config(self) -> BaseDynamicConfig:
+            return {"metadata": {"tags": {self.genre}}}
+
+    DynamicMetadataPrompt(genre="fantasy").run(mock_decorator)
+    DynamicMetadataPrompt(genre="fantasy").run(mock_decorator)
+    assert mock_decorator.call_count == 4
+    assert mock_decorator.call_args[0][0]._metadata == {"tags": {"fantasy"}}
+
+    class SlottedDecorator:
+        __slots__ = ()
+
+        def __call__(self, fn: Callable) -> Callable:
+            return mock_decorator(fn)
+
+    slotted_decorator = SlottedDecorator()
+    BookRecommendationPrompt(genre="fantasy").run(slotted_decorator)
+    BookRecommendationPrompt(genre="fantasy").run(slotted_decorator)
+    assert mock_decorator.call_count == 6
+
+
 @pytest.mark.asyncio
 async def test_base_prompt_run_async() -> None:
     mock_decorator = MagicMock()
@@ -0,0 +1,273 @@
+"""Tests recording and replaying the provider requests of calls."""
+
+import json
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from anthropic import Anthropic
+from anthropic.types import (
+    Message,
+    MessageDeltaUsage,
+    RawContentBlockDeltaEvent,
+    RawContentBlockStartEvent,
+    RawContentBlockStopEvent,
+    RawMessageDeltaEvent,
+    RawMessageStartEvent,
+    RawMessageStopEvent,
+    TextBlock,
+    TextDelta,
+    Usage,
+)
+from anthropic.types.raw_message_delta_event import Delta
+from openai import OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
+from openai.types.chat.chat_completion_chunk import ChoiceDelta
+from openai.types.chat.chat_completion_message import ChatCompletionMessage
+from openai.types.completion_usage import CompletionUsage
+
+from mirascope.core import anthropic, fake, openai
+from mirascope.core.base.recording import (
+    RecordingNotFoundError,
+    get_call_recorder,
+    get_call_replayer,
+    record_calls,
+    replay_calls,
+)
+
+
+def test_record_and_replay(tmp_path: Path) -> None:
+    """Tests replaying recorded responses and streams without the provider."""
+    path = tmp_path / "traffic.jsonl"
+    client = fake.FakeClient(
+        [fake.FakeResponse(content="The Name of the Wind", latency=0.2)] * 2
+    )
+
+    @fake.call("fake-model", client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    @fake.call("fake-model", client=client, stream=True)
+    def stream_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    with record_calls(path) as recorder, patch("time.sleep"):
+        assert get_call_recorder() is recorder
+        response = recommend_book("fantasy")
+        streamed = "".join(chunk.content for chunk, _ in stream_book("sf"))
+    assert get_call_recorder() is None
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["stream"] for record in records] == [False, True]
+    assert records[0]["request"]["messages"] == [
+        {"role": "user", "content": "Recommend a fantasy book"}
+    ]
+    assert records[0]["response"]["type"] == "mirascope.core.fake.types:FakeCompletion"
+    assert len(records[1]["chunks"]) == 6
+
+    client.error_rate = 1.0
+    with replay_calls(path, speed=None) as replayer:
+        assert get_call_replayer() is replayer
+        assert recommend_book("fantasy").response == response.response
+        stream = stream_book("sf")
+        assert "".join(chunk.content for chunk, _ in stream) == streamed
+        assert stream.input_tokens is not None
+        with pytest.raises(RecordingNotFoundError, match="matches the request"):
+            recommend_book("mystery")
+    assert get_call_replayer() is None
+    assert client.request_count == 2
+
+
+def test_replay_speed(tmp_path: Path) -> None:
+    """Tests delaying replayed responses by the recorded latencies over `speed`."""
+    path = tmp_path / "traffic.jsonl"
+    path.write_text(
+        json.dumps(
+            {
+                "key": "",
+                "request": {},
+                "stream": True,
+                "latency": 1.0,
+                "chunks": [[0.5, {"data": "a"}], [2.0, {"data": "b"}]],
+            }
+        )
+        + '\n{"key":'
+    )
+    with (
+        replay_calls(path, speed=2.0) as replayer,
+        patch("mirascope.core.base.recording._request_key", return_value=""),
+        patch("mirascope.core.base.recording.time.sleep") as mock_sleep,
+    ):
+        assert list(replayer.stream({})) == ["a", "b"]
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 0.25, 1.0]
+
+    with pytest.raises(ValueError, match="`speed` must be positive"):
+        replay_calls(path, speed=0).__enter__()
+
+
+def test_record_non_json_responses(tmp_path: Path) -> None:
+    """Tests recording and replaying responses that aren't JSON."""
+    path = tmp_path / "traffic.jsonl"
+    with record_calls(path) as recorder:
+        recorder.record_response({"n": 1}, {"published": date(2007, 3, 27)}, 0.1)
+        recorder.record_response({"n": 4}, {"key": lambda: None}, 0.1)
+        recorder.record_response({"n": 2}, {"title": "Dune"}, 0.1)
+        stream = recorder.record_stream({"n": 3}, iter([1, 2]), 0.1)
+        assert next(stream) == 1
+        stream.close()
+    assert len(path.read_text().splitlines()) == 2
+    assert recorder.errors == 1
+
+    with replay_calls(path, speed=None) as replayer:
+        assert replayer.response({"n": 1}) == {"published": date(2007, 3, 27)}
+        assert replayer.response({"n": 2, "timeout": 5}) == {"title": "Dune"}
+        with pytest.raises(RecordingNotFoundError, match="streamed request"):
+            replayer.stream({"n": 3})
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay_async(tmp_path: Path) -> None:
+    """Tests replaying recorded async responses and streams."""
+    path = tmp_path / "traffic.jsonl"
+    client = fake.AsyncFakeClient(
+        [fake.FakeResponse(content="Dune"), fake.FakeResponse(content="Mistborn")]
+    )
+
+    @fake.call("fake-model", client=client)
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    @fake.call("fake-model", client=client, stream=True)
+    async def stream_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    with record_calls(path):
+        response = await recommend_book("sf")
+        stream = await stream_book("fantasy")
+        assert "".join([chunk.content async for chunk, _ in stream]) == "Mistborn"
+
+    client.error_rate = 1.0
+    with replay_calls(path, speed=100.0):
+        assert (await recommend_book("sf")).content == response.content == "Dune"
+        stream = await stream_book("fantasy")
+        assert "".join([chunk.content async for chunk, _ in stream]) == "Mistborn"
+    assert client.request_count == 2
+
+
+def test_record_and_replay_openai(tmp_path: Path) -> None:
+    """Tests replaying recorded OpenAI completions and streams."""
+    path = tmp_path / "traffic.jsonl"
+    usage = CompletionUsage(completion_tokens=1, prompt_tokens=2, total_tokens=3)
+    completion = ChatCompletion(
+        id="id",
+        choices=[
+            Choice(
+                finish_reason="stop",
+                index=0,
+                message=ChatCompletionMessage(content="Dune", role="assistant"),
+            )
+        ],
+        created=0,
+        model="gpt-4o-mini",
+        object="chat.completion",
+        usage=usage,
+    )
+    chunks = [
+        ChatCompletionChunk(
+            id="id",
+            choices=[ChunkChoice(delta=ChoiceDelta(content=content), index=0)],
+            created=0,
+            model="gpt-4o-mini",
+            object="chat.completion.chunk",
+            usage=chunk_usage,
+        )
+        for content, chunk_usage in [("The Name", None), (" of the Wind", usage)]
+    ]
+    client = OpenAI(api_key="test")
+
+    @openai.call("gpt-4o-mini", client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    def stream_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    with patch.object(client.chat.completions, "create") as mock_create:
+        mock_create.side_effect = [completion, iter(chunks)]
+        with record_calls(path):
+            assert recommend_book("sf").content == "Dune"
+            streamed = "".join(chunk.content for chunk, _ in stream_book("fantasy"))
+        assert streamed == "The Name of the Wind"
+
+        with replay_calls(path, speed=None):
+            response = recommend_book("sf")
+            assert response.response == completion
+            stream = stream_book("fantasy")
+            assert "".join(chunk.content for chunk, _ in stream) == streamed
+            assert stream.input_tokens == 2
+    assert mock_create.call_count == 2
+
+
+def test_record_and_replay_anthropic(tmp_path: Path) -> None:
+    """Tests replaying recorded Anthropic messages and streams."""
+    path = tmp_path / "traffic.jsonl"
+    message = Message(
+        id="id",
+        content=[TextBlock(text="Dune", type="text")],
+        model="claude-3-5-sonnet-20240620",
+        role="assistant",
+        stop_reason="end_turn",
+        stop_sequence=None,
+        type="message",
+        usage=Usage(input_tokens=2, output_tokens=1),
+    )
+    chunks = [
+        RawMessageStartEvent(
+            message=message.model_copy(update={"content": [], "stop_reason": None}),
+            type="message_start",
+        ),
+        RawContentBlockStartEvent(
+            content_block=TextBlock(text="", type="text"),
+            index=0,
+            type="content_block_start",
+        ),
+        RawContentBlockDeltaEvent(
+            delta=TextDelta(text="The Name of the Wind", type="text_delta"),
+            index=0,
+            type="content_block_delta",
+        ),
+        RawContentBlockStopEvent(index=0, type="content_block_stop"),
+        RawMessageDeltaEvent(
+            delta=Delta(stop_reason="end_turn", stop_sequence=None),
+            type="message_delta",
+            usage=MessageDeltaUsage(output_tokens=5),
+        ),
+        RawMessageStopEvent(type="message_stop"),
+    ]
+    client = Anthropic(api_key="test")
+
+    @anthropic.call("claude-3-5-sonnet-20240620", client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    @anthropic.call("claude-3-5-sonnet-20240620", client=client, stream=True)
+    def stream_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    with patch.object(client.messages, "create") as mock_create:
+        mock_create.side_effect = [message, iter(chunks)]
+        with record_calls(path):
+            assert recommend_book("sf").content == "Dune"
+            streamed = "".join(chunk.content for chunk, _ in stream_book("fantasy"))
+        assert streamed == "The Name of the Wind"
+
+        with replay_calls(path, speed=None):
+            response = recommend_book("sf")
+            assert response.response == message
+            stream = stream_book("fantasy")
+            assert "".join(chunk.content for chunk, _ in stream) == streamed
+            assert stream.input_tokens == 2
+    assert mock_create.call_count == 2
@@ -0,0 +1,263 @@
+"""Tests the `CallScheduler` class."""
+
+import asyncio
+import threading
+import time
+from functools import partial
+from unittest.mock import MagicMock
+
+import pytest
+
+from mirascope.core.base._create import create_factory
+from mirascope.core.base.deadline import DeadlineExceededError, call_deadline
+from mirascope.core.base.scheduler import (
+    CallScheduler,
+    PriorityClass,
+    call_priority,
+    get_call_scheduler,
+    scheduled_call,
+    scheduled_call_async,
+    set_call_scheduler,
+)
+from mirascope.core.base.stream import stream_factory
+
+
+@pytest.fixture
+def scheduler() -> CallScheduler:
+    """Returns a scheduler with an interactive and a batch class."""
+    return CallScheduler(
+        {"interactive": PriorityClass(weight=2), "batch": {"weight": 1}},
+        max_concurrency=1,
+    )
+
+
+def test_call_scheduler_validation() -> None:
+    """Tests validating the classes of a scheduler."""
+    with pytest.raises(ValueError, match="at least one priority class"):
+        CallScheduler({}, max_concurrency=1)
+    with pytest.raises(ValueError, match="must be positive"):
+        CallScheduler({"a": PriorityClass(weight=0)}, max_concurrency=1)
+    with pytest.raises(ValueError, match="Unknown default priority class: b"):
+        CallScheduler({"a": PriorityClass()}, max_concurrency=1, default="b")
+
+
+def test_call_scheduler_weighted_fair_queuing(scheduler: CallScheduler) -> None:
+    """Tests that waiting classes receive slots in proportion to their weights."""
+    order = []
+    with scheduler.slot():
+        for priority in ["batch"] * 3 + ["interactive"] * 6:
+            scheduler._enqueue(
+                scheduler._get_class(priority), partial(order.append, priority)
+            )
+        assert scheduler.stats()["batch"].queued == 3
+    while scheduler._running:
+        (state,) = [s for s in scheduler._classes.values() if s.running]
+        scheduler._release(state)
+    assert order == [
+        "batch",
+        "interactive",
+        "interactive",
+        "batch",
+        "interactive",
+        "interactive",
+        "batch",
+        "interactive",
+        "interactive",
+    ]
+    stats = scheduler.stats()
+    assert (stats["interactive"].completed, stats["batch"].completed) == (7, 3)
+    assert stats["batch"].running == stats["batch"].queued == 0
+
+    with pytest.raises(ValueError, match="Unknown priority class: other"):
+        scheduler._get_class("other")
+
+
+def test_call_scheduler_class_max_concurrency() -> None:
+    """Tests limiting the number of running calls of a class."""
+    scheduler = CallScheduler(
+        {"interactive": PriorityClass(), "batch": PriorityClass(max_concurrency=1)},
+        max_concurrency=3,
+    )
+    order = []
+    with scheduler.slot("batch"):
+        scheduler._enqueue(scheduler._get_class("batch"), partial(order.append, "b"))
+        with scheduler.slot("interactive"), scheduler.slot("interactive"):
+            stats = scheduler.stats()
+            assert (stats["interactive"].running, stats["batch"].queued) == (2, 1)
+        assert order == []
+    assert order == ["b"]
+
+
+def test_call_scheduler_threads(scheduler: CallScheduler) -> None:
+    """Tests that threads wait for a slot and record their queue time."""
+    running, max_running = [0], [0]
+    lock = threading.Lock()
+
+    def call() -> None:
+        with scheduler.slot("batch"):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = scheduler.stats()["batch"]
+    assert max_running[0] == 1
+    assert stats.completed == 4
+    assert stats.max_queue_time > 0
+    assert 0 < stats.average_queue_time <= stats.max_queue_time
+    assert scheduler.stats()["interactive"].average_queue_time == 0
+
+
+@pytest.mark.asyncio
+async def test_call_scheduler_async(scheduler: CallScheduler) -> None:
+    """Tests that tasks wait for a slot and that cancelled tasks leave the queue."""
+    order = []
+
+    async def call(priority: str) -> None:
+        async with scheduler.slot_async(priority):
+            order.append(priority)
+            await asyncio.sleep(0)
+
+    async with scheduler.slot_async("batch"):
+        tasks = [asyncio.ensure_future(call(p)) for p in ("batch", "interactive")]
+        cancelled = asyncio.ensure_future(call("batch"))
+        await asyncio.sleep(0)
+        assert scheduler.stats()["batch"].queued == 2
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert scheduler.stats()["batch"].queued == 1
+    await asyncio.gather(*tasks)
+    assert order == ["interactive", "batch"]
+
+    # A task cancelled after being granted a slot releases it
+    async with scheduler.slot_async("batch"):
+        task = asyncio.ensure_future(call("batch"))
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert scheduler.stats()["batch"].running == 0
+    assert scheduler._running == 0
+
+
+def test_call_scheduler_deadline(scheduler: CallScheduler) -> None:
+    """Tests that waiting for a slot stops at the deadline and leaves the queue."""
+    with scheduler.slot("batch"):
+        with (
+            call_deadline(0.01),
+            pytest.raises(DeadlineExceededError),
+            scheduler.slot("interactive"),
+        ):
+            pass  # pragma: no cover
+        assert scheduler.stats()["interactive"].queued == 0
+    assert scheduler._running == 0
+    with call_deadline(1.0), scheduler.slot("interactive"):
+        assert scheduler.stats()["interactive"].running == 1
+
+
+@pytest.mark.asyncio
+async def test_call_scheduler_deadline_async(scheduler: CallScheduler) -> None:
+    """Tests that waiting for a slot asynchronously stops at the deadline."""
+    async with scheduler.slot_async("batch"):
+        with call_deadline(0.01), pytest.raises(DeadlineExceededError):
+            async with scheduler.slot_async("interactive"):
+                pass  # pragma: no cover
+        assert scheduler.stats()["interactive"].queued == 0
+    assert scheduler._running == 0
+
+
+def test_scheduled_call_priority(scheduler: CallScheduler) -> None:
+    """Tests the precedence of the ways to set the priority of a call."""
+    scheduler.slot = MagicMock(wraps=scheduler.slot)
+    with scheduled_call("batch", None):
+        pass  # no scheduler installed
+
+    set_call_scheduler(scheduler)
+    try:
+        assert get_call_scheduler() is scheduler
+        with scheduled_call(None, None):
+            pass
+        with scheduled_call("batch", {}):
+            pass
+        with call_priority("interactive"):
+            with scheduled_call("batch", None):
+                pass
+            with scheduled_call("interactive", {"priority": "batch"}):
+                pass
+    finally:
+        set_call_scheduler(None)
+    assert [call.args for call in scheduler.slot.call_args_list] == [
+        (None,),
+        ("batch",),
+        ("interactive",),
+        ("batch",),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scheduled_call_async(scheduler: CallScheduler) -> None:
+    """Tests holding a slot of the installed scheduler for an async call."""
+    async with scheduled_call_async("batch", None):
+        pass  # no scheduler installed
+
+    set_call_scheduler(scheduler)
+    try:
+        async with scheduled_call_async("batch", None):
+            assert scheduler.stats()["batch"].running == 1
+    finally:
+        set_call_scheduler(None)
+    assert scheduler.stats()["batch"].completed == 1
+
+
+def test_create_and_stream_factory_with_scheduler(scheduler: CallScheduler) -> None:
+    """Tests that calls and streams hold a slot until they complete."""
+    running = []
+
+    def setup_call(**kwargs: object) -> tuple:
+        def create(*, stream: bool, **kwargs: object) -> object:
+            running.append(scheduler.stats()["batch"].running)
+            return iter(["chunk"]) if stream else MagicMock()
+
+        return create, None, [], None, {}
+
+    def handle_stream(stream: object, tool_types: object, **kwargs: object) -> object:
+        for chunk in stream:  # pyright: ignore [reportGeneralTypeIssues]
+            running.append(scheduler.stats()["batch"].running)
+            yield chunk, None
+
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    kwargs = {"model": "model", "tools": None, "json_mode": False, "client": None}
+    call = create_factory(TCallResponse=MagicMock, setup_call=setup_call)(  # pyright: ignore [reportArgumentType, reportCallIssue]
+        recommend_book,
+        output_parser=None,
+        call_params={},
+        priority="batch",
+        **kwargs,
+    )
+    stream = stream_factory(
+        TCallResponse=MagicMock,
+        TStream=MagicMock,
+        setup_call=setup_call,  # pyright: ignore [reportArgumentType]
+        handle_stream=handle_stream,  # pyright: ignore [reportArgumentType]
+        handle_stream_async=MagicMock(),
+    )(recommend_book, call_params={}, priority="batch", **kwargs)  # pyright: ignore [reportArgumentType, reportCallIssue]
+
+    set_call_scheduler(scheduler)
+    try:
+        call("fantasy")
+        stream_generator = stream("fantasy").stream
+        list(stream_generator)  # pyright: ignore [reportArgumentType]
+    finally:
+        set_call_scheduler(None)
+    assert running == [1, 1, 1]
+    assert scheduler.stats()["batch"].completed == 2
@@ -0,0 +1,66 @@
+"""Tests serializing and loading call responses."""
+
+import pytest
+
+from mirascope.core import fake, metadata, prompt_template
+from mirascope.core.base.serialization import (
+    SERIALIZATION_VERSION,
+    dump_call_response,
+    load_call_response,
+)
+from mirascope.core.fake import FakeCallResponse
+from mirascope.core.fake.types import FakeToolCall
+
+
+def format_book(title: str) -> str:
+    """Returns the formatted book title."""
+    return f"Title: {title}"
+
+
+def test_dump_and_load_call_response() -> None:
+    """Tests rebuilding a call response and its tools from its serialized bytes."""
+    tool_call = FakeToolCall(id="id", name="format_book", arguments='{"title": "Dune"}')
+    client = fake.FakeClient(
+        [fake.FakeResponse(content="Dune", tool_calls=[tool_call])] * 3
+    )
+
+    @metadata({"tags": {"version:0001"}})
+    def recommend_book(genre: str, cover: bytes) -> str:
+        return f"Recommend a {genre} book"
+
+    call = fake.call("fake-model", client=client, tools=[format_book])
+    response = call(recommend_book)("fantasy", b"\x89PNG")
+    for compress in [True, False]:
+        data = dump_call_response(response, compress=compress)
+        loaded = load_call_response(data, tools=[format_book])
+        assert isinstance(loaded, FakeCallResponse)
+        assert loaded.response == response.response
+        assert loaded.metadata == {"tags": {"version:0001"}}
+        assert loaded.model == response.model == "fake-model"
+        assert loaded.messages == response.messages
+        assert loaded.fn_args == {"genre": "fantasy", "cover": "iVBORw=="}
+        assert loaded.dynamic_config is None
+        assert loaded.message_param == response.message_param
+        assert (tool := loaded.tool) is not None and tool.call() == "Title: Dune"
+    assert len(dump_call_response(response, compress=True)) < len(data)
+    assert load_call_response(data).tool_types == []
+
+    call = fake.call("fake-model", client=client, retention="lean")
+    lean = call(recommend_book)("fantasy", b"")
+    assert load_call_response(dump_call_response(lean)).messages == lean.messages
+
+    @prompt_template("Recommend a {genre} book")
+    def recommend_genre_book(genre: str) -> None: ...
+
+    lean = call(recommend_genre_book)("fantasy")
+    assert load_call_response(dump_call_response(lean)).messages == []
+
+
+def test_load_invalid_call_response() -> None:
+    """Tests loading data that isn't a call response that can be loaded."""
+    with pytest.raises(ValueError, match="not a serialized call response"):
+        load_call_response(b'{"content": "Dune"}')
+    with pytest.raises(ValueError, match=f"up to {SERIALIZATION_VERSION} are"):
+        load_call_response(b"MCR" + bytes([SERIALIZATION_VERSION + 1, 0]) + b"{}")
+    with pytest.raises(ValueError, match="is not a call response type"):
+        load_call_response(b'MCR\x01\x00{"type": "builtins:dict"}')
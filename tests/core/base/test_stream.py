@@ -6,7 +6,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from mirascope.core.base._utils import PartialToolConstructor
 from mirascope.core.base.stream import BaseStream, stream_factory
+from mirascope.core.base.tool import BaseTool
 
 
 @pytest.fixture()
@@ -233,6 +235,53 @@ async def test_base_stream(mock_get_possible_user_message_param: MagicMock) -> N
     mock_construct_message_param.assert_called_with(["tool_call"], "content")
     assert stream.message_param == "mock_message_param"
     assert stream.model == "updated_model"
+    assert 0 < stream.start_time <= stream.end_time
 
     assert stream.tool_message_params(tools_and_outputs)
     mock_tool_message_params.assert_called_once_with(tools_and_outputs)
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+@pytest.mark.asyncio
+async def test_base_stream_partial_tools() -> None:
+    """Tests that partial tools are streamed but not stored on the `BaseStream`."""
+
+    class FormatBook(BaseTool):
+        tool_call: str
+        title: str
+
+        def call(self) -> str:
+            return self.title
+
+    mock_construct_message_param = MagicMock()
+    BaseStream._construct_message_param = mock_construct_message_param
+    partial_tool = PartialToolConstructor[FormatBook]()(
+        FormatBook, {"title": "The"}, "partial_tool_call", '{"title": "The'
+    )
+    tool = FormatBook(tool_call="tool_call", title="The Name of the Wind")
+    mock_chunk = MagicMock(content="", input_tokens=None, output_tokens=None)
+    results = [(mock_chunk, partial_tool), (mock_chunk, tool)]
+    stream = BaseStream(
+        stream=(t for t in results),
+        metadata={},
+        tool_types=[FormatBook],
+        call_response_type=MagicMock,
+        model="model",
+        prompt_template="prompt_template",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )  # type: ignore
+    assert list(stream) == results
+    assert stream.tools == [tool]
+    mock_construct_message_param.assert_called_once_with(["tool_call"], "")
+
+    async def generator():
+        for result in results:
+            yield result
+
+    stream.stream = generator()
+    assert [result async for result in stream] == results
+    assert stream.tools == [tool]
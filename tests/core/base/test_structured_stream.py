@@ -76,6 +76,7 @@ def test_structured_stream_factory_sync(
         json_mode=mock_structured_stream_decorator_kwargs["json_mode"],
         client=mock_structured_stream_decorator_kwargs["client"],
         call_params=mock_structured_stream_decorator_kwargs["call_params"],
+        priority=None,
     )
     mock_stream_inner.assert_called_once_with(genre="fantasy", topic="magic")
     assert list(structured_stream.stream) == [("chunk", None)]
@@ -143,6 +144,7 @@ async def test_structured_stream_factory_async(
         json_mode=mock_structured_stream_decorator_kwargs["json_mode"],
         client=mock_structured_stream_decorator_kwargs["client"],
         call_params=mock_structured_stream_decorator_kwargs["call_params"],
+        priority=None,
     )
     mock_stream_inner.assert_called_once_with(genre="fantasy", topic="magic")
     stream_response = []
@@ -11,6 +11,7 @@ from mirascope.core.base import (
 from mirascope.core.bedrock import BedrockMessageParam
 from mirascope.core.bedrock._utils._convert_message_params import (
     convert_message_params,
+    convert_text_message,
 )
 
 
@@ -75,3 +76,11 @@ def test_convert_message_params() -> None:
                 )
             ]
         )
+
+
+def test_convert_text_message() -> None:
+    """Tests that text messages are converted the same as `BaseMessageParam`."""
+    for role in ["system", "user", "assistant"]:
+        assert convert_text_message(role, "Hello") == convert_message_params(
+            [BaseMessageParam(role=role, content="Hello")]
+        )
@@ -1,5 +1,5 @@
 from collections.abc import AsyncGenerator, Generator
-from typing import Any
+from typing import Any, cast
 
 import pytest
 
@@ -280,10 +280,10 @@ def test_handle_stream_with_text_and_tool(mock_response_text_with_tool):
     results = list(handle_stream(mock_stream(), tool_types))  # pyright: ignore [reportArgumentType]
 
     assert all(isinstance(chunk, BedrockCallResponseChunk) for chunk, tool in results)
-    assert isinstance(results[-2][1], MockRecommendBook)
-    assert results[-2][1].genre == "fantasy"
-    assert results[-2][1].title == "The Name of the Wind"
-    assert results[-2][1].author == "Patrick Rothfuss"
+    assert isinstance(tool := results[-2][1], MockRecommendBook)
+    assert tool.genre == "fantasy"
+    assert tool.title == "The Name of the Wind"
+    assert tool.author == "Patrick Rothfuss"
 
 
 @pytest.mark.asyncio
@@ -296,10 +296,10 @@ async def test_handle_stream_async_with_text_and_tool(mock_response_text_with_to
     results = tuple([c async for c in handle_stream_async(mock_stream(), tool_types)])  # pyright: ignore [reportArgumentType]
 
     assert all(isinstance(chunk, BedrockCallResponseChunk) for chunk, tool in results)
-    assert isinstance(results[-2][1], MockRecommendBook)
-    assert results[-2][1].genre == "fantasy"
-    assert results[-2][1].title == "The Name of the Wind"
-    assert results[-2][1].author == "Patrick Rothfuss"
+    assert isinstance(tool := results[-2][1], MockRecommendBook)
+    assert tool.genre == "fantasy"
+    assert tool.title == "The Name of the Wind"
+    assert tool.author == "Patrick Rothfuss"
 
 
 def test_handle_stream_with_only_tool(mock_response_only_tool):
@@ -345,10 +345,10 @@ def test_handle_stream_with_multiple_tool_types(mock_response_text_with_tool):
     results = list(handle_stream(mock_stream(), tool_types))  # pyright: ignore [reportArgumentType]
 
     assert all(isinstance(chunk, BedrockCallResponseChunk) for chunk, tool in results)
-    assert isinstance(results[-2][1], MockRecommendBook)
-    assert results[-2][1].genre == "fantasy"
-    assert results[-2][1].title == "The Name of the Wind"
-    assert results[-2][1].author == "Patrick Rothfuss"
+    assert isinstance(tool := results[-2][1], MockRecommendBook)
+    assert tool.genre == "fantasy"
+    assert tool.title == "The Name of the Wind"
+    assert tool.author == "Patrick Rothfuss"
 
 
 @pytest.mark.asyncio
@@ -378,7 +378,44 @@ async def test_handle_stream_async_with_multiple_tool_types(
     results = [c async for c in handle_stream_async(mock_stream(), tool_types)]  # pyright: ignore [reportArgumentType]
 
     assert all(isinstance(chunk, BedrockCallResponseChunk) for chunk, tool in results)
-    assert isinstance(results[-2][1], MockRecommendBook)
-    assert results[-2][1].genre == "fantasy"
-    assert results[-2][1].title == "The Name of the Wind"
-    assert results[-2][1].author == "Patrick Rothfuss"
+    assert isinstance(tool := results[-2][1], MockRecommendBook)
+    assert tool.genre == "fantasy"
+    assert tool.title == "The Name of the Wind"
+    assert tool.author == "Patrick Rothfuss"
+
+
+@pytest.mark.asyncio
+async def test_handle_stream_partial_tools(mock_response_only_tool):
+    def mock_stream() -> Generator[dict, None, None]:
+        yield from mock_response_only_tool
+
+    async def mock_stream_async() -> AsyncGenerator[dict, None]:
+        for chunk in mock_response_only_tool:
+            yield chunk
+
+    tool_types: list[type[BedrockTool]] = [MockRecommendBook]
+    tools = [
+        tool
+        for _, tool in handle_stream(mock_stream(), tool_types, partial_tools=True)  # pyright: ignore [reportArgumentType]
+        if tool
+    ]
+    assert all(isinstance(tool, MockRecommendBook) for tool in tools)
+    tools = cast(list[MockRecommendBook], tools)
+    assert tools[0].delta == '{"g'
+    assert tools[1].genre == ""
+    assert tools[2].genre == "fantasy" and tools[2].title is None
+    assert tools[2].tool_call["toolUse"]["input"] == {"genre": "fantasy"}
+    assert tools[-2].delta is not None
+    assert tools[-1].delta is None
+    assert tools[-1].author == "Brandon Sanderson"
+
+    async_tools = [
+        tool
+        async for _, tool in handle_stream_async(
+            mock_stream_async(),  # pyright: ignore [reportArgumentType]
+            tool_types,
+            partial_tools=True,
+        )
+        if tool
+    ]
+    assert [tool.delta for tool in async_tools] == [tool.delta for tool in tools]
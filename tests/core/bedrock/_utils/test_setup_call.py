@@ -1,17 +1,14 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from types_aiobotocore_bedrock_runtime import (
-    BedrockRuntimeClient as AsyncBedrockRuntimeClient,
-)
 
 from mirascope.core.bedrock._utils._convert_common_call_params import (
     convert_common_call_params,
 )
+from mirascope.core.bedrock._utils._convert_message_params import convert_text_message
 from mirascope.core.bedrock._utils._setup_call import (
     _extract_async_stream_fn,
     _extract_sync_stream_fn,
-    _get_async_client,
     setup_call,
 )
 from mirascope.core.bedrock.tool import BedrockTool
@@ -24,20 +21,6 @@ def mock_base_setup_call() -> MagicMock:
     return mock_setup_call
 
 
-@pytest.mark.asyncio
-async def test_get_async_client():
-    mock_session = MagicMock()
-
-    mock_client = MagicMock(spec=AsyncBedrockRuntimeClient)
-    mock_session.create_client.return_value.__aenter__.return_value = mock_client
-
-    client = await _get_async_client(mock_session)
-
-    assert isinstance(client, MagicMock)
-    assert client == mock_client
-    mock_session.create_client.assert_called_once_with("bedrock-runtime")
-
-
 def test_extract_sync_stream_fn():
     mock_fn = MagicMock()
     mock_fn.return_value = {
@@ -114,7 +97,14 @@ def test_setup_call(
     assert "modelId" in call_kwargs and call_kwargs["modelId"] == "anthropic.claude-v2"
     assert "messages" in call_kwargs and call_kwargs["messages"] == messages
     mock_base_setup_call.assert_called_once_with(
-        fn, {}, None, None, BedrockTool, {}, convert_common_call_params
+        fn,
+        {},
+        None,
+        None,
+        BedrockTool,
+        {},
+        convert_common_call_params,
+        convert_text_message=convert_text_message,
     )
     mock_convert_message_params.assert_called_once_with(
         mock_base_setup_call.return_value[1]
@@ -279,11 +269,11 @@ def test_setup_call_with_tools(
     assert call_kwargs["toolConfig"] == {"tools": [{"name": "test_tool"}]}
 
 
-@patch("mirascope.core.bedrock._utils._setup_call._get_async_client")
+@patch("mirascope.core.bedrock._utils._setup_call.default_client_pool")
 @patch("mirascope.core.bedrock._utils._setup_call._utils", new_callable=MagicMock)
 def test_setup_call_client_creation(
     mock_utils: MagicMock,
-    mock_get_async_client: AsyncMock,
+    mock_client_pool: MagicMock,
     mock_base_setup_call: MagicMock,
 ) -> None:
     mock_utils.setup_call = mock_base_setup_call
@@ -291,9 +281,10 @@ def test_setup_call_client_creation(
         {"role": "user", "content": [{"text": "user test"}]},
     ]
     mock_base_setup_call.return_value[3] = {}
+    mock_client = mock_client_pool.get_client.return_value
 
     # Test sync client creation
-    setup_call(
+    create, _, _, _, _ = setup_call(
         model="anthropic.claude-v2",
         client=None,
         fn=MagicMock(),
@@ -305,11 +296,14 @@ def test_setup_call_client_creation(
         extract=False,
         stream=False,
     )
+    mock_client_pool.get_client.assert_called_once_with()
+    assert create(modelId="model") == mock_client.converse.return_value
+    mock_client.converse.assert_called_once_with(modelId="model")
 
-    # Test async client creation
+    # Test async client creation, which is deferred until the request
     async def async_fn(): ...
 
-    setup_call(
+    async_create, _, _, _, _ = setup_call(
         model="anthropic.claude-v2",
         client=None,
         fn=async_fn,
@@ -321,13 +315,12 @@ def test_setup_call_client_creation(
         extract=False,
         stream=False,
     )
-    mock_get_async_client.assert_called_once()
+    mock_client_pool.get_async_client.assert_not_called()
 
     # Test when client is provided
-    mock_client = MagicMock()
     setup_call(
         model="anthropic.claude-v2",
-        client=mock_client,
+        client=MagicMock(),
         fn=MagicMock(),
         fn_args={},
         dynamic_config=None,
@@ -337,4 +330,56 @@ def test_setup_call_client_creation(
         extract=False,
         stream=False,
     )
-    assert mock_get_async_client.call_count == 1
+    assert mock_client_pool.get_client.call_count == 1
+
+
+@pytest.mark.asyncio
+@patch("mirascope.core.bedrock._utils._setup_call.default_client_pool")
+@patch("mirascope.core.bedrock._utils._setup_call._utils", new_callable=MagicMock)
+async def test_setup_call_async_client(
+    mock_utils: MagicMock,
+    mock_client_pool: MagicMock,
+    mock_base_setup_call: MagicMock,
+) -> None:
+    mock_utils.setup_call = mock_base_setup_call
+    mock_base_setup_call.return_value[1] = [
+        {"role": "user", "content": [{"text": "user test"}]},
+    ]
+    mock_base_setup_call.return_value[3] = {}
+    mock_client = AsyncMock()
+    mock_client_pool.get_async_client = AsyncMock(return_value=mock_client)
+
+    async def stream():
+        yield {"contentBlockDelta": {"delta": {"text": "content"}}}
+
+    mock_client.converse_stream.return_value = {
+        "stream": stream(),
+        "ResponseMetadata": {"RequestId": "id"},
+    }
+
+    async def async_fn(): ...
+
+    create, _, _, _, _ = setup_call(
+        model="anthropic.claude-v2",
+        client=None,
+        fn=async_fn,
+        fn_args={},
+        dynamic_config=None,
+        tools=None,
+        json_mode=False,
+        call_params={},
+        extract=False,
+        stream=False,
+    )
+    assert await create(modelId="model") == mock_client.converse.return_value
+    mock_client.converse.assert_awaited_once_with(modelId="model")
+    chunks = [chunk async for chunk in await create(stream=True, modelId="model")]
+    assert chunks == [
+        {
+            "responseMetadata": {"RequestId": "id"},
+            "model": "anthropic.claude-v2",
+            "contentBlockDelta": {"delta": {"text": "content"}},
+        }
+    ]
+    mock_client.converse_stream.assert_awaited_once_with(modelId="model")
+    assert mock_client_pool.get_async_client.await_count == 2
@@ -0,0 +1,101 @@
+"""Tests the `bedrock.client_pool` module."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.bedrock.client_pool import BedrockClientPool
+
+
+class ClientContext:
+    """Records entering and exiting an async client context."""
+
+    def __init__(self, events: list[tuple[str, str | None]], region: str | None):
+        self.events = events
+        self.region = region
+
+    async def __aenter__(self) -> MagicMock:
+        await asyncio.sleep(0)
+        if self.region == "invalid":
+            raise ValueError("Invalid region")
+        self.events.append(("enter", self.region))
+        return MagicMock(region=self.region)
+
+    async def __aexit__(self, *args: object) -> None:
+        self.events.append(("exit", self.region))
+
+
+def _async_session(events: list[tuple[str, str | None]]) -> MagicMock:
+    session = MagicMock()
+    session.create_client.side_effect = lambda service, region_name: ClientContext(
+        events, region_name
+    )
+    return session
+
+
+@patch("mirascope.core.bedrock.client_pool.Session")
+def test_get_client(mock_session: MagicMock) -> None:
+    """Tests creating each sync client once per region."""
+    mock_session.return_value.client.side_effect = lambda service, region_name: (
+        MagicMock(region=region_name)
+    )
+    pool = BedrockClientPool()
+    mock_session.assert_not_called()
+    client = pool.get_client()
+    assert pool.get_client() is client
+    west = pool.get_client("us-west-2")
+    assert west is not client
+    mock_session.assert_called_once_with()
+    assert mock_session.return_value.client.call_count == 2
+    mock_session.return_value.client.assert_called_with(
+        "bedrock-runtime", region_name="us-west-2"
+    )
+
+    session = MagicMock()
+    assert BedrockClientPool(session).get_client() == session.client.return_value
+
+
+def test_get_async_client() -> None:
+    """Tests creating async clients once per event loop and exiting them with it."""
+    events = []
+    pool = BedrockClientPool(async_session=_async_session(events))
+
+    async def get_clients() -> list:
+        clients = await asyncio.gather(pool.get_async_client(), pool.get_async_client())
+        return [*clients, await pool.get_async_client("us-west-2")]
+
+    first, same, west = asyncio.run(get_clients())
+    assert first is same and west.region == "us-west-2"
+    assert events == [
+        ("enter", None),
+        ("enter", "us-west-2"),
+        ("exit", "us-west-2"),
+        ("exit", None),
+    ]
+
+    second, _, _ = asyncio.run(get_clients())
+    assert second is not first
+    assert len(events) == 8
+    assert not pool._loop_clients  # the closed loops are released
+
+
+@pytest.mark.asyncio
+async def test_async_client_aclose() -> None:
+    """Tests exiting async clients with `aclose` and retrying failed clients."""
+    events = []
+    pool = BedrockClientPool()
+    with patch(
+        "mirascope.core.bedrock.client_pool.get_session",
+        return_value=_async_session(events),
+    ):
+        client = await pool.get_async_client()
+    with pytest.raises(ValueError, match="Invalid region"):
+        await pool.get_async_client("invalid")
+    with pytest.raises(ValueError, match="Invalid region"):
+        await pool.get_async_client("invalid")
+    await pool.aclose()
+    assert events == [("enter", None), ("exit", None)]
+    assert await pool.get_async_client() is not client
+    await pool.aclose()
+    await pool.aclose()
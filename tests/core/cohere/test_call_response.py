@@ -54,6 +54,9 @@ def test_cohere_call_response() -> None:
     assert call_response.tools is None
     assert call_response.tool is None
 
+    data = CohereCallResponse._dump_response(completion)
+    assert CohereCallResponse._load_response(data) == completion
+
 
 def test_cohere_call_response_with_tools() -> None:
     """Tests the `CohereCallResponse` class with tools."""
@@ -0,0 +1,16 @@
+"""Tests the `fake._utils.calculate_cost` function."""
+
+from unittest.mock import patch
+
+from mirascope.core.base.pricing import ModelPricing, PricingRegistry
+from mirascope.core.fake._utils._calculate_cost import calculate_cost
+
+
+def test_calculate_cost() -> None:
+    """Tests the `calculate_cost` function."""
+    registry = PricingRegistry(path=None)
+    with patch("mirascope.core.fake._utils._calculate_cost.pricing_registry", registry):
+        assert calculate_cost(1, 1, model="fake-model") is None
+        registry.register("fake", "fake-model", ModelPricing(input=1e-6, output=2e-6))
+        assert calculate_cost(None, None, model="fake-model") is None
+        assert calculate_cost(1, 1, model="fake-model") == 3e-6
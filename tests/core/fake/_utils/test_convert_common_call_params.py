@@ -0,0 +1,24 @@
+from mirascope.core.base.call_params import CommonCallParams
+from mirascope.core.fake._utils._convert_common_call_params import (
+    convert_common_call_params,
+)
+
+
+def test_fake_conversion_full():
+    """Test full parameter conversion for the fake provider."""
+    params: CommonCallParams = {
+        "temperature": 0.7,
+        "max_tokens": 100,
+        "top_p": 0.9,
+        "frequency_penalty": 0.5,
+        "presence_penalty": 0.5,
+        "seed": 42,
+        "stop": ["STOP", "END"],
+    }
+    assert convert_common_call_params(params) == params
+
+
+def test_fake_conversion_none_values():
+    """Test None values conversion for the fake provider."""
+    params: CommonCallParams = {"temperature": None, "max_tokens": None}
+    assert convert_common_call_params(params) == {}
@@ -0,0 +1,49 @@
+"""Tests the `fake._utils.convert_message_params` function."""
+
+from mirascope.core.base import (
+    BaseMessageParam,
+    CacheControlPart,
+    ImagePart,
+    TextPart,
+)
+from mirascope.core.fake._utils._convert_message_params import (
+    convert_message_params,
+    convert_text_message,
+)
+
+
+def test_convert_message_params() -> None:
+    """Tests the `convert_message_params` function."""
+    message_params = [
+        {"role": "user", "content": "Hello"},
+        BaseMessageParam(role="user", content="Hello"),
+        BaseMessageParam(
+            role="user",
+            content=[
+                TextPart(type="text", text="Hello"),
+                CacheControlPart(type="cache_control", cache_type="ephemeral"),
+                ImagePart(
+                    type="image", media_type="image/png", image=b"image", detail=None
+                ),
+            ],
+        ),
+    ]
+    assert convert_message_params(message_params) == [  # pyright: ignore [reportArgumentType]
+        {"role": "user", "content": "Hello"},
+        {"role": "user", "content": "Hello"},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "Hello"},
+                {"type": "image", "media_type": "image/png"},
+            ],
+        },
+    ]
+
+
+def test_convert_text_message() -> None:
+    """Tests that text messages are converted the same as `BaseMessageParam`."""
+    for role in ["system", "user", "assistant"]:
+        assert convert_text_message(role, "Hello") == convert_message_params(
+            [BaseMessageParam(role=role, content="Hello")]
+        )
@@ -0,0 +1,61 @@
+"""Tests the `fake._utils.get_json_output` function."""
+
+import pytest
+
+from mirascope.core.fake._utils._get_json_output import get_json_output
+from mirascope.core.fake.call_response import FakeCallResponse
+from mirascope.core.fake.call_response_chunk import FakeCallResponseChunk
+from mirascope.core.fake.types import (
+    FakeCompletion,
+    FakeCompletionChunk,
+    FakeToolCall,
+    FakeToolCallDelta,
+)
+
+
+def _call_response(completion: FakeCompletion) -> FakeCallResponse:
+    return FakeCallResponse(
+        metadata={},
+        response=completion,
+        tool_types=None,
+        prompt_template=None,
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )
+
+
+def test_get_json_output_call_response() -> None:
+    """Tests the `get_json_output` function with a call response."""
+    tool_call = FakeToolCall(id="id", name="FormatBook", arguments='{"title": "Dune"}')
+    completion = FakeCompletion(id="id", model="fake-model", content='{"a": 1}')
+    assert get_json_output(_call_response(completion), json_mode=True) == '{"a": 1}'
+    completion.tool_calls = [tool_call]
+    assert (
+        get_json_output(_call_response(completion), json_mode=False)
+        == '{"title": "Dune"}'
+    )
+    completion.tool_calls = None
+    with pytest.raises(
+        ValueError, match="No tool call or JSON object found in response."
+    ):
+        get_json_output(_call_response(completion), json_mode=False)
+
+
+def test_get_json_output_call_response_chunk() -> None:
+    """Tests the `get_json_output` function with a call response chunk."""
+    chunk = FakeCompletionChunk(id="id", model="fake-model", content='{"a": 1}')
+    assert get_json_output(FakeCallResponseChunk(chunk=chunk), json_mode=True) == (
+        '{"a": 1}'
+    )
+    assert get_json_output(FakeCallResponseChunk(chunk=chunk), json_mode=False) == ""
+    chunk.tool_calls = [FakeToolCallDelta(index=0, arguments='{"title": ')]
+    assert (
+        get_json_output(FakeCallResponseChunk(chunk=chunk), json_mode=False)
+        == '{"title": '
+    )
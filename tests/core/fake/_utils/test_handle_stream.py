@@ -0,0 +1,105 @@
+"""Tests the `fake._utils.handle_stream` module."""
+
+import pytest
+
+from mirascope.core.fake._utils._handle_stream import (
+    handle_stream,
+    handle_stream_async,
+)
+from mirascope.core.fake.tool import FakeTool
+from mirascope.core.fake.types import FakeCompletionChunk, FakeToolCallDelta
+
+
+class FormatBook(FakeTool):
+    """Returns the title and author nicely formatted."""
+
+    title: str
+    author: str
+
+    def call(self) -> None:
+        """Dummy call."""
+
+
+@pytest.fixture()
+def mock_chunks() -> list[FakeCompletionChunk]:
+    """Returns a list of chunks that stream two interleaved tool calls."""
+
+    def chunk(*deltas: FakeToolCallDelta) -> FakeCompletionChunk:
+        return FakeCompletionChunk(id="id", model="fake-model", tool_calls=list(deltas))
+
+    return [
+        FakeCompletionChunk(id="id", model="fake-model", content="content"),
+        chunk(FakeToolCallDelta(index=0, id="id0", name="FormatBook")),
+        chunk(
+            FakeToolCallDelta(index=0, arguments='{"title": "The Name of the Wind",'),
+            FakeToolCallDelta(index=1, id="id1", name="FormatBook"),
+        ),
+        chunk(
+            FakeToolCallDelta(index=1, arguments='{"title": "Dune", '),
+            FakeToolCallDelta(index=0, arguments=' "author": "Patrick Rothfuss"}'),
+        ),
+        chunk(FakeToolCallDelta(index=1, arguments='"author": "Frank Herbert"}')),
+        FakeCompletionChunk(id="id", model="fake-model", finish_reason="tool_calls"),
+    ]
+
+
+def test_handle_stream(mock_chunks: list[FakeCompletionChunk]) -> None:
+    """Tests the `handle_stream` function."""
+    result = list(handle_stream((c for c in mock_chunks), tool_types=[FormatBook]))
+    assert [getattr(tool, "title", None) for _, tool in result] == [
+        None,
+        "The Name of the Wind",
+        "Dune",
+        None,
+    ]
+    assert result[0][0].content == "content"
+    assert result[3][0].finish_reasons == ["tool_calls"]
+    tool = result[2][1]
+    assert isinstance(tool, FormatBook)
+    assert tool.tool_call.id == "id1"
+    assert tool.author == "Frank Herbert"
+
+    with pytest.raises(RuntimeError, match="Unknown tool type in stream: FormatBook"):
+        list(handle_stream((c for c in mock_chunks), tool_types=[FakeTool]))
+
+
+def test_handle_stream_partial_tools(mock_chunks: list[FakeCompletionChunk]) -> None:
+    """Tests the `handle_stream` function with partial tools."""
+    tools = [
+        tool
+        for _, tool in handle_stream(
+            (c for c in mock_chunks), tool_types=[FormatBook], partial_tools=True
+        )
+        if tool is not None
+    ]
+    assert [(tool.model_dump()["title"], tool.delta is not None) for tool in tools] == [
+        ("The Name of the Wind", True),
+        ("Dune", True),
+        ("The Name of the Wind", False),
+        ("Dune", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_handle_stream_async(mock_chunks: list[FakeCompletionChunk]) -> None:
+    """Tests the `handle_stream_async` function."""
+
+    async def generator():
+        for chunk in mock_chunks:
+            yield chunk
+
+    result = [t async for t in handle_stream_async(generator(), tool_types=None)]
+    assert len(result) == len(mock_chunks)
+    assert all(tool is None for _, tool in result)
+
+    tools = [
+        tool
+        async for _, tool in handle_stream_async(
+            generator(), tool_types=[FormatBook], partial_tools=True
+        )
+        if tool is not None and tool.delta is None
+    ]
+    assert [tool.model_dump()["title"] for tool in tools] == [
+        "The Name of the Wind",
+        "Dune",
+    ]
@@ -0,0 +1,158 @@
+"""Tests the `fake._utils.setup_call` module."""
+
+from collections.abc import Awaitable, Callable
+from typing import cast
+
+import pytest
+from pydantic import BaseModel
+
+from mirascope.core.base import BaseMessageParam, TextPart, prompt_template
+from mirascope.core.fake._utils._setup_call import setup_call
+from mirascope.core.fake.client import FakeClient
+from mirascope.core.fake.dynamic_config import AsyncFakeDynamicConfig, FakeDynamicConfig
+
+
+class Book(BaseModel):
+    title: str
+
+
+def _recommend_book(genre: str) -> None: ...
+
+
+async def _recommend_book_async(genre: str) -> None: ...
+
+
+recommend_book = cast(
+    Callable[..., FakeDynamicConfig],
+    prompt_template("Recommend a {genre} book")(_recommend_book),
+)
+recommend_book_async = cast(
+    Callable[..., Awaitable[AsyncFakeDynamicConfig]],
+    prompt_template("Recommend a {genre} book")(_recommend_book_async),
+)
+
+
+def test_setup_call() -> None:
+    """Tests the `setup_call` function with the default clients."""
+    create, prompt_template, messages, tool_types, call_kwargs = setup_call(
+        model="fake-model",
+        client=None,
+        fn=recommend_book,
+        fn_args={"genre": "fantasy"},
+        dynamic_config=None,
+        tools=None,
+        json_mode=False,
+        call_params={"max_tokens": 3},
+        extract=False,
+        stream=False,
+    )
+    assert prompt_template == "Recommend a {genre} book"
+    assert messages == [{"role": "user", "content": "Recommend a fantasy book"}]
+    assert tool_types is None
+    assert call_kwargs == {
+        "max_tokens": 3,
+        "model": "fake-model",
+        "messages": messages,
+    }
+    completion = create(**call_kwargs)
+    assert completion.model == "fake-model"
+    assert completion.usage and completion.usage.output_tokens == 3
+    assert [chunk.model for chunk in create(stream=True, **call_kwargs)][-1] == (
+        "fake-model"
+    )
+
+
+@pytest.mark.asyncio
+async def test_setup_call_async() -> None:
+    """Tests the `setup_call` function with the default async client."""
+    create, _, _, _, call_kwargs = setup_call(
+        model="fake-model",
+        client=None,
+        fn=recommend_book_async,
+        fn_args={"genre": "fantasy"},
+        dynamic_config=None,
+        tools=None,
+        json_mode=False,
+        call_params={},
+        extract=False,
+        stream=False,
+    )
+    completion = await create(**call_kwargs)
+    assert completion.model == "fake-model"
+
+
+def test_setup_call_json_mode() -> None:
+    """Tests the `setup_call` function with JSON mode."""
+    client = FakeClient()
+    _, _, messages, _, call_kwargs = setup_call(
+        model="fake-model",
+        client=client,
+        fn=recommend_book,
+        fn_args={"genre": "fantasy"},
+        dynamic_config=None,
+        tools=[Book],
+        json_mode=True,
+        call_params={},
+        extract=True,
+        stream=False,
+    )
+    assert call_kwargs.get("response_format") == {"type": "json_object"}
+    assert "tools" not in call_kwargs and "tool_choice" not in call_kwargs
+    assert isinstance(content := messages[-1]["content"], str)
+    assert content.startswith("Recommend a fantasy book\n\nExtract ONLY a valid JSON")
+
+    _, _, messages, _, _ = setup_call(
+        model="fake-model",
+        client=client,
+        fn=recommend_book,
+        fn_args={},
+        dynamic_config={
+            "messages": [
+                BaseMessageParam(
+                    role="user", content=[TextPart(type="text", text="Dune")]
+                )
+            ]
+        },
+        tools=None,
+        json_mode=True,
+        call_params={},
+        extract=False,
+        stream=False,
+    )
+    assert messages[-1]["content"][0] == {"type": "text", "text": "Dune"}  # pyright: ignore [reportIndexIssue]
+    assert messages[-1]["content"][1]["text"].startswith("Extract ONLY a valid JSON")  # pyright: ignore [reportIndexIssue, reportArgumentType, reportCallIssue]
+
+    _, _, messages, _, _ = setup_call(
+        model="fake-model",
+        client=client,
+        fn=recommend_book,
+        fn_args={},
+        dynamic_config={"messages": [{"role": "assistant", "content": "Dune"}]},
+        tools=None,
+        json_mode=True,
+        call_params={},
+        extract=False,
+        stream=False,
+    )
+    assert messages[-1]["role"] == "user"
+    assert isinstance(messages[-1]["content"], str)
+    assert messages[-1]["content"].startswith("Extract ONLY a valid JSON")
+
+
+def test_setup_call_extract() -> None:
+    """Tests the `setup_call` function with extraction."""
+    _, _, _, tool_types, call_kwargs = setup_call(
+        model="fake-model",
+        client=FakeClient(),
+        fn=recommend_book,
+        fn_args={"genre": "fantasy"},
+        dynamic_config=None,
+        tools=[Book],
+        json_mode=False,
+        call_params={},
+        extract=True,
+        stream=False,
+    )
+    assert tool_types and tool_types[0]._name() == "Book"
+    assert call_kwargs.get("tool_choice") == {"name": "Book"}
+    assert call_kwargs.get("tools") == [tool_types[0].tool_schema()]
@@ -0,0 +1,34 @@
+"""Tests the `fake.call` module."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+from mirascope.core.fake import _utils
+from mirascope.core.fake.call_response import FakeCallResponse
+from mirascope.core.fake.call_response_chunk import FakeCallResponseChunk
+from mirascope.core.fake.stream import FakeStream
+from mirascope.core.fake.tool import FakeTool
+
+
+def test_fake_call() -> None:
+    """Tests the `fake_call` decorator."""
+
+    if "mirascope.core.fake._call" in sys.modules:
+        del sys.modules["mirascope.core.fake._call"]
+
+    with patch(
+        "mirascope.core.base.call_factory", new_callable=MagicMock
+    ) as mock_call_factory:
+        import mirascope.core.fake._call  # noqa: F401
+
+        mock_call_factory.assert_called_once_with(
+            TCallResponse=FakeCallResponse,
+            TCallResponseChunk=FakeCallResponseChunk,
+            TToolType=FakeTool,
+            TStream=FakeStream,
+            default_call_params={},
+            setup_call=_utils.setup_call,
+            get_json_output=_utils.get_json_output,
+            handle_stream=_utils.handle_stream,
+            handle_stream_async=_utils.handle_stream_async,
+        )
@@ -0,0 +1,94 @@
+"""Tests the `fake.call_response` module."""
+
+from mirascope.core.fake.call_response import FakeCallResponse
+from mirascope.core.fake.tool import FakeTool
+from mirascope.core.fake.types import FakeCompletion, FakeToolCall, FakeUsage
+
+
+class FormatBook(FakeTool):
+    """Returns the title and author nicely formatted."""
+
+    title: str
+    author: str
+
+    def call(self) -> str:
+        return f"{self.title} by {self.author}"
+
+
+def _call_response(
+    completion: FakeCompletion, tool_types: list[type[FakeTool]] | None = None
+) -> FakeCallResponse:
+    return FakeCallResponse(
+        metadata={},
+        response=completion,
+        tool_types=tool_types,  # pyright: ignore [reportArgumentType]
+        prompt_template=None,
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )
+
+
+def test_fake_call_response() -> None:
+    """Tests the `FakeCallResponse` class."""
+    completion = FakeCompletion(
+        id="id",
+        model="fake-model",
+        content="content",
+        usage=FakeUsage(input_tokens=1, output_tokens=2),
+    )
+    call_response = _call_response(completion)
+    assert call_response._provider == "fake"
+    assert call_response.content == "content"
+    assert call_response.finish_reasons == ["stop"]
+    assert call_response.model == "fake-model"
+    assert call_response.id == "id"
+    assert call_response.usage == completion.usage
+    assert call_response.input_tokens == 1
+    assert call_response.output_tokens == 2
+    assert call_response.cost is None
+    assert call_response.message_param == {"role": "assistant", "content": "content"}
+    assert call_response.tools is None
+    assert call_response.tool is None
+
+    completion.usage = None
+    assert call_response.input_tokens is None
+    assert call_response.output_tokens is None
+
+
+def test_fake_call_response_with_tools() -> None:
+    """Tests the `FakeCallResponse` class with tools."""
+    tool_call = FakeToolCall(
+        id="id",
+        name="FormatBook",
+        arguments='{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}',
+    )
+    completion = FakeCompletion(
+        id="id", model="fake-model", tool_calls=[tool_call], finish_reason="tool_calls"
+    )
+    call_response = _call_response(completion, [FormatBook])
+    tools = call_response.tools
+    tool = call_response.tool
+    assert tools and len(tools) == 1 and tools[0] == tool
+    assert isinstance(tool, FormatBook)
+    assert tool.title == "The Name of the Wind"
+    assert tool.tool_call == tool_call
+    assert call_response.message_param == {
+        "role": "assistant",
+        "content": "",
+        "tool_calls": [tool_call.model_dump()],
+    }
+    output = tool.call()
+    assert call_response.tool_message_params([(tool, output)]) == [
+        {
+            "role": "tool",
+            "content": output,
+            "tool_call_id": "id",
+            "name": "FormatBook",
+        }
+    ]
@@ -0,0 +1,27 @@
+"""Tests the `fake.call_response_chunk` module."""
+
+from mirascope.core.fake.call_response_chunk import FakeCallResponseChunk
+from mirascope.core.fake.types import FakeCompletionChunk, FakeUsage
+
+
+def test_fake_call_response_chunk() -> None:
+    """Tests the `FakeCallResponseChunk` class."""
+    usage = FakeUsage(input_tokens=1, output_tokens=2)
+    chunk = FakeCompletionChunk(
+        id="id", model="fake-model", finish_reason="stop", usage=usage
+    )
+    call_response_chunk = FakeCallResponseChunk(chunk=chunk)
+    assert call_response_chunk.content == ""
+    assert call_response_chunk.finish_reasons == ["stop"]
+    assert call_response_chunk.model == "fake-model"
+    assert call_response_chunk.id == "id"
+    assert call_response_chunk.usage == usage
+    assert call_response_chunk.input_tokens == 1
+    assert call_response_chunk.output_tokens == 2
+
+    chunk = FakeCompletionChunk(id="id", model="fake-model", content="content")
+    call_response_chunk = FakeCallResponseChunk(chunk=chunk)
+    assert call_response_chunk.content == "content"
+    assert call_response_chunk.finish_reasons == []
+    assert call_response_chunk.input_tokens is None
+    assert call_response_chunk.output_tokens is None
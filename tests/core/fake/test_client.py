@@ -0,0 +1,215 @@
+"""Tests the `fake.client` module."""
+
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mirascope.core import fake
+from mirascope.core.base.deadline import call_deadline
+from mirascope.core.fake.client import (
+    AsyncFakeClient,
+    FakeAPIError,
+    FakeClient,
+    FakeRateLimitError,
+    FakeResponse,
+    FakeTimeoutError,
+    lognormal_latency,
+    uniform_latency,
+)
+from mirascope.core.fake.types import FakeToolCall
+
+MESSAGES = [{"role": "user", "content": "Recommend a fantasy book"}]
+
+
+def test_fake_client_scripted_responses() -> None:
+    """Tests that scripted responses are returned in order, then generated."""
+    tool_call = FakeToolCall(name="FormatBook", arguments='{"title": "Dune"}')
+    client = FakeClient(
+        [
+            "Mistborn",
+            FakeResponse(tool_calls=[tool_call], input_tokens=10, output_tokens=20),
+            None,
+        ],
+        output_tokens=4,
+        seed=0,
+    )
+    completion = client.create(model="fake-model", messages=MESSAGES)
+    assert completion.id == "fake-1"
+    assert completion.content == "Mistborn"
+    assert completion.finish_reason == "stop"
+    assert completion.usage and completion.usage.input_tokens == 6
+    assert completion.usage.output_tokens == 2
+
+    completion = client.create(model="fake-model", messages=MESSAGES)
+    assert completion.tool_calls == [tool_call.model_copy(update={"id": "call_2_0"})]
+    assert completion.finish_reason == "tool_calls"
+    assert completion.usage and completion.usage.input_tokens == 10
+    assert completion.usage.output_tokens == 20
+
+    for _ in range(2):
+        completion = client.create(model="fake-model", messages=MESSAGES)
+        assert len(completion.content.split()) == 4
+        assert completion.usage and completion.usage.output_tokens == 4
+    completion = client.create(model="fake-model", messages=[], max_tokens=2)
+    assert len(completion.content.split()) == 2
+    assert completion.finish_reason == "length"
+    assert client.request_count == 5
+    assert client.last_request == {
+        "model": "fake-model",
+        "messages": [],
+        "max_tokens": 2,
+    }
+
+    generated = [
+        FakeClient(seed=0).create(model="fake-model", messages=[]).content
+        for _ in range(2)
+    ]
+    assert generated[0] == generated[1]
+
+
+def test_fake_client_responses_fn() -> None:
+    """Tests responding to each request with a function of its arguments."""
+    client = FakeClient(
+        lambda kwargs: (
+            content.upper()
+            if isinstance(content := kwargs["messages"][-1]["content"], str)
+            else None
+        ),
+        output_tokens=3,
+    )
+    assert client.create(model="fake-model", messages=MESSAGES).content == (
+        "RECOMMEND A FANTASY BOOK"
+    )
+    messages = [
+        {"role": "user", "content": [{"type": "text", "text": "Hi"}, {"type": "image"}]}
+    ]
+    completion = client.create(model="fake-model", messages=messages)
+    assert len(completion.content.split()) == 3
+    assert completion.usage and completion.usage.input_tokens == 1
+
+
+def test_fake_client_errors() -> None:
+    """Tests scripted and injected errors."""
+    client = FakeClient([FakeAPIError("Bad gateway.", status_code=502), ValueError])
+    with pytest.raises(FakeAPIError, match="Bad gateway.") as exc_info:
+        client.create(model="fake-model", messages=MESSAGES)
+    assert exc_info.value.status_code == 502
+    with pytest.raises(ValueError):
+        client.create(model="fake-model", messages=MESSAGES)
+
+    client = FakeClient(error_rate=0.5, seed=0)
+    outcomes = []
+    for _ in range(100):
+        try:
+            client.create(model="fake-model", messages=MESSAGES)
+            outcomes.append(None)
+        except (FakeRateLimitError, FakeTimeoutError) as e:
+            outcomes.append(type(e))
+    assert set(outcomes) == {None, FakeRateLimitError, FakeTimeoutError}
+    assert 30 < outcomes.count(None) < 70
+    assert FakeRateLimitError().status_code == 429
+    assert FakeAPIError().status_code == 500
+
+    with pytest.raises(ValueError, match="`chunk_size` must be at least 1."):
+        FakeClient(chunk_size=0)
+
+
+@patch("mirascope.core.fake.client.time.sleep")
+def test_fake_client_latency(mock_sleep) -> None:
+    """Tests the latencies of sync requests, streams, and timeouts."""
+    tool_call = FakeToolCall(id="id", name="FormatBook", arguments='{"a": 1}')
+    client = FakeClient(
+        ["hello world", FakeResponse(content="hi", latency=3.0), FakeRateLimitError],
+        latency=1.0,
+        chunk_latency=0.1,
+        chunk_size=4,
+    )
+    client.create(model="fake-model", messages=MESSAGES)
+    assert mock_sleep.call_args_list[-1].args == (pytest.approx(1.3),)
+    chunks = list(client.create(model="fake-model", messages=MESSAGES, stream=True))
+    assert [chunk.content for chunk in chunks] == ["hi", ""]
+    assert mock_sleep.call_args_list[-2:] == [((3.0,),), ((0.1,),)]
+    with pytest.raises(FakeRateLimitError):
+        client.create(model="fake-model", messages=MESSAGES, stream=True)
+    assert mock_sleep.call_args_list[-1].args == (1.0,)
+
+    client = FakeClient(
+        [FakeResponse(content="hello", tool_calls=[tool_call]), "hello", "hello"],
+        chunk_latency=2.0,
+        chunk_size=4,
+    )
+    chunks = list(client.create(model="fake-model", messages=MESSAGES, stream=True))
+    assert [chunk.content for chunk in chunks] == ["hell", "o", "", "", ""]
+    assert chunks[2].tool_calls and chunks[2].tool_calls[0].name == "FormatBook"
+    assert chunks[3].tool_calls and chunks[3].tool_calls[0].arguments == ": 1}"
+    assert chunks[-1].finish_reason == "tool_calls" and chunks[-1].usage
+
+    mock_sleep.reset_mock()
+    with pytest.raises(FakeTimeoutError):
+        client.create(model="fake-model", messages=MESSAGES, timeout=3.0)
+    mock_sleep.assert_called_once_with(3.0)
+    stream = client.create(
+        model="fake-model", messages=MESSAGES, stream=True, timeout=1.0
+    )
+    assert next(stream).content == "hell"
+    with pytest.raises(FakeTimeoutError, match="Request timed out."):
+        next(stream)
+
+
+@pytest.mark.asyncio
+@patch("mirascope.core.fake.client.asyncio.sleep", new_callable=AsyncMock)
+async def test_async_fake_client(mock_sleep: AsyncMock) -> None:
+    """Tests the latencies of async requests, streams, and timeouts."""
+    client = AsyncFakeClient(
+        ["hello", "hello", "hello", FakeRateLimitError],
+        latency=1.0,
+        chunk_latency=0.5,
+        chunk_size=2,
+    )
+    completion = await client.create(model="fake-model", messages=MESSAGES)
+    assert completion.content == "hello"
+    mock_sleep.assert_called_once_with(2.5)
+
+    stream = await client.create(model="fake-model", messages=MESSAGES, stream=True)
+    assert [chunk.content async for chunk in stream] == ["he", "ll", "o", ""]
+    assert [call.args[0] for call in mock_sleep.call_args_list[1:]] == [
+        1.0,
+        0.5,
+        0.5,
+        0.5,
+    ]
+
+    mock_sleep.reset_mock()
+    stream = await client.create(
+        model="fake-model", messages=MESSAGES, stream=True, timeout=0.75
+    )
+    with pytest.raises(FakeTimeoutError):
+        await anext(stream)
+    mock_sleep.assert_called_once_with(0.75)
+    with pytest.raises(FakeRateLimitError):
+        await client.create(model="fake-model", messages=MESSAGES)
+
+
+def test_latency_distributions() -> None:
+    """Tests the latency distributions."""
+    rng = random.Random(0)
+    uniform = uniform_latency(1.0, 2.0)
+    assert all(1.0 <= uniform(rng) <= 2.0 for _ in range(100))
+    lognormal = lognormal_latency(0.5, 0.5)
+    samples = sorted(lognormal(rng) for _ in range(1001))
+    assert 0.4 < samples[500] < 0.6
+    assert all(sample > 0 for sample in samples)
+
+
+@patch("mirascope.core.fake.client.time.sleep")
+def test_fake_call_deadline(mock_sleep) -> None:
+    """Tests that deadlines are passed to the fake client as timeouts."""
+
+    @fake.call("fake-model", client=FakeClient(latency=10.0))
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    with call_deadline(5.0), pytest.raises(FakeTimeoutError):
+        recommend_book("fantasy")
+    assert mock_sleep.call_args.args[0] == pytest.approx(5.0, abs=0.5)
@@ -0,0 +1,101 @@
+"""Tests the `fake.stream` module."""
+
+import pytest
+
+from mirascope.core.fake.call_response import FakeCallResponse
+from mirascope.core.fake.call_response_chunk import FakeCallResponseChunk
+from mirascope.core.fake.stream import FakeStream
+from mirascope.core.fake.tool import FakeTool
+from mirascope.core.fake.types import (
+    FakeCompletionChunk,
+    FakeToolCall,
+    FakeUsage,
+)
+
+
+class FormatBook(FakeTool):
+    """Returns the title and author nicely formatted."""
+
+    title: str
+    author: str
+
+    def call(self) -> None:
+        """Dummy call."""
+
+
+def _stream(chunks: list[tuple[FakeCompletionChunk, FakeTool | None]]) -> FakeStream:
+    def generator():
+        for chunk, tool in chunks:
+            yield FakeCallResponseChunk(chunk=chunk), tool
+
+    return FakeStream(
+        stream=generator(),
+        metadata={},
+        tool_types=[FormatBook],
+        call_response_type=FakeCallResponse,
+        model="fake-model",
+        prompt_template="",
+        fn_args={},
+        dynamic_config=None,
+        messages=[{"role": "user", "content": "content"}],
+        call_params={},
+        call_kwargs={},
+    )
+
+
+def test_fake_stream() -> None:
+    """Tests the `FakeStream` class."""
+    assert FakeStream._provider == "fake"
+    tool_call = FakeToolCall(
+        id="id",
+        name="FormatBook",
+        arguments='{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}',
+    )
+    usage = FakeUsage(input_tokens=1, output_tokens=2)
+    stream = _stream(
+        [
+            (FakeCompletionChunk(id="id", model="fake-model", content="content"), None),
+            (
+                FakeCompletionChunk(id="id", model="fake-model"),
+                FormatBook.from_tool_call(tool_call),
+            ),
+            (
+                FakeCompletionChunk(
+                    id="id", model="fake-model", finish_reason="tool_calls", usage=usage
+                ),
+                None,
+            ),
+        ]
+    )
+    with pytest.raises(
+        ValueError, match="No stream response, check if the stream has been consumed."
+    ):
+        stream.construct_call_response()
+    assert stream.cost is None
+    for _ in stream:
+        pass
+    assert stream.message_param == {
+        "role": "assistant",
+        "content": "content",
+        "tool_calls": [tool_call.model_dump()],
+    }
+
+    call_response = stream.construct_call_response()
+    assert call_response.content == "content"
+    assert call_response.finish_reasons == ["tool_calls"]
+    assert call_response.usage == usage
+    assert call_response.tool and call_response.tool.tool_call == tool_call
+    assert call_response.message_param == stream.message_param
+
+
+def test_fake_stream_no_usage() -> None:
+    """Tests the `FakeStream.construct_call_response` method without usage."""
+    stream = _stream(
+        [(FakeCompletionChunk(id="id", model="fake-model", content="content"), None)]
+    )
+    for _ in stream:
+        pass
+    call_response = stream.construct_call_response()
+    assert call_response.usage is None
+    assert call_response.finish_reasons == ["stop"]
+    assert call_response.message_param == {"role": "assistant", "content": "content"}
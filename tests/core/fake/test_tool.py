@@ -0,0 +1,56 @@
+"""Tests the `fake.tool` module."""
+
+from mirascope.core.base.tool import BaseTool
+from mirascope.core.fake.tool import FakeTool
+from mirascope.core.fake.types import FakeToolCall
+
+
+def test_fake_tool() -> None:
+    """Tests the `FakeTool` class."""
+
+    class FormatBook(FakeTool):
+        """Returns the title and author nicely formatted."""
+
+        title: str
+        author: str
+
+        def call(self) -> str:
+            return f"{self.title} by {self.author}"
+
+    tool_call = FakeToolCall(
+        id="id",
+        name="FormatBook",
+        arguments='{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}',
+    )
+    tool = FormatBook.from_tool_call(tool_call)
+    assert isinstance(tool, BaseTool)
+    assert isinstance(tool, FormatBook)
+    assert tool.tool_call == tool_call
+    assert tool.call() == "The Name of the Wind by Patrick Rothfuss"
+    assert FormatBook.tool_schema() == {
+        "name": "FormatBook",
+        "description": "Returns the title and author nicely formatted.",
+        "parameters": {
+            "properties": {
+                "title": {"type": "string"},
+                "author": {"type": "string"},
+            },
+            "required": ["title", "author"],
+            "type": "object",
+        },
+    }
+
+
+def test_fake_tool_no_parameters() -> None:
+    """Tests the `FakeTool.tool_schema` method for a tool without parameters."""
+
+    class GetTime(FakeTool):
+        """Returns the time."""
+
+        def call(self) -> str:
+            return "noon"  # pragma: no cover
+
+    assert GetTime.tool_schema() == {
+        "name": "GetTime",
+        "description": "Returns the time.",
+    }
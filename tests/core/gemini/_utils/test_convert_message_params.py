@@ -13,7 +13,10 @@ from mirascope.core.base import (
     ImagePart,
     TextPart,
 )
-from mirascope.core.gemini._utils._convert_message_params import convert_message_params
+from mirascope.core.gemini._utils._convert_message_params import (
+    convert_message_params,
+    convert_text_message,
+)
 
 
 @patch("PIL.Image.open", new_callable=MagicMock)
@@ -104,3 +107,11 @@ def test_convert_message_params(mock_image_open: MagicMock) -> None:
                 )
             ]
         )
+
+
+def test_convert_text_message() -> None:
+    """Tests that text messages are converted the same as `BaseMessageParam`."""
+    for role in ["system", "user", "assistant"]:
+        assert convert_text_message(role, "Hello") == convert_message_params(
+            [BaseMessageParam(role=role, content="Hello")]
+        )
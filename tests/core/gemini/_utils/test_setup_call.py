@@ -10,6 +10,7 @@ from google.generativeai.types.content_types import ToolConfigDict
 from mirascope.core.gemini._utils._convert_common_call_params import (
     convert_common_call_params,
 )
+from mirascope.core.gemini._utils._convert_message_params import convert_text_message
 from mirascope.core.gemini._utils._setup_call import setup_call
 from mirascope.core.gemini.tool import GeminiTool
 
@@ -62,7 +63,14 @@ def test_setup_call(
     assert tool_types == mock_base_setup_call.return_value[2]
     assert "contents" in call_kwargs and call_kwargs["contents"] == messages
     mock_base_setup_call.assert_called_once_with(
-        fn, {}, None, None, GeminiTool, {}, convert_common_call_params
+        fn,
+        {},
+        None,
+        None,
+        GeminiTool,
+        {},
+        convert_common_call_params,
+        convert_text_message=convert_text_message,
     )
     mock_convert_message_params.assert_called_once_with(
         mock_base_setup_call.return_value[1]
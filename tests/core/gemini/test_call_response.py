@@ -62,6 +62,9 @@ def test_gemini_call_response() -> None:
         "parts": [Part(text="The author is Patrick Rothfuss")],
     }
 
+    data = GeminiCallResponse._dump_response(response)
+    assert GeminiCallResponse._load_response(data).to_dict() == response.to_dict()
+
 
 def test_gemini_call_response_with_tools() -> None:
     """Tests the `GeminiCallResponse` class with tools."""
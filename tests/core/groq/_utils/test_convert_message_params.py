@@ -4,7 +4,10 @@ import pytest
 from groq.types.chat import ChatCompletionMessageParam
 
 from mirascope.core.base import AudioPart, BaseMessageParam, ImagePart, TextPart
-from mirascope.core.groq._utils._convert_message_params import convert_message_params
+from mirascope.core.groq._utils._convert_message_params import (
+    convert_message_params,
+    convert_text_message,
+)
 
 
 def test_convert_message_params() -> None:
@@ -65,8 +68,7 @@ def test_convert_message_params() -> None:
 
     with pytest.raises(
         ValueError,
-        match="Groq currently only supports text and image parts. "
-        "Part provided: audio",
+        match="Groq currently only supports text and image parts. Part provided: audio",
     ):
         convert_message_params(
             [
@@ -78,3 +80,11 @@ def test_convert_message_params() -> None:
                 )
             ]
         )
+
+
+def test_convert_text_message() -> None:
+    """Tests that text messages are converted the same as `BaseMessageParam`."""
+    for role in ["system", "user", "assistant"]:
+        assert convert_text_message(role, "Hello") == convert_message_params(
+            [BaseMessageParam(role=role, content="Hello")]
+        )
@@ -8,6 +8,7 @@ import pytest
 from mirascope.core.groq._utils._convert_common_call_params import (
     convert_common_call_params,
 )
+from mirascope.core.groq._utils._convert_message_params import convert_text_message
 from mirascope.core.groq._utils._setup_call import setup_call
 from mirascope.core.groq.tool import GroqTool
 
@@ -52,7 +53,14 @@ def test_setup_call(
     assert "model" in call_kwargs and call_kwargs["model"] == "llama-3.1-8b-instant"
     assert "messages" in call_kwargs and call_kwargs["messages"] == messages
     mock_base_setup_call.assert_called_once_with(
-        fn, {}, None, None, GroqTool, {}, convert_common_call_params
+        fn,
+        {},
+        None,
+        None,
+        GroqTool,
+        {},
+        convert_common_call_params,
+        convert_text_message=convert_text_message,
     )
     mock_convert_message_params.assert_called_once_with(
         mock_base_setup_call.return_value[1]
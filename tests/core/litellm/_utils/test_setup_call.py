@@ -1,13 +1,11 @@
 """Tests the `openai._utils.setup_call` module."""
 
-import inspect
 from unittest.mock import MagicMock, patch
 
-from litellm import completion
-
 from mirascope.core.litellm._utils._setup_call import setup_call
 
 
+@patch("mirascope.core.litellm._utils._setup_call.completion", new_callable=MagicMock)
 @patch("mirascope.core.litellm._utils._setup_call.OpenAI", new_callable=MagicMock)
 @patch(
     "mirascope.core.litellm._utils._setup_call.setup_call_openai",
@@ -16,6 +14,7 @@ from mirascope.core.litellm._utils._setup_call import setup_call
 def test_setup_call(
     mock_setup_call_openai: MagicMock,
     mock_openai: MagicMock,
+    mock_completion: MagicMock,
 ) -> None:
     """Tests the `setup_call` function."""
     mock_setup_call_openai.return_value = [MagicMock() for _ in range(5)]
@@ -45,7 +44,8 @@ def test_setup_call(
         extract=False,
         stream=False,
     )
-    assert inspect.signature(create) == inspect.signature(completion)
+    assert create(model="gpt-4o") == mock_completion.return_value
+    mock_completion.assert_called_once_with(model="gpt-4o")
     assert prompt_template == mock_setup_call_openai.return_value[1]
     assert messages == mock_setup_call_openai.return_value[2]
     assert tool_types == mock_setup_call_openai.return_value[3]
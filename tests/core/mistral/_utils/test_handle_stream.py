@@ -1,5 +1,7 @@
 """Tests the `mistral._utils.handle_stream` module."""
 
+import copy
+
 import pytest
 from mistralai.models.chat_completion import (
     ChatCompletionResponseStreamChoice,
@@ -146,10 +148,11 @@ def test_handle_stream(mock_chunks: list[ChatCompletionStreamResponse]) -> None:
     """Tests the `handle_stream` function."""
 
     result = list(handle_stream((c for c in mock_chunks), tool_types=[FormatBook]))
-    # Check we get three tuples back.
-    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook)
-    assert len(result) == 3
+    # Check we get four tuples back, with each tool emitted as soon as it's complete.
+    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook), (chunk, None)
+    assert len(result) == 4
     assert result[0][1] is None
+    assert result[3][1] is None
     assert (
         (tool := result[1][1]) is not None
         and isinstance(tool, FormatBook)
@@ -177,10 +180,11 @@ async def test_handle_stream_async(
     result = []
     async for t in handle_stream_async(generator(), tool_types=[FormatBook]):
         result.append(t)
-    # Check we get three tuples back.
-    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook)
-    assert len(result) == 3
+    # Check we get four tuples back, with each tool emitted as soon as it's complete.
+    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook), (chunk, None)
+    assert len(result) == 4
     assert result[0][1] is None
+    assert result[3][1] is None
     assert (
         (tool := result[1][1]) is not None
         and isinstance(tool, FormatBook)
@@ -193,3 +197,36 @@ async def test_handle_stream_async(
         and tool.model_dump(exclude={"tool_call"})
         == {"title": "The Name of the Wind", "author": "Patrick Rothfuss"}
     )
+
+
+def test_handle_stream_partial_tools(
+    mock_chunks: list[ChatCompletionStreamResponse],
+) -> None:
+    """Tests streaming partial tools as the tool arguments are streamed."""
+    chunks = [
+        mock_chunks[1],
+        copy.deepcopy(mock_chunks[2]),
+        copy.deepcopy(mock_chunks[2]),
+        mock_chunks[-1],
+    ]
+    for chunk, arguments in zip(
+        chunks[1:3],
+        ['{"title": "The Name', ' of the Wind", "author": "Patrick Rothfuss"}'],
+        strict=True,
+    ):
+        chunk.choices[0].delta.tool_calls[0].function.arguments = arguments  # pyright: ignore [reportOptionalSubscript]
+    tools = [
+        tool
+        for _, tool in handle_stream(
+            (c for c in chunks), tool_types=[FormatBook], partial_tools=True
+        )
+    ]
+    assert [tool.delta if tool else None for tool in tools] == [
+        '{"title": "The Name',
+        None,
+        None,
+    ]
+    assert isinstance(tools[0], FormatBook)
+    assert tools[0].title == "The Name" and tools[0].author is None
+    assert isinstance(tools[1], FormatBook)
+    assert tools[1].author == "Patrick Rothfuss"
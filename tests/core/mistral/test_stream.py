@@ -15,6 +15,7 @@ from mistralai.models.chat_completion import (
 )
 from mistralai.models.common import UsageInfo
 
+from mirascope.core.mistral._utils._handle_stream import handle_stream
 from mirascope.core.mistral.call_response import MistralCallResponse
 from mirascope.core.mistral.call_response_chunk import MistralCallResponseChunk
 from mirascope.core.mistral.stream import MistralStream
@@ -261,3 +262,58 @@ def test_construct_call_response() -> None:
     )
     constructed_call_response = stream.construct_call_response()
     assert constructed_call_response.response == call_response.response
+
+
+def test_mistral_stream_chunk_with_several_tools() -> None:
+    """Tests that a chunk completing several tools only counts its usage once."""
+
+    class FormatBook(MistralTool):
+        """Returns the title nicely formatted."""
+
+        title: str
+
+        def call(self) -> None:
+            """Dummy call."""
+
+    tool_calls = [
+        ToolCall(
+            id=f"id{i}",
+            function=FunctionCall(name="FormatBook", arguments=f'{{"title": "{t}"}}'),
+            type=ToolType.function,
+        )
+        for i, t in enumerate(["Dune", "Emma"])
+    ]
+    chunk = ChatCompletionStreamResponse(
+        id="id",
+        choices=[
+            ChatCompletionResponseStreamChoice(
+                index=0,
+                delta=DeltaMessage(content=None, tool_calls=tool_calls),
+                finish_reason=None,
+            )
+        ],
+        created=0,
+        model="mistral-large-latest",
+        object="chat.completion.chunk",
+        usage=UsageInfo(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+    )
+    stream = MistralStream(
+        stream=handle_stream((c for c in [chunk]), [FormatBook]),
+        metadata={},
+        tool_types=[FormatBook],
+        call_response_type=MistralCallResponse,
+        model="mistral-large-latest",
+        prompt_template="",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )
+    tools = [tool for _, tool in stream]
+    assert [tool.title for tool in tools if isinstance(tool, FormatBook)] == [
+        "Dune",
+        "Emma",
+    ]
+    assert stream.input_tokens == 10
+    assert stream.output_tokens == 5
@@ -10,7 +10,10 @@ from mirascope.core.base import (
     ImagePart,
     TextPart,
 )
-from mirascope.core.openai._utils._convert_message_params import convert_message_params
+from mirascope.core.openai._utils._convert_message_params import (
+    convert_message_params,
+    convert_text_message,
+)
 
 
 def test_convert_message_params() -> None:
@@ -106,3 +109,11 @@ def test_convert_message_params() -> None:
                 )
             ]
         )
+
+
+def test_convert_text_message() -> None:
+    """Tests that text messages are converted the same as `BaseMessageParam`."""
+    for role in ["system", "user", "assistant"]:
+        assert convert_text_message(role, "Hello") == convert_message_params(
+            [BaseMessageParam(role=role, content="Hello")]
+        )
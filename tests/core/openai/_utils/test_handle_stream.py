@@ -138,10 +138,11 @@ def test_handle_stream(mock_chunks: list[ChatCompletionChunk]) -> None:
     """Tests the `handle_stream` function."""
 
     result = list(handle_stream((c for c in mock_chunks), tool_types=[FormatBook]))
-    # Check we get three tuples back.
-    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook)
-    assert len(result) == 3
+    # Check we get four tuples back, with each tool emitted as soon as it's complete.
+    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook), (chunk, None)
+    assert len(result) == 4
     assert result[0][1] is None
+    assert result[3][1] is None
     assert (
         (tool := result[1][1]) is not None
         and isinstance(tool, FormatBook)
@@ -167,10 +168,11 @@ async def test_handle_stream_async(mock_chunks: list[ChatCompletionChunk]) -> No
     result = []
     async for t in handle_stream_async(generator(), tool_types=[FormatBook]):
         result.append(t)
-    # Check we get three tuples back.
-    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook)
-    assert len(result) == 3
+    # Check we get four tuples back, with each tool emitted as soon as it's complete.
+    # (chunk, None), (chunk, FormatBook), (chunk, FormatBook), (chunk, None)
+    assert len(result) == 4
     assert result[0][1] is None
+    assert result[3][1] is None
     assert (
         (tool := result[1][1]) is not None
         and isinstance(tool, FormatBook)
@@ -183,3 +185,115 @@ async def test_handle_stream_async(mock_chunks: list[ChatCompletionChunk]) -> No
         and tool.model_dump(exclude={"tool_call"})
         == {"title": "The Name of the Wind", "author": "Patrick Rothfuss"}
     )
+
+
+def _tool_call_chunk(
+    index: int, id: str | None, name: str | None, arguments: str | None
+) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="id",
+        choices=[
+            Choice(
+                delta=ChoiceDelta(
+                    content=None,
+                    tool_calls=[
+                        ChoiceDeltaToolCall(
+                            index=index,
+                            id=id,
+                            function=ChoiceDeltaToolCallFunction(
+                                arguments=arguments, name=name
+                            ),
+                            type="function",
+                        )
+                    ],
+                ),
+                index=0,
+            )
+        ],
+        created=0,
+        model="gpt-4o",
+        object="chat.completion.chunk",
+    )
+
+
+def test_handle_stream_parallel_tool_calls() -> None:
+    """Tests that interleaved parallel tool calls are tracked by index."""
+    chunks = [
+        _tool_call_chunk(0, "id0", "FormatBook", None),
+        _tool_call_chunk(1, "id1", "FormatBook", None),
+        _tool_call_chunk(0, None, None, '{"title": "The Name of the Wind", '),
+        _tool_call_chunk(1, None, None, '{"title": "Mistborn", '),
+        _tool_call_chunk(1, None, None, '"author": "Brandon Sanderson"}'),
+        _tool_call_chunk(0, None, None, '"author": "Patrick Rothfuss"}'),
+        ChatCompletionChunk(
+            id="id",
+            choices=[
+                Choice(
+                    delta=ChoiceDelta(content=None, tool_calls=None),
+                    finish_reason="tool_calls",
+                    index=0,
+                )
+            ],
+            created=0,
+            model="gpt-4o",
+            object="chat.completion.chunk",
+        ),
+    ]
+    result = list(handle_stream((c for c in chunks), tool_types=[FormatBook]))
+    assert [(chunk.chunk, tool) for chunk, tool in result[:2]] == [
+        (chunks[4], result[0][1]),
+        (chunks[5], result[1][1]),
+    ]
+    assert [
+        tool.tool_call.id if tool else None
+        for _, tool in result  # pyright: ignore [reportAttributeAccessIssue]
+    ] == ["id1", "id0", None]
+    assert isinstance(tool := result[1][1], FormatBook)
+    assert tool.model_dump(exclude={"tool_call"}) == {
+        "title": "The Name of the Wind",
+        "author": "Patrick Rothfuss",
+    }
+    assert result[2][0].chunk == chunks[-1]
+
+    # Incomplete tool calls are flushed on the next chunk without tool calls.
+    chunks.insert(-1, _tool_call_chunk(2, "id2", "FormatBook", '{"title": "Dune", '))
+    with pytest.raises(ValueError, match="EOF while parsing"):
+        list(handle_stream((c for c in chunks), tool_types=[FormatBook]))
+
+
+@pytest.mark.asyncio
+async def test_handle_stream_partial_tools() -> None:
+    """Tests streaming partial tools as the tool arguments are streamed."""
+    chunks = [
+        _tool_call_chunk(0, "id0", "FormatBook", '{"title": "The Name'),
+        _tool_call_chunk(0, None, None, ' of the Wind", "auth'),
+        _tool_call_chunk(0, None, None, 'or": "Patrick Rothfuss"}'),
+    ]
+    result = list(
+        handle_stream((c for c in chunks), tool_types=[FormatBook], partial_tools=True)
+    )
+    tools = [tool for _, tool in result]
+    assert [tool.delta for tool in tools if tool] == [
+        '{"title": "The Name',
+        ' of the Wind", "auth',
+        None,
+    ]
+    assert [tool.title for tool in tools if isinstance(tool, FormatBook)] == [
+        "The Name"
+    ] + ["The Name of the Wind"] * 2
+    assert isinstance(tools[0], FormatBook) and tools[0].author is None
+    assert tools[0].tool_call.id == "id0"
+    assert isinstance(tools[2], FormatBook) and tools[2].author == "Patrick Rothfuss"
+
+    async def generator():
+        for chunk in chunks:
+            yield chunk
+
+    result = []
+    async for _, tool in handle_stream_async(
+        generator(), tool_types=[FormatBook], partial_tools=True
+    ):
+        result.append(tool)
+    assert [tool.delta if tool else None for tool in result] == [
+        tool.delta if tool else None for tool in tools
+    ]
@@ -0,0 +1,201 @@
+"""Tests the `OpenAIBatch` class against a local stub of the Batch API."""
+
+import json
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from openai import OpenAI
+from pydantic import BaseModel
+
+from mirascope.core import openai
+from mirascope.core.base.batch import BatchError, BatchRequestError
+
+
+class BatchAPIStub(BaseHTTPRequestHandler):
+    """Implements the file and batch endpoints used by `OpenAIBatch`."""
+
+    requests: list[dict]
+    batch_status: list[str]
+
+    def _send(self, body: object, content_type: str = "application/json") -> None:
+        data = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _batch(self, status: str) -> dict:
+        return {
+            "id": "batch_1",
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": "file-in",
+            "completion_window": "24h",
+            "created_at": 0,
+            "status": status,
+            "output_file_id": "file-out" if status == "completed" else None,
+            "error_file_id": "file-err" if status == "completed" else None,
+            "errors": {"data": [{"message": "Invalid file"}]}
+            if status == "failed"
+            else None,
+        }
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/v1/files":
+            type(self).requests = [
+                json.loads(line)
+                for line in body.decode().splitlines()
+                if line.startswith('{"custom_id"')
+            ]
+            self._send(
+                {
+                    "id": "file-in",
+                    "object": "file",
+                    "bytes": len(body),
+                    "created_at": 0,
+                    "filename": "batch.jsonl",
+                    "purpose": "batch",
+                    "status": "processed",
+                }
+            )
+        else:
+            self._send(self._batch("validating"))
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path == "/v1/batches/batch_1":
+            self._send(self._batch(self.batch_status.pop(0)))
+        elif self.path == "/v1/files/file-out/content":
+            self._send("\n".join(_output(r) for r in self.requests[:2]))
+        else:
+            self._send(
+                json.dumps(
+                    {
+                        "id": "batch_req_2",
+                        "custom_id": self.requests[2]["custom_id"],
+                        "response": None,
+                        "error": {"code": "rate_limited", "message": "Rate limited"},
+                    }
+                )
+                + "\n"
+            )
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _output(request: dict) -> str:
+    body = request["body"]
+    text = body["messages"][0]["content"]
+    content = json.dumps({"title": text}) if "response_format" in body else text
+    completion = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": body["model"],
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3},
+    }
+    return json.dumps(
+        {
+            "id": "batch_req_1",
+            "custom_id": request["custom_id"],
+            "response": {"status_code": 200, "request_id": "1", "body": completion},
+            "error": None,
+        }
+    )
+
+
+@pytest.fixture
+def client() -> Generator[OpenAI, None, None]:
+    """Returns a client for a stub Batch API server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BatchAPIStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield OpenAI(
+        api_key="test",
+        base_url=f"http://127.0.0.1:{server.server_address[1]}/v1",
+        max_retries=0,
+    )
+    server.shutdown()
+    server.server_close()
+
+
+class Book(BaseModel):
+    title: str
+
+
+def test_openai_batch(client: OpenAI) -> None:
+    """Tests submitting a batch and parsing its results into call outputs."""
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    BatchAPIStub.batch_status = ["validating", "in_progress", "completed"]
+    batch = openai.OpenAIBatch(recommend_book, client=client, poll_interval=0)
+    batch.add("fantasy", custom_id="fantasy")
+    batch.add("mystery", custom_id="mystery")
+    batch.add("horror", custom_id="horror")
+    assert batch.submit() == "batch_1"
+    assert not batch.poll()
+    assert batch.status == "validating"
+    results = batch.wait()
+    assert batch.status == "completed"
+
+    assert [request["body"] for request in BatchAPIStub.requests] == [
+        {
+            "model": "gpt-4o-mini",
+            "messages": [{"role": "user", "content": f"Recommend a {genre} book"}],
+        }
+        for genre in ("fantasy", "mystery", "horror")
+    ]
+    response = results["fantasy"]
+    assert isinstance(response, openai.OpenAICallResponse)
+    assert response.content == "Recommend a fantasy book"
+    assert response.fn_args == {"genre": "fantasy"}
+    assert response.input_tokens == 1
+    assert isinstance(results["horror"], BatchRequestError)
+    assert "Rate limited" in str(results["horror"])
+
+
+def test_openai_batch_response_model(client: OpenAI) -> None:
+    """Tests parsing batch results into `response_model` outputs."""
+
+    @openai.call("gpt-4o-mini", response_model=Book, json_mode=True)
+    def extract_book(text: str) -> str:
+        return text
+
+    BatchAPIStub.batch_status = ["completed"]
+    batch = openai.OpenAIBatch(extract_book, client=client, poll_interval=0)
+    for text in ("The Name of the Wind", "Dune", "Mistborn"):
+        batch.add(text)
+    results = batch.wait()
+    assert results["request-0"] == Book(title="The Name of the Wind")
+    assert results["request-1"] == Book(title="Dune")
+    assert BatchAPIStub.requests[0]["body"]["response_format"] == {
+        "type": "json_object"
+    }
+
+
+def test_openai_batch_failed(client: OpenAI) -> None:
+    """Tests that a failed batch raises a `BatchError`."""
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    BatchAPIStub.batch_status = ["failed"]
+    batch = openai.OpenAIBatch(recommend_book, client=client)
+    batch.add("fantasy")
+    with pytest.raises(BatchError, match="Invalid file"):
+        batch.wait()
@@ -11,7 +11,7 @@ from openai.types.chat.chat_completion_message_tool_call import (
     ChatCompletionMessageToolCall,
     Function,
 )
-from openai.types.completion_usage import CompletionUsage
+from openai.types.completion_usage import CompletionUsage, PromptTokensDetails
 
 from mirascope.core.openai.call_response import OpenAICallResponse
 from mirascope.core.openai.tool import OpenAITool
@@ -58,6 +58,10 @@ def test_openai_call_response() -> None:
     assert call_response.input_tokens == 1
     assert call_response.output_tokens == 1
     assert call_response.cost == 1.25e-05
+    assert call_response.cached_input_tokens is None
+    usage.prompt_tokens_details = PromptTokensDetails(cached_tokens=1)
+    assert call_response.cached_input_tokens == 1
+    assert call_response.cost == pytest.approx(1.125e-05)
     assert call_response.message_param == {
         "content": "content",
         "role": "assistant",
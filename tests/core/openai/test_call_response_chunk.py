@@ -48,6 +48,7 @@ def test_openai_call_response_chunk() -> None:
     assert call_response_chunk.usage == usage
     assert call_response_chunk.input_tokens == 1
     assert call_response_chunk.output_tokens == 1
+    assert call_response_chunk.cached_input_tokens is None
 
 
 def test_openai_call_response_chunk_no_choices_or_usage() -> None:
@@ -65,6 +66,7 @@ def test_openai_call_response_chunk_no_choices_or_usage() -> None:
     assert call_response_chunk.usage is None
     assert call_response_chunk.input_tokens is None
     assert call_response_chunk.output_tokens is None
+    assert call_response_chunk.cached_input_tokens is None
 
 
 def test_openai_call_response_chunk_with_audio() -> None:
@@ -16,7 +16,7 @@ from openai.types.chat.chat_completion_message_tool_call import (
     ChatCompletionMessageToolCall,
     Function,
 )
-from openai.types.completion_usage import CompletionUsage
+from openai.types.completion_usage import CompletionUsage, PromptTokensDetails
 
 from mirascope.core.openai.call_response import OpenAICallResponse
 from mirascope.core.openai.call_response_chunk import OpenAICallResponseChunk
@@ -156,7 +156,12 @@ def test_construct_call_response() -> None:
         ),
         type="function",
     )
-    usage = CompletionUsage(completion_tokens=1, prompt_tokens=1, total_tokens=2)
+    usage = CompletionUsage(
+        completion_tokens=1,
+        prompt_tokens=2,
+        total_tokens=3,
+        prompt_tokens_details=PromptTokensDetails(cached_tokens=1),
+    )
     chunks = [
         ChatCompletionChunk(
             id="id",
@@ -223,6 +228,8 @@ def test_construct_call_response() -> None:
 
     for _ in stream:
         pass
+    assert stream.cached_input_tokens == 1
+    assert stream.cost == pytest.approx(1.375e-05)
 
     tool_call = ChatCompletionMessageToolCall(
         id="id",
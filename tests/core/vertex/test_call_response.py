@@ -73,6 +73,9 @@ def test_vertex_call_response() -> None:
         "role": "model",
     }
 
+    data = VertexCallResponse._dump_response(response)
+    assert VertexCallResponse._load_response(data).to_dict() == response.to_dict()
+
 
 def test_vertex_call_response_with_tools() -> None:
     """Tests the `VertexCallResponse` class with tools."""
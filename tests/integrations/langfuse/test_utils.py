@@ -1,12 +1,14 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from langfuse.client import StateType
 from pydantic import BaseModel
 
 from mirascope.core.base.call_response import BaseCallResponse
 from mirascope.core.base.metadata import Metadata
 from mirascope.core.base.stream import BaseStream
 from mirascope.core.base.structured_stream import BaseStructuredStream
+from mirascope.integrations._payload import PayloadPolicy, PayloadWorker
 from mirascope.integrations.langfuse import _utils
 from mirascope.integrations.langfuse._utils import ModelUsage
 
@@ -137,7 +139,7 @@ async def test_handle_stream_async(
 
     result = MagicMock(spec=BaseStream)
     await _utils.handle_stream_async(result, mock_fn, None)
-    mock_handle_stream.assert_called_once_with(result, mock_fn, None)
+    mock_handle_stream.assert_called_once_with(result, mock_fn, None, None)
 
 
 @patch(
@@ -272,4 +274,84 @@ async def test_handle_structured_stream_async(
     result = MagicMock(spec=BaseStructuredStream)
 
     await _utils.handle_structured_stream_async(result, mock_fn, None)
-    mock_handle_structured_stream.assert_called_once_with(result, mock_fn, None)
+    mock_handle_structured_stream.assert_called_once_with(result, mock_fn, None, None)
+
+
+@patch(
+    "mirascope.integrations.langfuse._utils.langfuse_context",
+    new_callable=MagicMock,
+)
+def test_update_current_observation(mock_langfuse_context: MagicMock) -> None:
+    """Tests updating the current observation with a payload policy."""
+    update = mock_langfuse_context.update_current_observation
+    _utils.update_current_observation(None, name="dummy", input="hi")
+    update.assert_called_once_with(name="dummy", input="hi")
+
+    update.reset_mock()
+    payload_policy = PayloadPolicy(allowed_fields={"output"}, max_string_length=1)
+    _utils.update_current_observation(
+        payload_policy, name="dummy", input="hi", output="hi"
+    )
+    update.assert_called_once_with(name="dummy", output="h...[1 more characters]")
+
+    update.reset_mock()
+    payload_policy = PayloadPolicy(sample_rate=0)
+    _utils.update_current_observation(payload_policy, name="dummy", input="hi")
+    update.assert_called_once_with(name="dummy")
+
+
+@patch(
+    "mirascope.integrations.langfuse._utils._update_observation",
+    new_callable=MagicMock,
+)
+@patch(
+    "mirascope.integrations.langfuse._utils.langfuse_context",
+    new_callable=MagicMock,
+)
+def test_update_current_observation_worker(
+    mock_langfuse_context: MagicMock, mock_update_observation: MagicMock
+) -> None:
+    """Tests sending the payload on the payload policy's worker."""
+    mock_langfuse_context.get_current_observation_id.return_value = "observation_id"
+    mock_langfuse_context.get_current_trace_id.return_value = "trace_id"
+    worker = PayloadWorker()
+    payload_policy = PayloadPolicy(max_string_length=1, worker=worker)
+    _utils.update_current_observation(payload_policy, name="dummy", input="hi")
+    mock_langfuse_context.update_current_observation.assert_called_once_with(
+        name="dummy"
+    )
+    assert worker.flush(timeout=5)
+    mock_update_observation.assert_called_once_with(
+        "observation_id", "trace_id", {"input": "h...[1 more characters]"}
+    )
+
+    mock_update_observation.reset_mock()
+    mock_langfuse_context.get_current_observation_id.return_value = None
+    _utils.update_current_observation(payload_policy, name="dummy", input="hi")
+    assert worker.flush(timeout=5)
+    mock_update_observation.assert_not_called()
+
+
+@patch(
+    "mirascope.integrations.langfuse._utils.StatefulGenerationClient",
+    new_callable=MagicMock,
+)
+@patch(
+    "mirascope.integrations.langfuse._utils.langfuse_context",
+    new_callable=MagicMock,
+)
+def test_update_observation(
+    mock_langfuse_context: MagicMock, mock_client: MagicMock
+) -> None:
+    """Tests updating an observation by its id."""
+    client = mock_langfuse_context.client_instance
+    _utils._update_observation("observation_id", "trace_id", {"input": "hi"})
+    mock_client.assert_called_once_with(
+        client.client,
+        "observation_id",
+        StateType.OBSERVATION,
+        "trace_id",
+        client.task_manager,
+        client.environment,
+    )
+    mock_client.return_value.update.assert_called_once_with(input="hi")
@@ -1,6 +1,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from opentelemetry import context as otel_context
 from pydantic import BaseModel, Field
 
 from mirascope.core.base.call_response import BaseCallResponse
@@ -8,6 +9,7 @@ from mirascope.core.base.metadata import Metadata
 from mirascope.core.base.stream import BaseStream
 from mirascope.core.base.structured_stream import BaseStructuredStream
 from mirascope.core.base.tool import BaseTool
+from mirascope.integrations._payload import PayloadPolicy, PayloadWorker
 from mirascope.integrations.logfire import _utils
 
 
@@ -177,7 +179,7 @@ def test_handle_stream(mock_handle_call_response: MagicMock) -> None:
     mock_stream.construct_call_response.return_value = construct_call_response
     _utils.handle_stream(mock_stream, mock_fn, mock_span)
     mock_handle_call_response.assert_called_once_with(
-        construct_call_response, mock_fn, mock_span
+        construct_call_response, mock_fn, mock_span, None
     )
 
 
@@ -194,7 +196,7 @@ async def test_handle_stream_async(mock_handle_call_response_async: MagicMock) -
     mock_stream.construct_call_response.return_value = construct_call_response
     await _utils.handle_stream_async(mock_stream, mock_fn, mock_span)
     mock_handle_call_response_async.assert_called_once_with(
-        construct_call_response, mock_fn, mock_span
+        construct_call_response, mock_fn, mock_span, None
     )
 
 
@@ -378,3 +380,59 @@ def test_get_structured_stream_span_data_base_type(
     mock_result.constructed_response_model = "foo"
     span_data = _utils.get_structured_stream_span_data(mock_result)
     assert span_data == {"output": {"content": "foo"}}
+
+
+def test_set_span_data() -> None:
+    """Tests setting the span data with a payload policy."""
+    mock_span = MagicMock()
+    fn = MagicMock(__name__="dummy_function")
+    _utils.set_span_data(mock_span, {"async": False, "messages": ["hi"]}, fn, None)
+    mock_span.set_attributes.assert_called_once_with(
+        {"async": False, "messages": ["hi"]}
+    )
+
+    mock_span.reset_mock()
+    payload_policy = PayloadPolicy(max_string_length=1)
+    _utils.set_span_data(
+        mock_span, {"async": False, "messages": ["hi"]}, fn, payload_policy
+    )
+    mock_span.set_attributes.assert_called_once_with(
+        {"async": False, "messages": ["h...[1 more characters]"]}
+    )
+
+    mock_span.reset_mock()
+    payload_policy = PayloadPolicy(sample_rate=0)
+    _utils.set_span_data(
+        mock_span, {"async": False, "messages": ["hi"]}, fn, payload_policy
+    )
+    mock_span.set_attributes.assert_called_once_with({"async": False})
+
+
+@patch("mirascope.integrations.logfire._utils._log_payload", new_callable=MagicMock)
+def test_set_span_data_worker(mock_log_payload: MagicMock) -> None:
+    """Tests logging the payload on the payload policy's worker."""
+    mock_span = MagicMock()
+    fn = MagicMock(__name__="dummy_function")
+    worker = PayloadWorker()
+    payload_policy = PayloadPolicy(max_string_length=1, worker=worker)
+    _utils.set_span_data(
+        mock_span, {"async": False, "messages": ["hi"]}, fn, payload_policy
+    )
+    mock_span.set_attributes.assert_called_once_with({"async": False})
+    assert worker.flush(timeout=5)
+    mock_log_payload.assert_called_once()
+    assert mock_log_payload.call_args.args[1:] == (
+        fn,
+        {"messages": ["h...[1 more characters]"]},
+    )
+
+
+@patch("mirascope.integrations.logfire._utils.logfire", new_callable=MagicMock)
+def test_log_payload(mock_logfire: MagicMock) -> None:
+    """Tests logging the payload within the given context."""
+    fn = MagicMock(__name__="dummy_function")
+    _utils._log_payload(otel_context.get_current(), fn, {"messages": ["hi"]})
+    mock_logfire.with_settings.assert_called_once_with(custom_scope_suffix="mirascope")
+    mock_logfire.with_settings.return_value.log.assert_called_once_with(
+        "info", "dummy_function payload", attributes={"messages": ["hi"]}
+    )
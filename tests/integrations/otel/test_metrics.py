@@ -0,0 +1,215 @@
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from pydantic import BaseModel
+
+from mirascope.core import fake
+from mirascope.core.base.call_response import BaseCallResponse
+from mirascope.core.base.stream import BaseStream
+from mirascope.integrations.otel import _metrics
+from mirascope.integrations.otel._with_otel import with_otel
+
+patch.multiple(BaseStream, __abstractmethods__=set()).start()
+
+
+@pytest.fixture
+def reader() -> Generator[InMemoryMetricReader, None, None]:
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    _metrics._get_instruments.cache_clear()
+    with patch.object(_metrics, "get_meter", provider.get_meter):
+        yield reader
+    _metrics._get_instruments.cache_clear()
+
+
+def _data_points(reader: InMemoryMetricReader) -> dict[str, list[Any]]:
+    metrics_data = reader.get_metrics_data()
+    assert metrics_data is not None
+    return {
+        metric.name: list(metric.data.data_points)
+        for resource_metrics in metrics_data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+def _call_response() -> MagicMock:
+    response = MagicMock(spec=BaseCallResponse)
+    response._provider = "openai"
+    response.call_kwargs = {"model": "gpt-4o-mini"}
+    response.input_tokens = 10
+    response.output_tokens = 5
+    response.cost = 0.01
+    return response
+
+
+def test_with_otel_metrics_call_response(reader: InMemoryMetricReader) -> None:
+    """Tests recording the metrics of a call."""
+    response = _call_response()
+
+    @with_otel(metrics=True)
+    def recommend_book() -> BaseCallResponse:
+        return response
+
+    assert recommend_book() is response
+    data_points = _data_points(reader)
+    expected_attributes = {
+        "gen_ai.system": "openai",
+        "gen_ai.request.model": "gpt-4o-mini",
+        "mirascope.function": "recommend_book",
+    }
+    (duration,) = data_points["gen_ai.client.operation.duration"]
+    assert duration.count == 1
+    assert dict(duration.attributes) == expected_attributes
+    assert data_points["gen_ai.client.input_tokens"][0].value == 10
+    assert data_points["gen_ai.client.output_tokens"][0].value == 5
+    assert data_points["gen_ai.client.cost"][0].value == 0.01
+    assert data_points["gen_ai.client.requests.in_flight"][0].value == 0
+    assert "gen_ai.client.time_to_first_token" not in data_points
+    assert "gen_ai.client.errors" not in data_points
+
+
+@pytest.mark.asyncio
+async def test_with_otel_metrics_error_async(reader: InMemoryMetricReader) -> None:
+    """Tests recording the errors of an async call."""
+
+    @with_otel(metrics=True)
+    async def recommend_book() -> BaseCallResponse:
+        raise ValueError("error")
+
+    with pytest.raises(ValueError, match="error"):
+        await recommend_book()
+    data_points = _data_points(reader)
+    (errors,) = data_points["gen_ai.client.errors"]
+    assert errors.value == 1
+    assert errors.attributes["error.type"] == "ValueError"
+    assert data_points["gen_ai.client.requests.in_flight"][0].value == 0
+    assert "gen_ai.client.operation.duration" not in data_points
+
+
+def test_with_otel_metrics_error_provider(reader: InMemoryMetricReader) -> None:
+    """Tests labeling the in-flight and error metrics with the call's provider."""
+
+    @with_otel(metrics=True)
+    @fake.call("fake-model", client=fake.FakeClient([fake.FakeRateLimitError()]))
+    def recommend_book() -> str:
+        return "Recommend a book"
+
+    with pytest.raises(fake.FakeRateLimitError):
+        recommend_book()
+    data_points = _data_points(reader)
+    expected_attributes = {
+        "gen_ai.system": "fake",
+        "gen_ai.request.model": "fake-model",
+        "mirascope.function": "recommend_book",
+    }
+    (errors,) = data_points["gen_ai.client.errors"]
+    assert dict(errors.attributes) == expected_attributes | {
+        "error.type": "FakeRateLimitError"
+    }
+    (in_flight,) = data_points["gen_ai.client.requests.in_flight"]
+    assert dict(in_flight.attributes) == expected_attributes
+
+
+def test_with_otel_metrics_stream(reader: InMemoryMetricReader) -> None:
+    """Tests recording the metrics of a stream once it's exhausted."""
+    chunk = MagicMock(content="content", input_tokens=3, output_tokens=4, model=None)
+
+    class MyStream(BaseStream):
+        _provider = "anthropic"
+
+        @property
+        def cost(self) -> float:
+            return 0.5
+
+    @with_otel(metrics=True)
+    def recommend_book() -> BaseStream:
+        return MyStream(
+            stream=(t for t in [(chunk, None)]),
+            metadata={},
+            tool_types=[],
+            call_response_type=MagicMock,
+            model="claude-3-5-sonnet-20240620",
+            prompt_template=None,
+            fn_args={},
+            dynamic_config=None,
+            messages=[],
+            call_params={},
+            call_kwargs={},
+        )  # pyright: ignore [reportAbstractUsage]
+
+    stream = recommend_book()
+    assert "gen_ai.client.operation.duration" not in _data_points(reader)
+    assert _data_points(reader)["gen_ai.client.requests.in_flight"][0].value == 1
+    for _ in stream:
+        pass
+    assert stream.first_chunk_time
+    data_points = _data_points(reader)
+    # Streams are timed from when they started being iterated, not when they were made
+    (time_to_first_token,) = data_points["gen_ai.client.time_to_first_token"]
+    assert time_to_first_token.count == 1
+    assert time_to_first_token.sum == pytest.approx(
+        (stream.first_chunk_time - stream.start_time) / 1000
+    )
+    (duration,) = data_points["gen_ai.client.operation.duration"]
+    assert duration.sum == pytest.approx((stream.end_time - stream.start_time) / 1000)
+    assert time_to_first_token.attributes["gen_ai.system"] == "anthropic"
+    assert (
+        time_to_first_token.attributes["gen_ai.request.model"]
+        == "claude-3-5-sonnet-20240620"
+    )
+    assert data_points["gen_ai.client.input_tokens"][0].value == 3
+    assert data_points["gen_ai.client.output_tokens"][0].value == 4
+    assert data_points["gen_ai.client.cost"][0].value == 0.5
+    assert data_points["gen_ai.client.requests.in_flight"][0].value == 0
+
+
+def test_handle_response_model(reader: InMemoryMetricReader) -> None:
+    """Tests recording the metrics of response models."""
+
+    class Book(BaseModel):
+        title: str
+
+    book = Book(title="The Name of the Wind")
+    book._response = _call_response()  # pyright: ignore [reportAttributeAccessIssue]
+    metrics = _metrics.CallMetrics(
+        MagicMock(__name__="extract_book", _provider="openai", _model="gpt-4o")
+    )
+    _metrics.handle_response_model(book, MagicMock(), metrics)
+    _metrics.handle_response_model("The Name of the Wind", MagicMock(), metrics)
+    _metrics.handle_response_model(book, MagicMock(), None)
+
+    data_points = _data_points(reader)
+    durations = data_points["gen_ai.client.operation.duration"]
+    assert sorted(
+        (point.attributes["gen_ai.system"], point.attributes["gen_ai.request.model"])
+        for point in durations
+    ) == [("openai", "gpt-4o"), ("openai", "gpt-4o-mini")]
+    assert data_points["gen_ai.client.input_tokens"][0].value == 10
+
+
+@pytest.mark.asyncio
+async def test_handle_async(reader: InMemoryMetricReader) -> None:
+    """Tests the async handlers."""
+    metrics = MagicMock()
+    response, stream = _call_response(), MagicMock()
+    await _metrics.handle_call_response_async(response, MagicMock(), metrics)
+    metrics.record_call_response.assert_called_once_with(response)
+    await _metrics.handle_stream_async(stream, MagicMock(), metrics)
+    metrics.record_stream.assert_called_once_with(stream)
+    await _metrics.handle_structured_stream_async(stream, MagicMock(), metrics)
+    metrics.record_stream.assert_called_with(stream.stream)
+    await _metrics.handle_response_model_async("book", MagicMock(), metrics)
+    metrics.record.assert_called_once_with("", "", None, None, None)
+    with pytest.raises(KeyError):
+        await _metrics.handle_error_async(KeyError(), MagicMock(), None)
+    for handler in (
+        _metrics.handle_call_response,
+        _metrics.handle_stream,
+        _metrics.handle_structured_stream,
+    ):
+        handler(MagicMock(), MagicMock(), None)
@@ -1,3 +1,4 @@
+import hashlib
 import json
 from typing import cast
 from unittest.mock import MagicMock, patch
@@ -58,11 +59,11 @@ def test_custom_context_manager(mock_get_tracer: MagicMock) -> None:
 @patch("mirascope.integrations.otel._utils.get_tracer", new_callable=MagicMock)
 @patch("mirascope.integrations.otel._utils.set_tracer_provider", new_callable=MagicMock)
 @patch("mirascope.integrations.otel._utils.TracerProvider", new_callable=MagicMock)
-@patch("mirascope.integrations.otel._utils.SimpleSpanProcessor", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.BatchSpanProcessor", new_callable=MagicMock)
 @patch("mirascope.integrations.otel._utils.ConsoleSpanExporter", new_callable=MagicMock)
 def test_configure_no_processor(
     mock_console_span_exporter: MagicMock,
-    mock_simple_span_processor: MagicMock,
+    mock_batch_span_processor: MagicMock,
     mock_tracer_provider: MagicMock,
     mock_set_tracer_provider: MagicMock,
     mock_get_tracer: MagicMock,
@@ -71,13 +72,13 @@ def test_configure_no_processor(
     mock_add_span_processor = MagicMock()
     mock_tracer_provider.return_value.add_span_processor = mock_add_span_processor
     _utils.configure(None)
-    mock_tracer_provider.assert_called_once()
+    mock_tracer_provider.assert_called_once_with(sampler=None)
     mock_console_span_exporter.assert_called_once()
-    mock_simple_span_processor.assert_called_once_with(
+    mock_batch_span_processor.assert_called_once_with(
         mock_console_span_exporter.return_value
     )
     mock_add_span_processor.assert_called_once_with(
-        mock_simple_span_processor.return_value
+        mock_batch_span_processor.return_value
     )
     mock_set_tracer_provider.assert_called_once_with(mock_tracer_provider.return_value)
     mock_get_tracer.assert_called_once_with("otel")
@@ -102,6 +103,130 @@ def test_configure_with_processors(
     mock_get_tracer.assert_called_once_with("otel")
 
 
+@patch("mirascope.integrations.otel._utils.get_tracer", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.set_tracer_provider", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.TracerProvider", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.SimpleSpanProcessor", new_callable=MagicMock)
+def test_configure_exporter_sampling(
+    mock_simple_span_processor: MagicMock,
+    mock_tracer_provider: MagicMock,
+    mock_set_tracer_provider: MagicMock,
+    mock_get_tracer: MagicMock,
+) -> None:
+    """Tests the `configure` function with an exporter and sampling."""
+    exporter, sampler = MagicMock(), MagicMock()
+    tail_sampler = MagicMock(side_effect=[True, False])
+    mock_add_span_processor = MagicMock()
+    mock_tracer_provider.return_value.add_span_processor = mock_add_span_processor
+    _utils.configure(
+        exporter=exporter, batch=False, sampler=sampler, tail_sampler=tail_sampler
+    )
+    mock_tracer_provider.assert_called_once_with(sampler=sampler)
+    mock_simple_span_processor.assert_called_once_with(exporter)
+    processor = mock_add_span_processor.call_args[0][0]
+    assert isinstance(processor, _utils._TailSamplingSpanProcessor)
+    assert processor.processor is mock_simple_span_processor.return_value
+
+    span = MagicMock()
+    processor.on_start(span)
+    mock_simple_span_processor.return_value.on_start.assert_called_once_with(
+        span, parent_context=None
+    )
+    processor.on_end(span)
+    processor.on_end(span)
+    mock_simple_span_processor.return_value.on_end.assert_called_once_with(span)
+    processor.force_flush(10)
+    mock_simple_span_processor.return_value.force_flush.assert_called_once_with(10)
+    processor.shutdown()
+    mock_simple_span_processor.return_value.shutdown.assert_called_once()
+
+
+@patch("mirascope.integrations.otel._utils.get_tracer", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.set_tracer_provider", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.set_meter_provider", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.MeterProvider", new_callable=MagicMock)
+def test_configure_metric_readers(
+    mock_meter_provider: MagicMock,
+    mock_set_meter_provider: MagicMock,
+    mock_set_tracer_provider: MagicMock,
+    mock_get_tracer: MagicMock,
+) -> None:
+    """Tests the `configure` function with metric readers."""
+    _utils.configure([])
+    mock_set_meter_provider.assert_not_called()
+    metric_readers: list = [MagicMock()]
+    _utils.configure([], metric_readers=metric_readers)
+    mock_meter_provider.assert_called_once_with(metric_readers=metric_readers)
+    mock_set_meter_provider.assert_called_once_with(mock_meter_provider.return_value)
+
+
+@patch("mirascope.integrations.otel._utils.get_tracer", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.set_tracer_provider", new_callable=MagicMock)
+def test_configure_content_capture(
+    mock_set_tracer_provider: MagicMock, mock_get_tracer: MagicMock
+) -> None:
+    """Tests that `configure` only updates the content settings it is given."""
+    with (
+        patch.object(_utils, "_content_capture", "full"),
+        patch.object(_utils, "_content_max_bytes", 4096),
+    ):
+        _utils.configure([], content_capture="truncate", content_max_bytes=6)
+        _utils.configure([])
+        assert _utils._content_capture == "truncate"
+        assert _utils._content_max_bytes == 6
+        _utils.configure([], content_capture="hash")
+        assert _utils._content_capture == "hash"
+        assert _utils._content_max_bytes == 6
+
+
+@pytest.mark.parametrize(
+    "content_capture,expected",
+    [
+        ("full", ["prompt content", 1]),
+        ("truncate", ["prompt", 1]),
+        (
+            "hash",
+            [
+                f"sha256:{hashlib.sha256(b'prompt content').hexdigest()}",
+                f"sha256:{hashlib.sha256(b'1').hexdigest()}",
+            ],
+        ),
+        ("off", []),
+    ],
+)
+def test_content_capture(
+    content_capture: _utils.ContentCapture, expected: list
+) -> None:
+    """Tests adding content events with each content capture policy."""
+    span = MagicMock()
+    serialize = MagicMock(return_value="prompt content")
+    with (
+        patch.object(_utils, "_content_capture", content_capture),
+        patch.object(_utils, "_content_max_bytes", 6),
+    ):
+        _utils._add_content_event(span, "prompt", "gen_ai.prompt", serialize)
+        _utils._add_content_event(span, "completion", "gen_ai.completion", lambda: 1)
+    assert [
+        call.kwargs["attributes"][key]
+        for call, key in zip(
+            span.add_event.call_args_list,
+            ["gen_ai.prompt", "gen_ai.completion"],
+            strict=False,
+        )
+    ] == expected
+    assert serialize.call_count == (content_capture != "off")
+
+
+def test_handle_call_response_not_recording() -> None:
+    """Tests that nothing is serialized for spans that aren't recorded."""
+    span = MagicMock()
+    span.is_recording.return_value = False
+    result = MagicMock()
+    _utils.handle_call_response(result, MagicMock(), span)
+    span.set_attributes.assert_not_called()
+    span.add_event.assert_not_called()
+
+
 def test_get_call_response_attributes() -> None:
     """Tests the `get_call_response_attributes` function."""
     call_response = MyCallResponse(
@@ -1,3 +1,7 @@
+import asyncio
+from collections.abc import Generator
+from contextlib import contextmanager
+from functools import wraps
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -1319,3 +1323,166 @@ async def test_middleware_factory_structured_stream_error_no_handler_async() ->
             chunks.append(chunk)
 
     assert chunks == ["chunk1"]
+
+
+def _recording_middleware(name: str, events: list[str], **kwargs: Any):
+    @contextmanager
+    def custom_context_manager(fn):
+        events.append(f"enter {name}")
+        yield name
+        events.append(f"exit {name}")
+
+    def handle_stream(result, fn, context) -> None:
+        events.append(f"handle_stream {context}")
+
+    def handle_response_model(result, fn, context) -> None:
+        events.append(f"handle_response_model {context}")
+
+    return middleware_factory(
+        custom_context_manager=custom_context_manager,
+        handle_stream=handle_stream,
+        handle_response_model=handle_response_model,
+        **kwargs,
+    )
+
+
+def test_middleware_factory_stacked_stream() -> None:
+    """Test that stacked middleware are composed into a single stream wrapper."""
+    patch.multiple(BaseStream, __abstractmethods__=set()).start()
+
+    class MyStream(BaseStream):
+        def __iter__(self):
+            assert isinstance(self.stream, Generator)
+            yield from self.stream
+
+    def sync_fn() -> BaseStream:
+        return MyStream(
+            stream=(t for t in [("chunk1", None), ("chunk2", None)]),
+            metadata={},
+            tool_types=[],
+            call_response_type=MagicMock,
+            model="model",
+            prompt_template="prompt_template",
+            fn_args={},
+            dynamic_config=None,
+            messages=[],
+            call_params={},
+            call_kwargs={},
+        )  # type: ignore
+
+    events = []
+    decorate = _recording_middleware("outer", events)(
+        _recording_middleware("inner", events)(sync_fn)
+    )
+    assert len(decorate._middleware_pipeline.layers) == 2  # pyright: ignore [reportFunctionMemberAccess]
+    assert decorate.__name__ == "sync_fn"
+
+    result = decorate()
+    assert events == ["enter outer", "enter inner"]
+    assert [chunk for chunk, _ in result] == ["chunk1", "chunk2"]
+    assert events == [
+        "enter outer",
+        "enter inner",
+        "handle_stream inner",
+        "exit inner",
+        "handle_stream outer",
+        "exit outer",
+    ]
+    assert type(result).__name__ == "MiddlewareStream"
+    assert type(result).__bases__ == (MyStream,)
+    assert type(decorate()) is type(result)
+
+
+def test_middleware_factory_stacked_handle_error() -> None:
+    """Test that an error handled by an inner middleware isn't seen by outer ones."""
+
+    class Foo(BaseModel):
+        bar: str
+
+    def sync_fn() -> Foo:
+        raise ValueError("error")
+
+    def handle_error(e, fn, context) -> Foo:
+        return Foo(bar=str(e))
+
+    events = []
+    outer_handle_error = MagicMock()
+    decorate = _recording_middleware("outer", events, handle_error=outer_handle_error)(
+        _recording_middleware("inner", events, handle_error=handle_error)(sync_fn)
+    )
+    assert decorate() == Foo(bar="error")
+    outer_handle_error.assert_not_called()
+    assert events == [
+        "enter outer",
+        "enter inner",
+        "exit inner",
+        "handle_response_model inner",
+        "handle_response_model outer",
+        "exit outer",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_middleware_factory_stacked_cancelled_async() -> None:
+    """Test that a cancelled call exits every layer without handling an error."""
+
+    async def async_fn() -> None:
+        raise asyncio.CancelledError
+
+    events = []
+    handle_error_async = MagicMock()
+    decorate = _recording_middleware(
+        "outer", events, handle_error_async=handle_error_async
+    )(_recording_middleware("inner", events)(async_fn))
+    with pytest.raises(asyncio.CancelledError):
+        await decorate()
+    handle_error_async.assert_not_called()
+    assert events == ["enter outer", "enter inner", "exit inner", "exit outer"]
+
+
+@pytest.mark.asyncio
+async def test_middleware_factory_stacked_custom_decorator_async() -> None:
+    """Test that middleware with a custom decorator aren't composed with outer ones."""
+
+    class Foo(BaseModel):
+        bar: str
+
+    async def async_fn() -> Foo:
+        return Foo(bar="baz")
+
+    def custom_decorator(fn):
+        def decorator(wrapper):
+            @wraps(wrapper)
+            async def inner(*args, **kwargs):
+                events.append("custom_decorator")
+                return await wrapper(*args, **kwargs)
+
+            return inner
+
+        return decorator
+
+    events = []
+
+    async def handle_response_model_async(result, fn, context) -> None:
+        events.append(f"handle_response_model_async {context}")
+
+    inner = _recording_middleware(
+        "inner",
+        events,
+        custom_decorator=custom_decorator,
+        handle_response_model_async=handle_response_model_async,
+    )(async_fn)
+    decorate = _recording_middleware(
+        "outer", events, handle_response_model_async=handle_response_model_async
+    )(inner)
+    assert len(decorate._middleware_pipeline.layers) == 1  # pyright: ignore [reportFunctionMemberAccess]
+    assert await decorate() == Foo(bar="baz")
+    assert events == [
+        "enter outer",
+        "custom_decorator",
+        "enter inner",
+        "handle_response_model_async inner",
+        "exit inner",
+        "handle_response_model_async outer",
+        "exit outer",
+    ]
@@ -0,0 +1,106 @@
+"""Tests the `_payload` module."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from mirascope.integrations._payload import (
+    PayloadPolicy,
+    PayloadWorker,
+    bind_payload_policy,
+)
+
+
+class Image(BaseModel):
+    media_type: str
+    data: str
+
+
+def test_payload_policy_apply() -> None:
+    """Tests applying the policy's allowlist, truncation, and media stripping."""
+    payload = {
+        "messages": [
+            {"role": "user", "content": "Recommend a fantasy book"},
+            {"url": "data:image/png;base64,iVBORw0KGgo="},
+            Image(media_type="image/jpeg", data="/9j/4AAQ"),
+            {"inline_data": {"mime_type": "audio/wav", "data": b"RIFF"}},
+            ("tuple", 1),
+        ],
+        "response": "The Name of the Wind",
+    }
+    assert PayloadPolicy().apply(payload) is payload
+    assert PayloadPolicy(allowed_fields={"response"}).apply(payload) == {
+        "response": "The Name of the Wind"
+    }
+    assert PayloadPolicy(max_string_length=8, strip_media=True).apply(payload) == {
+        "messages": [
+            {"role": "user", "content": "Recommen...[16 more characters]"},
+            {"url": "<image/png data: 34 chars>"},
+            {
+                "media_type": "image/jp...[2 more characters]",
+                "data": "<image/jpeg data: 8 chars>",
+            },
+            {
+                "inline_data": {
+                    "mime_type": "audio/wa...[1 more characters]",
+                    "data": "<4 bytes>",
+                }
+            },
+            ["tuple", 1],
+        ],
+        "response": "The Name...[12 more characters]",
+    }
+    assert PayloadPolicy(max_string_length=100).apply({"data": b"RIFF"}) == {
+        "data": b"RIFF"
+    }
+
+
+def test_payload_policy_sample() -> None:
+    """Tests sampling payloads."""
+    assert PayloadPolicy().sample()
+    assert not PayloadPolicy(sample_rate=0).sample()
+    with patch("mirascope.integrations._payload.random.random", return_value=0.2):
+        assert PayloadPolicy(sample_rate=0.5).sample()
+        assert not PayloadPolicy(sample_rate=0.1).sample()
+
+
+def test_payload_worker() -> None:
+    """Tests running tasks on the worker and dropping them when the queue is full."""
+    worker = PayloadWorker(max_queue_size=1)
+    assert worker.flush(timeout=0)
+    started, release = threading.Event(), threading.Event()
+    results = []
+
+    def block() -> None:
+        started.set()
+        release.wait(5)
+        results.append(1)
+
+    assert worker.submit(block)
+    assert started.wait(5)
+    assert worker.submit(lambda: results.append(2))
+    assert not worker.submit(lambda: results.append(3))
+    assert worker.dropped == 1
+    assert not worker.flush(timeout=0.01)
+    release.set()
+    assert worker.flush()
+    assert results == [1, 2]
+
+    assert worker.submit(MagicMock(side_effect=ValueError()))
+    assert worker.flush(timeout=5)
+    assert worker.failed == 1
+    worker._start()  # Already started
+
+
+@pytest.mark.asyncio
+async def test_bind_payload_policy() -> None:
+    """Tests binding the payload policy to a handler."""
+
+    async def handler(result, fn, context, payload_policy=None):
+        return payload_policy
+
+    assert bind_payload_policy(handler, None) is handler
+    payload_policy = PayloadPolicy()
+    assert await bind_payload_policy(handler, payload_policy)(1, 2, 3) is payload_policy
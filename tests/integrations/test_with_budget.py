@@ -0,0 +1,169 @@
+"""Tests the `with_budget` decorator."""
+
+import asyncio
+import gc
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from mirascope.core import fake
+from mirascope.core.base import BaseCallResponse
+from mirascope.core.base.budget import Budget, BudgetExceededError
+from mirascope.integrations import _with_budget, with_budget
+
+
+class Book(BaseModel):
+    title: str
+
+
+def _mock_call_response(
+    cost: float | None = 0.5,
+    input_tokens: int | None = 1,
+    output_tokens: int | None = 2,
+) -> MagicMock:
+    return MagicMock(
+        spec=BaseCallResponse,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cost=cost,
+    )
+
+
+def test_with_budget() -> None:
+    """Tests settling calls and response models against budgets."""
+    budget, tenant_budget = Budget(max_cost=2.0), Budget(max_tokens=100)
+    book = Book(title="The Name of the Wind")
+    book._response = _mock_call_response()  # pyright: ignore [reportAttributeAccessIssue]
+
+    @with_budget(budget, estimated_cost=1.0, estimated_tokens=10)
+    def recommend_book(result: object) -> object:
+        assert budget.reserved_cost == 1.0
+        assert tenant_budget.reserved_tokens == 10
+        return result
+
+    with tenant_budget.scope():
+        recommend_book(_mock_call_response())
+        recommend_book(book)
+        recommend_book(Book(title="The Way of Kings"))  # spends the estimate
+    assert (budget.spent_cost, budget.spent_tokens) == (2.0, 16)
+    assert (tenant_budget.spent_cost, tenant_budget.spent_tokens) == (2.0, 16)
+    assert budget.reserved_cost == tenant_budget.reserved_tokens == 0
+    with pytest.raises(BudgetExceededError):
+        recommend_book(_mock_call_response())
+
+
+def test_with_budget_errors() -> None:
+    """Tests that reservations are released when a call or reservation fails."""
+    budget, scoped_budget = Budget(max_cost=1.0), Budget(max_cost=1.0)
+
+    @with_budget(estimated_cost=0.8)
+    def recommend_book() -> None:
+        raise ValueError("error")
+
+    @with_budget(budget)
+    def no_budget() -> object:
+        return _mock_call_response(None, None, None)
+
+    with budget.scope(), scoped_budget.scope():
+        with pytest.raises(ValueError):
+            recommend_book()
+        assert budget.reserved_cost == scoped_budget.reserved_cost == 0
+        scoped_budget.reserve(0.5)
+        with pytest.raises(BudgetExceededError):
+            recommend_book()
+        assert budget.reserved_cost == 0
+
+    no_budget()
+    assert (budget.spent_cost, budget.calls) == (0, 0)
+    assert recommend_book.__name__ == "recommend_book"
+
+
+@pytest.mark.asyncio
+async def test_with_budget_async() -> None:
+    """Tests settling async calls and releasing their reservations on failure."""
+    budget = Budget(max_cost=1.0, wait=True, timeout=0.01)
+
+    @with_budget(budget, estimated_cost=0.5)
+    async def recommend_book(result: object) -> object:
+        return result
+
+    await recommend_book(_mock_call_response(cost=0.25))
+    assert budget.average_cost == 0.25
+    reservation = budget.reserve(0.75)
+    with pytest.raises(BudgetExceededError):
+        await recommend_book(_mock_call_response())
+    reservation.release()
+    assert budget.reserved_cost == 0
+
+
+@pytest.mark.asyncio
+async def test_with_budget_unconsumed_streams() -> None:
+    """Tests releasing the reservations of streams that are never consumed."""
+    budget = Budget(max_cost=1.0)
+
+    @with_budget(budget, estimated_cost=0.5, estimated_tokens=10)
+    @fake.call("fake-model", stream=True)
+    def stream_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    @with_budget(budget, estimated_cost=0.5, estimated_tokens=10)
+    @fake.call("fake-model", stream=True)
+    async def stream_book_async(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    stream = stream_book("fantasy")
+    async_stream = await stream_book_async("fantasy")
+    assert budget.reserved_cost == 1.0
+    del stream, async_stream
+    gc.collect()
+    assert budget.reserved_cost == 0
+    assert budget.spent_cost == 0
+
+    for _ in stream_book("fantasy"):
+        pass
+    assert budget.calls == 1
+    gc.collect()
+    assert budget.reserved_cost == 0
+
+
+@pytest.mark.asyncio
+async def test_handle_streams() -> None:
+    """Tests settling consumed streams and structured streams."""
+    budget = Budget()
+    fn = MagicMock()
+    stream = _mock_call_response(cost=0.1, output_tokens=None)
+    structured_stream = MagicMock(stream=stream)
+    _with_budget._handle_stream(stream, fn, None)
+    _with_budget._handle_response_model(Book(title=""), fn, None)
+    _with_budget._handle_stream(stream, fn, (budget.reserve(),))
+    _with_budget._handle_structured_stream(structured_stream, fn, (budget.reserve(),))
+    await _with_budget._handle_stream_async(stream, fn, (budget.reserve(),))
+    await _with_budget._handle_structured_stream_async(
+        structured_stream, fn, (budget.reserve(),)
+    )
+    await _with_budget._handle_call_response_async(stream, fn, (budget.reserve(),))
+    await _with_budget._handle_response_model_async(
+        Book(title=""), fn, (budget.reserve(0.1, 1),)
+    )
+    assert budget.calls == 6
+    assert budget.spent_cost == pytest.approx(0.6)
+    assert budget.spent_tokens == 6
+
+
+@pytest.mark.asyncio
+async def test_with_budget_concurrent_calls_without_estimate() -> None:
+    """Tests that concurrent first calls without an estimate can't exceed the budget
+    together."""
+    budget = Budget(max_tokens=100)
+
+    @with_budget(budget)
+    async def recommend_book() -> object:
+        await asyncio.sleep(0)
+        return _mock_call_response(cost=None, input_tokens=15, output_tokens=50)
+
+    results = await asyncio.gather(
+        *(recommend_book() for _ in range(20)), return_exceptions=True
+    )
+    assert sum(not isinstance(result, Exception) for result in results) == 1
+    assert (budget.spent_tokens, budget.reserved_tokens) == (65, 0)
@@ -0,0 +1,90 @@
+"""Tests the `with_cost_ledger` decorator."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from mirascope.core.base import BaseCallResponse
+from mirascope.core.base.ledger import CostLedger, LedgerUsage
+from mirascope.integrations import _with_cost_ledger, with_cost_ledger
+
+
+class Book(BaseModel):
+    title: str
+
+
+def _mock_call_response() -> MagicMock:
+    return MagicMock(
+        spec=BaseCallResponse,
+        _provider="openai",
+        model="gpt-4o-mini",
+        input_tokens=1,
+        output_tokens=2,
+        cost=0.5,
+        metadata={"tags": {"books"}},
+    )
+
+
+def test_with_cost_ledger() -> None:
+    """Tests recording calls and response models in the ledger."""
+    ledger = CostLedger()
+    book = Book(title="The Name of the Wind")
+    book._response = _mock_call_response()  # pyright: ignore [reportAttributeAccessIssue]
+
+    @with_cost_ledger(ledger)
+    def recommend_book(result: object) -> object:
+        return result
+
+    recommend_book(_mock_call_response())
+    recommend_book(book)
+    recommend_book(Book(title="The Way of Kings"))
+    snapshot = ledger.snapshot()
+    assert snapshot.group_by("function") == {
+        "recommend_book": LedgerUsage(calls=2, input_tokens=2, output_tokens=4, cost=1)
+    }
+    assert list(snapshot.group_by("tag")) == ["books"]
+
+
+@pytest.mark.asyncio
+async def test_with_cost_ledger_async() -> None:
+    """Tests recording async calls and response models in the ledger."""
+    ledger = CostLedger()
+    book = Book(title="The Name of the Wind")
+    book._response = _mock_call_response()  # pyright: ignore [reportAttributeAccessIssue]
+
+    @with_cost_ledger(ledger)
+    async def recommend_book(result: object) -> object:
+        return result
+
+    await recommend_book(_mock_call_response())
+    await recommend_book(book)
+    assert ledger.snapshot().total() == LedgerUsage(
+        calls=2, input_tokens=2, output_tokens=4, cost=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_handle_streams() -> None:
+    """Tests recording consumed streams and structured streams."""
+    ledger = MagicMock(spec=CostLedger)
+    fn = MagicMock()
+    stream = MagicMock()
+    structured_stream = MagicMock(stream=stream)
+    _with_cost_ledger._handle_stream(stream, fn, None)
+    _with_cost_ledger._handle_structured_stream(structured_stream, fn, None)
+    ledger.record_response.assert_not_called()
+
+    _with_cost_ledger._handle_stream(stream, fn, ledger)
+    _with_cost_ledger._handle_structured_stream(structured_stream, fn, ledger)
+    await _with_cost_ledger._handle_stream_async(stream, fn, ledger)
+    await _with_cost_ledger._handle_structured_stream_async(
+        structured_stream, fn, ledger
+    )
+    assert ledger.record_response.call_count == 4
+    ledger.record_response.assert_called_with(stream, fn)
+
+    _with_cost_ledger._handle_call_response(_mock_call_response(), fn, None)
+    ledger.record_response.reset_mock()
+    _with_cost_ledger._handle_response_model(Book(title=""), fn, None)
+    ledger.record_response.assert_not_called()
@@ -0,0 +1,294 @@
+"""Tests for the `fallback` module."""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncGenerator, Generator
+from unittest.mock import MagicMock
+
+import pytest
+
+from mirascope.core.base import BaseStream, BaseStructuredStream
+from mirascope.core.base.deadline import DeadlineExceededError, call_deadline
+from mirascope.retries import fallback as fallback_module
+from mirascope.retries.fallback import FallbackError, HedgeDelay, fallback
+
+
+def _mock_stream(generator: Generator | AsyncGenerator) -> MagicMock:
+    stream = MagicMock(spec=BaseStream)
+    stream.stream = generator
+    return stream
+
+
+def test_hedge_delay() -> None:
+    """Tests the percentile-based hedging delay."""
+    delay = HedgeDelay(50, initial=2.0, min_delay=0.05, window=4, min_samples=2)
+    assert delay.delay() == 2.0
+    delay.record(1.0)
+    assert delay.delay() == 2.0
+    for latency in (0.01, 0.02, 0.3, 0.4):
+        delay.record(latency)
+    assert delay.delay() == 0.05
+    delay.record(0.5)
+    assert delay.delay() == 0.3
+    assert HedgeDelay(0, min_samples=1).delay() == 1.0
+
+    with pytest.raises(ValueError, match="Percentile must be between 0 and 100"):
+        HedgeDelay(101)
+
+
+def test_fallback() -> None:
+    """Tests falling back to the next call on errors."""
+
+    def fail(genre: str) -> str:
+        raise ValueError(genre)
+
+    def succeed(genre: str) -> str:
+        return f"Recommended {genre} book"
+
+    def fail_type(genre: str) -> str:
+        raise TypeError(genre)
+
+    recommend_book = fallback(fail, succeed)
+    assert recommend_book("fantasy") == "Recommended fantasy book"
+    assert recommend_book.__name__ == "fail"
+
+    with pytest.raises(FallbackError, match="All 2 calls failed") as exc_info:
+        fallback(fail, fail)("fantasy")
+    assert [str(error) for error in exc_info.value.errors] == ["fantasy", "fantasy"]
+
+    with pytest.raises(TypeError):
+        fallback(fail_type, succeed, catch=ValueError)("fantasy")
+
+    with pytest.raises(ValueError, match="At least one call"):
+        fallback()
+
+    async def succeed_async(genre: str) -> str:
+        return genre
+
+    with pytest.raises(ValueError, match="all be sync or all be async"):
+        fallback(succeed, succeed_async)
+
+
+def test_fallback_deadline() -> None:
+    """Tests that no further calls are made once the deadline has passed."""
+    calls = []
+
+    def fail() -> str:
+        calls.append("fail")
+        time.sleep(0.02)
+        raise ValueError("Failed")
+
+    def exceed() -> str:
+        raise DeadlineExceededError("The deadline was exceeded.")
+
+    def slow() -> str:
+        time.sleep(0.1)
+        return "slow"
+
+    def hedge() -> str:
+        calls.append("hedge")  # pragma: no cover
+        return "hedge"  # pragma: no cover
+
+    with call_deadline(0.01):
+        with pytest.raises(DeadlineExceededError):
+            fallback(fail, fail)()
+        assert calls == ["fail"]
+    with pytest.raises(DeadlineExceededError):
+        fallback(exceed, fail)()
+    with pytest.raises(DeadlineExceededError):
+        fallback(exceed, fail, hedge=1)()
+    with call_deadline(0.01):
+        assert fallback(slow, hedge, hedge=0.05)() == "slow"
+    assert calls == ["fail"]
+    with call_deadline(0.05), pytest.raises(DeadlineExceededError):
+        fallback(fail, slow, hedge=1)()
+
+
+def test_fallback_stream() -> None:
+    """Tests falling back when a stream fails before its first chunk."""
+
+    def failing_generator() -> Generator:
+        raise ValueError("Stream failed")
+        yield  # pragma: no cover
+
+    def generator() -> Generator:
+        yield from ("chunk1", "chunk2")
+
+    def empty_generator() -> Generator:
+        yield from ()
+
+    recommend_book = fallback(
+        lambda: _mock_stream(failing_generator()),
+        lambda: BaseStructuredStream(
+            stream=_mock_stream(generator()),
+            response_model=str,
+            fields_from_call_args={},
+        ),
+    )
+    result = recommend_book()
+    assert isinstance(result, BaseStructuredStream)
+    assert isinstance(result.stream.stream, Generator)
+    assert list(result.stream.stream) == ["chunk1", "chunk2"]
+
+    stream = fallback(lambda: _mock_stream(empty_generator()))()
+    assert list(stream.stream) == []
+
+
+def test_fallback_hedge() -> None:
+    """Tests hedging a slow call with the next call on another thread."""
+    delay = HedgeDelay(initial=0.01)
+    closed = []
+    threads = []
+
+    def slow() -> str:
+        threads.append(threading.current_thread())
+        time.sleep(0.2)
+        return "slow"
+
+    def fail() -> str:
+        raise ValueError("Failed")
+
+    def fast() -> str:
+        threads.append(threading.current_thread())
+        return "fast"
+
+    def generator() -> Generator:
+        try:
+            yield "chunk"
+        finally:
+            closed.append(True)
+
+    def slow_stream() -> MagicMock:
+        time.sleep(0.2)
+        return _mock_stream(generator())
+
+    assert fallback(slow, fail, fast, hedge=delay)() == "fast"
+    assert threads == [threading.current_thread(), threads[1]]
+    assert threads[1] is not threading.current_thread()
+    assert len(delay._latencies) == 1
+    assert delay._latencies[0] < 0.1
+    assert fallback(fast, slow, hedge=10)() == "fast"
+    assert fallback(slow_stream, fast, hedge=0.01)() == "fast"
+    assert closed == [True]
+    assert fallback(slow, slow_stream, hedge=0.01)() == "slow"
+    time.sleep(0.2)
+    assert closed == [True, True]
+
+    with pytest.raises(FallbackError):
+        fallback(fail, fail, hedge=0.01)()
+
+    def fail_type() -> str:
+        raise TypeError("Failed")
+
+    with pytest.raises(TypeError):
+        fallback(fail_type, fast, catch=ValueError, hedge=0.01)()
+
+
+@pytest.mark.asyncio
+async def test_fallback_async() -> None:
+    """Tests falling back across async calls and streams."""
+
+    async def fail(genre: str) -> str:
+        raise ValueError(genre)
+
+    async def succeed(genre: str) -> str:
+        return genre
+
+    assert await fallback(fail, succeed)("fantasy") == "fantasy"
+    with pytest.raises(FallbackError):
+        await fallback(fail, fail)("fantasy")
+
+    async def failing_generator() -> AsyncGenerator:
+        raise ValueError("Stream failed")
+        yield  # pragma: no cover
+
+    async def generator() -> AsyncGenerator:
+        for chunk in ("chunk1", "chunk2"):
+            yield chunk
+
+    async def empty_generator() -> AsyncGenerator:
+        for chunk in ():
+            yield chunk  # pragma: no cover
+
+    async def failing_stream() -> MagicMock:
+        return _mock_stream(failing_generator())
+
+    async def stream() -> MagicMock:
+        return _mock_stream(generator())
+
+    async def empty_stream() -> MagicMock:
+        return _mock_stream(empty_generator())
+
+    result = await fallback(failing_stream, stream)()
+    assert [chunk async for chunk in result.stream] == ["chunk1", "chunk2"]
+    result = await fallback(empty_stream)()
+    assert [chunk async for chunk in result.stream] == []
+
+
+@pytest.mark.asyncio
+async def test_fallback_deadline_async() -> None:
+    """Tests that no further async calls are made once the deadline has passed."""
+
+    async def fail() -> str:
+        await asyncio.sleep(0.02)
+        raise ValueError("Failed")
+
+    async def exceed() -> str:
+        raise DeadlineExceededError("The deadline was exceeded.")
+
+    with call_deadline(0.01), pytest.raises(DeadlineExceededError):
+        await fallback(fail, fail)()
+    with pytest.raises(DeadlineExceededError):
+        await fallback(exceed, fail)()
+    with call_deadline(0.01), pytest.raises(DeadlineExceededError):
+        await fallback(fail, fail, hedge=1)()
+
+
+@pytest.mark.asyncio
+async def test_fallback_hedge_async() -> None:
+    """Tests hedging slow async calls and cancelling the losers."""
+    cancelled = asyncio.Event()
+    closed = []
+
+    async def slow() -> str:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "slow"  # pragma: no cover
+
+    async def fail() -> str:
+        raise ValueError("Failed")
+
+    async def fast() -> str:
+        return "fast"
+
+    async def generator() -> AsyncGenerator:
+        try:
+            yield "chunk"
+        finally:
+            closed.append(True)
+
+    async def stream() -> MagicMock:
+        return _mock_stream(generator())
+
+    delay = HedgeDelay(initial=0.01)
+    assert await fallback(slow, fail, fast, hedge=delay)() == "fast"
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert len(delay._latencies) == 1
+
+    task = asyncio.ensure_future(stream())
+    await task
+    await anext(task.result().stream)
+    await fallback_module._close_async(task)
+    assert closed == [True]
+    with pytest.raises(FallbackError):
+        await fallback(fail, fail, hedge=0.01)()
+
+    async def fail_type() -> str:
+        raise TypeError("Failed")
+
+    with pytest.raises(TypeError):
+        await fallback(fail_type, fast, catch=ValueError, hedge=0.01)()
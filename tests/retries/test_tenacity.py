@@ -3,7 +3,8 @@ from unittest.mock import MagicMock
 from pydantic import BaseModel, ValidationError
 from tenacity import RetryCallState
 
-from mirascope.retries.tenacity import collect_errors
+from mirascope.core.base.deadline import call_deadline
+from mirascope.retries.tenacity import collect_errors, stop_at_deadline
 
 
 def test_collect_errors() -> None:
@@ -23,3 +24,13 @@ def test_collect_errors() -> None:
     outcome.exception.return_value = validation_error
     collect_errors(ValidationError)(mock_retry_state)
     assert mock_retry_state.kwargs["errors"] == [validation_error]
+
+
+def test_stop_at_deadline() -> None:
+    mock_retry_state = MagicMock(spec=RetryCallState)
+    mock_retry_state.upcoming_sleep = 1.0
+    assert not stop_at_deadline(mock_retry_state)
+    with call_deadline(10):
+        assert not stop_at_deadline(mock_retry_state)
+        mock_retry_state.upcoming_sleep = 20.0
+        assert stop_at_deadline(mock_retry_state)